@@ -75,6 +75,7 @@ CREATE TABLE IF NOT EXISTS `mydb`.`car` (
   INDEX `fk_car_engine_idx` (`engine_id` ASC) VISIBLE,
   INDEX `fk_car_transmission1_idx` (`transmission_id` ASC) VISIBLE,
   INDEX `fk_car_manufacturer1_idx` (`manufacturer_id` ASC) VISIBLE,
+  INDEX `ix_car_year` (`year` ASC) VISIBLE,
   CONSTRAINT `fk_car_engine`
     FOREIGN KEY (`engine_id`)
     REFERENCES `mydb`.`engine` (`id`)
@@ -107,6 +108,7 @@ CREATE TABLE IF NOT EXISTS `mydb`.`equipment` (
   `car_id` INT NOT NULL,
   PRIMARY KEY (`id`),
   INDEX `fk_equipment_car1_idx` (`car_id` ASC) VISIBLE,
+  INDEX `ix_equipment_description` (`description` ASC) VISIBLE,
   CONSTRAINT `fk_equipment_car1`
     FOREIGN KEY (`car_id`)
     REFERENCES `mydb`.`car` (`id`)
@@ -0,0 +1,334 @@
+"""
+Módulo do teste de carga do servidor MCP.
+
+Simula N agentes simultâneos: cada cliente virtual abre a sua sessão MCP e
+repete, até o fim do estágio, sessões de agente sorteadas entre:
+
+- a sessão sintética (`synthetic_session`): lista os fabricantes, busca os
+  carros de um deles, refina a busca (ordenação e limite) e pede os detalhes
+  dos primeiros resultados;
+- as sessões gravadas em um arquivo JSONL (`load_recording`), uma chamada de
+  ferramenta por linha: `{"session": "a", "tool": "search_cars",
+  "arguments": {...}}`, reproduzidas na ordem do arquivo.
+
+A carga sobe em estágios (ex: 1, 10, 50 clientes). De cada estágio são
+reportados a vazão, a latência p50/p99 das chamadas, a taxa de erros e a
+saturação do pool de conexões, lida das métricas do servidor (`/metrics`):
+o pico de conexões em uso e a espera média por uma conexão. Uma chamada com
+erro encerra a sessão do agente, como aconteceria com um agente real.
+
+O alvo é um servidor HTTP local (`--url`, ex: `http://127.0.0.1:8000`) ou,
+sem ele, o próprio servidor carregado no processo (transporte em memória).
+Com vários workers, passe em `--metrics` os endpoints de métricas de todos
+eles (ex: `http://127.0.0.1:9464,http://127.0.0.1:9465`): as amostras do
+pool são somadas entre os workers.
+
+Uso:
+    python -m mcp_car_agent.benchmarks.load --url http://127.0.0.1:8000 \\
+        --clients 1,10,50 --stage-seconds 30 --output carga.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+import httpx
+from fastmcp import Client
+from loguru import logger
+
+from mcp_car_agent.benchmarks.stats import percentile
+from mcp_car_agent.core.schemas.load_test_schema import LoadStageResult, LoadTestRun
+
+Call = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+"""
+Executa uma chamada de ferramenta e retorna o resultado estruturado.
+"""
+
+Session = Callable[[Call, random.Random], Awaitable[None]]
+"""
+Uma sessão de agente: uma sequência de chamadas de ferramentas.
+"""
+
+POOL_SAMPLE_INTERVAL = 0.5
+"""
+Intervalo, em segundos, entre as leituras das métricas do pool.
+"""
+
+_POOL_SAMPLE = re.compile(r"^(mcp_db_pool_\w+) (\S+)$", re.MULTILINE)
+
+
+class SessionAborted(Exception):
+    """
+    Lançada quando uma chamada falha, encerrando a sessão do agente.
+    """
+
+
+@dataclass(frozen=True)
+class LoadTarget:
+    """
+    O servidor sob teste: como abrir um cliente MCP e ler as métricas.
+    """
+
+    name: str
+    client: Callable[[], Client]
+    metrics: Callable[[], Awaitable[str]]
+
+
+def http_target(url: str, metrics_urls: Sequence[str] = ()) -> LoadTarget:
+    """
+    Um servidor HTTP local (ex: `http://127.0.0.1:8000`), com as métricas
+    lidas de `metrics_urls` (uma por worker) ou, sem elas, do próprio servidor.
+    """
+    url = url.rstrip("/")
+    endpoints = [f"{base.rstrip('/')}/metrics" for base in metrics_urls or [url]]
+
+    async def scrape() -> str:
+        async with httpx.AsyncClient() as http:
+            responses = await asyncio.gather(*(http.get(e) for e in endpoints))
+        return "".join(response.text for response in responses)
+
+    return LoadTarget(url, lambda: Client(f"{url}/mcp"), scrape)
+
+
+def local_target() -> LoadTarget:
+    """
+    O servidor carregado no próprio processo, pelo transporte em memória.
+    """
+    # pylint: disable=import-outside-toplevel
+    from mcp_car_agent.server.mcp_server import mcp, render_metrics
+
+    return LoadTarget("local", lambda: Client(mcp), render_metrics)
+
+
+async def synthetic_session(call: Call, rng: random.Random):
+    """
+    Uma sessão típica de agente: busca, refinamento e detalhes.
+    """
+    manufacturers = await call("list_manufacturers", {})
+    if not manufacturers:
+        return
+    filters = {"manufacturer_id": rng.choice(manufacturers)["id"]}
+    await call("search_cars", {"query": {"filters": filters, "limit": 20}})
+    refined = await call(
+        "search_cars", {"query": {"filters": filters, "order_by": "year", "limit": 5}}
+    )
+    ids = [car["id"] for car in refined[:3]]
+    if ids:
+        await call("get_cars", {"ids": ids})
+
+
+def replay(steps: Sequence[Dict[str, Any]]) -> Session:
+    """
+    Uma sessão gravada, reproduzida na ordem.
+    """
+
+    async def session(call: Call, _rng: random.Random):
+        for step in steps:
+            await call(step["tool"], step.get("arguments", {}))
+
+    return session
+
+
+def load_recording(path: Path) -> List[Session]:
+    """
+    As sessões gravadas em um arquivo JSONL, agrupadas pelo campo `session`.
+    """
+    steps = defaultdict(list)
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            step = json.loads(line)
+            steps[step.get("session")].append(step)
+    return [replay(session) for session in steps.values()]
+
+
+def pool_samples(text: str) -> Dict[str, float]:
+    """
+    As amostras sem rótulos do pool de conexões em uma coleta do Prometheus,
+    somadas quando a coleta junta as de vários workers.
+    """
+    samples: Dict[str, float] = defaultdict(float)
+    for name, value in _POOL_SAMPLE.findall(text):
+        samples[name] += float(value)
+    return dict(samples)
+
+
+class StageStats:
+    """
+    As medições de um estágio, compartilhadas pelos clientes virtuais.
+    """
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.pool_peak = 0.0
+
+    def result(
+        self, clients: int, seconds: float, before: Dict[str, float], after: Dict
+    ) -> LoadStageResult:
+        """
+        Resume o estágio, com a espera pelo pool entre as coletas `before` e
+        `after`.
+        """
+        latencies = self.latencies or [0.0]
+        waits = after.get("mcp_db_pool_wait_seconds_count", 0.0) - before.get(
+            "mcp_db_pool_wait_seconds_count", 0.0
+        )
+        waited = after.get("mcp_db_pool_wait_seconds_sum", 0.0) - before.get(
+            "mcp_db_pool_wait_seconds_sum", 0.0
+        )
+        size = after.get("mcp_db_pool_size")
+        return LoadStageResult(
+            clients=clients,
+            seconds=seconds,
+            calls=len(self.latencies),
+            errors=self.errors,
+            error_rate=self.errors / len(self.latencies) if self.latencies else 0.0,
+            calls_per_sec=len(self.latencies) / seconds if seconds else 0.0,
+            p50_ms=percentile(latencies, 50) * 1000,
+            p99_ms=percentile(latencies, 99) * 1000,
+            pool_size=None if size is None else int(size),
+            pool_peak_in_use=None if size is None else int(self.pool_peak),
+            pool_wait_ms=waited / waits * 1000 if waits else None,
+        )
+
+
+async def virtual_client(
+    target: LoadTarget,
+    sessions: Sequence[Session],
+    stats: StageStats,
+    deadline: float,
+    rng: random.Random,
+):
+    """
+    Um agente: abre uma sessão MCP e repete sessões sorteadas até o prazo.
+    """
+    async with target.client() as client:
+
+        async def call(tool: str, arguments: Dict[str, Any]) -> Any:
+            started = time.perf_counter()
+            try:
+                result = await client.call_tool(tool, arguments, raise_on_error=False)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.debug(f"{tool}: {exc}")
+                result = None
+            stats.latencies.append(time.perf_counter() - started)
+            if result is None or result.is_error:
+                stats.errors += 1
+                raise SessionAborted(tool)
+            return (result.structured_content or {}).get("result")
+
+        while time.monotonic() < deadline:
+            try:
+                await rng.choice(sessions)(call, rng)
+            except SessionAborted:
+                pass
+
+
+async def _sample_pool(target: LoadTarget, stats: StageStats):
+    while True:
+        samples = pool_samples(await target.metrics())
+        stats.pool_peak = max(
+            stats.pool_peak, samples.get("mcp_db_pool_checked_out", 0.0)
+        )
+        await asyncio.sleep(POOL_SAMPLE_INTERVAL)
+
+
+async def run_stage(
+    target: LoadTarget, sessions: Sequence[Session], clients: int, seconds: float
+) -> LoadStageResult:
+    """
+    Executa um estágio: `clients` agentes simultâneos por `seconds` segundos.
+    """
+    stats = StageStats()
+    before = pool_samples(await target.metrics())
+    sampler = asyncio.create_task(_sample_pool(target, stats))
+    deadline, started = time.monotonic() + seconds, time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                virtual_client(target, sessions, stats, deadline, random.Random(i))
+                for i in range(clients)
+            )
+        )
+    finally:
+        sampler.cancel()
+    return stats.result(
+        clients,
+        time.perf_counter() - started,
+        before,
+        pool_samples(await target.metrics()),
+    )
+
+
+async def run(
+    target: LoadTarget,
+    sessions: Sequence[Session],
+    stages: Sequence[int],
+    seconds: float,
+) -> LoadTestRun:
+    """
+    Executa os estágios em ordem, subindo a carga.
+
+    Args:
+        target (LoadTarget): O servidor sob teste.
+        sessions (Sequence[Session]): As sessões de agente sorteadas.
+        stages (Sequence[int]): O número de clientes de cada estágio.
+        seconds (float): A duração de cada estágio.
+
+    Returns:
+        LoadTestRun: Os resultados de todos os estágios.
+    """
+    results = []
+    for clients in stages:
+        result = await run_stage(target, sessions, clients, seconds)
+        logger.info(
+            f"{clients} clientes: {result.calls_per_sec:.1f} chamadas/s, "
+            f"p50 {result.p50_ms:.1f} ms, p99 {result.p99_ms:.1f} ms, "
+            f"erros {result.error_rate:.1%}, pool {result.pool_peak_in_use}"
+            f"/{result.pool_size} (espera {result.pool_wait_ms or 0:.2f} ms)"
+        )
+        results.append(result)
+    return LoadTestRun(
+        created_at=datetime.now(timezone.utc), target=target.name, stages=results
+    )
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando do teste de carga.
+    """
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("--url", default="")
+    arguments.add_argument("--metrics", default="")
+    arguments.add_argument("--clients", default="1,10,50")
+    arguments.add_argument("--stage-seconds", type=float, default=30)
+    arguments.add_argument("--recording", type=Path)
+    arguments.add_argument("--output", type=Path, default=Path("load_test.json"))
+    args = arguments.parse_args()
+    sessions = load_recording(args.recording) if args.recording else []
+    result = asyncio.run(
+        run(
+            (
+                http_target(args.url, [u for u in args.metrics.split(",") if u])
+                if args.url
+                else local_target()
+            ),
+            sessions or [synthetic_session],
+            [int(clients) for clients in args.clients.split(",")],
+            args.stage_seconds,
+        )
+    )
+    args.output.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+    logger.info(f"Resultados gravados em {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Módulo de verificação dos planos de execução das buscas canônicas.
+
+As buscas mais usadas pelo agente (por fabricante, ano, câmbio, motor e
+equipamento) estão registradas em `CANONICAL_SEARCHES`. Cada uma é executada
+pelo seu repositório, o statement enviado ao banco é capturado e submetido
+ao `EXPLAIN` do dialeto:
+
+- SQLite: `EXPLAIN QUERY PLAN`;
+- PostgreSQL: `EXPLAIN (ANALYZE, FORMAT JSON)`, com `enable_seqscan`
+  desligado na transação, para que o plano só use uma leitura sequencial se
+  não houver índice utilizável (em tabelas pequenas ela seria sempre a mais
+  barata);
+- MySQL: `EXPLAIN FORMAT=JSON` (o `EXPLAIN ANALYZE` só existe no formato
+  texto).
+
+Os bancos são os do benchmark (`BENCHMARK_POSTGRES_URL` / `BENCHMARK_MYSQL_URL`
+e o SQLite em memória), recriados e populados com o catálogo sintético. Os
+planos são gravados em JSON (`QueryPlanRun`), e a verificação falha se alguma
+busca fizer leitura completa de uma das tabelas de `GUARDED_TABLES`.
+
+Uso:
+    python -m mcp_car_agent.benchmarks.query_plans --size 10000 \\
+        --output planos.json
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mcp_car_agent.benchmarks.repository import BACKENDS, open_backend, reset_catalog
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.database.repository.engine_repository import (
+    EngineSpecRepository,
+)
+from mcp_car_agent.core.database.repository.equipment_repository import (
+    EquipmentRepository,
+)
+from mcp_car_agent.core.schemas.query_plan_schema import QueryPlan, QueryPlanRun
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+
+CANONICAL_SEARCHES: Dict[str, Tuple[type, CarQuery]] = {
+    "car_by_manufacturer": (
+        CarRepository,
+        CarQuery(filters={"manufacturer_id": 1}, limit=20),
+    ),
+    "car_by_manufacturer_newest": (
+        CarRepository,
+        CarQuery(filters={"manufacturer_id": 1}, order_by="year", limit=20),
+    ),
+    "car_by_year": (CarRepository, CarQuery(filters={"year": date(2020, 1, 1)})),
+    "car_newest": (CarRepository, CarQuery(order_by="year", limit=20)),
+    "car_by_gearbox": (CarRepository, CarQuery(filters={"transmission_id": 1})),
+    "car_by_engine": (CarRepository, CarQuery(filters={"engine_id": 1})),
+    "equipment_by_description": (
+        EquipmentRepository,
+        CarQuery(filters={"description": "Airbag duplo"}, limit=100),
+    ),
+    "equipment_by_car": (EquipmentRepository, CarQuery(filters={"car_id": 1})),
+    "engine_specs_by_engine": (
+        EngineSpecRepository,
+        CarQuery(filters={"engine_id": 1}),
+    ),
+}
+"""
+Buscas canônicas do agente: o repositório e a consulta de `search`. A busca
+por tipo de câmbio filtra pela transmissão (o agente resolve o tipo em IDs
+com `list_transmissions`), e a busca por ano usa igualdade e ordenação, as
+formas que `search` oferece.
+"""
+
+GUARDED_TABLES = ("car", "equipment", "engine_specs")
+"""
+Tabelas que crescem com o catálogo e não podem ser lidas por inteiro.
+"""
+
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+
+
+def _nodes(plan: Any) -> Iterator[Dict]:
+    """
+    Os objetos (dicionários) de um plano em JSON, em qualquer profundidade.
+    """
+    if isinstance(plan, dict):
+        yield plan
+        plan = list(plan.values())
+    if isinstance(plan, list):
+        for item in plan:
+            yield from _nodes(item)
+
+
+def _json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+def sqlite_plan(rows: Sequence[Sequence]) -> Tuple[Any, List[str]]:
+    """
+    O plano do SQLite (a coluna `detail`) e as tabelas lidas por inteiro
+    (`SCAN tabela`, sem `USING INDEX`).
+    """
+    details = [row[-1] for row in rows]
+    return details, [
+        match.group(1) for match in map(_SQLITE_SCAN.match, details) if match
+    ]
+
+
+def postgres_plan(rows: Sequence[Sequence]) -> Tuple[Any, List[str]]:
+    """
+    O plano do PostgreSQL e as tabelas com `Seq Scan`.
+    """
+    plan = _json(rows[0][0])
+    return plan, [
+        node["Relation Name"]
+        for node in _nodes(plan)
+        if node.get("Node Type") == "Seq Scan"
+    ]
+
+
+def mysql_plan(rows: Sequence[Sequence]) -> Tuple[Any, List[str]]:
+    """
+    O plano do MySQL e as tabelas com `access_type` `ALL`.
+    """
+    plan = _json(rows[0][0])
+    return plan, [
+        node["table_name"] for node in _nodes(plan) if node.get("access_type") == "ALL"
+    ]
+
+
+@dataclass(frozen=True)
+class DialectExplain:
+    """
+    Como obter e interpretar o plano de execução em cada dialeto.
+    """
+
+    prefix: str
+    parse: Callable[[Sequence[Sequence]], Tuple[Any, List[str]]]
+    setup_sql: Optional[str] = None
+
+
+DIALECT_EXPLAIN = {
+    "sqlite": DialectExplain(prefix="EXPLAIN QUERY PLAN ", parse=sqlite_plan),
+    "postgresql": DialectExplain(
+        prefix="EXPLAIN (ANALYZE, FORMAT JSON) ",
+        parse=postgres_plan,
+        setup_sql="SET LOCAL enable_seqscan = off",
+    ),
+    "mysql": DialectExplain(prefix="EXPLAIN FORMAT=JSON ", parse=mysql_plan),
+}
+
+
+async def _capture(
+    session_factory: async_sessionmaker, repository: type, query: CarQuery
+) -> Tuple[str, Any]:
+    """
+    Executa a busca e captura o último statement enviado ao banco (o da busca),
+    com os parâmetros no formato do driver.
+    """
+    engine = session_factory.kw["bind"].sync_engine
+    captured = []
+
+    def listener(_conn, _cursor, statement, parameters, _context, _many):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        async with session_factory() as session:
+            await repository(session).search(**query.model_dump())
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return captured[-1]
+
+
+async def _explain(
+    engine: AsyncEngine, statement: str, parameters: Any
+) -> Tuple[Any, List[str]]:
+    """
+    Executa o `EXPLAIN` do dialeto para o statement capturado.
+    """
+    dialect = DIALECT_EXPLAIN[engine.dialect.name]
+    # A transação nunca é confirmada: o `SET LOCAL` e o ANALYZE não deixam rastro.
+    async with engine.connect() as connection, connection.begin():
+        if dialect.setup_sql:
+            await connection.exec_driver_sql(dialect.setup_sql)
+        result = await connection.exec_driver_sql(
+            dialect.prefix + statement, parameters
+        )
+        return dialect.parse(result.all())
+
+
+async def explain(
+    session_factory: async_sessionmaker, backend: str, name: str
+) -> QueryPlan:
+    """
+    Captura o plano de execução de uma busca canônica.
+
+    Args:
+        session_factory (async_sessionmaker): A fábrica de sessões do banco.
+        backend (str): O nome do banco, para o resultado.
+        name (str): A busca, uma chave de `CANONICAL_SEARCHES`.
+
+    Returns:
+        QueryPlan: O statement, o plano e as tabelas lidas por inteiro.
+    """
+    repository, query = CANONICAL_SEARCHES[name]
+    statement, parameters = await _capture(session_factory, repository, query)
+    plan, full_scans = await _explain(session_factory.kw["bind"], statement, parameters)
+    return QueryPlan(
+        backend=backend,
+        name=name,
+        statement=statement,
+        plan=plan,
+        full_scans=full_scans,
+    )
+
+
+async def explain_all(
+    session_factory: async_sessionmaker, backend: str
+) -> List[QueryPlan]:
+    """
+    Captura os planos de todas as buscas canônicas em um banco.
+    """
+    return [
+        await explain(session_factory, backend, name) for name in CANONICAL_SEARCHES
+    ]
+
+
+def regressions(
+    plans: List[QueryPlan], tables: Sequence[str] = GUARDED_TABLES
+) -> List[QueryPlan]:
+    """
+    Os planos que leem por inteiro alguma das tabelas protegidas.
+    """
+    return [plan for plan in plans if set(plan.full_scans) & set(tables)]
+
+
+async def run_all(backends: Dict[str, str], size: int) -> QueryPlanRun:
+    """
+    Popula cada banco disponível com o catálogo sintético e captura os planos.
+
+    Args:
+        backends (Dict[str, str]): Os bancos e as suas URLs.
+        size (int): O número de carros do catálogo.
+
+    Returns:
+        QueryPlanRun: Os planos de todos os bancos.
+    """
+    plans = []
+    for name, url in backends.items():
+        engine = await open_backend(name, url)
+        if engine is None:
+            continue
+        factory = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        try:
+            await reset_catalog(factory, size)
+            plans += await explain_all(factory, name)
+        finally:
+            await engine.dispose()
+    return QueryPlanRun(created_at=datetime.now(timezone.utc), size=size, plans=plans)
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando da verificação dos planos.
+    """
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("--backends", default=",".join(BACKENDS))
+    arguments.add_argument("--size", type=int, default=10000)
+    arguments.add_argument("--output", type=Path, default=Path("query_plans.json"))
+    args = arguments.parse_args()
+    backends = {name: BACKENDS[name] for name in args.backends.split(",")}
+    run = asyncio.run(run_all(backends, args.size))
+    args.output.write_text(run.model_dump_json(indent=2), encoding="utf-8")
+    logger.info(f"{len(run.plans)} planos gravados em {args.output}.")
+    failures = regressions(run.plans)
+    for plan in failures:
+        logger.warning(
+            f"{plan.key}: leitura completa de {', '.join(plan.full_scans)}: "
+            f"{plan.statement}"
+        )
+    if failures:
+        sys.exit(1)
+    logger.info("Todas as buscas canônicas usam índices.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Módulo do benchmark dos repositórios.
+
+Mede as operações de `BaseRepository` (via `CarRepository`) em cada banco
+disponível e em vários tamanhos de catálogo:
+
+- operações unitárias: `create`, `get_one`, `search`, `update` e `delete`;
+- operações em lote: `create_many`, `search` paginado, `update_many` e
+  `delete_many`, com `batch` carros por operação.
+
+Antes de cada tamanho, as tabelas são recriadas e populadas com o catálogo
+sintético (`mcp_car_agent.ingestion.synthetic`), sempre com a mesma semente.
+O SQLite em memória é sempre medido; PostgreSQL e MySQL apenas se
+`BENCHMARK_POSTGRES_URL` / `BENCHMARK_MYSQL_URL` estiverem configurados e o
+banco (e o driver) estiverem acessíveis.
+
+Uso:
+    python -m mcp_car_agent.benchmarks.repository run --sizes 1000,10000 \\
+        --output base.json
+    python -m mcp_car_agent.benchmarks.repository compare base.json atual.json
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mcp_car_agent.benchmarks import stats
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.models import CarModel
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.schemas.benchmark_schema import BenchmarkResult, BenchmarkRun
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.engine_schema import Engine
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+from mcp_car_agent.ingestion.bulk import BulkImporter
+from mcp_car_agent.ingestion.synthetic import CatalogGenerator
+
+BACKENDS = {
+    "sqlite": "sqlite+aiosqlite:///:memory:",
+    "postgresql": config.BENCHMARK_POSTGRES_URL,
+    "mysql": config.BENCHMARK_MYSQL_URL,
+}
+"""
+Bancos medidos e as suas URLs; URLs vazias são ignoradas.
+"""
+
+SAMPLE_SIZE = 1000
+"""
+Número de carros do catálogo usados para sortear os IDs e os nomes buscados.
+"""
+
+
+async def open_backend(name: str, url: str) -> Optional[AsyncEngine]:
+    """
+    Cria o motor de um banco, se ele estiver configurado e acessível.
+
+    Args:
+        name (str): O nome do banco (para o log).
+        url (str): A URL do SQLAlchemy.
+
+    Returns:
+        Optional[AsyncEngine]: O motor, ou `None` se o banco não puder ser usado.
+    """
+    if not url:
+        return None
+    try:
+        engine = create_async_engine(url)
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except (ImportError, OSError, SQLAlchemyError) as error:
+        logger.warning(f"{name}: banco indisponível, ignorado ({error}).")
+        return None
+    return engine
+
+
+async def reset_catalog(session_factory: async_sessionmaker, size: int, seed: int = 0):
+    """
+    Recria as tabelas e carrega o catálogo sintético com `size` carros.
+
+    Args:
+        session_factory (async_sessionmaker): A fábrica de sessões do banco.
+        size (int): O número de carros (ao menos um, para que haja dimensões).
+        seed (int): Semente do catálogo.
+    """
+    engine = session_factory.kw["bind"]
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.drop_all)
+        await connection.run_sync(SQLModel.metadata.create_all)
+    cars = CatalogGenerator(seed).cars(max(size, 1))
+    await BulkImporter(session_factory).load(cars)
+
+
+class RepositoryBenchmark:
+    """
+    Mede as operações do repositório de carros em um banco.
+
+    Args:
+        session_factory (async_sessionmaker): A fábrica de sessões do banco.
+        batch (int): Carros por operação em lote.
+        seed (int): Semente do catálogo e dos sorteios.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker, batch: int = 100, seed: int = 0
+    ):
+        self.session_factory = session_factory
+        self.batch = batch
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._sample: List[Car] = []
+        self._created: List[int] = []
+        self._batches: List[List[Car]] = []
+
+    def operations(self) -> List[Tuple[str, int, Callable]]:
+        """
+        As operações medidas, em ordem: nome, carros por operação e a função.
+
+        A ordem importa: `update` e `delete` usam os carros criados por
+        `create` (e o mesmo para as operações em lote), de modo que o catálogo
+        termina com o tamanho inicial.
+        """
+        return [
+            ("create", 1, self._create),
+            ("get_one", 1, self._get_one),
+            ("search", 1, self._search),
+            ("update", 1, self._update),
+            ("delete", 1, self._delete),
+            ("create_many", self.batch, self._create_many),
+            ("search_page", self.batch, self._search_page),
+            ("update_many", self.batch, self._update_many),
+            ("delete_many", self.batch, self._delete_many),
+        ]
+
+    async def run(
+        self, backend: str, size: int, iterations: int = 100
+    ) -> List[BenchmarkResult]:
+        """
+        Popula o banco com `size` carros e mede todas as operações.
+
+        Args:
+            backend (str): O nome do banco, para os resultados.
+            size (int): O número de carros do catálogo.
+            iterations (int): Execuções de cada operação.
+
+        Returns:
+            List[BenchmarkResult]: Um resultado por operação.
+        """
+        await self._populate(size)
+        results = []
+        for operation, rows_per_op, call in self.operations():
+            latencies = await stats.measure(call, iterations)
+            labels = {
+                "backend": backend,
+                "size": size,
+                "operation": operation,
+                "rows_per_op": rows_per_op,
+            }
+            results.append(stats.summarize(labels, latencies))
+            logger.info(
+                f"{backend}/{size}/{operation}: {results[-1].ops_per_sec:.1f} ops/s, "
+                f"p95 {results[-1].p95_ms:.2f} ms"
+            )
+        return results
+
+    async def _populate(self, size: int):
+        """
+        Recria as tabelas, carrega o catálogo sintético e sorteia a amostra.
+        """
+        await reset_catalog(self.session_factory, size, self.seed)
+        async with self.session_factory() as session:
+            query = select(CarModel).order_by(CarModel.id).limit(SAMPLE_SIZE)
+            self._sample = [
+                Car(
+                    id=row.id,
+                    name=row.name,
+                    engine=Engine(id=row.engine_id),
+                    transmission=Transmission(id=row.transmission_id, gearbox_type="-"),
+                    manufacturer=Manufacturer(id=row.manufacturer_id, name="-"),
+                )
+                for row in (await session.exec(query)).all()
+            ]
+
+    def _new_car(self) -> Car:
+        """
+        Um carro novo com as dimensões de um carro da amostra.
+        """
+        base = self._rng.choice(self._sample)
+        return base.model_copy(
+            update={"id": None, "name": "Benchmark", "version": str(self._rng.random())}
+        )
+
+    async def _create(self):
+        async with self.session_factory() as session:
+            car = await CarRepository(session).create(self._new_car())
+        self._created.append(car.id)
+
+    async def _get_one(self):
+        async with self.session_factory() as session:
+            await CarRepository(session).get_one(
+                {"id": self._rng.choice(self._sample).id}
+            )
+
+    async def _search(self):
+        async with self.session_factory() as session:
+            name = self._rng.choice(self._sample).name
+            await CarRepository(session).search(filters={"name": name}, limit=20)
+
+    async def _update(self):
+        _id = self._created[self._rng.randrange(len(self._created))]
+        async with self.session_factory() as session:
+            await CarRepository(session).update(
+                Car(version=str(self._rng.random())), _id
+            )
+
+    async def _delete(self):
+        async with self.session_factory() as session:
+            await CarRepository(session).delete(self._created.pop())
+
+    async def _create_many(self):
+        cars = [self._new_car() for _ in range(self.batch)]
+        async with self.session_factory() as session:
+            self._batches.append(await CarRepository(session).create_many(cars))
+
+    async def _search_page(self):
+        async with self.session_factory() as session:
+            await CarRepository(session).search(
+                order_by="year",
+                offset=self._rng.randrange(max(1, len(self._sample))),
+                limit=self.batch,
+            )
+
+    async def _update_many(self):
+        cars = self._batches[self._rng.randrange(len(self._batches))]
+        for car in cars:
+            car.version = str(self._rng.random())
+        async with self.session_factory() as session:
+            await CarRepository(session).update_many(cars)
+
+    async def _delete_many(self):
+        ids = [car.id for car in self._batches.pop()]
+        async with self.session_factory() as session:
+            await CarRepository(session).delete_many(ids)
+
+
+async def _run_backend(
+    engine: AsyncEngine, name: str, sizes: List[int], iterations: int, batch: int
+) -> List[BenchmarkResult]:
+    """
+    Executa o benchmark em um banco, em cada tamanho, e remove as tabelas ao final.
+    """
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    results = []
+    try:
+        for size in sizes:
+            benchmark = RepositoryBenchmark(factory, batch)
+            results += await benchmark.run(name, size, iterations)
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.drop_all)
+        await engine.dispose()
+    return results
+
+
+async def run_all(
+    backends: Dict[str, str], sizes: List[int], iterations: int, batch: int
+) -> BenchmarkRun:
+    """
+    Executa o benchmark em cada banco disponível e em cada tamanho.
+
+    Args:
+        backends (Dict[str, str]): Os bancos e as suas URLs.
+        sizes (List[int]): Os tamanhos do catálogo.
+        iterations (int): Execuções de cada operação.
+        batch (int): Carros por operação em lote.
+
+    Returns:
+        BenchmarkRun: Os resultados de todos os bancos e tamanhos.
+    """
+    results = []
+    for name, url in backends.items():
+        engine = await open_backend(name, url)
+        if engine is not None:
+            results += await _run_backend(engine, name, sizes, iterations, batch)
+    return stats.new_run(results)
+
+
+def _run(args: argparse.Namespace):
+    backends = {name: BACKENDS[name] for name in args.backends.split(",")}
+    sizes = [int(size) for size in args.sizes.split(",")]
+    run = asyncio.run(run_all(backends, sizes, args.iterations, args.batch))
+    stats.save(run, args.output)
+    logger.info(f"{len(run.results)} resultados gravados em {args.output}.")
+
+
+def _compare(args: argparse.Namespace):
+    regressions = stats.compare(
+        stats.load(args.baseline), stats.load(args.current), args.threshold
+    )
+    for regression in regressions:
+        logger.warning(
+            f"{regression.key} {regression.metric}: {regression.baseline:.2f} -> "
+            f"{regression.current:.2f} ({regression.change:+.1%})"
+        )
+    if regressions:
+        sys.exit(1)
+    logger.info("Nenhuma regressão acima do limite.")
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando do benchmark.
+    """
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = arguments.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Executa o benchmark.")
+    run.add_argument("--backends", default=",".join(BACKENDS))
+    run.add_argument("--sizes", default="1000,10000")
+    run.add_argument("--iterations", type=int, default=100)
+    run.add_argument("--batch", type=int, default=100)
+    run.add_argument("--output", type=Path, default=Path("benchmark.json"))
+    run.set_defaults(handler=_run)
+    compare = commands.add_parser("compare", help="Compara duas execuções.")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--threshold", type=float, default=config.BENCHMARK_THRESHOLD)
+    compare.set_defaults(handler=_compare)
+    args = arguments.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Módulo das medições e comparações dos benchmarks.
+
+Cada operação é executada várias vezes; de cada execução guarda-se a
+latência, e do conjunto, a vazão (operações por segundo) e os percentis
+p50/p95/p99. Os resultados são gravados em JSON (`BenchmarkRun`) para que
+duas execuções possam ser comparadas.
+"""
+
+import math
+import platform
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Sequence
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.schemas.benchmark_schema import (
+    BenchmarkResult,
+    BenchmarkRun,
+    Regression,
+)
+
+LOWER_IS_WORSE = ("ops_per_sec",)
+HIGHER_IS_WORSE = ("p95_ms", "p99_ms")
+"""
+Métricas comparadas e o sentido em que uma variação é uma regressão. O p50
+fica de fora: ele acompanha a vazão e só duplicaria o alerta.
+"""
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    O percentil `q` (0-100) pelo método do posto mais próximo.
+
+    Args:
+        values (Sequence[float]): Os valores (não vazio).
+        q (float): O percentil.
+
+    Returns:
+        float: O menor valor com pelo menos `q`% dos valores menores ou iguais.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+async def measure(operation: Callable[[], Awaitable], times: int) -> List[float]:
+    """
+    Executa a operação várias vezes, em sequência.
+
+    Args:
+        operation (Callable[[], Awaitable]): A operação (uma nova corrotina por
+            chamada).
+        times (int): O número de execuções.
+
+    Returns:
+        List[float]: A latência de cada execução, em segundos.
+    """
+    latencies = []
+    for _ in range(times):
+        started = time.perf_counter()
+        await operation()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def summarize(labels: Dict, latencies: Sequence[float]) -> BenchmarkResult:
+    """
+    Resume as latências de uma operação.
+
+    Args:
+        labels (Dict): `backend`, `size`, `operation` e `rows_per_op`.
+        latencies (Sequence[float]): As latências, em segundos.
+
+    Returns:
+        BenchmarkResult: A vazão e os percentis, em milissegundos.
+    """
+    total = sum(latencies)
+    return BenchmarkResult(
+        **labels,
+        ops=len(latencies),
+        ops_per_sec=len(latencies) / total if total else 0.0,
+        p50_ms=percentile(latencies, 50) * 1000,
+        p95_ms=percentile(latencies, 95) * 1000,
+        p99_ms=percentile(latencies, 99) * 1000,
+    )
+
+
+def new_run(results: List[BenchmarkResult]) -> BenchmarkRun:
+    """
+    Agrupa os resultados de uma execução, com a data e a versão do Python.
+    """
+    return BenchmarkRun(
+        created_at=datetime.now(timezone.utc),
+        python=platform.python_version(),
+        results=results,
+    )
+
+
+def save(run: BenchmarkRun, path: Path):
+    """
+    Grava os resultados em JSON.
+    """
+    Path(path).write_text(run.model_dump_json(indent=2), encoding="utf-8")
+
+
+def load(path: Path) -> BenchmarkRun:
+    """
+    Lê os resultados gravados por `save`.
+    """
+    return BenchmarkRun.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+def _change(baseline: float, current: float) -> float:
+    return (current - baseline) / baseline if baseline else 0.0
+
+
+def compare(
+    baseline: BenchmarkRun,
+    current: BenchmarkRun,
+    threshold: float = config.BENCHMARK_THRESHOLD,
+) -> List[Regression]:
+    """
+    Aponta as métricas que pioraram mais que o limite entre duas execuções.
+
+    Apenas as operações presentes nas duas execuções são comparadas.
+
+    Args:
+        baseline (BenchmarkRun): A execução de referência.
+        current (BenchmarkRun): A execução avaliada.
+        threshold (float): A piora relativa tolerada (ex: 0.10 = 10%).
+
+    Returns:
+        List[Regression]: As regressões encontradas.
+    """
+    previous = {result.key: result for result in baseline.results}
+    regressions = []
+    for result in current.results:
+        if result.key not in previous:
+            continue
+        for metric in LOWER_IS_WORSE + HIGHER_IS_WORSE:
+            before, after = getattr(previous[result.key], metric), getattr(
+                result, metric
+            )
+            change = _change(before, after)
+            if (metric in LOWER_IS_WORSE and change < -threshold) or (
+                metric in HIGHER_IS_WORSE and change > threshold
+            ):
+                regressions.append(
+                    Regression(
+                        key=result.key,
+                        metric=metric,
+                        baseline=before,
+                        current=after,
+                        change=change,
+                    )
+                )
+    return regressions
@@ -14,18 +14,19 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-DB_ENGINE = os.getenv("DB_ENGINE")
+DB_ENGINE = os.getenv("DB_ENGINE", "POSTGRESQL")
 """
-Motor do banco de dados a ser utilizado (ex: 'POSTGRESQL').
+Motor do banco de dados a ser utilizado: 'POSTGRESQL', 'MYSQL' (como no
+`docker/docker-compose.yml`) ou 'SQLITE' (com `DB_NAME` sendo o arquivo).
 """
 
 DB_USER = os.getenv("DB_USER")
 """
 Nome de usuário para o banco de dados.
 """
-DB_PWD = os.getenv("DB_PWD")
+DB_PWD = os.getenv("DB_PWD", os.getenv("DB_USER_PWD"))
 """
-Senha para o banco de dados.
+Senha para o banco de dados (ou `DB_USER_PWD`, a variável do docker-compose).
 """
 DB_HOST = os.getenv("DB_HOST")
 """
@@ -33,9 +34,302 @@ Host do servidor do banco de dados.
 """
 DB_PORT = os.getenv("DB_PORT")
 """
-Porta do servidor do banco de dados.
+Porta do servidor do banco de dados. Vazia: a porta padrão do banco.
 """
-DB_NAME = os.getenv("DB_NAME")
+DB_NAME = os.getenv("DB_NAME", os.getenv("DB_SCHEMA"))
 """
-Nome do banco de dados.
+Nome do banco de dados (ou `DB_SCHEMA`, a variável do docker-compose).
+"""
+
+DB_REPLICA_HOSTS = [
+    host.strip()
+    for host in os.getenv("DB_REPLICA_HOSTS", "").split(",")
+    if host.strip()
+]
+"""
+Réplicas de leitura do banco (`host` ou `host:porta`, separadas por vírgula),
+com o mesmo usuário, senha e nome do primário. Vazio: tudo vai ao primário.
+"""
+
+DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "5"))
+"""
+Intervalo, em segundos, entre as verificações de saúde das réplicas.
+"""
+
+DB_STATEMENT_TIMEOUT = float(os.getenv("DB_STATEMENT_TIMEOUT", "30"))
+"""
+Prazo máximo, em segundos, das consultas disparadas por cada chamada de ferramenta MCP.
+"""
+
+MCP_BATCH_CONCURRENCY = int(os.getenv("MCP_BATCH_CONCURRENCY", "5"))
+"""
+Número máximo de consultas de um lote executadas em paralelo (uma sessão do pool cada).
+"""
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+"""
+Número de conexões mantidas no pool de cada processo.
+"""
+
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+"""
+Número de conexões extras que o pool de cada processo pode abrir em picos.
+"""
+
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true")
+"""
+Escreve todo statement SQL no log do SQLAlchemy. Apenas para depuração local:
+em produção, use a instrumentação (`DB_SLOW_QUERY_SECONDS`).
+"""
+
+DB_SLOW_QUERY_SECONDS = float(os.getenv("DB_SLOW_QUERY_SECONDS", "0.5"))
+"""
+Latência, em segundos, a partir da qual um statement SQL é registrado no log
+como consulta lenta.
+"""
+
+DB_N_PLUS_ONE_MODE = os.getenv("DB_N_PLUS_ONE_MODE", "warn").lower()
+"""
+Reação ao padrão N+1 em uma requisição: `warn` (registra no log), `raise`
+(lança `NPlusOneError`, usado nos testes) ou `off` (desliga a detecção).
+"""
+
+DB_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "5"))
+"""
+Número de execuções do mesmo statement (diferindo apenas nos parâmetros) em
+uma requisição a partir do qual ela é considerada um N+1.
+"""
+
+DB_CONNECTION_BUDGET = int(os.getenv("DB_CONNECTION_BUDGET", "20"))
+"""
+Total de conexões ao banco permitidas para o servidor, dividido entre os workers
+e a folga de um worker para o reload (ver `mcp_car_agent.server.supervisor`).
+"""
+
+MCP_HOST = os.getenv("MCP_HOST", "127.0.0.1")
+"""
+Endereço em que o servidor MCP escuta no modo HTTP.
+"""
+
+MCP_PORT = int(os.getenv("MCP_PORT", "8000"))
+"""
+Porta em que o servidor MCP escuta no modo HTTP.
+"""
+
+MCP_WORKERS = int(os.getenv("MCP_WORKERS", "1"))
+"""
+Número de processos worker do servidor MCP. Com mais de um, o servidor roda
+em modo HTTP, com os workers compartilhando o socket de escuta.
+"""
+
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+"""
+Endereço em que o endpoint `/metrics` escuta. Por padrão, só local: as
+métricas expõem nomes de métodos e statements e não devem ficar públicas
+junto com o servidor MCP.
+"""
+
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9464"))
+"""
+Porta do endpoint `/metrics`, no formato do Prometheus; 0 desliga. No modo
+HTTP com vários workers, o worker do posto `i` usa `METRICS_PORT + i`, de
+modo que cada um é coletado separadamente.
+"""
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+"""
+Fração das chamadas de ferramentas rastreadas (ver
+`mcp_car_agent.core.services.tracing`): 0 desliga, 1 rastreia todas.
+"""
+
+TRACE_EXPORT = os.getenv("TRACE_EXPORT", "traces.jsonl")
+"""
+Destino dos traces, no formato JSON do OTLP: um arquivo (uma linha por trace)
+ou a URL de um coletor OTLP/HTTP (ex: `http://localhost:4318/v1/traces`).
+"""
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+"""
+Diretório dos perfis de CPU e snapshots de memória gravados sob demanda (ver
+`mcp_car_agent.server.profiling`).
+"""
+
+PROFILE_SECONDS = float(os.getenv("PROFILE_SECONDS", "30"))
+"""
+Duração máxima, em segundos, de um perfil de CPU ligado por `SIGUSR1`.
+"""
+
+PROFILE_REQUESTS = int(os.getenv("PROFILE_REQUESTS", "0"))
+"""
+Número de chamadas de ferramentas após o qual o perfil de CPU termina; 0
+limita o perfil apenas pela duração.
+"""
+
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+"""
+Intervalo, em segundos, entre as amostras do profiler de CPU.
+"""
+
+CACHE_INVALIDATION_BUS = os.getenv("CACHE_INVALIDATION_BUS", "memory")
+"""
+Barramento de invalidação de cache: 'memory' (um único nó) ou 'postgresql'
+(LISTEN/NOTIFY, para vários nós compartilhando o banco).
+"""
+
+CACHE_INVALIDATION_CHECK_INTERVAL = float(
+    os.getenv("CACHE_INVALIDATION_CHECK_INTERVAL", "5")
+)
+"""
+Intervalo, em segundos, da verificação da conexão do LISTEN do barramento
+'postgresql'. Uma conexão perdida é refeita e todos os caches são invalidados.
+"""
+
+SCRAPER_MAX_CONNECTIONS = int(os.getenv("SCRAPER_MAX_CONNECTIONS", "32"))
+"""
+Número máximo de conexões HTTP abertas (e mantidas em keep-alive) pelo scraper.
+"""
+
+SCRAPER_HOST_CONCURRENCY = int(os.getenv("SCRAPER_HOST_CONCURRENCY", "4"))
+"""
+Número máximo de requisições simultâneas do scraper a um mesmo host.
+"""
+
+SCRAPER_HOST_RATE = float(os.getenv("SCRAPER_HOST_RATE", "5"))
+"""
+Número máximo de requisições por segundo do scraper a um mesmo host.
+"""
+
+SCRAPER_RETRIES = int(os.getenv("SCRAPER_RETRIES", "3"))
+"""
+Número de novas tentativas do scraper para falhas transitórias.
+"""
+
+SCRAPER_BACKOFF = float(os.getenv("SCRAPER_BACKOFF", "0.5"))
+"""
+Espera base, em segundos, do backoff exponencial entre tentativas do scraper.
+"""
+
+SCRAPER_TIMEOUT = float(os.getenv("SCRAPER_TIMEOUT", "20"))
+"""
+Timeout, em segundos, de cada requisição HTTP do scraper.
+"""
+
+SCRAPER_USER_AGENT = os.getenv("SCRAPER_USER_AGENT", "mcp-car-agent/1.0")
+"""
+User-Agent enviado pelo scraper, identificando o projeto aos sites de origem.
+"""
+
+PARSER_WORKERS = int(os.getenv("PARSER_WORKERS", str(os.cpu_count() or 1)))
+"""
+Número de processos usados para interpretar o HTML das páginas obtidas pelo scraper.
+"""
+
+SCRAPER_CACHE_DIR = os.getenv("SCRAPER_CACHE_DIR")
+"""
+Diretório do cache em disco das respostas do scraper. Sem ele, o cache fica
+desativado.
+"""
+
+SCRAPER_CACHE_MAX_BYTES = int(os.getenv("SCRAPER_CACHE_MAX_BYTES", str(1024**3)))
+"""
+Tamanho máximo, em bytes (já comprimidos), do cache em disco do scraper. Acima
+dele, as respostas usadas há mais tempo são descartadas.
+"""
+
+SCRAPER_OFFLINE = os.getenv("SCRAPER_OFFLINE", "false").lower() in ("1", "true")
+"""
+Modo somente replay: o scraper responde apenas a partir do cache em disco,
+sem nenhum acesso à rede.
+"""
+
+INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", "64"))
+"""
+Capacidade de cada fila entre as etapas do pipeline de ingestão. Filas cheias
+fazem as etapas anteriores esperarem, limitando a memória usada.
+"""
+
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "200"))
+"""
+Número de carros gravados no banco por lote pelo pipeline de ingestão.
+"""
+
+INGEST_PARSE_CONCURRENCY = int(
+    os.getenv("INGEST_PARSE_CONCURRENCY", str(PARSER_WORKERS))
+)
+"""
+Número de páginas enviadas ao mesmo tempo para o pool de interpretação.
+"""
+
+INGEST_REPORT_INTERVAL = float(os.getenv("INGEST_REPORT_INTERVAL", "10"))
+"""
+Intervalo, em segundos, entre os relatórios de vazão e profundidade das filas.
+"""
+
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "5000"))
+"""
+Número de carros enviados por vez às tabelas de staging da importação em massa.
+"""
+
+BULK_LOCK_TIMEOUT = int(os.getenv("BULK_LOCK_TIMEOUT", "300"))
+"""
+Tempo máximo, em segundos, que uma importação em massa no MySQL espera pelo
+lock da numeração dos carros enquanto outra importação está em andamento.
+"""
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+"""
+Número de linhas buscadas por vez no cursor do servidor durante a exportação
+(e gravadas por vez no arquivo).
+"""
+
+EXPORT_DIR = os.getenv("EXPORT_DIR", "exports")
+"""
+Diretório onde a ferramenta MCP de exportação grava os arquivos.
+"""
+
+EXPORT_TIMEOUT = float(os.getenv("EXPORT_TIMEOUT", "600"))
+"""
+Prazo, em segundos, de uma exportação pela ferramenta `export_cars`. É separado
+de `DB_STATEMENT_TIMEOUT` porque a exportação percorre toda a fatia do catálogo;
+as exportações pela linha de comando não têm prazo.
+"""
+
+CHANGE_LOG_GAP_TIMEOUT = float(os.getenv("CHANGE_LOG_GAP_TIMEOUT", "600"))
+"""
+Tempo, em segundos, durante o qual uma versão pulada do `change_log` continua
+sendo procurada. Deve ser maior que a transação de escrita mais longa; depois
+dele, a versão é tida como de uma transação desfeita.
+"""
+
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "")
+"""
+Arquivo do snapshot do catálogo carregado na inicialização do servidor (ver
+`mcp_car_agent.core.services.snapshot`). Vazio ou inexistente: o warm-up lê
+tudo do banco.
+"""
+
+WARM_UP_RETRY_BACKOFF = float(os.getenv("WARM_UP_RETRY_BACKOFF", "1"))
+WARM_UP_RETRY_BACKOFF_MAX = float(os.getenv("WARM_UP_RETRY_BACKOFF_MAX", "60"))
+"""
+Espera, em segundos, antes de repetir a inicialização do worker HTTP quando
+ela falha (ex: banco fora do ar no boot): dobra a cada falha, até o máximo.
+"""
+
+BENCHMARK_POSTGRES_URL = os.getenv("BENCHMARK_POSTGRES_URL", "")
+"""
+URL (SQLAlchemy, driver asyncpg) de um PostgreSQL descartável para os
+benchmarks. As tabelas são recriadas: nunca aponte para o banco da aplicação.
+Vazio: o PostgreSQL não é medido.
+"""
+
+BENCHMARK_MYSQL_URL = os.getenv("BENCHMARK_MYSQL_URL", "")
+"""
+URL (SQLAlchemy, driver aiomysql) de um MySQL descartável para os benchmarks.
+Vazio: o MySQL não é medido.
+"""
+
+BENCHMARK_THRESHOLD = float(os.getenv("BENCHMARK_THRESHOLD", "0.10"))
+"""
+Piora relativa (ex: 0.10 = 10%) a partir da qual a comparação de dois
+benchmarks aponta uma regressão.
 """
@@ -0,0 +1,215 @@
+"""
+Módulo do registro de alterações (change log) do catálogo.
+
+Toda escrita grava, na mesma transação, uma linha `(version, table_name,
+row_id)` em `change_log` para cada registro criado, alterado ou excluído.
+`version` é crescente, de modo que um nó que carregou um snapshot na versão N
+alcança o banco lendo apenas as alterações com versão maior que N (ver
+`mcp_car_agent.core.services.snapshot`).
+
+A versão é atribuída no INSERT, mas só fica visível no commit: uma transação
+longa pode confirmar a versão 10 depois que a 11 já foi lida. Por isso, quem
+lê o `change_log` guarda as versões puladas abaixo da maior já lida (as
+lacunas) e as lê de novo nas chamadas seguintes (ver `ChangeCursor`).
+Versões de transações desfeitas nunca aparecem e são descartadas após
+`config.CHANGE_LOG_GAP_TIMEOUT`.
+
+As alterações só interessam a quem parte de um snapshot: cada nova geração do
+snapshot exclui as anteriores à geração substituída (ver `prune`).
+"""
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Set, Tuple
+
+from sqlalchemy import (
+    ColumnElement,
+    String,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+)
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.models import ChangeLogModel
+
+COLUMNS = ["table_name", "row_id"]
+
+TABLE_ROW = 0
+"""
+`row_id` das alterações que valem para a tabela inteira (ex: a importação em
+massa, que cria milhões de linhas); quem lê o `change_log` relê a tabela.
+"""
+
+GAP_SCAN = 10_000
+"""
+Número de versões anteriores à de um snapshot em que as lacunas são procuradas.
+"""
+
+
+def log_ids(table: str, ids: Iterable[int]):
+    """
+    INSERT das alterações de registros com IDs conhecidos.
+
+    Args:
+        table (str): O nome da tabela alterada.
+        ids (Iterable[int]): Os IDs dos registros (não vazio).
+    """
+    return insert(ChangeLogModel).values(
+        [{"table_name": table, "row_id": _id} for _id in ids]
+    )
+
+
+def log_table(table: str):
+    """
+    INSERT de uma alteração da tabela inteira (ver `TABLE_ROW`).
+
+    Args:
+        table (str): O nome da tabela alterada.
+    """
+    return log_ids(table, [TABLE_ROW])
+
+
+def log_select(table: str, id_column: ColumnElement, *conditions):
+    """
+    INSERT ... SELECT das alterações de registros selecionados no banco (ex:
+    as linhas criadas por um INSERT ... SELECT da importação em massa).
+
+    Args:
+        table (str): O nome da tabela alterada.
+        id_column (ColumnElement): A coluna de ID da tabela.
+        *conditions: As condições que selecionam os registros alterados.
+    """
+    query = select(literal(table, String), id_column).where(*conditions)
+    return insert(ChangeLogModel).from_select(COLUMNS, query)
+
+
+async def current_version(session: AsyncSession) -> int:
+    """
+    A versão da última escrita registrada (0 se não houver nenhuma).
+    """
+    query = select(func.coalesce(func.max(ChangeLogModel.version), 0))
+    return (await session.exec(query)).scalar_one()
+
+
+async def gaps_before(session: AsyncSession, version: int) -> Set[int]:
+    """
+    As lacunas entre as `GAP_SCAN` versões que antecedem uma versão, isto é,
+    as escritas que ainda não tinham sido confirmadas (ou foram desfeitas).
+
+    Args:
+        session (AsyncSession): A sessão do banco.
+        version (int): A versão a partir da qual as anteriores são verificadas.
+
+    Returns:
+        Set[int]: As versões ausentes.
+    """
+    query = select(ChangeLogModel.version).where(
+        ChangeLogModel.version > version - GAP_SCAN,
+        ChangeLogModel.version <= version,
+    )
+    seen = set((await session.exec(query)).scalars())
+    return set(range(min(seen, default=version), version)) - seen
+
+
+async def changes_since(
+    session: AsyncSession, version: int, gaps: Iterable[int] = ()
+) -> Tuple[int, Dict[str, Set[int]], Set[int]]:
+    """
+    Lê as alterações posteriores a uma versão e as das lacunas informadas.
+
+    Args:
+        session (AsyncSession): A sessão do banco.
+        version (int): A maior versão já aplicada.
+        gaps (Iterable[int]): As versões abaixo de `version` ainda não vistas.
+
+    Returns:
+        Tuple[int, Dict[str, Set[int]], Set[int]]: A versão mais recente lida,
+        os IDs alterados por tabela e as lacunas que continuam sem aparecer
+        (as informadas e as puladas nesta leitura).
+    """
+    gaps = set(gaps)
+    query = (
+        select(ChangeLogModel.version, ChangeLogModel.table_name, ChangeLogModel.row_id)
+        .where(or_(ChangeLogModel.version > version, ChangeLogModel.version.in_(gaps)))
+        .order_by(ChangeLogModel.version)
+    )
+    latest, changes = version, defaultdict(set)
+    for row in (await session.exec(query)).all():
+        if row.version > latest:
+            gaps.update(range(latest + 1, row.version))
+            latest = row.version
+        gaps.discard(row.version)
+        changes[row.table_name].add(row.row_id)
+    return latest, dict(changes), gaps
+
+
+async def prune(session: AsyncSession, version: int) -> int:
+    """
+    Exclui as alterações que nenhum leitor de um snapshot da versão `version`
+    (ou mais recente) lê mais: as anteriores às `GAP_SCAN` versões em que as
+    lacunas do snapshot são procuradas.
+
+    Args:
+        session (AsyncSession): A sessão do banco.
+        version (int): A versão do snapshot mais antigo ainda em uso.
+
+    Returns:
+        int: O número de alterações excluídas.
+    """
+    statement = delete(ChangeLogModel).where(
+        ChangeLogModel.version <= version - GAP_SCAN
+    )
+    result = await session.exec(statement)
+    await session.commit()
+    return result.rowcount
+
+
+@dataclass(frozen=True)
+class ChangeCursor:
+    """
+    Posição de leitura do `change_log`: a maior versão aplicada e as lacunas
+    abaixo dela, com o instante (`time.monotonic`) em que cada uma foi notada.
+    """
+
+    version: int
+    gaps: Dict[int, float] = field(default_factory=dict)
+
+    @classmethod
+    def at(cls, version: int, gaps: Iterable[int] = ()) -> "ChangeCursor":
+        """
+        Cria o cursor de uma versão (ex: a de um snapshot) e das suas lacunas.
+        """
+        return cls(version, dict.fromkeys(gaps, time.monotonic()))
+
+    async def read(
+        self, session: AsyncSession
+    ) -> Tuple["ChangeCursor", Dict[str, Set[int]]]:
+        """
+        Lê as alterações posteriores ao cursor e as das lacunas.
+
+        As lacunas procuradas há mais de `config.CHANGE_LOG_GAP_TIMEOUT`
+        segundos são descartadas.
+
+        Args:
+            session (AsyncSession): A sessão do banco.
+
+        Returns:
+            Tuple[ChangeCursor, Dict[str, Set[int]]]: O cursor após a leitura,
+            a ser usado depois que as alterações forem aplicadas, e os IDs
+            alterados por tabela.
+        """
+        version, changes, gaps = await changes_since(session, self.version, self.gaps)
+        now = time.monotonic()
+        noticed = {gap: self.gaps.get(gap, now) for gap in gaps}
+        pending = {
+            gap: since
+            for gap, since in noticed.items()
+            if now - since < config.CHANGE_LOG_GAP_TIMEOUT
+        }
+        return ChangeCursor(version, pending), changes
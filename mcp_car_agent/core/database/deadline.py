@@ -0,0 +1,268 @@
+"""
+Módulo de prazos (deadlines) para consultas ao banco de dados.
+
+Permite definir, por chamada, um tempo máximo para as consultas executadas
+pelos repositórios. O prazo é propagado via `contextvars`, de modo que a
+camada que recebe a requisição (ex: uma ferramenta MCP) define o limite e os
+repositórios o respeitam sem alterar suas assinaturas.
+
+Quando há um prazo ativo, o tempo restante é repassado ao servidor como
+timeout de statement (`statement_timeout` no PostgreSQL e o hint
+`MAX_EXECUTION_TIME` no MySQL). O `statement_timeout` vale para a transação
+inteira, então é restaurado logo após a consulta, para não limitar os
+statements seguintes da mesma transação (ex: escritas sem prazo). Se a task
+asyncio for cancelada ou o prazo expirar, a consulta em andamento é cancelada
+no servidor e a conexão é descartada, liberando CPU do banco e o slot do pool.
+
+Leituras com cursor no servidor (`stream_with_deadline`, usada nas
+exportações) seguem as mesmas regras, com o prazo valendo para a leitura
+inteira.
+"""
+
+import asyncio
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import RowMapping, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mcp_car_agent.core.database.n_plus_one import IGNORE_OPTION
+
+_deadline: ContextVar[Optional[float]] = ContextVar("db_deadline", default=None)
+
+TIMEOUT_GRANULARITY_MS = 100
+"""
+Granularidade (em ms) do timeout enviado ao servidor. O valor é arredondado
+para cima para limitar o número de variações do statement compilado em cache.
+"""
+
+
+@dataclass(frozen=True)
+class DialectTimeouts:
+    """
+    Comandos específicos de cada dialeto para aplicar timeouts e cancelar
+    consultas em andamento.
+    """
+
+    backend_id_sql: str
+    cancel_sql: str
+    timeout_sql: Optional[str] = None
+    reset_sql: Optional[str] = None
+    timeout_hint: Optional[str] = None
+
+
+DIALECT_TIMEOUTS = {
+    "postgresql": DialectTimeouts(
+        backend_id_sql="SELECT pg_backend_pid()",
+        cancel_sql="SELECT pg_cancel_backend(:backend_id)",
+        timeout_sql="SELECT set_config('statement_timeout', :timeout_ms, true)",
+        reset_sql="SET LOCAL statement_timeout TO DEFAULT",
+    ),
+    "mysql": DialectTimeouts(
+        backend_id_sql="SELECT CONNECTION_ID()",
+        cancel_sql="KILL QUERY :backend_id",
+        timeout_hint="/*+ MAX_EXECUTION_TIME({timeout_ms}) */",
+    ),
+}
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Define um prazo para as consultas executadas dentro do bloco.
+
+    Prazos aninhados nunca estendem o prazo externo: vale sempre o menor.
+
+    Args:
+        seconds (float): Tempo máximo, em segundos, a partir de agora.
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Retorna o tempo restante, em segundos, do prazo corrente.
+
+    Returns:
+        Optional[float]: O tempo restante ou `None` se não houver prazo ativo.
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+async def _arm(
+    session: AsyncSession,
+    statement: Any,
+    timeouts: DialectTimeouts,
+    seconds: Optional[float],
+):
+    """
+    Obtém a conexão que executará o statement (a de uma réplica, se for o
+    caso) e o seu identificador no servidor e, havendo prazo, aplica o
+    timeout do dialeto ao statement. O identificador fica em cache no `info`
+    da conexão física, custando uma única ida ao banco por conexão do pool.
+    """
+    connection = await session.connection(bind_arguments={"clause": statement})
+    if "backend_id" not in connection.info:
+        result = await connection.execute(text(timeouts.backend_id_sql))
+        connection.info["backend_id"] = result.scalar()
+    if seconds is None:
+        return statement, connection
+
+    timeout_ms = (
+        math.ceil(seconds * 1000 / TIMEOUT_GRANULARITY_MS) * TIMEOUT_GRANULARITY_MS
+    )
+    if timeouts.timeout_sql:
+        await connection.execute(
+            text(timeouts.timeout_sql).execution_options(**{IGNORE_OPTION: True}),
+            {"timeout_ms": str(timeout_ms)},
+        )
+    if timeouts.timeout_hint:
+        statement = statement.prefix_with(
+            timeouts.timeout_hint.format(timeout_ms=timeout_ms), dialect="mysql"
+        )
+    return statement, connection
+
+
+async def _disarm(connection: AsyncConnection, timeouts: DialectTimeouts):
+    """
+    Restaura o timeout da transação aplicado por `_arm`, devolvendo aos
+    statements seguintes o timeout padrão da conexão.
+    """
+    if timeouts.reset_sql:
+        await connection.execute(
+            text(timeouts.reset_sql).execution_options(**{IGNORE_OPTION: True})
+        )
+
+
+async def _cancel(
+    session: AsyncSession,
+    timeouts: Optional[DialectTimeouts],
+    armed: Optional[AsyncConnection],
+):
+    """
+    Cancela a consulta no servidor em que ela roda, usando uma conexão
+    separada, e descarta a conexão da sessão, cujo estado de protocolo é
+    desconhecido.
+    """
+    if timeouts is None:
+        await session.rollback()
+        return
+    backend_id = armed.info["backend_id"]
+    try:
+        async with armed.engine.connect() as connection:
+            await connection.execute(
+                text(timeouts.cancel_sql), {"backend_id": backend_id}
+            )
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.warning(f"Falha ao cancelar a consulta {backend_id} no servidor: {exc}")
+    await session.invalidate()
+
+
+async def _prepare(
+    session: AsyncSession, statement: Any
+) -> Tuple[Any, Optional[DialectTimeouts], Optional[AsyncConnection], Optional[float]]:
+    """
+    Verifica o prazo corrente e aplica o timeout do dialeto ao statement.
+
+    Returns:
+        Tuple: O statement, os comandos do dialeto, a conexão que o executará
+        e o tempo restante do prazo.
+
+    Raises:
+        TimeoutError: Se o prazo já tiver expirado.
+    """
+    seconds = remaining()
+    if seconds is not None and seconds <= 0:
+        raise TimeoutError("Prazo da consulta expirou antes de sua execução.")
+
+    timeouts = DIALECT_TIMEOUTS.get(session.bind.dialect.name)
+    armed = None
+    if timeouts is not None:
+        statement, armed = await _arm(session, statement, timeouts, seconds)
+    return statement, timeouts, armed, seconds
+
+
+async def exec_with_deadline(session: AsyncSession, statement: Any):
+    """
+    Executa um statement respeitando o prazo corrente e propagando o
+    cancelamento da task para o banco de dados.
+
+    Args:
+        session (AsyncSession): A sessão usada na execução.
+        statement (Any): O statement a ser executado (ex: um `select`).
+
+    Returns:
+        O resultado de `session.exec(statement)`.
+
+    Raises:
+        TimeoutError: Se o prazo já tiver expirado ou expirar durante a consulta.
+    """
+    statement, timeouts, armed, seconds = await _prepare(session, statement)
+
+    # Sem prazo ativo, `wait_for` recebe `None` e apenas propaga o cancelamento.
+    try:
+        result = await asyncio.wait_for(session.exec(statement), remaining())
+    except asyncio.TimeoutError as exc:
+        await _cancel(session, timeouts, armed)
+        raise TimeoutError(f"Consulta excedeu o prazo de {seconds:.3f}s.") from exc
+    except asyncio.CancelledError:
+        await asyncio.shield(_cancel(session, timeouts, armed))
+        raise
+    # Se a consulta falhar, a transação é desfeita e o timeout some com ela.
+    if seconds is not None and armed is not None:
+        await _disarm(armed, timeouts)
+    return result
+
+
+async def stream_with_deadline(
+    session: AsyncSession, statement: Any
+) -> AsyncIterator[RowMapping]:
+    """
+    Percorre o resultado de um statement com um cursor no servidor,
+    respeitando o prazo corrente como `exec_with_deadline`.
+
+    O timeout do dialeto limita cada ida ao servidor e o prazo limita a
+    leitura inteira, verificado a cada linha. Se o prazo expirar ou a task do
+    consumidor for cancelada, a consulta é cancelada no servidor.
+
+    Args:
+        session (AsyncSession): A sessão usada na execução.
+        statement (Any): O statement a ser executado (ex: um `select` com
+            `yield_per`).
+
+    Yields:
+        RowMapping: As colunas de cada linha, indexadas pelo nome.
+
+    Raises:
+        TimeoutError: Se o prazo já tiver expirado ou expirar durante a leitura.
+    """
+    statement, timeouts, armed, seconds = await _prepare(session, statement)
+    try:
+        result = await session.stream(statement)
+        async for row in result.mappings():
+            if seconds is not None and remaining() <= 0:
+                await _cancel(session, timeouts, armed)
+                raise TimeoutError(f"Leitura excedeu o prazo de {seconds:.3f}s.")
+            yield row
+    except asyncio.CancelledError:
+        await asyncio.shield(_cancel(session, timeouts, armed))
+        raise
+    if seconds is not None and armed is not None:
+        await _disarm(armed, timeouts)
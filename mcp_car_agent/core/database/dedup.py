@@ -0,0 +1,231 @@
+"""
+Módulo do job de deduplicação das dimensões do catálogo.
+
+Bancos populados antes das chaves naturais têm fabricantes, transmissões e
+motores repetidos (tipicamente um motor por carro). Este job, executado uma
+única vez após a atualização, prepara o banco para as chaves naturais:
+
+1. adiciona a coluna `natural_key` às tabelas que ainda não a têm;
+2. agrupa os registros pela chave natural e mantém o de menor ID de cada grupo;
+3. aponta as chaves estrangeiras (`car.engine_id` etc.) para o registro mantido
+   e exclui os repetidos, com as linhas que pertencem a eles (a especificação
+   de um motor repetido, igual à do mantido, pois faz parte da chave);
+4. preenche `natural_key` e cria os índices únicos.
+
+Uso:
+    python -m mcp_car_agent.core.database.dedup
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from loguru import logger
+from sqlalchemy import case, delete, inspect, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import SQLModel, select
+
+from mcp_car_agent.core.database.change_log import log_ids, log_select
+from mcp_car_agent.core.database.models import CarModel, EngineSpecModel
+from mcp_car_agent.core.database.natural_key import MAX_LENGTH
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.core.database.repository.engine_repository import (
+    EngineRepository,
+)
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.database.repository.natural_key_repository import (
+    NaturalKeyRepository,
+)
+from mcp_car_agent.core.database.repository.transmission_repository import (
+    TransmissionRepository,
+)
+from mcp_car_agent.core.schemas.engine_schema import EngineSpec
+
+REPOSITORIES = {
+    "manufacturer": ManufacturerRepository,
+    "transmission": TransmissionRepository,
+    "engine": EngineRepository,
+}
+"""
+Tabelas com chave natural e os repositórios que sabem calculá-la.
+"""
+
+REFERENCES: Dict[str, List[Tuple[type[SQLModel], str]]] = {
+    "manufacturer": [(CarModel, "manufacturer_id")],
+    "transmission": [(CarModel, "transmission_id")],
+    "engine": [(CarModel, "engine_id")],
+}
+"""
+Colunas que referenciam cada tabela e precisam ser reapontadas.
+"""
+
+DEPENDENTS: Dict[str, List[Tuple[type[SQLModel], str]]] = {
+    "engine": [(EngineSpecModel, "engine_id")],
+}
+"""
+Linhas que pertencem a cada registro e são excluídas com os repetidos.
+"""
+
+CHUNK_SIZE = 500
+"""
+Número máximo de IDs por UPDATE/DELETE.
+"""
+
+
+def _add_natural_key_columns(connection):
+    """
+    Adiciona a coluna `natural_key` às tabelas criadas antes dela.
+    """
+    inspector = inspect(connection)
+    for table in REPOSITORIES:
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        if "natural_key" not in columns:
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table} ADD COLUMN natural_key VARCHAR({MAX_LENGTH})"
+                )
+            )
+
+
+def _create_indexes(connection):
+    """
+    Cria os índices únicos das chaves naturais que ainda não existem.
+    """
+    for table in REPOSITORIES:
+        for index in SQLModel.metadata.tables[table].indexes:
+            index.create(connection, checkfirst=True)
+
+
+async def _repoint(repository: NaturalKeyRepository, survivors: Dict[int, int]):
+    """
+    Aponta as referências aos registros repetidos para os registros mantidos
+    e exclui os repetidos, registrando as linhas alteradas no `change_log`.
+    """
+    model = repository.model
+    duplicates = list(survivors)
+    for start in range(0, len(duplicates), CHUNK_SIZE):
+        chunk = duplicates[start : start + CHUNK_SIZE]
+        mapping = {duplicate: survivors[duplicate] for duplicate in chunk}
+        for referencing, column in REFERENCES[model.__tablename__]:
+            attribute = getattr(referencing, column)
+            await repository.session.exec(
+                log_select(
+                    referencing.__tablename__, referencing.id, attribute.in_(chunk)
+                )
+            )
+            await repository.session.exec(
+                update(referencing)
+                .where(attribute.in_(chunk))
+                .values({column: case(mapping, value=attribute)})
+                .execution_options(synchronize_session=False)
+            )
+        await _delete_dependents(repository, chunk)
+        await repository.session.exec(delete(model).where(model.id.in_(chunk)))
+        await repository.session.exec(log_ids(model.__tablename__, chunk))
+
+
+async def _delete_dependents(repository: NaturalKeyRepository, chunk: List[int]):
+    """
+    Exclui as linhas que pertencem aos registros repetidos (ver `DEPENDENTS`).
+    """
+    for dependent, column in DEPENDENTS.get(repository.model.__tablename__, []):
+        attribute = getattr(dependent, column)
+        await repository.session.exec(
+            log_select(dependent.__tablename__, dependent.id, attribute.in_(chunk))
+        )
+        await repository.session.exec(
+            delete(dependent)
+            .where(attribute.in_(chunk))
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def _group(repository: NaturalKeyRepository) -> Dict[str, List[SQLModel]]:
+    """
+    Agrupa os registros da tabela pela chave natural, em ordem de ID.
+    """
+    query = select(repository.model).order_by(repository.model.id)
+    specs = {}
+    if repository.model.__tablename__ == "engine":
+        specs = await _engine_specs(repository)
+    groups: Dict[str, List[SQLModel]] = defaultdict(list)
+    for row in (await repository.session.exec(query)).all():
+        data = repository.schema.model_validate(row.model_dump())
+        if row.id in specs:
+            data.engine_specs = specs[row.id]
+        groups[repository.natural_key(data)].append(row)
+    return groups
+
+
+async def _engine_specs(repository: NaturalKeyRepository) -> Dict[int, EngineSpec]:
+    """
+    A especificação mais antiga de cada motor, que entra na chave natural. Os
+    valores gravados não são revalidados: a chave só lê os campos.
+    """
+    query = select(EngineSpecModel).order_by(EngineSpecModel.id)
+    specs = {}
+    for row in (await repository.session.exec(query)).all():
+        specs.setdefault(row.engine_id, EngineSpec.model_construct(**row.model_dump()))
+    return specs
+
+
+async def _merge(repository: NaturalKeyRepository) -> int:
+    """
+    Mescla os registros repetidos de uma tabela e preenche as chaves naturais.
+
+    Returns:
+        int: O número de registros repetidos excluídos.
+    """
+    groups = await _group(repository)
+    survivors = {
+        duplicate.id: kept.id
+        for kept, *duplicates in groups.values()
+        for duplicate in duplicates
+    }
+    await _repoint(repository, survivors)
+    for key, (kept, *_) in groups.items():
+        kept.natural_key = key
+    await repository.session.commit()
+    return len(survivors)
+
+
+async def deduplicate(session_factory: async_sessionmaker) -> Dict[str, int]:
+    """
+    Executa a deduplicação de fabricantes, transmissões e motores.
+
+    Args:
+        session_factory (async_sessionmaker): A fábrica de sessões do banco.
+
+    Returns:
+        Dict[str, int]: O número de registros repetidos excluídos por tabela.
+    """
+    engine = session_factory.kw["bind"]
+    async with engine.begin() as connection:
+        await connection.run_sync(_add_natural_key_columns)
+    removed = {}
+    async with session_factory() as session:
+        for table, repository in REPOSITORIES.items():
+            removed[table] = await _merge(repository(session))
+            logger.info(f"{table}: {removed[table]} registros repetidos mesclados.")
+    async with engine.begin() as connection:
+        await connection.run_sync(_create_indexes)
+    return removed
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando da deduplicação.
+    """
+
+    async def run():
+        await deduplicate(await ConnectionRepository.session_factory())
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
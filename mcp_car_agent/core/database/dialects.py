@@ -0,0 +1,164 @@
+"""
+Módulo dos perfis de conexão de cada banco suportado.
+
+`config.DB_ENGINE` escolhe o perfil (`POSTGRESQL`, `MYSQL` ou `SQLITE`), e o
+perfil define o driver assíncrono e os ajustes do motor, para que o mesmo
+código dos repositórios rode bem em cada banco:
+
+- driver: o primeiro instalado entre os do perfil (no MySQL, `asyncmy`, mais
+  rápido, e depois `aiomysql`), que vêm dos extras `postgres`, `mysql` e
+  `mysql-aiomysql` do projeto;
+- nível de isolamento: `READ COMMITTED` no PostgreSQL e no MySQL (cujo padrão,
+  `REPEATABLE READ`, trava intervalos de índice nas escritas sem benefício
+  para consultas independentes como as das ferramentas), exceto na conexão da
+  importação em massa do MySQL, que precisa dessas travas (ver
+  `BULK_ISOLATION_LEVELS`);
+- escritas em lote: o tamanho das páginas do "insertmanyvalues" do SQLAlchemy
+  e, no MySQL, `local_infile` para o `LOAD DATA` da importação em massa, só
+  na conexão aberta pela importação (ver `mcp_car_agent.ingestion.staging`):
+  nas do servidor, ele permitiria que o banco lesse arquivos do cliente;
+- cursores no servidor: `stream` (exportação) usa `yield_per`, que abre um
+  cursor no servidor no asyncpg, no asyncmy e no aiomysql; no MySQL, o
+  `pool_recycle` evita reaproveitar conexões já encerradas pelo
+  `wait_timeout` do servidor durante exportações longas;
+- SQLite: WAL e `synchronous=NORMAL` em cada conexão, para leituras
+  concorrentes com uma escrita, e `foreign_keys` ligado.
+"""
+
+import importlib.util
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from mcp_car_agent.core import config
+
+BULK_CONNECT_ARGS: Dict[str, Dict[str, Any]] = {"mysql": {"local_infile": True}}
+"""
+Argumentos do driver ligados apenas no motor da importação em massa, por
+banco.
+"""
+
+BULK_ISOLATION_LEVELS: Dict[str, str] = {"mysql": "REPEATABLE READ"}
+"""
+Nível de isolamento do motor da importação em massa, por banco. No MySQL, só
+em REPEATABLE READ o `SELECT ... FOR UPDATE` do maior ID de `car` trava o
+intervalo depois dele (gap lock), reservando a numeração dos carros
+importados (ver `mcp_car_agent.ingestion.bulk._reserve_car_ids`).
+"""
+
+
+@dataclass(frozen=True)
+class DialectProfile:
+    """
+    O driver e os ajustes do motor de um banco.
+    """
+
+    backend: str
+    drivers: Tuple[str, ...]
+    port: Optional[int] = None
+    isolation_level: Optional[str] = None
+    connect_args: Dict[str, Any] = field(default_factory=dict)
+    options: Dict[str, Any] = field(default_factory=dict)
+    on_connect: Tuple[str, ...] = ()
+
+    @property
+    def driver(self) -> str:
+        """
+        O primeiro driver do perfil instalado (ou o preferido, se nenhum
+        estiver, para que o SQLAlchemy aponte o pacote ausente).
+        """
+        for driver in self.drivers:
+            if importlib.util.find_spec(driver) is not None:
+                return driver
+        return self.drivers[0]
+
+    def engine_options(self, bulk: bool = False) -> Dict[str, Any]:
+        """
+        Os argumentos de `create_async_engine` do perfil.
+
+        Args:
+            bulk (bool): Se o motor é o da importação em massa, que recebe
+                também os `BULK_CONNECT_ARGS` e o `BULK_ISOLATION_LEVELS` do
+                banco.
+        """
+        options = dict(self.options)
+        isolation_level = self.isolation_level
+        if bulk:
+            isolation_level = BULK_ISOLATION_LEVELS.get(self.backend, isolation_level)
+        if isolation_level:
+            options["isolation_level"] = isolation_level
+        connect_args = {
+            **self.connect_args,
+            **(BULK_CONNECT_ARGS.get(self.backend, {}) if bulk else {}),
+        }
+        if connect_args:
+            options["connect_args"] = connect_args
+        return options
+
+    def attach(self, engine: AsyncEngine):
+        """
+        Registra os comandos executados em cada nova conexão do motor.
+        """
+        if not self.on_connect:
+            return
+
+        def configure(dbapi_connection, _record):
+            cursor = dbapi_connection.cursor()
+            for statement in self.on_connect:
+                cursor.execute(statement)
+            cursor.close()
+
+        event.listen(engine.sync_engine, "connect", configure)
+
+
+DIALECT_PROFILES = {
+    "POSTGRESQL": DialectProfile(
+        backend="postgresql",
+        drivers=("asyncpg",),
+        port=5432,
+        isolation_level="READ COMMITTED",
+        connect_args={"server_settings": {"application_name": "mcp-car-agent"}},
+        options={"insertmanyvalues_page_size": 1000},
+    ),
+    "MYSQL": DialectProfile(
+        backend="mysql",
+        drivers=("asyncmy", "aiomysql"),
+        port=3306,
+        isolation_level="READ COMMITTED",
+        connect_args={"charset": "utf8mb4"},
+        options={"insertmanyvalues_page_size": 1000, "pool_recycle": 3600},
+    ),
+    "SQLITE": DialectProfile(
+        backend="sqlite",
+        drivers=("aiosqlite",),
+        on_connect=(
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA foreign_keys=ON",
+        ),
+    ),
+}
+"""
+Perfis por valor de `config.DB_ENGINE`.
+"""
+
+
+def dialect_profile(engine: Optional[str] = None) -> DialectProfile:
+    """
+    O perfil do banco configurado.
+
+    Args:
+        engine (Optional[str]): O banco (ex: "MYSQL"); por padrão,
+            `config.DB_ENGINE`, ou PostgreSQL se não estiver definido.
+
+    Raises:
+        ValueError: Se o banco não for suportado.
+    """
+    name = (engine or config.DB_ENGINE or "POSTGRESQL").upper()
+    if name not in DIALECT_PROFILES:
+        raise ValueError(
+            f"DB_ENGINE '{name}' não suportado: use {', '.join(DIALECT_PROFILES)}."
+        )
+    return DIALECT_PROFILES[name]
@@ -0,0 +1,259 @@
+"""
+Módulo de instrumentação das consultas SQL.
+
+Substitui o `echo=True` do SQLAlchemy (que escreve todo statement, de forma
+síncrona, na saída padrão) por eventos do motor que medem cada statement:
+
+- latência e linhas afetadas (ou retornadas, quando o driver informa) são
+  agregadas em histogramas por método de repositório e tipo de statement
+  (ex: `CarRepository.search` / `SELECT`);
+- apenas statements acima de `config.DB_SLOW_QUERY_SECONDS` geram um registro
+  no log, estruturado (campos em `extra`) e sem os parâmetros da consulta.
+
+O método de repositório é informado pelo decorador `instrumented`, por uma
+`ContextVar`, que acompanha a corrotina até o greenlet em que o SQLAlchemy
+executa o statement; o decorador também mede a latência do método inteiro.
+O pool `MeteredQueuePool` mede a espera por uma conexão. O `echo` do
+SQLAlchemy continua disponível via `config.DB_ECHO`, para depuração local.
+"""
+
+import functools
+import math
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.services.tracing import tracer
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+"""
+Limites superiores, em segundos, das faixas do histograma de latência.
+"""
+
+ROW_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000)
+"""
+Limites superiores das faixas do histograma de linhas por statement.
+"""
+
+UNKNOWN_OPERATION = "-"
+"""
+Operação dos statements executados fora de um método de repositório
+instrumentado (ex: importação em massa, migrações).
+"""
+
+_operation: ContextVar[str] = ContextVar("db_operation", default=UNKNOWN_OPERATION)
+
+_STARTED = "_instrumentation_started"
+"""
+Atributo do contexto de execução com o início do statement.
+"""
+
+
+def current_operation() -> str:
+    """
+    O método de repositório em execução na task atual.
+    """
+    return _operation.get()
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Decorador dos métodos assíncronos dos repositórios: os statements
+    executados pelo método são atribuídos a `Classe.método`, e a latência da
+    chamada é registrada em `instrumentation.methods` e rastreada em um span.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        operation = f"{type(self).__name__}.{method.__name__}"
+        token = _operation.set(operation)
+        started = time.perf_counter()
+        try:
+            with tracer.span(operation):
+                return await method(self, *args, **kwargs)
+        finally:
+            _operation.reset(token)
+            instrumentation.methods[operation].observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+class Histogram:
+    """
+    Histograma de faixas fixas, no formato do Prometheus.
+
+    Args:
+        buckets (Tuple[float, ...]): Os limites superiores das faixas, em
+            ordem crescente; a faixa `+Inf` é implícita.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """
+        Registra um valor.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimativa do quantil `q` (0-1): o limite superior da faixa em que ele
+        cai (`inf` se cair acima da última).
+        """
+        if not self.count:
+            return 0.0
+        rank, seen = math.ceil(q * self.count), 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return math.inf
+
+
+class StatementStats:
+    """
+    Estatísticas agregadas dos statements de uma operação.
+    """
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.rows = Histogram(ROW_BUCKETS)
+        self.slow = 0
+
+
+class SqlInstrumentation:
+    """
+    Mede os statements SQL executados pelos motores em que é registrada.
+
+    Args:
+        slow_query_seconds (float): Latência a partir da qual o statement é
+            registrado no log.
+    """
+
+    def __init__(self, slow_query_seconds: float = config.DB_SLOW_QUERY_SECONDS):
+        self.slow_query_seconds = slow_query_seconds
+        self.stats: Dict[Tuple[str, str], StatementStats] = defaultdict(StatementStats)
+        self.methods: Dict[str, Histogram] = defaultdict(
+            lambda: Histogram(LATENCY_BUCKETS)
+        )
+
+    def attach(self, engine: Union[AsyncEngine, Engine]):
+        """
+        Registra os eventos de execução no motor (síncrono ou assíncrono).
+        """
+        target = getattr(engine, "sync_engine", engine)
+        if not event.contains(target, "before_cursor_execute", self._before):
+            event.listen(target, "before_cursor_execute", self._before)
+            event.listen(target, "after_cursor_execute", self._after)
+
+    def detach(self, engine: Union[AsyncEngine, Engine]):
+        """
+        Remove os eventos registrados por `attach`.
+        """
+        target = getattr(engine, "sync_engine", engine)
+        if event.contains(target, "before_cursor_execute", self._before):
+            event.remove(target, "before_cursor_execute", self._before)
+            event.remove(target, "after_cursor_execute", self._after)
+
+    def reset(self):
+        """
+        Descarta as estatísticas acumuladas.
+        """
+        self.stats.clear()
+        self.methods.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        As estatísticas por operação e tipo de statement, com a latência em ms.
+        """
+        return [
+            {
+                "operation": operation,
+                "statement": kind,
+                "count": stats.latency.count,
+                "slow": stats.slow,
+                "total_ms": stats.latency.sum * 1000,
+                "p50_ms": stats.latency.quantile(0.5) * 1000,
+                "p99_ms": stats.latency.quantile(0.99) * 1000,
+                "rows": stats.rows.sum,
+            }
+            for (operation, kind), stats in sorted(self.stats.items())
+        ]
+
+    @staticmethod
+    def _before(_conn, _cursor, _statement, _parameters, context, _executemany):
+        setattr(context, _STARTED, time.perf_counter())
+
+    def _after(self, _conn, cursor, statement, _parameters, context, _executemany):
+        started = getattr(context, _STARTED, None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        operation = current_operation()
+        kind = statement.lstrip().split(None, 1)[0].upper() if statement else "-"
+        rows = max(getattr(cursor, "rowcount", -1), 0)
+        stats = self.stats[(operation, kind)]
+        stats.latency.observe(elapsed)
+        stats.rows.observe(rows)
+        if elapsed >= self.slow_query_seconds:
+            stats.slow += 1
+            logger.bind(
+                operation=operation,
+                statement_type=kind,
+                duration_ms=round(elapsed * 1000, 3),
+                rows=rows,
+                statement=statement,
+            ).warning(f"Consulta lenta em {operation}: {elapsed * 1000:.1f} ms.")
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool de conexões que mede, em `wait`, o tempo de espera por uma conexão
+    (imediato com conexões livres; até `pool_timeout` com o pool esgotado).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait = Histogram(LATENCY_BUCKETS)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait.observe(time.perf_counter() - started)
+
+
+instrumentation = SqlInstrumentation()
+"""
+Instrumentação compartilhada pelos motores da aplicação.
+"""
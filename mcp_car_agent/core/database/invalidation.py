@@ -0,0 +1,221 @@
+"""
+Módulo de barramentos de invalidação de cache.
+
+Toda escrita feita por `BaseRepository` publica um evento
+`(table, ids, version)`. Caches em memória se inscrevem no barramento e
+descartam os dados afetados assim que o evento chega, em vez de esperar um
+TTL expirar.
+
+Há duas implementações: uma dentro do processo, que entrega o evento após o
+commit, e outra que usa LISTEN/NOTIFY do PostgreSQL para propagar os
+eventos entre os nós, publicados na própria transação da escrita.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlmodel import SQLModel
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.interfaces.invalidation_bus import (
+    IInvalidationBus,
+    InvalidationHandler,
+)
+from mcp_car_agent.core.schemas.invalidation_schema import InvalidationEvent
+
+NOTIFY_CHANNEL = "mcp_car_agent_invalidation"
+"""
+Canal do LISTEN/NOTIFY usado pelo barramento do PostgreSQL.
+"""
+
+NOTIFY_MAX_IDS = 500
+"""
+Quantidade máxima de IDs por notificação, mantendo o payload abaixo do
+limite de 8000 bytes do NOTIFY.
+"""
+
+
+class InProcessInvalidationBus(IInvalidationBus):
+    """
+    Barramento de invalidação que entrega os eventos aos handlers do próprio processo.
+    """
+
+    def __init__(self):
+        self.handlers: List[InvalidationHandler] = []
+
+    async def publish(self, table: str, ids: List[int]):
+        self.dispatch(InvalidationEvent(table=table, ids=ids, version=time.time_ns()))
+
+    def subscribe(self, handler: InvalidationHandler):
+        # Inscrever o mesmo handler de novo (ex: ao repetir a inicialização) não o duplica.
+        if handler not in self.handlers:
+            self.handlers.append(handler)
+
+    def dispatch(self, event: InvalidationEvent):
+        """
+        Entrega um evento a todos os handlers inscritos.
+
+        Uma falha em um handler é registrada e não impede a entrega aos demais.
+
+        Args:
+            event (InvalidationEvent): O evento a ser entregue.
+        """
+        for handler in self.handlers:
+            try:
+                handler(event)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.error(f"Falha ao aplicar invalidação {event}: {exc}")
+
+
+class PostgresInvalidationBus(InProcessInvalidationBus):
+    """
+    Barramento de invalidação entre nós usando LISTEN/NOTIFY do PostgreSQL.
+
+    As escritas dos repositórios publicam o evento com `pg_notify` na própria
+    transação (ver `statements`): o PostgreSQL só o entrega no commit, e uma
+    falha na publicação desfaz a escrita em vez de deixá-la sem invalidação.
+    O evento publicado por qualquer nó (inclusive o próprio) é entregue aos
+    handlers locais quando a notificação chega, com latência de milissegundos.
+
+    A conexão do LISTEN é verificada a cada `check_interval` segundos e
+    imediatamente quando o driver avisa que ela caiu. Ao reconectar, como os
+    eventos do intervalo se perderam, todas as tabelas são invalidadas.
+
+    Args:
+        connect (Callable[[], Awaitable[Any]]): Função que retorna uma conexão
+            crua, cuja `driver_connection` é uma conexão do asyncpg. Deve vir
+            de um motor sem pool (ver `ConnectionRepository.dedicated_engine`):
+            a conexão fica reservada enquanto o barramento escuta e, tirada do
+            pool das requisições, o deixaria com uma conexão a menos.
+        check_interval (float): O intervalo, em segundos, das verificações.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        check_interval: float = config.CACHE_INVALIDATION_CHECK_INTERVAL,
+    ):
+        super().__init__()
+        self._connect = connect
+        self._connection: Optional[Any] = None
+        self._lock = asyncio.Lock()
+        self.check_interval = check_interval
+        self._lost = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """
+        Reserva uma conexão dedicada, passa a escutar o canal de invalidação e
+        inicia a verificação da conexão.
+        """
+        await self._listen()
+        self._task = asyncio.create_task(self._monitor())
+
+    async def stop(self):
+        """
+        Para de escutar o canal e fecha a conexão.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._connection is None:
+            return
+        driver = self._connection.driver_connection
+        driver.remove_termination_listener(self._on_terminate)
+        await driver.remove_listener(NOTIFY_CHANNEL, self._on_notify)
+        self._connection.close()
+        self._connection = None
+
+    async def publish(self, table: str, ids: List[int]):
+        # Fora de uma transação de escrita: notifica pela conexão do LISTEN.
+        for payload in self._events(table, ids):
+            # Uma conexão do asyncpg não aceita operações concorrentes.
+            async with self._lock:
+                await self._connection.driver_connection.execute(
+                    "SELECT pg_notify($1, $2)", NOTIFY_CHANNEL, payload
+                )
+
+    def statements(self, table: str, ids: List[int]) -> List[Any]:
+        return [
+            text("SELECT pg_notify(:channel, :payload)").bindparams(
+                channel=NOTIFY_CHANNEL, payload=payload
+            )
+            for payload in self._events(table, ids)
+        ]
+
+    def invalidate_all(self):
+        """
+        Entrega aos handlers locais a invalidação de todas as tabelas.
+        """
+        version = time.time_ns()
+        for table in SQLModel.metadata.tables:
+            self.dispatch(InvalidationEvent(table=table, ids=[], version=version))
+
+    @staticmethod
+    def _events(table: str, ids: List[int]) -> List[str]:
+        """
+        Os payloads do evento, divididos em partes de até `NOTIFY_MAX_IDS` IDs
+        com a mesma versão.
+        """
+        version = time.time_ns()
+        return [
+            InvalidationEvent(
+                table=table, ids=ids[start : start + NOTIFY_MAX_IDS], version=version
+            ).model_dump_json()
+            for start in range(0, max(len(ids), 1), NOTIFY_MAX_IDS)
+        ]
+
+    async def _listen(self):
+        self._connection = await self._connect()
+        driver = self._connection.driver_connection
+        await driver.add_listener(NOTIFY_CHANNEL, self._on_notify)
+        driver.add_termination_listener(self._on_terminate)
+
+    async def _healthy(self) -> bool:
+        if self._connection is None:
+            return False
+        try:
+            async with self._lock:
+                await asyncio.wait_for(
+                    self._connection.driver_connection.execute("SELECT 1"),
+                    self.check_interval,
+                )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Conexão do LISTEN de invalidação perdida: {exc}")
+            return False
+        return True
+
+    async def _reconnect(self):
+        self._lost.clear()
+        if self._connection is not None:
+            try:
+                self._connection.invalidate()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+            self._connection = None
+        try:
+            await self._listen()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Falha ao refazer o LISTEN de invalidação: {exc}")
+            self._connection = None
+            return
+        logger.info("LISTEN de invalidação refeito; invalidando todos os caches.")
+        self.invalidate_all()
+
+    async def _monitor(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._lost.wait(), self.check_interval)
+            except asyncio.TimeoutError:
+                if await self._healthy():
+                    continue
+            await self._reconnect()
+
+    def _on_terminate(self, _connection: Any):
+        self._lost.set()
+
+    def _on_notify(self, _connection: Any, _pid: int, _channel: str, payload: str):
+        self.dispatch(InvalidationEvent.model_validate_json(payload))
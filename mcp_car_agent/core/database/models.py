@@ -1,6 +1,7 @@
 from datetime import date
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -10,11 +11,13 @@ class EngineModel(SQLModel, table=True):
     """
 
     __tablename__ = "engine"
+    __table_args__ = (Index("ix_engine_natural_key", "natural_key", unique=True),)
 
     id: Optional[int] = Field(primary_key=True)
     compression_rate: Optional[str] = Field(max_length=10, default=None)
     total_cc: Optional[int] = Field(default=None)
     aspiration: Optional[str] = Field(max_length=45, default=None)
+    natural_key: Optional[str] = Field(max_length=255, default=None)
 
     engine_specs: List["EngineSpecModel"] = Relationship(back_populates="engine")
     cars: List["CarModel"] = Relationship(back_populates="engine")
@@ -26,11 +29,13 @@ class TransmissionModel(SQLModel, table=True):
     """
 
     __tablename__ = "transmission"
+    __table_args__ = (Index("ix_transmission_natural_key", "natural_key", unique=True),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     gearbox_type: str = Field(max_length=20, min_length=1)
     gears_qtde: Optional[int] = Field(default=None)
     traction: Optional[str] = Field(max_length=45, default=None)
+    natural_key: Optional[str] = Field(max_length=255, default=None)
     cars: List["CarModel"] = Relationship(back_populates="transmission")
 
 
@@ -40,9 +45,11 @@ class ManufacturerModel(SQLModel, table=True):
     """
 
     __tablename__ = "manufacturer"
+    __table_args__ = (Index("ix_manufacturer_natural_key", "natural_key", unique=True),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=150, min_length=1)
+    natural_key: Optional[str] = Field(max_length=255, default=None)
 
     cars: List["CarModel"] = Relationship(back_populates="manufacturer")
 
@@ -57,10 +64,10 @@ class CarModel(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: Optional[str] = Field(max_length=80)
     version: Optional[str] = Field(max_length=80)
-    year: Optional[date] = Field(default=None)
-    engine_id: int = Field(foreign_key="engine.id")
-    transmission_id: int = Field(foreign_key="transmission.id")
-    manufacturer_id: int = Field(foreign_key="manufacturer.id")
+    year: Optional[date] = Field(default=None, index=True)
+    engine_id: int = Field(foreign_key="engine.id", index=True)
+    transmission_id: int = Field(foreign_key="transmission.id", index=True)
+    manufacturer_id: int = Field(foreign_key="manufacturer.id", index=True)
 
     engine: EngineModel = Relationship(back_populates="cars")
     transmission: TransmissionModel = Relationship(back_populates="cars")
@@ -79,10 +86,10 @@ class EquipmentModel(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     category: str = Field(max_length=50, min_length=1)
-    description: str = Field(max_length=150, min_length=1)
+    description: str = Field(max_length=150, min_length=1, index=True)
     is_standard: bool = Field(default=False)
     is_optional: bool = Field(default=False)
-    car_id: int = Field(foreign_key="car.id")
+    car_id: int = Field(foreign_key="car.id", index=True)
 
     car: CarModel = Relationship(back_populates="equipments")
 
@@ -99,7 +106,7 @@ class CarSpecsModel(SQLModel, table=True):
     config: Optional[str] = Field(max_length=45)
     doors: Optional[int] = Field(default=None)
     spaces: Optional[int] = Field(default=None)
-    car_id: int = Field(foreign_key="car.id")
+    car_id: int = Field(foreign_key="car.id", index=True)
 
     car: CarModel = Relationship(back_populates="car_specs")
 
@@ -119,6 +126,35 @@ class EngineSpecModel(SQLModel, table=True):
     max_torque: Optional[int] = Field(gt=0, default=None)
     max_torque_rpm: Optional[int] = Field(gt=0, default=None)
     torque_unit_measure: Optional[str] = Field(max_length=10, default="kgfm")
-    engine_id: int = Field(foreign_key="engine.id")
+    engine_id: int = Field(foreign_key="engine.id", index=True)
 
     engine: EngineModel = Relationship(back_populates="engine_specs")
+
+
+class SourcePageModel(SQLModel, table=True):
+    """
+    Representa a tabela `source_page` no banco de dados: a impressão digital
+    de cada página de origem usada pela ingestão incremental.
+    """
+
+    __tablename__ = "source_page"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    url: str = Field(max_length=500, unique=True)
+    etag: Optional[str] = Field(max_length=200, default=None)
+    last_modified: Optional[str] = Field(max_length=50, default=None)
+    content_hash: Optional[str] = Field(max_length=64, default=None)
+    car_id: Optional[int] = Field(foreign_key="car.id", default=None)
+
+
+class ChangeLogModel(SQLModel, table=True):
+    """
+    Representa a tabela `change_log` no banco de dados: uma linha por registro
+    alterado, com a versão crescente da escrita.
+    """
+
+    __tablename__ = "change_log"
+
+    version: Optional[int] = Field(default=None, primary_key=True)
+    table_name: str = Field(max_length=50)
+    row_id: int
@@ -0,0 +1,209 @@
+"""
+Módulo de detecção de consultas N+1.
+
+Os muitos `Relationship` de `models.py` facilitam que uma ferramenta nova
+dispare, sem perceber, uma carga preguiçosa por linha (ex: ler
+`car.equipments` para cada carro de uma busca). O detector conta os
+statements de cada requisição lógica, delimitada por `watch`, agrupados pelo
+formato: o SQL com as listas de parâmetros (`IN (?, ?, ...)`) normalizadas,
+de modo que statements que diferem apenas nos parâmetros caiam no mesmo
+grupo. Apenas leituras são agrupadas: escritas repetidas vêm do flush da
+sessão, que o SQLAlchemy já agrupa quando o driver permite.
+
+Ao fim da requisição, os formatos repetidos `config.DB_N_PLUS_ONE_THRESHOLD`
+vezes ou mais são reportados com a relação que os disparou (via o evento
+`do_orm_execute` da sessão) e o método de repositório em execução. Em
+produção o relatório vai para o log; nos testes de integração, `raise` faz o
+teste falhar.
+
+Os eventos são registrados nas classes `Engine` e `Session`, valendo para
+todos os motores e sessões, e só fazem trabalho dentro de um `watch`.
+"""
+
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.instrumentation import current_operation
+
+IGNORE_OPTION = "n_plus_one_ignore"
+"""
+Opção de execução que exclui um statement da contagem (ex: os comandos de
+timeout repetidos a cada consulta por `deadline`).
+"""
+
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PLACEHOLDER_GROUP = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_REPEATED_GROUPS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_NUMBERED = re.compile(r"\$\d+")
+
+_watch: ContextVar[Optional["QueryWatch"]] = ContextVar("n_plus_one", default=None)
+
+
+class NPlusOneError(RuntimeError):
+    """
+    Lançada ao fim de uma requisição com consultas N+1, no modo `raise`.
+    """
+
+    def __init__(self, message: str, offenders: List["Offender"]):
+        super().__init__(message)
+        self.offenders = offenders
+
+
+@dataclass(frozen=True)
+class Offender:
+    """
+    Um formato de statement repetido em uma requisição.
+    """
+
+    shape: str
+    count: int
+    operation: str
+    relationship: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self.relationship:
+            return (
+                f"relação {self.relationship} carregada {self.count} vezes "
+                f"(em {self.operation})"
+            )
+        return f"{self.count} execuções em {self.operation} de: {self.shape[:200]}"
+
+
+def shape(statement: str) -> str:
+    """
+    O formato de um statement: o SQL com as listas de parâmetros reduzidas a
+    um único `(?)`.
+    """
+    statement = _NUMBERED.sub("?", statement)
+    statement = _PLACEHOLDER_GROUP.sub("(?)", statement)
+    return _REPEATED_GROUPS.sub("(?)", statement)
+
+
+class QueryWatch:
+    """
+    Os statements de uma requisição lógica, por formato.
+
+    Args:
+        name (str): O nome da requisição (ex: a ferramenta MCP), para o relatório.
+        threshold (int): Repetições de um formato a partir das quais há N+1.
+    """
+
+    def __init__(self, name: str, threshold: int):
+        self.name = name
+        self.threshold = threshold
+        self.statements = 0
+        self.shapes: Counter = Counter()
+        self.operations: Dict[str, str] = {}
+        self.relationships: Dict[str, str] = {}
+        self.loading: Optional[str] = None
+
+    def record(self, statement: str):
+        """
+        Conta um statement e, se for uma leitura, o seu formato, associado à
+        relação em carga, se houver.
+        """
+        self.statements += 1
+        loading, self.loading = self.loading, None
+        if statement.lstrip()[:6].upper() != "SELECT":
+            return
+        key = shape(statement)
+        self.shapes[key] += 1
+        self.operations.setdefault(key, current_operation())
+        if loading is not None:
+            self.relationships.setdefault(key, loading)
+
+    def offenders(self) -> List[Offender]:
+        """
+        Os formatos repetidos pelo menos `threshold` vezes, do mais repetido.
+        """
+        return [
+            Offender(key, count, self.operations[key], self.relationships.get(key))
+            for key, count in self.shapes.most_common()
+            if count >= self.threshold
+        ]
+
+
+def _on_orm_execute(state: ORMExecuteState):
+    current = _watch.get()
+    if current is not None and state.is_relationship_load:
+        path = state.loader_strategy_path
+        current.loading = str(path.prop) if path is not None else None
+
+
+def _on_cursor_execute(_conn, _cursor, statement, _parameters, context, _many):
+    current = _watch.get()
+    if current is None:
+        return
+    if context is not None and context.execution_options.get(IGNORE_OPTION):
+        return
+    current.record(statement)
+
+
+def install():
+    """
+    Registra os eventos do detector em todos os motores e sessões.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _on_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _on_cursor_execute)
+        event.listen(Session, "do_orm_execute", _on_orm_execute)
+
+
+def report(current: QueryWatch, mode: str = config.DB_N_PLUS_ONE_MODE):
+    """
+    Reporta os N+1 de uma requisição, conforme o modo.
+
+    Raises:
+        NPlusOneError: No modo `raise`, se houver formatos repetidos.
+    """
+    offenders = current.offenders()
+    if not offenders or mode == "off":
+        return
+    message = f"Consultas N+1 em {current.name}: " + "; ".join(map(str, offenders))
+    if mode == "raise":
+        raise NPlusOneError(message, offenders)
+    logger.bind(
+        request=current.name,
+        statements=current.statements,
+        relationships=[offender.relationship for offender in offenders],
+    ).warning(message)
+
+
+@contextmanager
+def watch(
+    name: str,
+    threshold: int = config.DB_N_PLUS_ONE_THRESHOLD,
+    mode: str = config.DB_N_PLUS_ONE_MODE,
+) -> Iterator[Optional[QueryWatch]]:
+    """
+    Delimita uma requisição lógica e, ao final, reporta os N+1 encontrados.
+
+    Blocos aninhados são requisições independentes: os statements contam
+    apenas no bloco mais interno. Se o bloco lançar uma exceção, nada é
+    reportado.
+
+    Args:
+        name (str): O nome da requisição, para o relatório.
+        threshold (int): Repetições de um formato a partir das quais há N+1.
+        mode (str): `warn`, `raise` ou `off`.
+    """
+    if mode == "off":
+        yield None
+        return
+    install()
+    current = QueryWatch(name, threshold)
+    token = _watch.set(current)
+    try:
+        yield current
+    finally:
+        _watch.reset(token)
+    report(current, mode)
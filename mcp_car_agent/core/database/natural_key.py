@@ -0,0 +1,91 @@
+"""
+Módulo de chaves naturais das dimensões do catálogo.
+
+Fabricantes, transmissões e motores são identificados pelo seu conteúdo
+normalizado (ex: "Toyota" e " TOYOTA " são o mesmo fabricante), gravado na
+coluna `natural_key`, que tem índice único. Assim, cada dimensão existe uma
+única vez no banco, por mais carros que a referenciem.
+"""
+
+import re
+import unicodedata
+from typing import Any
+
+from mcp_car_agent.core.schemas.engine_schema import Engine
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+
+MAX_LENGTH = 255
+"""
+Tamanho máximo da coluna `natural_key`.
+"""
+
+SEPARATOR = "|"
+
+_SPACES = re.compile(r"\s+")
+
+
+def _normalize(value: Any) -> str:
+    """
+    Remove acentos, converte para minúsculas e colapsa espaços.
+    """
+    if value is None:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(value))
+    text = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _SPACES.sub(" ", text).strip().lower()
+
+
+def natural_key(*parts: Any) -> str:
+    """
+    Monta a chave natural a partir das partes que identificam o registro.
+
+    Args:
+        *parts (Any): Os valores que identificam o registro (`None` é aceito).
+
+    Returns:
+        str: A chave normalizada (ex: "13,0:1|1987|natural").
+    """
+    return SEPARATOR.join(_normalize(part) for part in parts)[:MAX_LENGTH]
+
+
+def manufacturer_key(data: Manufacturer) -> str:
+    """
+    A chave natural de um fabricante: o nome.
+    """
+    return natural_key(data.name)
+
+
+def transmission_key(data: Transmission) -> str:
+    """
+    A chave natural de uma transmissão: o tipo de câmbio, as marchas e a tração.
+    """
+    return natural_key(data.gearbox_type, data.gears_qtde, data.traction)
+
+
+def engine_key(data: Engine) -> str:
+    """
+    A chave natural de um motor: a taxa de compressão, a cilindrada, a
+    aspiração e a especificação (combustível, potência e torque).
+
+    O mesmo bloco com especificações diferentes (ex: versões com mais
+    potência) são motores distintos: como a especificação pertence ao motor,
+    um registro compartilhado teria a especificação do último carro gravado.
+    """
+    spec = data.engine_specs
+    return natural_key(
+        data.compression_rate,
+        data.total_cc,
+        data.aspiration,
+        *(
+            getattr(spec, field, None)
+            for field in (
+                "gas_type",
+                "max_hp",
+                "max_hp_rpm",
+                "max_torque",
+                "max_torque_rpm",
+                "torque_unit_measure",
+            )
+        ),
+    )
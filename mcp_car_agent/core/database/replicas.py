@@ -0,0 +1,232 @@
+"""
+Módulo de roteamento das leituras para réplicas do banco de dados.
+
+Com réplicas configuradas (`config.DB_REPLICA_HOSTS`), as sessões criadas
+por `ConnectionRepository` são `RoutingSession`s: os statements marcados com
+a opção de execução `REPLICA_OPTION` (as leituras `search` e `get_one` dos
+repositórios) vão para uma réplica; todo o resto, inclusive o flush, vai para
+o primário.
+
+- Balanceamento: cada sessão escolhe, na primeira leitura, a réplica saudável
+  com menos conexões em uso (empates em rodízio) e a mantém até o fim, para
+  que as leituras de uma requisição vejam o mesmo estado.
+- Saúde: `ReplicaSet.monitor` verifica as réplicas a cada
+  `config.DB_REPLICA_CHECK_INTERVAL` segundos, e uma réplica que perde a
+  conexão sai do rodízio imediatamente. Sem réplicas saudáveis, as leituras
+  vão para o primário.
+- Consistência: réplicas podem estar atrasadas. Uma sessão marcada com
+  `read_your_writes` passa a ler do primário depois da sua primeira escrita,
+  e uma marcada com `primary_only` lê sempre do primário. É o caso das cargas
+  dos caches em memória (ex: `DimensionCache`): o evento de invalidação é
+  publicado pelo primário no commit e pode chegar antes de a réplica aplicar
+  a escrita, e uma recarga lida dela guardaria o dado antigo até a próxima
+  invalidação.
+- Encerramento: `ReplicaSet.close` cancela o monitoramento e fecha os pools
+  das réplicas (ver `ConnectionRepository.close`).
+"""
+
+import asyncio
+import contextlib
+import itertools
+from typing import List, Optional
+
+from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.n_plus_one import IGNORE_OPTION
+
+REPLICA_OPTION = "replica"
+"""
+Opção de execução das leituras que podem ser atendidas por uma réplica.
+"""
+
+REPLICAS = "replicas"
+READ_YOUR_WRITES = "read_your_writes"
+PRIMARY_ONLY = "primary_only"
+_WROTE = "replicas_wrote"
+_CHOSEN = "replicas_chosen"
+"""
+Chaves do `info` da sessão: as réplicas, o pedido de ler as próprias
+escritas, o de ler só do primário, se a sessão já escreveu e a réplica
+escolhida.
+"""
+
+
+def _name(engine: AsyncEngine) -> str:
+    return engine.url.host or engine.url.database or str(engine.url)
+
+
+class ReplicaSet:
+    """
+    As réplicas de leitura, com verificação de saúde e balanceamento.
+
+    Args:
+        engines (List[AsyncEngine]): Os motores das réplicas.
+        check_interval (float): O intervalo, em segundos, das verificações.
+    """
+
+    def __init__(
+        self,
+        engines: List[AsyncEngine],
+        check_interval: float = config.DB_REPLICA_CHECK_INTERVAL,
+    ):
+        self.engines = engines
+        self.healthy: List[AsyncEngine] = list(engines)
+        self.check_interval = check_interval
+        self.task: Optional[asyncio.Task] = None
+        self._turn = itertools.count()
+        for engine in engines:
+            event.listen(engine.sync_engine, "handle_error", self._on_error)
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """
+        A réplica saudável com menos conexões em uso, ou `None` se não houver
+        nenhuma.
+        """
+        if not self.healthy:
+            return None
+        start = next(self._turn) % len(self.healthy)
+        candidates = self.healthy[start:] + self.healthy[:start]
+        return min(candidates, key=lambda engine: engine.sync_engine.pool.checkedout())
+
+    def mark_down(self, engine: AsyncEngine, reason: object):
+        """
+        Tira uma réplica do rodízio até a próxima verificação bem-sucedida.
+        """
+        if engine in self.healthy:
+            self.healthy.remove(engine)
+            logger.warning(f"Réplica {_name(engine)} fora do rodízio: {reason}")
+
+    async def check(self):
+        """
+        Verifica cada réplica com um `SELECT 1` e atualiza o rodízio.
+        """
+        for engine in self.engines:
+            try:
+                async with engine.connect() as connection:
+                    await asyncio.wait_for(
+                        connection.execute(
+                            text("SELECT 1").execution_options(**{IGNORE_OPTION: True})
+                        ),
+                        self.check_interval,
+                    )
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.mark_down(engine, exc)
+                continue
+            if engine not in self.healthy:
+                self.healthy.append(engine)
+                logger.info(f"Réplica {_name(engine)} de volta ao rodízio.")
+
+    async def monitor(self):
+        """
+        Verifica as réplicas periodicamente, até ser cancelado.
+        """
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+    def start(self):
+        """
+        Inicia o monitoramento em segundo plano, no event loop corrente.
+        """
+        if self.task is None:
+            self.task = asyncio.create_task(self.monitor())
+
+    async def close(self):
+        """
+        Cancela o monitoramento e fecha os pools das réplicas.
+        """
+        if self.task is not None:
+            self.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.task
+            self.task = None
+        for engine in self.engines:
+            event.remove(engine.sync_engine, "handle_error", self._on_error)
+            await engine.dispose()
+        self.healthy = []
+
+    def _on_error(self, context):
+        if context.is_disconnect:
+            for engine in self.engines:
+                if engine.sync_engine is context.engine:
+                    self.mark_down(engine, context.original_exception)
+
+
+class RoutingSession(Session):
+    """
+    Sessão que envia as leituras marcadas com `REPLICA_OPTION` a uma réplica
+    e todo o resto ao primário.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kw) -> Engine:
+        """
+        O motor que executa `clause`: uma réplica para as leituras marcadas
+        com `REPLICA_OPTION`, o primário para o resto. Registra também se a
+        sessão escreveu, para `read_your_writes`.
+        """
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[_WROTE] = True
+        replica = self._replica(clause)
+        if replica is not None:
+            return replica.sync_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _replica(self, clause) -> Optional[AsyncEngine]:
+        replicas: Optional[ReplicaSet] = self.info.get(REPLICAS)
+        if replicas is None or clause is None or self._flushing:
+            return None
+        if self.info.get(PRIMARY_ONLY):
+            return None
+        if not clause.get_execution_options().get(REPLICA_OPTION):
+            return None
+        if self.info.get(READ_YOUR_WRITES) and self.info.get(_WROTE):
+            return None
+        if self.info.get(_CHOSEN) not in replicas.healthy:
+            self.info[_CHOSEN] = replicas.choose()
+        return self.info[_CHOSEN]
+
+
+def routing_sessionmaker(
+    primary: AsyncEngine, replicas: ReplicaSet
+) -> async_sessionmaker:
+    """
+    A fábrica de sessões que roteia as leituras para as réplicas.
+    """
+    return async_sessionmaker(
+        primary,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        info={REPLICAS: replicas},
+    )
+
+
+def read_your_writes(session: AsyncSession) -> AsyncSession:
+    """
+    Faz a sessão ler do primário depois da sua primeira escrita, para que
+    ela sempre veja o que escreveu.
+
+    Returns:
+        AsyncSession: A própria sessão.
+    """
+    session.sync_session.info[READ_YOUR_WRITES] = True
+    return session
+
+
+def primary_only(session: AsyncSession) -> AsyncSession:
+    """
+    Faz a sessão ler sempre do primário, para leituras que não podem ver um
+    estado anterior ao de uma invalidação já recebida.
+
+    Returns:
+        AsyncSession: A própria sessão.
+    """
+    session.sync_session.info[PRIMARY_ONLY] = True
+    return session
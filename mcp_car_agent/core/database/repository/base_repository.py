@@ -1,12 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, List, Optional, TypeVar
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import Select, delete
 from sqlalchemy.exc import MultipleResultsFound
 from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.change_log import log_ids
+from mcp_car_agent.core.database.deadline import (
+    exec_with_deadline,
+    stream_with_deadline,
+)
+from mcp_car_agent.core.database.instrumentation import instrumented
+from mcp_car_agent.core.database.invalidation import InProcessInvalidationBus
+from mcp_car_agent.core.database.replicas import REPLICA_OPTION
 from mcp_car_agent.core.interfaces.database_repository import IDefaultRepository
+from mcp_car_agent.core.interfaces.invalidation_bus import IInvalidationBus
+from mcp_car_agent.core.services.tracing import tracer
+
+ATOMIC = "atomic"
+"""
+Chave do `info` da sessão com as invalidações pendentes de um bloco `atomic`.
+"""
 
 T = TypeVar("T", bound=BaseModel)
 M = TypeVar("M", bound=SQLModel)
@@ -16,8 +34,19 @@ class BaseRepository(Generic[T, M], IDefaultRepository[T], ABC):
     """
     Implementação base genérica da interface IDefaultRepository para SQLModel.
     Esta classe é abstrata e deve ser herdada por repositórios específicos.
+
+    Toda escrita é registrada no `change_log`, na mesma transação, e publicada
+    em `bus`, compartilhado por todos os repositórios, para que caches em
+    memória (locais ou de outros nós) descartem os registros alterados.
+    Escritas de vários repositórios na mesma sessão podem ser agrupadas em uma
+    única transação com `atomic`.
+
+    As leituras `search` e `get_one` podem ser atendidas por uma réplica (ver
+    `mcp_car_agent.core.database.replicas`).
     """
 
+    bus: IInvalidationBus = InProcessInvalidationBus()
+
     def __init__(self, session: AsyncSession, model: type[M], schema: type[T]):
         self.session = session
         self.model = model
@@ -27,14 +56,65 @@ class BaseRepository(Generic[T, M], IDefaultRepository[T], ABC):
     async def input(self, data: T) -> M:
         pass
 
+    async def _commit(self, ids: List[int]):
+        """
+        Registra os IDs alterados no `change_log`, confirma a transação e
+        publica a invalidação: na própria transação, se o barramento oferecer
+        statements para isso, ou após o commit. Dentro de `atomic`, o commit é
+        adiado para o fim do bloco.
+        """
+        table = self.model.__tablename__
+        published = not ids
+        if ids:
+            await self.session.exec(log_ids(table, ids))
+            for statement in self.bus.statements(table, ids):
+                await self.session.exec(statement)
+                published = True
+        pending = self.session.info.get(ATOMIC)
+        if pending is not None:
+            # Dentro de `atomic`: o commit e a publicação ficam para o fim do bloco.
+            pending.extend([] if published else [(table, ids)])
+            return
+        await self.session.commit()
+        if not published:
+            await self.bus.publish(table, ids)
+
+    @instrumented
     async def create(self, data: T):
         db_model = await self.input(data)
         self.session.add(db_model)
-        await self.session.commit()
+        await self.session.flush()
+        await self._commit([db_model.id])
         await self.session.refresh(db_model)
         data.id = db_model.id
         return data
 
+    @instrumented
+    async def create_many(self, data: List[T]) -> List[T]:
+        """
+        Cria vários registros em uma única transação.
+
+        Os registros são enviados juntos no flush, o que permite ao SQLAlchemy
+        agrupá-los em INSERTs com vários valores, e a invalidação é publicada
+        uma única vez para o lote.
+
+        Args:
+            data (List[T]): Os registros a serem criados.
+
+        Returns:
+            List[T]: Os mesmos registros, com os IDs preenchidos.
+        """
+        if not data:
+            return data
+        db_models = [await self.input(item) for item in data]
+        self.session.add_all(db_models)
+        await self.session.flush()
+        for item, db_model in zip(data, db_models):
+            item.id = db_model.id
+        await self._commit([db_model.id for db_model in db_models])
+        return data
+
+    @instrumented
     async def update(self, data: T, _id: int):
         existing_db_model = await self.session.get(self.model, _id)
         if not existing_db_model:
@@ -45,46 +125,130 @@ class BaseRepository(Generic[T, M], IDefaultRepository[T], ABC):
                 setattr(existing_db_model, key, value)
 
         self.session.add(existing_db_model)
-        await self.session.commit()
+        await self._commit([_id])
         await self.session.refresh(existing_db_model)
         return self.schema.model_validate(existing_db_model.model_dump())
 
+    @instrumented
+    async def update_many(self, data: List[T]) -> List[T]:
+        """
+        Sobrescreve vários registros existentes em uma única transação.
+
+        Diferente de `update`, todas as colunas mapeadas por `input` são
+        gravadas, inclusive as que passaram a ser vazias.
+
+        Args:
+            data (List[T]): Os registros, com os IDs preenchidos.
+
+        Returns:
+            List[T]: Os mesmos registros.
+        """
+        if not data:
+            return data
+        ids = [item.id for item in data]
+        query = select(self.model).where(self.model.id.in_(ids))
+        result = await exec_with_deadline(self.session, query)
+        db_models = {db_model.id: db_model for db_model in result.all()}
+        for item in data:
+            values = (await self.input(item)).model_dump(exclude={"id"})
+            db_models[item.id].sqlmodel_update(values)
+        await self._commit(ids)
+        return data
+
+    @instrumented
     async def delete(self, _id: int):
         data = await self.session.get(self.model, _id)
         if data:
             await self.session.delete(data)
-            await self.session.commit()
+            await self._commit([_id])
             return True
         return False
 
-    async def search(
+    @instrumented
+    async def delete_many(self, ids: List[int]) -> int:
+        """
+        Exclui vários registros com um único DELETE.
+
+        Args:
+            ids (List[int]): Os identificadores dos registros.
+
+        Returns:
+            int: O número de registros excluídos.
+        """
+        if not ids:
+            return 0
+        result = await self.session.exec(
+            delete(self.model).where(self.model.id.in_(ids))
+        )
+        await self._commit(list(ids))
+        return result.rowcount
+
+    def _filtered(
         self,
+        query: Select,
         filters: Optional[dict] = None,
         order_by: Optional[str] = None,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
-    ) -> List[T]:
-        query = select(self.model)
-        if filters:
-            for key, value in filters.items():
-                query = query.where(getattr(self.model, key) == value)
-
+    ) -> Select:
+        """
+        Aplica à consulta os filtros, a ordenação e a paginação de `search`.
+        """
+        for key, value in (filters or {}).items():
+            query = query.where(getattr(self.model, key) == value)
         if order_by:
             query = query.order_by(getattr(self.model, order_by))
-
         if offset is not None:
             query = query.offset(offset)
         if limit is not None:
             query = query.limit(limit)
+        return query
 
-        result = await self.session.exec(query)
-        return list(
-            map(
-                lambda data: self.schema.model_validate(data.model_dump()),
-                result.all(),
-            )
+    @instrumented
+    async def search(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[T]:
+        query = self._filtered(select(self.model), filters, order_by, offset, limit)
+        result = await exec_with_deadline(
+            self.session, query.execution_options(**{REPLICA_OPTION: True})
         )
+        return self.to_schemas(result.all())
+
+    def to_schemas(self, rows: List[M]) -> List[T]:
+        """
+        Converte os modelos do banco no esquema do repositório, em um span de
+        rastreamento próprio (a validação do pydantic pesa em buscas grandes).
+        """
+        with tracer.span("schema.convert", schema=self.schema.__name__, rows=len(rows)):
+            return [self.schema.model_validate(row.model_dump()) for row in rows]
+
+    def stream_columns(self) -> Select:
+        """
+        A consulta base de `stream`: as colunas da tabela do repositório.
+
+        Repositórios podem sobrescrevê-la para incluir colunas de outras
+        tabelas (ex: o nome do fabricante do carro).
+        """
+        return select(*self.model.__table__.columns)
+
+    async def stream(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        query = self._filtered(self.stream_columns(), filters, order_by, offset, limit)
+        async for row in stream_with_deadline(
+            self.session, query.execution_options(yield_per=config.EXPORT_BATCH_SIZE)
+        ):
+            yield dict(row)
 
+    @instrumented
     async def get_one(self, by: Dict) -> T:
         query = select(self.model)
         if not by:
@@ -93,7 +257,9 @@ class BaseRepository(Generic[T, M], IDefaultRepository[T], ABC):
         for key, value in by.items():
             query = query.where(getattr(self.model, key) == value)
 
-        result = await self.session.exec(query)
+        result = await exec_with_deadline(
+            self.session, query.execution_options(**{REPLICA_OPTION: True})
+        )
         try:
             db_instance: M = result.one_or_none()
         except MultipleResultsFound:
@@ -106,4 +272,33 @@ class BaseRepository(Generic[T, M], IDefaultRepository[T], ABC):
                 f"Nenhum {self.model.__name__} encontrado com o critério: {by}"
             )
 
-        return self.schema.model_validate(db_instance.model_dump())
+        return self.to_schemas([db_instance])[0]
+
+
+@asynccontextmanager
+async def atomic(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Agrupa as escritas dos repositórios na sessão em uma única transação.
+
+    Dentro do bloco, cada escrita só registra o `change_log`; o commit e as
+    invalidações publicadas após o commit ficam para o fim do bloco. Uma
+    exceção desfaz todas as escritas do bloco.
+
+    Args:
+        session (AsyncSession): A sessão usada pelos repositórios.
+
+    Yields:
+        AsyncSession: A mesma sessão.
+    """
+    pending: List[Tuple[str, List[int]]] = []
+    session.info[ATOMIC] = pending
+    try:
+        yield session
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        del session.info[ATOMIC]
+    await session.commit()
+    for table, ids in pending:
+        await BaseRepository.bus.publish(table, ids)
@@ -1,8 +1,26 @@
+from typing import List
+
+from sqlalchemy import Select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from mcp_car_agent.core.database.models import CarModel, CarSpecsModel
+from mcp_car_agent.core.database.deadline import exec_with_deadline
+from mcp_car_agent.core.database.instrumentation import instrumented
+from mcp_car_agent.core.database.models import (
+    CarModel,
+    CarSpecsModel,
+    EngineModel,
+    ManufacturerModel,
+    TransmissionModel,
+)
 from mcp_car_agent.core.database.repository.base_repository import BaseRepository
 from mcp_car_agent.core.schemas.car_schema import Car, CarSpecs
+from mcp_car_agent.core.schemas.engine_schema import Engine, EngineSpec
+from mcp_car_agent.core.schemas.equipment_schema import Equipment
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+from mcp_car_agent.core.services.tracing import tracer
 
 
 class CarRepository(BaseRepository[Car, CarModel]):
@@ -19,6 +37,90 @@ class CarRepository(BaseRepository[Car, CarModel]):
             manufacturer_id=data.manufacturer.id,
         )
 
+    def stream_columns(self) -> Select:
+        """
+        As colunas do carro junto com as do fabricante, da transmissão e do
+        motor, para exportações legíveis sem consultas adicionais.
+        """
+        return (
+            select(
+                *CarModel.__table__.columns,
+                ManufacturerModel.name.label("manufacturer"),
+                TransmissionModel.gearbox_type,
+                TransmissionModel.gears_qtde,
+                TransmissionModel.traction,
+                EngineModel.compression_rate,
+                EngineModel.total_cc,
+                EngineModel.aspiration,
+            )
+            .join(ManufacturerModel, CarModel.manufacturer_id == ManufacturerModel.id)
+            .join(TransmissionModel, CarModel.transmission_id == TransmissionModel.id)
+            .join(EngineModel, CarModel.engine_id == EngineModel.id)
+        )
+
+    @instrumented
+    async def get_many(self, ids: List[int]) -> List[Car]:
+        """
+        Busca o grafo completo (motor, transmissão, fabricante, equipamentos e
+        especificações) de vários carros.
+
+        Relações muitos-para-um são carregadas via JOIN e coleções via
+        `SELECT ... IN`, de modo que o número de consultas é constante,
+        independente da quantidade de IDs.
+
+        Args:
+            ids (List[int]): Os IDs dos carros.
+
+        Returns:
+            List[Car]: Os carros encontrados, na ordem dos IDs informados.
+        """
+        if not ids:
+            return []
+
+        query = (
+            select(CarModel)
+            .where(CarModel.id.in_(ids))
+            .options(
+                joinedload(CarModel.engine).selectinload(EngineModel.engine_specs),
+                joinedload(CarModel.transmission),
+                joinedload(CarModel.manufacturer),
+                selectinload(CarModel.equipments),
+                selectinload(CarModel.car_specs),
+            )
+        )
+        result = await exec_with_deadline(self.session, query)
+        rows = result.all()
+        with tracer.span("schema.convert", schema="Car", rows=len(rows)):
+            cars = {car.id: self.to_graph(car) for car in rows}
+        return [cars[_id] for _id in ids if _id in cars]
+
+    @staticmethod
+    def to_graph(car: CarModel) -> Car:
+        """
+        Converte um `CarModel` com relações já carregadas no schema `Car` completo.
+
+        Args:
+            car (CarModel): O modelo com as relações carregadas.
+
+        Returns:
+            Car: O schema com o grafo completo do carro.
+        """
+        engine = Engine.model_validate(car.engine.model_dump())
+        if car.engine.engine_specs:
+            engine.engine_specs = EngineSpec.model_validate(
+                car.engine.engine_specs[0].model_dump()
+            )
+        return Car(
+            **car.model_dump(),
+            engine=engine,
+            transmission=Transmission.model_validate(car.transmission.model_dump()),
+            manufacturer=Manufacturer.model_validate(car.manufacturer.model_dump()),
+            equipments=[
+                Equipment.model_validate(e.model_dump()) for e in car.equipments
+            ],
+            car_specs=[CarSpecs.model_validate(s.model_dump()) for s in car.car_specs],
+        )
+
 
 class CarSpecsRepository(BaseRepository[CarSpecs, CarSpecsModel]):
     def __init__(self, session: AsyncSession):
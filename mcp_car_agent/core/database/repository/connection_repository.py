@@ -1,50 +1,183 @@
 """
-Módulo de repositório de conexão para PostgreSQL.
+Módulo de repositório de conexão com o banco de dados.
 
 Este módulo gerencia a criação de sessões de banco de dados assíncronas para
-o PostgreSQL, garantindo que as tabelas sejam criadas e que as sessões
-sejam devidamente gerenciadas dentro de um contexto.
+o banco de `DB_ENGINE` (PostgreSQL, MySQL ou SQLite), garantindo que as
+tabelas sejam criadas e que as sessões sejam devidamente gerenciadas dentro
+de um contexto.
 """
 
+import asyncio
 import urllib
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from mcp_car_agent.core import config
+from mcp_car_agent.core.database.dialects import dialect_profile
+from mcp_car_agent.core.database.instrumentation import (
+    MeteredQueuePool,
+    instrumentation,
+)
+from mcp_car_agent.core.database.replicas import ReplicaSet, routing_sessionmaker
 from mcp_car_agent.core.interfaces.database_repository import IConnectionRepository
 
 
 class ConnectionRepository(IConnectionRepository[AsyncSession]):
     """
-    Repositório de conexão para o banco de dados PostgreSQL.
+    Repositório de conexão para o banco de dados da aplicação.
 
     Esta classe implementa a interface `IConnectionRepository` para fornecer
-    uma conexão assíncrona com o banco de dados PostgreSQL.
+    uma conexão assíncrona com o banco de dados de `DB_ENGINE`.
+
+    O motor (e seu pool de conexões) é criado uma única vez por processo e
+    compartilhado por todas as sessões, assim como os das réplicas de
+    leitura, se houver.
     """
 
+    _session_factory: Optional[async_sessionmaker] = None
+    _replicas: Optional[ReplicaSet] = None
+    _lock: Optional[asyncio.Lock] = None
+
+    @staticmethod
+    def url(host: Optional[str] = None) -> str:
+        """
+        Monta a URL de conexão a partir das configurações da aplicação, com o
+        driver do banco de `DB_ENGINE` (ver
+        `mcp_car_agent.core.database.dialects`).
+
+        Args:
+            host (Optional[str]): O servidor (`host` ou `host:porta`), para as
+                réplicas; por padrão, o primário (`DB_HOST` e `DB_PORT`).
+
+        Returns:
+            str: A URL de conexão do SQLAlchemy.
+        """
+        profile = dialect_profile()
+        scheme = f"{profile.backend}+{profile.driver}"
+        if profile.port is None:
+            return f"{scheme}:///{config.DB_NAME}"
+        host, _, port = (host or config.DB_HOST).partition(":")
+        return (
+            f"{scheme}://{urllib.parse.quote(config.DB_USER)}:"
+            + f"{urllib.parse.quote(config.DB_PWD)}@{host}:"
+            + f"{port or config.DB_PORT or profile.port}/{config.DB_NAME}"
+        )
+
+    @staticmethod
+    def engine(url: str) -> AsyncEngine:
+        """
+        Cria um motor assíncrono instrumentado, com o pool configurado e os
+        ajustes do banco.
+        """
+        profile = dialect_profile()
+        async_engine = create_async_engine(
+            url,
+            echo=config.DB_ECHO,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            poolclass=MeteredQueuePool,
+            **profile.engine_options(),
+        )
+        profile.attach(async_engine)
+        instrumentation.attach(async_engine)
+        return async_engine
+
+    @staticmethod
+    def dedicated_engine(engine: AsyncEngine, bulk: bool = False) -> AsyncEngine:
+        """
+        Cria um motor sem pool para o mesmo banco de `engine`, para conexões
+        que não devem ocupar o pool das requisições: as de longa duração (ex:
+        o LISTEN do barramento de invalidação) e as com ajustes próprios (ex:
+        a da importação em massa).
+
+        Args:
+            engine (AsyncEngine): O motor compartilhado.
+            bulk (bool): Se o motor é o da importação em massa (ver
+                `DialectProfile.engine_options`).
+
+        Returns:
+            AsyncEngine: O motor, cujas conexões são abertas e fechadas a cada uso.
+        """
+        profile = dialect_profile(engine.dialect.name)
+        dedicated = create_async_engine(
+            engine.url, poolclass=NullPool, **profile.engine_options(bulk=bulk)
+        )
+        profile.attach(dedicated)
+        return dedicated
+
+    @classmethod
+    async def session_factory(cls) -> async_sessionmaker:
+        """
+        Retorna a fábrica de sessões compartilhada, criando-a na primeira chamada.
+
+        Na criação, o motor assíncrono é instanciado, instrumentado (ver
+        `mcp_car_agent.core.database.instrumentation`) e o esquema do banco de
+        dados é criado no primário. Com `DB_REPLICA_HOSTS`, também são criados
+        os motores das réplicas (ver `mcp_car_agent.core.database.replicas`).
+        As chamadas seguintes reutilizam os mesmos pools.
+
+        Returns:
+            async_sessionmaker: A fábrica de sessões assíncronas.
+        """
+        # Criado na primeira chamada, já no event loop que usará o pool.
+        lock = cls._lock = cls._lock or asyncio.Lock()
+        async with lock:
+            if cls._session_factory is None:
+                async_engine = cls.engine(cls.url())
+                async with async_engine.begin() as conn:
+                    await conn.run_sync(SQLModel.metadata.create_all)
+                cls._session_factory = cls._sessionmaker(async_engine)
+        return cls._session_factory
+
+    @classmethod
+    def _sessionmaker(cls, primary: AsyncEngine) -> async_sessionmaker:
+        """
+        A fábrica de sessões: com réplicas configuradas, as leituras dos
+        repositórios são roteadas para elas, monitoradas em segundo plano.
+        """
+        if not config.DB_REPLICA_HOSTS:
+            return async_sessionmaker(
+                primary, class_=AsyncSession, expire_on_commit=False
+            )
+        replicas = cls._replicas = ReplicaSet(
+            [cls.engine(cls.url(host)) for host in config.DB_REPLICA_HOSTS]
+        )
+        replicas.start()
+        return routing_sessionmaker(primary, replicas)
+
+    @classmethod
+    async def close(cls):
+        """
+        Encerra a fábrica de sessões compartilhada: cancela o monitoramento das
+        réplicas e fecha os pools do primário e das réplicas. Uma chamada
+        seguinte a `session_factory` cria tudo de novo.
+        """
+        factory, cls._session_factory = cls._session_factory, None
+        replicas, cls._replicas = cls._replicas, None
+        if replicas is not None:
+            await replicas.close()
+        if factory is not None:
+            await factory.kw["bind"].dispose()
+
     @staticmethod
     async def connect() -> AsyncGenerator[AsyncSession, None]:
         """
         Cria e gerencia uma sessão de banco de dados assíncrona.
 
-        Cria o motor assíncrono, garante que o esquema do banco de dados seja
-        criado e, em seguida, cede uma sessão assíncrona para a aplicação.
+        Obtém a fábrica de sessões compartilhada e cede uma sessão assíncrona
+        para a aplicação, devolvendo a conexão ao pool ao final.
 
         Yields:
             AsyncGenerator[AsyncSession, None]: Uma sessão de banco de dados assíncrona.
         """
-        async_engine = create_async_engine(
-            f"postgresql+asyncpg://{urllib.parse.quote(config.DB_USER)}:"
-            + f"{urllib.parse.quote(config.DB_PWD)}@{config.DB_HOST}:"
-            + f"{config.DB_PORT}/{config.DB_NAME}",
-            echo=True,
-        )
-        async with async_engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
-        async_session = async_sessionmaker(
-            async_engine, class_=AsyncSession, expire_on_commit=False
-        )
+        async_session = await ConnectionRepository.session_factory()
         async with async_session() as session:
             yield session
@@ -1,11 +1,20 @@
+from typing import Dict, List
+
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from mcp_car_agent.core.database.deadline import exec_with_deadline
+from mcp_car_agent.core.database.instrumentation import instrumented
 from mcp_car_agent.core.database.models import EngineModel, EngineSpecModel
+from mcp_car_agent.core.database.natural_key import engine_key
 from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.database.repository.natural_key_repository import (
+    NaturalKeyRepository,
+)
 from mcp_car_agent.core.schemas.engine_schema import Engine, EngineSpec
 
 
-class EngineRepository(BaseRepository[Engine, EngineModel]):
+class EngineRepository(NaturalKeyRepository[Engine, EngineModel]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, model=EngineModel, schema=Engine)
 
@@ -14,8 +23,18 @@ class EngineRepository(BaseRepository[Engine, EngineModel]):
             compression_rate=data.compression_rate,
             total_cc=data.total_cc,
             aspiration=data.aspiration,
+            natural_key=self.natural_key(data),
         )
 
+    def natural_key(self, data: Engine) -> str:
+        return engine_key(data)
+
+    async def stored(self, db_model: EngineModel) -> Engine:
+        engine = Engine.model_validate(db_model.model_dump())
+        specs = await EngineSpecRepository(self.session).by_engine([engine.id])
+        engine.engine_specs = specs.get(engine.id)
+        return engine
+
 
 class EngineSpecRepository(BaseRepository[EngineSpec, EngineSpecModel]):
     def __init__(self, session: AsyncSession):
@@ -31,3 +50,30 @@ class EngineSpecRepository(BaseRepository[EngineSpec, EngineSpecModel]):
             torque_unit_measure=data.torque_unit_measure,
             engine_id=data.engine.id,
         )
+
+    @instrumented
+    async def by_engine(self, engine_ids: List[int]) -> Dict[int, EngineSpec]:
+        """
+        Busca a especificação gravada de cada motor.
+
+        Args:
+            engine_ids (List[int]): Os IDs dos motores.
+
+        Returns:
+            Dict[int, EngineSpec]: A especificação mais antiga de cada motor
+                que tem uma, com `engine` apontando para o motor.
+        """
+        if not engine_ids:
+            return {}
+        query = (
+            select(EngineSpecModel)
+            .where(EngineSpecModel.engine_id.in_(engine_ids))
+            .order_by(EngineSpecModel.id)
+        )
+        specs = {}
+        for row in (await exec_with_deadline(self.session, query)).all():
+            if row.engine_id not in specs:
+                specs[row.engine_id] = EngineSpec.model_validate(
+                    {**row.model_dump(), "engine": {"id": row.engine_id}}
+                )
+        return specs
@@ -1,10 +1,19 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from mcp_car_agent.core.database.models import ManufacturerModel
-from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.database.natural_key import manufacturer_key
+from mcp_car_agent.core.database.repository.natural_key_repository import (
+    NaturalKeyRepository,
+)
 from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
 
 
-class ManufacturerRepository(BaseRepository[Manufacturer, ManufacturerModel]):
+class ManufacturerRepository(NaturalKeyRepository[Manufacturer, ManufacturerModel]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, model=ManufacturerModel, schema=Manufacturer)
+
+    async def input(self, data: Manufacturer) -> ManufacturerModel:
+        return ManufacturerModel(name=data.name, natural_key=self.natural_key(data))
+
+    def natural_key(self, data: Manufacturer) -> str:
+        return manufacturer_key(data)
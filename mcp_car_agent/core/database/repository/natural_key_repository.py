@@ -0,0 +1,118 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlmodel import select
+
+from mcp_car_agent.core.database.deadline import exec_with_deadline
+from mcp_car_agent.core.database.instrumentation import instrumented
+from mcp_car_agent.core.database.repository.base_repository import BaseRepository, M, T
+
+
+class NaturalKeyRepository(BaseRepository[T, M], ABC):
+    """
+    Base dos repositórios de tabelas com a coluna `natural_key` (fabricante,
+    transmissão, motor), que implementam `natural_key` e ganham
+    `get_or_create_many`.
+    """
+
+    @abstractmethod
+    def natural_key(self, data: T) -> str:
+        """
+        Calcula a chave natural de um registro.
+
+        Args:
+            data (T): O registro.
+
+        Returns:
+            str: A chave natural normalizada.
+        """
+
+    async def update(self, data: T, _id: int):
+        """
+        Atualiza o registro como `BaseRepository.update`, recalculando a chave
+        natural a partir dos valores resultantes. Sem isso, um registro
+        renomeado manteria a chave antiga, e `get_or_create_many` resolveria o
+        nome antigo para ele e criaria um registro repetido para o novo.
+
+        Args:
+            data (T): Os valores a alterar (os vazios são ignorados).
+            _id (int): O ID do registro.
+
+        Returns:
+            T: O registro atualizado.
+        """
+        db_model = await self.session.get(self.model, _id)
+        if db_model is not None:
+            current = await self.stored(db_model)
+            for key, value in data.model_dump(exclude_unset=True).items():
+                if value:
+                    setattr(current, key, getattr(data, key))
+            db_model.natural_key = self.natural_key(current)
+        return await super().update(data, _id)
+
+    async def stored(self, db_model: M) -> T:
+        """
+        O registro gravado, com tudo o que a chave natural lê.
+
+        Repositórios cuja chave depende de outras tabelas (ex: a especificação
+        do motor) a sobrescrevem.
+        """
+        return self.schema.model_validate(db_model.model_dump())
+
+    @instrumented
+    async def get_or_create_many(self, data: List[T]) -> List[T]:
+        """
+        Resolve vários registros pela chave natural, criando os que não existem.
+
+        Os registros ausentes são inseridos com um único INSERT que ignora
+        conflitos na chave natural (`ON CONFLICT DO NOTHING` / `INSERT IGNORE`)
+        e todos os IDs são lidos em seguida. Assim, ingestões concorrentes que
+        tentem criar a mesma dimensão acabam apontando para o mesmo registro.
+
+        Args:
+            data (List[T]): Os registros (pode conter repetições).
+
+        Returns:
+            List[T]: Os mesmos registros, com os IDs preenchidos.
+        """
+        if not data:
+            return data
+        rows = {}
+        for item in data:
+            row = (await self.input(item)).model_dump(exclude={"id"})
+            rows.setdefault(row["natural_key"], row)
+        ids = await self._ids_by_natural_key(list(rows))
+        missing = [row for key, row in rows.items() if key not in ids]
+        if missing:
+            await self.session.exec(self._insert_ignore().values(missing))
+            ids = await self._ids_by_natural_key(list(rows))
+        await self._commit([ids[row["natural_key"]] for row in missing])
+        for item in data:
+            item.id = ids[self.natural_key(item)]
+        return data
+
+    async def _ids_by_natural_key(self, keys: List[str]) -> Dict[str, int]:
+        query = select(self.model.natural_key, self.model.id).where(
+            self.model.natural_key.in_(keys)
+        )
+        result = await exec_with_deadline(self.session, query)
+        return dict(result.all())
+
+    def _insert_ignore(self):
+        """
+        INSERT que ignora linhas cuja chave natural já existe, conforme o dialeto.
+        """
+        dialect = self.session.bind.dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(self.model).on_conflict_do_nothing(
+                index_elements=["natural_key"]
+            )
+        if dialect == "sqlite":
+            return sqlite.insert(self.model).on_conflict_do_nothing(
+                index_elements=["natural_key"]
+            )
+        if dialect == "mysql":
+            return mysql.insert(self.model).prefix_with("IGNORE")
+        return insert(self.model)
@@ -0,0 +1,74 @@
+from typing import Dict, List
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mcp_car_agent.core.database.deadline import exec_with_deadline
+from mcp_car_agent.core.database.instrumentation import instrumented
+from mcp_car_agent.core.database.models import SourcePageModel
+from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.schemas.source_page_schema import SourcePage
+
+
+class SourcePageRepository(BaseRepository[SourcePage, SourcePageModel]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, model=SourcePageModel, schema=SourcePage)
+
+    async def input(self, data: SourcePage) -> SourcePageModel:
+        return SourcePageModel(
+            url=data.url,
+            etag=data.etag,
+            last_modified=data.last_modified,
+            content_hash=data.content_hash,
+            car_id=data.car_id,
+        )
+
+    @instrumented
+    async def get_many(self, urls: List[str]) -> Dict[str, SourcePage]:
+        """
+        Busca as impressões digitais de várias páginas em uma única consulta.
+
+        Args:
+            urls (List[str]): As URLs das páginas.
+
+        Returns:
+            Dict[str, SourcePage]: As páginas já conhecidas, indexadas pela URL.
+        """
+        if not urls:
+            return {}
+        query = select(SourcePageModel).where(SourcePageModel.url.in_(urls))
+        result = await exec_with_deadline(self.session, query)
+        return {
+            page.url: self.schema.model_validate(page.model_dump())
+            for page in result.all()
+        }
+
+    @instrumented
+    async def save_many(self, pages: List[SourcePage]) -> List[SourcePage]:
+        """
+        Grava as impressões digitais das páginas, atualizando as já conhecidas.
+
+        Args:
+            pages (List[SourcePage]): As páginas obtidas na ingestão.
+
+        Returns:
+            List[SourcePage]: As mesmas páginas, com os IDs preenchidos.
+        """
+        query = select(SourcePageModel).where(
+            SourcePageModel.url.in_([page.url for page in pages])
+        )
+        existing = {
+            page.url: page
+            for page in (await exec_with_deadline(self.session, query)).all()
+        }
+        for page in pages:
+            if page.url in existing:
+                existing[page.url].sqlmodel_update(page.model_dump(exclude={"id"}))
+            else:
+                existing[page.url] = await self.input(page)
+                self.session.add(existing[page.url])
+        await self.session.flush()
+        for page in pages:
+            page.id = existing[page.url].id
+        await self._commit([])
+        return pages
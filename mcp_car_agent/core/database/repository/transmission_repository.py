@@ -1,10 +1,24 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from mcp_car_agent.core.database.models import TransmissionModel
-from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.database.natural_key import transmission_key
+from mcp_car_agent.core.database.repository.natural_key_repository import (
+    NaturalKeyRepository,
+)
 from mcp_car_agent.core.schemas.transmission_schema import Transmission
 
 
-class TransmissionRepository(BaseRepository[Transmission, TransmissionModel]):
+class TransmissionRepository(NaturalKeyRepository[Transmission, TransmissionModel]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, model=TransmissionModel, schema=Transmission)
+
+    async def input(self, data: Transmission) -> TransmissionModel:
+        return TransmissionModel(
+            gearbox_type=data.gearbox_type,
+            gears_qtde=data.gears_qtde,
+            traction=data.traction,
+            natural_key=self.natural_key(data),
+        )
+
+    def natural_key(self, data: Transmission) -> str:
+        return transmission_key(data)
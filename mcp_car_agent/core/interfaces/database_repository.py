@@ -7,7 +7,7 @@ implementação de banco de dados específica, seguindo o padrão "Ports and Ada
 """
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Generic, Optional, TypeVar
+from typing import AsyncGenerator, AsyncIterator, Generic, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -54,6 +54,19 @@ class IDefaultRepository(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, data: list[T]) -> list[T]:
+        """
+        Cria vários registros de uma só vez no repositório.
+
+        Args:
+            data (list[T]): Os objetos de dados a serem criados.
+
+        Returns:
+            list[T]: Os objetos criados, com os identificadores preenchidos.
+        """
+        pass
+
     @abstractmethod
     async def update(self, data: T, _id: int):
         """
@@ -65,6 +78,19 @@ class IDefaultRepository(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def update_many(self, data: list[T]) -> list[T]:
+        """
+        Sobrescreve vários registros existentes de uma só vez.
+
+        Args:
+            data (list[T]): Os objetos de dados, com os identificadores preenchidos.
+
+        Returns:
+            list[T]: Os objetos atualizados.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, _id: int):
         """
@@ -75,6 +101,19 @@ class IDefaultRepository(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def delete_many(self, ids: list[int]) -> int:
+        """
+        Exclui vários registros de uma só vez.
+
+        Args:
+            ids (list[int]): Os identificadores dos registros a serem excluídos.
+
+        Returns:
+            int: O número de registros excluídos.
+        """
+        pass
+
     @abstractmethod
     async def search(
         self,
@@ -97,6 +136,32 @@ class IDefaultRepository(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def stream(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Percorre os registros com um cursor no servidor, sem materializá-los.
+
+        Aceita os mesmos filtros e a mesma paginação de `search` e respeita o
+        prazo corrente (ver `mcp_car_agent.core.database.deadline`) durante a
+        leitura inteira.
+
+        Args:
+            filters (Optional[dict]): Dicionário de filtros para a consulta.
+            order_by (Optional[str]): Coluna para ordenação dos resultados.
+            offset (Optional[int]): O ponto de partida da paginação.
+            limit (Optional[int]): O número máximo de resultados a serem retornados.
+
+        Yields:
+            dict: As colunas de cada registro, indexadas pelo nome.
+        """
+        pass
+
     @abstractmethod
     async def get_one(self, by: dict) -> T:
         """
@@ -0,0 +1,54 @@
+"""
+Módulo de interfaces para a obtenção de páginas pelo scraper.
+
+O scraper depende apenas deste contrato, de modo que o cliente HTTP real
+possa ser trocado por um cache em disco ou por um substituto local nos testes.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class FetchResponse:
+    """
+    Resposta de uma requisição feita pelo scraper.
+    """
+
+    url: str
+    status: int
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class IFetcher(ABC):
+    """
+    Interface para clientes que obtêm páginas da fonte de dados.
+    """
+
+    @abstractmethod
+    async def fetch(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> FetchResponse:
+        """
+        Obtém uma página.
+
+        Args:
+            url (str): A URL da página.
+            headers (Optional[Dict[str, str]]): Cabeçalhos extras da requisição.
+
+        Returns:
+            FetchResponse: A resposta obtida, qualquer que seja o status HTTP.
+
+        Raises:
+            ConnectionError: Se a página não puder ser obtida (rede, timeout).
+        """
+        pass
+
+    @abstractmethod
+    async def close(self):
+        """
+        Libera os recursos do cliente (ex: conexões mantidas em keep-alive).
+        """
+        pass
@@ -0,0 +1,60 @@
+"""
+Módulo de interfaces para o barramento de invalidação de cache.
+
+Define o contrato usado pelos repositórios para avisar, a cada escrita, que
+registros de uma tabela mudaram, e pelos caches para serem notificados,
+independente de o aviso trafegar dentro do processo ou entre nós.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List
+
+from mcp_car_agent.core.schemas.invalidation_schema import InvalidationEvent
+
+InvalidationHandler = Callable[[InvalidationEvent], None]
+
+
+class IInvalidationBus(ABC):
+    """
+    Interface para barramentos de invalidação de cache.
+    """
+
+    @abstractmethod
+    async def publish(self, table: str, ids: List[int]):
+        """
+        Publica que os registros informados de uma tabela foram alterados.
+
+        Args:
+            table (str): O nome da tabela alterada.
+            ids (List[int]): Os IDs dos registros alterados.
+        """
+        pass
+
+    @abstractmethod
+    def subscribe(self, handler: InvalidationHandler):
+        """
+        Registra um handler chamado a cada evento de invalidação recebido.
+
+        Args:
+            handler (InvalidationHandler): Função que recebe o evento.
+        """
+        pass
+
+    def statements(  # pylint: disable=unused-argument
+        self, table: str, ids: List[int]
+    ) -> List[Any]:
+        """
+        Os statements que publicam o evento dentro da transação da escrita, de
+        modo que ele só seja entregue se ela for confirmada (ex: `pg_notify`).
+
+        Quem os executa na transação não chama `publish` depois do commit. Por
+        padrão, não há nenhum, e o evento é publicado por `publish`.
+
+        Args:
+            table (str): O nome da tabela alterada.
+            ids (List[int]): Os IDs dos registros alterados.
+
+        Returns:
+            List[Any]: Os statements a executar antes do commit.
+        """
+        return []
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class BenchmarkResult(BaseModel):
+    backend: str = Field(min_length=1)
+    size: int = Field(ge=0)
+    operation: str = Field(min_length=1)
+    rows_per_op: int = Field(gt=0)
+    ops: int = Field(gt=0)
+    ops_per_sec: float = Field(ge=0)
+    p50_ms: float = Field(ge=0)
+    p95_ms: float = Field(ge=0)
+    p99_ms: float = Field(ge=0)
+
+    @property
+    def key(self) -> str:
+        """
+        Identifica o resultado na comparação entre execuções (ex:
+        "sqlite/1000/search").
+        """
+        return f"{self.backend}/{self.size}/{self.operation}"
+
+
+class BenchmarkRun(BaseModel):
+    created_at: datetime
+    python: str
+    results: List[BenchmarkResult] = []
+
+
+class Regression(BaseModel):
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
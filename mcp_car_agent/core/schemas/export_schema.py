@@ -0,0 +1,12 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+ExportFormat = Literal["csv", "jsonl", "parquet"]
+
+
+class ExportResult(BaseModel):
+    path: str = Field(min_length=1)
+    rows: int = Field(ge=0)
+    format: ExportFormat
+    compression: Optional[str] = None
@@ -0,0 +1,9 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class InvalidationEvent(BaseModel):
+    table: str = Field(min_length=1)
+    ids: List[int]
+    version: int
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class LoadStageResult(BaseModel):
+    clients: int = Field(gt=0)
+    seconds: float = Field(ge=0)
+    calls: int = Field(ge=0)
+    errors: int = Field(ge=0)
+    error_rate: float = Field(ge=0, le=1)
+    calls_per_sec: float = Field(ge=0)
+    p50_ms: float = Field(ge=0)
+    p99_ms: float = Field(ge=0)
+    pool_size: Optional[int] = None
+    pool_peak_in_use: Optional[int] = None
+    pool_wait_ms: Optional[float] = None
+
+
+class LoadTestRun(BaseModel):
+    created_at: datetime
+    target: str
+    stages: List[LoadStageResult] = []
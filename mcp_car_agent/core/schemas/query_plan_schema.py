@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any, List
+
+from pydantic import BaseModel, Field
+
+
+class QueryPlan(BaseModel):
+    backend: str = Field(min_length=1)
+    name: str = Field(min_length=1)
+    statement: str
+    plan: Any
+    full_scans: List[str] = []
+
+    @property
+    def key(self) -> str:
+        """
+        Identifica o plano na comparação entre execuções (ex: "postgresql/car_by_year").
+        """
+        return f"{self.backend}/{self.name}"
+
+
+class QueryPlanRun(BaseModel):
+    created_at: datetime
+    size: int = Field(ge=0)
+    plans: List[QueryPlan] = []
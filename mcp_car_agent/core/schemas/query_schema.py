@@ -0,0 +1,10 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CarQuery(BaseModel):
+    filters: Optional[Dict[str, Any]] = None
+    order_by: Optional[str] = None
+    offset: Optional[int] = Field(default=None, ge=0)
+    limit: Optional[int] = Field(default=None, gt=0)
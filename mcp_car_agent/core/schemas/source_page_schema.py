@@ -0,0 +1,24 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SourcePage(BaseModel):
+    id: Optional[int] = None
+    url: str = Field(max_length=500, min_length=1)
+    etag: Optional[str] = Field(max_length=200, default=None)
+    last_modified: Optional[str] = Field(max_length=50, default=None)
+    content_hash: Optional[str] = Field(max_length=64, default=None)
+    car_id: Optional[int] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Cabeçalhos de requisição condicional, para que a origem responda
+        `304 Not Modified` se a página não mudou desde a última ingestão.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
@@ -0,0 +1,31 @@
+"""
+Módulo dos contadores de acerto dos caches em memória do servidor.
+"""
+
+
+class CacheStats:
+    """
+    Acertos (leituras atendidas pelo cache) e faltas (leituras que foram ao
+    banco) de um cache.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool):
+        """
+        Registra uma leitura.
+        """
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def ratio(self) -> float:
+        """
+        A fração das leituras atendidas pelo cache (0 sem leituras).
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
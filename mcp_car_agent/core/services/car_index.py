@@ -0,0 +1,293 @@
+"""
+Módulo do índice em memória dos carros do catálogo.
+
+O índice é carregado de um snapshot (ver `mcp_car_agent.core.services.snapshot`)
+na inicialização e mantido em dia pelo `change_log`: a cada invalidação de
+uma tabela do catálogo ele é marcado como desatualizado e, na próxima busca,
+lê apenas as alterações posteriores à versão que já aplicou e as das versões
+puladas abaixo dela (de transações que ainda não tinham feito commit). Uma
+alteração da tabela inteira (ex: uma importação em massa) faz o índice reler
+todos os carros.
+
+As buscas por igualdade nas colunas do carro são atendidas em memória, com o
+mesmo resultado de `BaseRepository.search` no banco configurado: os nulos são
+ordenados como o banco os ordena, e filtros e ordenações por texto só são
+atendidos onde o banco compara textos byte a byte (ver `EXACT_TEXT` e
+`SORTED_TEXT`); as demais buscas vão ao banco.
+"""
+
+import asyncio
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from mcp_car_agent.core.database.change_log import TABLE_ROW, ChangeCursor
+from mcp_car_agent.core.database.models import CarModel
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.invalidation_schema import InvalidationEvent
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+from mcp_car_agent.core.services.cache_stats import CacheStats
+from mcp_car_agent.core.services.snapshot import Snapshot
+
+COLUMNS = {
+    "id": int,
+    "name": str,
+    "version": str,
+    "year": date,
+    "engine_id": int,
+    "transmission_id": int,
+    "manufacturer_id": int,
+}
+"""
+Colunas do carro atendidas pelo índice e os seus tipos.
+"""
+
+INDEXED = ("name", "manufacturer_id", "transmission_id", "engine_id")
+"""
+Colunas com índice invertido (valor -> IDs dos carros).
+"""
+
+DIMENSIONS = {
+    "manufacturer": CarModel.manufacturer_id,
+    "transmission": CarModel.transmission_id,
+    "engine": CarModel.engine_id,
+}
+"""
+Tabelas cujas alterações mudam as colunas de dimensão dos carros.
+"""
+
+NULLS_FIRST = {"mysql", "sqlite"}
+"""
+Bancos que ordenam os nulos antes dos demais valores (o PostgreSQL os põe por
+último).
+"""
+
+EXACT_TEXT = {"postgresql", "sqlite"}
+"""
+Bancos em que a igualdade de textos diferencia maiúsculas e acentos. A
+collation padrão do MySQL não diferencia: nele, filtros por texto vão ao banco.
+"""
+
+SORTED_TEXT = {"sqlite"}
+"""
+Bancos que ordenam textos pelos bytes, como o Python. O PostgreSQL segue a
+collation do banco (ex: `en_US.UTF-8`) e o MySQL a sua: neles, a ordenação por
+texto vai ao banco.
+"""
+
+
+def _sort_key(column: str, nulls_first: bool):
+    """
+    Ordenação de `order_by`: nulos no início ou no fim, como no banco, e o ID
+    como desempate.
+    """
+
+    def key(row: Dict[str, Any]) -> tuple:
+        value = row[column]
+        return (
+            (value is None) != nulls_first,
+            value if value is not None else 0,
+            row["id"],
+        )
+
+    return key
+
+
+class CarIndex:
+    """
+    Índice em memória dos carros, indexado por ID e pelas colunas de `INDEXED`.
+    """
+
+    TABLES = ("car", *DIMENSIONS)
+
+    def __init__(self):
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self.postings: Dict[str, Dict[Any, Set[int]]] = {
+            column: defaultdict(set) for column in INDEXED
+        }
+        self.cursor: Optional[ChangeCursor] = None
+        self.stale = False
+        self.stats = CacheStats()
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> Optional[int]:
+        """
+        A maior versão do `change_log` já aplicada ao índice.
+        """
+        return self.cursor.version if self.cursor else None
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Indica se o índice foi carregado de um snapshot.
+        """
+        return self.cursor is not None
+
+    def load(self, snapshot: Snapshot):
+        """
+        Carrega os carros do snapshot, substituindo o conteúdo do índice.
+
+        O índice fica marcado como desatualizado até alcançar o banco.
+
+        Args:
+            snapshot (Snapshot): O snapshot aberto.
+        """
+        self.rows.clear()
+        for postings in self.postings.values():
+            postings.clear()
+        self._put(snapshot.rows("car"))
+        self.cursor = ChangeCursor.at(snapshot.version, snapshot.gaps)
+        self.stale = True
+
+    def invalidate(self, event: InvalidationEvent):
+        """
+        Marca o índice como desatualizado se o evento afetar o catálogo.
+
+        Args:
+            event (InvalidationEvent): O evento de invalidação recebido.
+        """
+        if event.table in self.TABLES:
+            self._generation += 1
+            self.stale = True
+
+    async def catch_up(self, session_factory: async_sessionmaker) -> int:
+        """
+        Aplica as alterações registradas no `change_log` após a versão do
+        índice e nas suas lacunas.
+
+        Args:
+            session_factory (async_sessionmaker): A fábrica de sessões do banco.
+
+        Returns:
+            int: O número de carros relidos ou removidos.
+        """
+        async with self._lock:
+            generation = self._generation
+            async with session_factory() as session:
+                cursor, changes = await self.cursor.read(session)
+                rows = await self._changed_rows(CarRepository(session), changes)
+            touched = changes.get("car", set()) | {row["id"] for row in rows}
+            if self._whole_table(changes):
+                touched |= set(self.rows)
+            self._remove(touched)
+            self._put(rows)
+            self.cursor = cursor
+            # Uma invalidação recebida durante a leitura mantém o índice desatualizado.
+            self.stale = generation != self._generation
+        return len(touched)
+
+    async def search(
+        self, query: CarQuery, session_factory: async_sessionmaker
+    ) -> Optional[List[Car]]:
+        """
+        Atende a busca em memória, se possível.
+
+        Args:
+            query (CarQuery): A consulta.
+            session_factory (async_sessionmaker): Usada para alcançar o banco
+                se o índice estiver desatualizado.
+
+        Returns:
+            Optional[List[Car]]: Os carros encontrados, ou `None` se a busca
+            precisar ir ao banco (índice não carregado ou filtros não suportados).
+        """
+        dialect = session_factory.kw["bind"].dialect.name
+        if not self.loaded or not self._supports(query, dialect):
+            self.stats.record(False)
+            return None
+        self.stats.record(True)
+        if self.stale:
+            await self.catch_up(session_factory)
+        rows = [self.rows[_id] for _id in self._candidates(query.filters or {})]
+        rows.sort(key=_sort_key(query.order_by or "id", dialect in NULLS_FIRST))
+        start = query.offset or 0
+        stop = start + query.limit if query.limit is not None else None
+        return [
+            Car.model_validate({column: row[column] for column in COLUMNS})
+            for row in rows[start:stop]
+        ]
+
+    @staticmethod
+    def _supports(query: CarQuery, dialect: str) -> bool:
+        """
+        Indica se os filtros e a ordenação usam apenas colunas do índice, com
+        valores do tipo da coluna, e se o banco compara os textos envolvidos
+        como o Python.
+        """
+        if query.order_by is not None:
+            kind = COLUMNS.get(query.order_by)
+            if kind is None or (kind is str and dialect not in SORTED_TEXT):
+                return False
+        return all(
+            key in COLUMNS
+            and isinstance(value, COLUMNS[key])
+            and (COLUMNS[key] is not str or dialect in EXACT_TEXT)
+            for key, value in (query.filters or {}).items()
+        )
+
+    def _candidates(self, filters: Dict[str, Any]) -> Iterable[int]:
+        """
+        Os IDs dos carros que atendem aos filtros, partindo do menor índice.
+        """
+        indexed = [key for key in filters if key in INDEXED]
+        if indexed:
+            ids = min(
+                (self.postings[key].get(filters[key], set()) for key in indexed),
+                key=len,
+            )
+        else:
+            ids = self.rows.keys()
+        return [
+            _id
+            for _id in ids
+            if all(self.rows[_id][key] == value for key, value in filters.items())
+        ]
+
+    @classmethod
+    def _whole_table(cls, changes: Dict[str, Set[int]]) -> bool:
+        """
+        Indica se alguma tabela do índice foi alterada por inteiro.
+        """
+        return any(TABLE_ROW in changes.get(table, ()) for table in cls.TABLES)
+
+    @classmethod
+    async def _changed_rows(
+        cls, repository: CarRepository, changes: Dict[str, Set[int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Relê os carros alterados e os que apontam para dimensões alteradas, ou
+        todos os carros se alguma tabela foi alterada por inteiro.
+        """
+        query = repository.stream_columns()
+        if not cls._whole_table(changes):
+            conditions = [
+                column.in_(changes[table])
+                for table, column in DIMENSIONS.items()
+                if changes.get(table)
+            ]
+            if changes.get("car"):
+                conditions.append(CarModel.id.in_(changes["car"]))
+            if not conditions:
+                return []
+            query = query.where(or_(*conditions))
+        return [dict(row) for row in (await repository.session.exec(query)).mappings()]
+
+    def _put(self, rows: Iterable[Dict[str, Any]]):
+        for row in rows:
+            self.rows[row["id"]] = row
+            for column in INDEXED:
+                self.postings[column][row[column]].add(row["id"])
+
+    def _remove(self, ids: Iterable[int]):
+        for _id in ids:
+            row = self.rows.pop(_id, None)
+            if row is None:
+                continue
+            for column in INDEXED:
+                self.postings[column][row[column]].discard(_id)
@@ -0,0 +1,87 @@
+"""
+Módulo de serviço do catálogo de carros.
+
+Este módulo concentra as operações de leitura expostas ao agente, abrindo
+uma sessão do pool por consulta para que consultas independentes possam ser
+executadas em paralelo.
+"""
+
+import asyncio
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+from mcp_car_agent.core.services.car_index import CarIndex
+
+
+class CatalogService:
+    """
+    Serviço de consultas ao catálogo de carros.
+
+    Cada consulta usa sua própria sessão, pois uma `AsyncSession` não pode ser
+    usada por várias tasks ao mesmo tempo. O paralelismo é limitado por um
+    semáforo para não esgotar o pool de conexões.
+
+    Com um índice de carros carregado, as buscas que ele suporta são atendidas
+    em memória.
+
+    A fábrica de sessões pode ser definida depois da criação do serviço (ex:
+    quando o pool de conexões só é criado na primeira chamada).
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker],
+        max_concurrency: int = config.MCP_BATCH_CONCURRENCY,
+        index: Optional[CarIndex] = None,
+    ):
+        self.session_factory = session_factory
+        self.index = index
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def search(self, query: CarQuery) -> List[Car]:
+        """
+        Busca carros de acordo com os filtros e a paginação da consulta.
+
+        Args:
+            query (CarQuery): A consulta a ser executada.
+
+        Returns:
+            List[Car]: Os carros encontrados.
+        """
+        if self.index is not None:
+            cars = await self.index.search(query, self.session_factory)
+            if cars is not None:
+                return cars
+        async with self._semaphore:
+            async with self.session_factory() as session:
+                return await CarRepository(session).search(**query.model_dump())
+
+    async def batch_search(self, queries: List[CarQuery]) -> List[List[Car]]:
+        """
+        Executa várias consultas em paralelo, cada uma em uma sessão do pool.
+
+        Args:
+            queries (List[CarQuery]): As consultas a serem executadas.
+
+        Returns:
+            List[List[Car]]: Os resultados, na mesma ordem das consultas.
+        """
+        return list(await asyncio.gather(*(self.search(query) for query in queries)))
+
+    async def get_cars(self, ids: List[int]) -> List[Car]:
+        """
+        Busca o grafo completo de vários carros com um número constante de consultas.
+
+        Args:
+            ids (List[int]): Os IDs dos carros.
+
+        Returns:
+            List[Car]: Os carros encontrados, na ordem dos IDs informados.
+        """
+        async with self.session_factory() as session:
+            return await CarRepository(session).get_many(ids)
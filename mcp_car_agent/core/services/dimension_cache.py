@@ -0,0 +1,122 @@
+"""
+Módulo de cache em memória das tabelas de dimensão do catálogo.
+
+Fabricantes e transmissões mudam raramente e são consultados em quase toda
+conversa do agente (para montar filtros por `manufacturer_id` ou
+`transmission_id`), por isso são mantidos em memória no servidor.
+"""
+
+from typing import Dict, List
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from mcp_car_agent.core.database.replicas import primary_only
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.database.repository.transmission_repository import (
+    TransmissionRepository,
+)
+from mcp_car_agent.core.schemas.invalidation_schema import InvalidationEvent
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+from mcp_car_agent.core.services.cache_stats import CacheStats
+from mcp_car_agent.core.services.snapshot import Snapshot
+
+
+class DimensionCache:
+    """
+    Cache em memória de fabricantes e transmissões, indexados por ID.
+
+    O cache é descartado ao receber um evento de invalidação de uma das suas
+    tabelas e recarregado na próxima leitura, sempre do primário: uma réplica
+    atrasada devolveria os dados de antes da invalidação.
+    """
+
+    TABLES = ("manufacturer", "transmission")
+
+    def __init__(self):
+        self.manufacturers: Dict[int, Manufacturer] = {}
+        self.transmissions: Dict[int, Transmission] = {}
+        self.loaded = False
+        self.stats = CacheStats()
+        self._generation = 0
+
+    async def load(self, session_factory: async_sessionmaker):
+        """
+        Carrega (ou recarrega) as dimensões a partir do banco de dados.
+
+        Args:
+            session_factory (async_sessionmaker): A fábrica de sessões do banco.
+        """
+        generation = self._generation
+        async with session_factory() as session:
+            primary_only(session)
+            manufacturers = await ManufacturerRepository(session).search()
+            transmissions = await TransmissionRepository(session).search()
+        self.manufacturers = {item.id: item for item in manufacturers}
+        self.transmissions = {item.id: item for item in transmissions}
+        # Uma invalidação recebida durante a carga mantém o cache marcado para recarga.
+        self.loaded = generation == self._generation
+
+    def load_snapshot(self, snapshot: Snapshot):
+        """
+        Carrega as dimensões a partir de um snapshot do catálogo.
+
+        Args:
+            snapshot (Snapshot): O snapshot aberto.
+        """
+        self.manufacturers = {
+            row["id"]: Manufacturer.model_validate(row)
+            for row in snapshot.rows("manufacturer")
+        }
+        self.transmissions = {
+            row["id"]: Transmission.model_validate(row)
+            for row in snapshot.rows("transmission")
+        }
+        self.loaded = True
+
+    def invalidate(self, event: InvalidationEvent):
+        """
+        Marca o cache para recarga se o evento afetar uma das dimensões.
+
+        Args:
+            event (InvalidationEvent): O evento de invalidação recebido.
+        """
+        if event.table in self.TABLES:
+            self._generation += 1
+            self.loaded = False
+
+    async def list_manufacturers(
+        self, session_factory: async_sessionmaker
+    ) -> List[Manufacturer]:
+        """
+        Retorna os fabricantes, carregando as dimensões se necessário.
+
+        Args:
+            session_factory (async_sessionmaker): A fábrica de sessões do banco.
+
+        Returns:
+            List[Manufacturer]: Os fabricantes em cache.
+        """
+        self.stats.record(self.loaded)
+        if not self.loaded:
+            await self.load(session_factory)
+        return list(self.manufacturers.values())
+
+    async def list_transmissions(
+        self, session_factory: async_sessionmaker
+    ) -> List[Transmission]:
+        """
+        Retorna as transmissões, carregando as dimensões se necessário.
+
+        Args:
+            session_factory (async_sessionmaker): A fábrica de sessões do banco.
+
+        Returns:
+            List[Transmission]: As transmissões em cache.
+        """
+        self.stats.record(self.loaded)
+        if not self.loaded:
+            await self.load(session_factory)
+        return list(self.transmissions.values())
@@ -0,0 +1,330 @@
+"""
+Módulo de exportação de fatias do catálogo.
+
+As linhas são lidas com um cursor no servidor (`BaseRepository.stream`) e
+gravadas em blocos de `config.EXPORT_BATCH_SIZE`, de modo que a memória usada
+não depende do tamanho da exportação. A gravação acontece em uma thread, sem
+bloquear o event loop do servidor MCP.
+
+Formatos suportados: CSV e JSONL (opcionalmente comprimidos com gzip, bz2 ou
+xz) e Parquet (compressão interna snappy, gzip, zstd, brotli ou lz4), que
+exige o pacote opcional `pyarrow`.
+
+Uso:
+    python -m mcp_car_agent.core.services.export_service carros.csv.gz \\
+        --filter manufacturer_id=1 --order-by year
+"""
+
+import argparse
+import asyncio
+import bz2
+import csv
+import gzip
+import importlib
+import importlib.util
+import json
+import lzma
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import ColumnElement
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.core.schemas.export_schema import ExportFormat, ExportResult
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+
+TEXT_COMPRESSIONS = {
+    None: open,
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+"""
+Compressões dos formatos texto e as funções que abrem os arquivos.
+"""
+
+PARQUET_COMPRESSIONS = {"snappy", "gzip", "zstd", "brotli", "lz4"}
+
+SUFFIXES = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+"""
+Extensões de arquivo das compressões dos formatos texto.
+"""
+
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+class CsvWriter:
+    """
+    Grava as linhas em CSV, com cabeçalho.
+    """
+
+    def __init__(
+        self, path: Path, columns: Sequence[ColumnElement], compression: Optional[str]
+    ):
+        self.file = TEXT_COMPRESSIONS[compression](
+            path, "wt", encoding="utf-8", newline=""
+        )
+        self.writer = csv.DictWriter(self.file, [column.name for column in columns])
+        self.writer.writeheader()
+
+    def write(self, rows: List[Dict[str, Any]]):
+        """
+        Grava um bloco de linhas.
+        """
+        self.writer.writerows(rows)
+
+    def close(self):
+        """
+        Fecha o arquivo.
+        """
+        self.file.close()
+
+
+class JsonlWriter:
+    """
+    Grava as linhas em JSONL, um objeto por linha.
+    """
+
+    def __init__(
+        self, path: Path, _: Sequence[ColumnElement], compression: Optional[str]
+    ):
+        self.file = TEXT_COMPRESSIONS[compression](path, "wt", encoding="utf-8")
+
+    def write(self, rows: List[Dict[str, Any]]):
+        """
+        Grava um bloco de linhas.
+        """
+        self.file.writelines(
+            json.dumps(row, default=str, ensure_ascii=False) + "\n" for row in rows
+        )
+
+    def close(self):
+        """
+        Fecha o arquivo.
+        """
+        self.file.close()
+
+
+def _python_type(column: ColumnElement) -> Optional[type]:
+    """
+    O tipo Python da coluna, ou `None` se o SQLAlchemy não souber qual é.
+    """
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _as_text(row: Dict[str, Any], names: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Os valores das colunas informadas convertidos em texto (nulos permanecem nulos).
+    """
+    return {name: None if row[name] is None else str(row[name]) for name in names}
+
+
+class ParquetWriter:
+    """
+    Grava as linhas em Parquet, um row group por bloco.
+
+    O esquema vem dos tipos das colunas da consulta, e não das linhas, para
+    que blocos com colunas inteiramente nulas tenham o mesmo esquema. Colunas
+    de tipos sem equivalente no Arrow são gravadas como texto.
+    """
+
+    def __init__(
+        self, path: Path, columns: Sequence[ColumnElement], compression: Optional[str]
+    ):
+        pyarrow = importlib.import_module("pyarrow")
+        types = {
+            bool: pyarrow.bool_(),
+            int: pyarrow.int64(),
+            float: pyarrow.float64(),
+            str: pyarrow.string(),
+            date: pyarrow.date32(),
+            datetime: pyarrow.timestamp("us"),
+        }
+        fields = {column.name: types.get(_python_type(column)) for column in columns}
+        self.text = [name for name, field in fields.items() if field is None]
+        self.schema = pyarrow.schema(
+            [(name, field or pyarrow.string()) for name, field in fields.items()]
+        )
+        self.table = pyarrow.Table
+        self.writer = importlib.import_module("pyarrow.parquet").ParquetWriter(
+            path, self.schema, compression=compression or "snappy"
+        )
+
+    def write(self, rows: List[Dict[str, Any]]):
+        """
+        Grava um bloco de linhas como um row group.
+        """
+        if self.text:
+            rows = [row | _as_text(row, self.text) for row in rows]
+        self.writer.write_table(self.table.from_pylist(rows, schema=self.schema))
+
+    def close(self):
+        """
+        Fecha o arquivo, gravando o rodapé do Parquet.
+        """
+        self.writer.close()
+
+
+WRITERS = {"csv": CsvWriter, "jsonl": JsonlWriter, "parquet": ParquetWriter}
+
+
+def validate(file_format: ExportFormat, compression: Optional[str]):
+    """
+    Verifica se o formato e a compressão podem ser usados.
+
+    Raises:
+        ValueError: Se o formato não existir, a compressão não se aplicar a
+            ele ou o Parquet for pedido sem o `pyarrow` instalado.
+    """
+    if file_format not in WRITERS:
+        raise ValueError(f"Formato de exportação desconhecido: {file_format}.")
+    if file_format == "parquet":
+        if not PARQUET_AVAILABLE:
+            raise ValueError("A exportação em Parquet exige o pacote `pyarrow`.")
+        if compression is not None and compression not in PARQUET_COMPRESSIONS:
+            raise ValueError(f"Compressão inválida para Parquet: {compression}.")
+    elif compression not in TEXT_COMPRESSIONS:
+        raise ValueError(f"Compressão inválida para {file_format}: {compression}.")
+
+
+def file_name(stem: str, file_format: ExportFormat, compression: Optional[str]):
+    """
+    O nome do arquivo de exportação (ex: "carros.csv.gz").
+    """
+    suffix = SUFFIXES.get(compression, "") if file_format != "parquet" else ""
+    return f"{stem}.{file_format}{suffix}"
+
+
+async def _batches(rows: AsyncIterator[Dict], size: int) -> AsyncIterator[List[Dict]]:
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _write(writer, rows: AsyncIterator[Dict]) -> int:
+    """
+    Grava as linhas em blocos, cada um em uma thread; retorna o total gravado.
+    """
+    total = 0
+    async for batch in _batches(rows, config.EXPORT_BATCH_SIZE):
+        await asyncio.to_thread(writer.write, batch)
+        total += len(batch)
+    return total
+
+
+class ExportService:
+    """
+    Exporta os carros encontrados por uma consulta para um arquivo.
+
+    Args:
+        session_factory (async_sessionmaker): A fábrica de sessões do banco.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+
+    async def export(
+        self,
+        query: CarQuery,
+        path: Path,
+        file_format: ExportFormat = "csv",
+        compression: Optional[str] = None,
+    ) -> ExportResult:
+        """
+        Grava os carros da consulta no arquivo, em blocos.
+
+        Args:
+            query (CarQuery): Os filtros, a ordenação e a paginação, como em `search`.
+            path (Path): O arquivo de destino.
+            file_format (ExportFormat): "csv", "jsonl" ou "parquet".
+            compression (Optional[str]): A compressão do arquivo.
+
+        Returns:
+            ExportResult: O arquivo gravado e o número de linhas.
+        """
+        validate(file_format, compression)
+        async with self.session_factory() as session:
+            repository = CarRepository(session)
+            writer = await asyncio.to_thread(
+                WRITERS[file_format],
+                path,
+                repository.stream_columns().selected_columns,
+                compression,
+            )
+            try:
+                rows = await _write(writer, repository.stream(**query.model_dump()))
+            finally:
+                await asyncio.to_thread(writer.close)
+        return ExportResult(
+            path=str(path), rows=rows, format=file_format, compression=compression
+        )
+
+
+def _filter(text: str) -> tuple:
+    """
+    Converte "coluna=valor" em um filtro; valores JSON (ex: números) são
+    interpretados, os demais ficam como texto.
+    """
+    key, _, value = text.partition("=")
+    try:
+        return key, json.loads(value)
+    except json.JSONDecodeError:
+        return key, value
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando da exportação.
+    """
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("path", type=Path, help="Arquivo de destino.")
+    arguments.add_argument(
+        "--format", choices=list(WRITERS), help="Padrão: pela extensão do arquivo."
+    )
+    arguments.add_argument(
+        "--compression", help="Padrão: pela extensão do arquivo (.gz, .bz2, .xz)."
+    )
+    arguments.add_argument(
+        "--filter", type=_filter, action="append", default=[], help="coluna=valor"
+    )
+    arguments.add_argument("--order-by", default=None)
+    arguments.add_argument("--offset", type=int, default=None)
+    arguments.add_argument("--limit", type=int, default=None)
+    args = arguments.parse_args()
+    suffixes = [suffix[1:] for suffix in args.path.suffixes]
+    file_format = args.format or next((s for s in suffixes if s in WRITERS), "csv")
+    compression = args.compression or next(
+        (name for name, suffix in SUFFIXES.items() if args.path.suffix == suffix), None
+    )
+    query = CarQuery(
+        filters=dict(args.filter) or None,
+        order_by=args.order_by,
+        offset=args.offset,
+        limit=args.limit,
+    )
+
+    async def run():
+        service = ExportService(await ConnectionRepository.session_factory())
+        result = await service.export(query, args.path, file_format, compression)
+        logger.info(f"{result.rows} carros exportados para {result.path}.")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""
+Módulo do snapshot do catálogo.
+
+Um nó novo do servidor precisaria consultar o banco inteiro para aquecer as
+suas estruturas em memória. O snapshot é um arquivo compacto com o catálogo
+de carros (já com as colunas das dimensões, como em
+`CarRepository.stream_columns`) e as tabelas de dimensão, que o nó mapeia em
+memória na inicialização e depois alcança o banco pelo `change_log`, a partir
+da versão gravada no arquivo.
+
+Formato (versão `FORMAT_VERSION`):
+
+    "MCPSNAP" | versão do formato (1 byte) | tamanho do cabeçalho (4 bytes)
+    cabeçalho JSON: versão de escrita e lacunas abaixo dela, seções,
+    colunas, tipos e posições
+    blocos das colunas, cada um comprimido com zlib:
+        validade (1 byte por linha) + valores (int64/float64) ou
+        validade + offsets int64 + texto UTF-8
+
+Uso:
+    python -m mcp_car_agent.core.services.snapshot catalogo.snap
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import ColumnElement, String, TypeDecorator
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from mcp_car_agent.core.database.change_log import (
+    current_version,
+    gaps_before,
+    prune,
+)
+from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.core.database.repository.engine_repository import (
+    EngineRepository,
+)
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.database.repository.transmission_repository import (
+    TransmissionRepository,
+)
+
+MAGIC = b"MCPSNAP"
+
+FORMAT_VERSION = 1
+"""
+Versão do formato do arquivo; arquivos de outras versões são recusados.
+"""
+
+PREAMBLE = struct.Struct("<7sBI")
+
+COMPRESSION_LEVEL = 6
+
+SECTIONS = {
+    "car": CarRepository,
+    "manufacturer": ManufacturerRepository,
+    "transmission": TransmissionRepository,
+    "engine": EngineRepository,
+}
+"""
+Seções do snapshot e os repositórios que as leem do banco.
+"""
+
+KINDS = {bool: "bool", int: "int", float: "float", str: "str", date: "date"}
+"""
+Tipos de coluna suportados, pelo tipo Python da coluna SQL.
+"""
+
+
+def _number(kind: str, value: Any) -> float:
+    if value is None:
+        return 0
+    return value.toordinal() if kind == "date" else value
+
+
+def _from_number(kind: str, value: Any) -> Any:
+    if kind == "date":
+        return date.fromordinal(value)
+    return bool(value) if kind == "bool" else value
+
+
+def encode_column(kind: str, values: Sequence[Any]) -> bytes:
+    """
+    Codifica e comprime os valores de uma coluna.
+
+    Args:
+        kind (str): O tipo da coluna (chave de `KINDS`).
+        values (Sequence[Any]): Os valores, `None` para nulos.
+
+    Returns:
+        bytes: O bloco comprimido.
+    """
+    validity = bytes(value is not None for value in values)
+    if kind == "str":
+        texts = [value.encode() if value is not None else b"" for value in values]
+        offsets = array("q", itertools.accumulate(map(len, texts), initial=0))
+        body = offsets.tobytes() + b"".join(texts)
+    else:
+        typecode = "d" if kind == "float" else "q"
+        body = array(typecode, (_number(kind, value) for value in values)).tobytes()
+    return zlib.compress(validity + body, COMPRESSION_LEVEL)
+
+
+def decode_column(kind: str, block: bytes, rows: int, swap: bool = False) -> List:
+    """
+    Descomprime e decodifica um bloco gerado por `encode_column`.
+
+    Args:
+        kind (str): O tipo da coluna.
+        block (bytes): O bloco comprimido.
+        rows (int): O número de linhas da seção.
+        swap (bool): Se o arquivo foi gravado com a outra ordem de bytes.
+
+    Returns:
+        List: Os valores da coluna.
+    """
+    raw = memoryview(zlib.decompress(block))
+    validity, body = raw[:rows], raw[rows:]
+    numbers = array("d" if kind == "float" else "q")
+    if kind == "str":
+        numbers.frombytes(body[: 8 * (rows + 1)])
+        texts = body[8 * (rows + 1) :]
+    else:
+        numbers.frombytes(body)
+    if swap:
+        numbers.byteswap()
+    if kind == "str":
+        return [
+            bytes(texts[numbers[i] : numbers[i + 1]]).decode() if validity[i] else None
+            for i in range(rows)
+        ]
+    return [
+        _from_number(kind, value) if valid else None
+        for value, valid in zip(numbers, validity)
+    ]
+
+
+def _kind(column: ColumnElement) -> str:
+    """
+    O tipo de uma coluna SQL (o `AutoString` do SQLModel não informa
+    `python_type`).
+    """
+    sql_type = column.type
+    if isinstance(sql_type, TypeDecorator):
+        sql_type = sql_type.impl_instance
+    return "str" if isinstance(sql_type, String) else KINDS[sql_type.python_type]
+
+
+async def _read_section(repository: BaseRepository) -> Dict[str, Any]:
+    """
+    Lê uma tabela inteira, em ordem de ID, coluna a coluna.
+    """
+    columns: Sequence[ColumnElement] = repository.stream_columns().selected_columns
+    values = {column.name: [] for column in columns}
+    async for row in repository.stream(order_by="id"):
+        for name, value in row.items():
+            values[name].append(value)
+    kinds = {column.name: _kind(column) for column in columns}
+    return {"kinds": kinds, "values": values}
+
+
+def _encode_section(section: Dict[str, Any], offset: int) -> tuple:
+    """
+    Comprime as colunas de uma seção a partir da posição `offset` dos blocos.
+
+    Returns:
+        tuple: A descrição da seção para o cabeçalho e os blocos comprimidos.
+    """
+    columns, blocks = [], []
+    for name, kind in section["kinds"].items():
+        block = encode_column(kind, section["values"][name])
+        columns.append(
+            {"name": name, "kind": kind, "offset": offset, "size": len(block)}
+        )
+        blocks.append(block)
+        offset += len(block)
+    rows = len(next(iter(section["values"].values()), []))
+    return {"rows": rows, "columns": columns}, blocks
+
+
+def _write_file(
+    path: Path, position: Dict[str, Any], sections: Dict[str, Dict[str, Any]]
+):
+    """
+    Grava o arquivo de forma atômica (arquivo temporário + rename).
+
+    `position` é a posição do catálogo no `change_log` (`version` e `gaps`).
+    """
+    header, blocks = {}, []
+    for name, section in sections.items():
+        header[name], encoded = _encode_section(section, sum(map(len, blocks)))
+        blocks += encoded
+    encoded = json.dumps(
+        {
+            **position,
+            "created_at": time.time(),
+            "byteorder": sys.byteorder,
+            "sections": header,
+        }
+    ).encode()
+    temporary = Path(path).with_suffix(".tmp")
+    with temporary.open("wb") as file:
+        file.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(encoded)) + encoded)
+        file.writelines(blocks)
+    os.replace(temporary, path)
+
+
+async def build(session_factory: async_sessionmaker, path: Path) -> int:
+    """
+    Gera o snapshot do catálogo.
+
+    A versão de escrita é lida antes dos dados: alterações feitas durante a
+    leitura podem já estar no arquivo, mas também serão reaplicadas pelo
+    `change_log`, o que é inofensivo. As lacunas abaixo dela (escritas ainda
+    sem commit) são gravadas junto, para que o nó também as leia depois.
+
+    Se o arquivo substituído era um snapshot, o `change_log` anterior à sua
+    versão é excluído (ver `prune`): os nós que partiram dele ainda alcançam o
+    banco, mas os que partiram de gerações mais antigas e não o alcançaram
+    desde então precisam ser reiniciados.
+
+    Args:
+        session_factory (async_sessionmaker): A fábrica de sessões do banco.
+        path (Path): O arquivo de destino.
+
+    Returns:
+        int: A versão de escrita do snapshot.
+    """
+    async with session_factory() as session:
+        version = await current_version(session)
+        gaps = await gaps_before(session, version)
+        sections = {
+            name: await _read_section(repository(session))
+            for name, repository in SECTIONS.items()
+        }
+    position = {"version": version, "gaps": sorted(gaps)}
+    previous = _version_of(path)
+    await asyncio.to_thread(_write_file, path, position, sections)
+    if previous is not None:
+        async with session_factory() as session:
+            pruned = await prune(session, previous)
+        logger.info(f"{pruned} alterações anteriores à versão {previous} excluídas.")
+    return version
+
+
+def _version_of(path: Path) -> Optional[int]:
+    """
+    A versão do snapshot gravado em `path`, ou `None` se não houver um.
+    """
+    try:
+        with Snapshot(path) as snapshot:
+            return snapshot.version
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+class Snapshot:
+    """
+    Snapshot do catálogo mapeado em memória.
+
+    Apenas o cabeçalho é lido na abertura; cada coluna é descomprimida
+    diretamente do mapeamento quando pedida.
+
+    Args:
+        path (Path): O arquivo do snapshot.
+
+    Raises:
+        ValueError: Se o arquivo não for um snapshot desta versão do formato.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, file_format, size = PREAMBLE.unpack_from(self._map)
+        if magic != MAGIC or file_format != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} não é um snapshot no formato {FORMAT_VERSION}.")
+        header = json.loads(self._map[PREAMBLE.size : PREAMBLE.size + size])
+        self.version: int = header["version"]
+        self.gaps: List[int] = header.get("gaps", [])
+        self.sections: Dict[str, Dict[str, Any]] = header["sections"]
+        self._swap = header["byteorder"] != sys.byteorder
+        self._data = PREAMBLE.size + size
+
+    def columns(self, section: str) -> Dict[str, List]:
+        """
+        Decodifica todas as colunas de uma seção.
+
+        Args:
+            section (str): O nome da seção (ex: "car").
+
+        Returns:
+            Dict[str, List]: Os valores de cada coluna.
+        """
+        rows = self.sections[section]["rows"]
+        return {
+            column["name"]: decode_column(
+                column["kind"], self._block(column), rows, self._swap
+            )
+            for column in self.sections[section]["columns"]
+        }
+
+    def _block(self, column: Dict[str, Any]) -> bytes:
+        start = self._data + column["offset"]
+        return self._map[start : start + column["size"]]
+
+    def rows(self, section: str) -> List[Dict[str, Any]]:
+        """
+        As linhas de uma seção, indexadas pelo nome da coluna.
+        """
+        columns = self.columns(section)
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def close(self):
+        """
+        Desfaz o mapeamento do arquivo.
+        """
+        self._map.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando da geração do snapshot.
+    """
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("path", type=Path, help="Arquivo do snapshot.")
+    args = arguments.parse_args()
+
+    async def run():
+        version = await build(await ConnectionRepository.session_factory(), args.path)
+        logger.info(f"Snapshot gravado em {args.path} (versão {version}).")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
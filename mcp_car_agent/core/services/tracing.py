@@ -0,0 +1,317 @@
+"""
+Módulo de rastreamento (tracing) das requisições.
+
+Cada chamada de ferramenta MCP abre um span raiz; dentro dele, os métodos de
+repositório (`instrumented`), as conversões dos modelos do banco nos esquemas
+e cada statement SQL abrem spans filhos. O span corrente é propagado por uma
+`ContextVar`, que acompanha a corrotina até o greenlet em que o SQLAlchemy
+executa o statement, de modo que a árvore mostra onde o tempo de uma chamada
+foi gasto.
+
+A amostragem é decidida na raiz (`config.TRACE_SAMPLE_RATE`): um trace não
+amostrado não cria nenhum span. Os traces amostrados são exportados, quando o
+span raiz termina, no formato JSON do OTLP (`ExportTraceServiceRequest`),
+para um arquivo (uma linha por trace, como o file exporter do OpenTelemetry
+Collector) ou para um coletor OTLP/HTTP (ex: `http://localhost:4318/v1/traces`).
+
+O formato é gerado diretamente, sem depender do SDK do OpenTelemetry.
+"""
+
+import json
+import random
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.request import Request, urlopen
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from mcp_car_agent.core import config
+
+SCOPE = "mcp_car_agent"
+"""
+Nome do escopo de instrumentação dos spans exportados.
+"""
+
+INTERNAL, SERVER, CLIENT = 1, 2, 3
+"""
+Tipos (`SpanKind`) do OTLP: operação interna, requisição recebida (ferramenta
+MCP) e requisição enviada (statement SQL).
+"""
+
+STATUS_OK, STATUS_ERROR = 1, 2
+"""
+Códigos (`StatusCode`) do OTLP.
+"""
+
+_UNSAMPLED = object()
+"""
+Marca o contexto de um trace não amostrado: os spans filhos são ignorados.
+"""
+
+_SPAN = "_tracing_span"
+"""
+Atributo do contexto de execução com o span do statement.
+"""
+
+_current: ContextVar[Any] = ContextVar("trace_span", default=None)
+
+
+def _value(value: Any) -> Dict[str, Any]:
+    """
+    Um valor de atributo no formato `AnyValue` do OTLP.
+    """
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Trace:
+    """
+    Os spans já terminados de um trace, aguardando o fim do span raiz.
+    """
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Dict[str, Any]] = []
+
+
+class Span:
+    """
+    Um span em andamento, já no formato `Span` do OTLP.
+
+    Args:
+        name (str): O nome do span.
+        parent (Optional[Span]): O span pai; sem ele, o span inicia um trace.
+        kind (int): O tipo do span (`INTERNAL`, `SERVER` ou `CLIENT`).
+        attributes (Dict[str, Any]): Os atributos do span.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"] = None,
+        kind: int = INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.trace = parent.trace if parent else Trace()
+        self.root = parent is None
+        self.data: Dict[str, Any] = {
+            "traceId": self.trace.trace_id,
+            "spanId": secrets.token_hex(8),
+            "name": name,
+            "kind": kind,
+            "startTimeUnixNano": str(time.time_ns()),
+            "attributes": [],
+            "status": {"code": STATUS_OK},
+        }
+        if parent is not None:
+            self.data["parentSpanId"] = parent.span_id
+        self.set(**(attributes or {}))
+
+    @property
+    def span_id(self) -> str:
+        """
+        O identificador do span.
+        """
+        return self.data["spanId"]
+
+    def set(self, **attributes):
+        """
+        Adiciona atributos ao span.
+        """
+        self.data["attributes"] += [
+            {"key": key, "value": _value(value)} for key, value in attributes.items()
+        ]
+
+    def fail(self, error: BaseException):
+        """
+        Marca o span como falho.
+        """
+        self.data["status"] = {
+            "code": STATUS_ERROR,
+            "message": f"{type(error).__name__}: {error}",
+        }
+
+    def end(self) -> bool:
+        """
+        Termina o span e o guarda no trace.
+
+        Returns:
+            bool: Se o span é a raiz do trace (e o trace está completo).
+        """
+        self.data["endTimeUnixNano"] = str(time.time_ns())
+        self.trace.spans.append(self.data)
+        return self.root
+
+
+def otlp_request(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Os spans de um trace como um `ExportTraceServiceRequest` do OTLP.
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": _value("mcp-car-agent")}
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": SCOPE}, "spans": spans}],
+            }
+        ]
+    }
+
+
+class OtlpJsonExporter:
+    """
+    Exporta os traces no formato JSON do OTLP.
+
+    Args:
+        target (str): Um caminho de arquivo (uma linha JSON por trace) ou a URL
+            de um coletor OTLP/HTTP.
+    """
+
+    def __init__(self, target: str):
+        self.target = target
+        self.lock = threading.Lock()
+
+    def export(self, spans: List[Dict[str, Any]]):
+        """
+        Exporta um trace. O envio ao coletor roda em uma thread, sem bloquear
+        o event loop.
+        """
+        body = json.dumps(otlp_request(spans))
+        if self.target.startswith(("http://", "https://")):
+            threading.Thread(target=self._post, args=(body,), daemon=True).start()
+            return
+        with self.lock, Path(self.target).open("a", encoding="utf-8") as file:
+            file.write(body + "\n")
+
+    def _post(self, body: str):
+        request = Request(
+            self.target,
+            data=body.encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urlopen(request, timeout=5):
+                pass
+        except OSError as error:
+            logger.warning(f"Falha ao enviar o trace para {self.target}: {error}")
+
+
+class Tracer:
+    """
+    Cria os spans e exporta os traces amostrados.
+
+    Args:
+        sample_rate (float): A fração dos traces amostrados (0 desliga).
+        exporter (Optional[OtlpJsonExporter]): O destino dos traces.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = config.TRACE_SAMPLE_RATE,
+        exporter: Optional[OtlpJsonExporter] = None,
+    ):
+        self.sample_rate = sample_rate
+        self.exporter = exporter or OtlpJsonExporter(config.TRACE_EXPORT)
+
+    @contextmanager
+    def span(
+        self, name: str, kind: int = INTERNAL, **attributes
+    ) -> Iterator[Optional[Span]]:
+        """
+        Executa o bloco dentro de um span filho do span corrente; sem span
+        corrente, o bloco inicia um trace, se for amostrado.
+
+        Yields:
+            Optional[Span]: O span, ou `None` se o trace não for amostrado.
+        """
+        parent = _current.get()
+        sampled = parent is not None or random.random() < self.sample_rate
+        if parent is _UNSAMPLED or not sampled:
+            token = _current.set(_UNSAMPLED)
+            try:
+                yield None
+            finally:
+                _current.reset(token)
+            return
+        install()
+        current = Span(name, parent, kind, attributes)
+        token = _current.set(current)
+        try:
+            yield current
+        except BaseException as error:
+            current.fail(error)
+            raise
+        finally:
+            _current.reset(token)
+            self.finish(current)
+
+    def finish(self, current: Span):
+        """
+        Termina um span e, se for a raiz, exporta o trace.
+        """
+        if current.end():
+            try:
+                self.exporter.export(current.trace.spans)
+            except OSError as error:
+                logger.warning(f"Falha ao exportar o trace: {error}")
+
+
+def _on_before_execute(conn, _cursor, statement, _parameters, context, _many):
+    parent = _current.get()
+    if parent is None or parent is _UNSAMPLED or context is None:
+        return
+    setattr(
+        context,
+        _SPAN,
+        Span(
+            "db.statement",
+            parent,
+            CLIENT,
+            {"db.system": conn.dialect.name, "db.statement": statement},
+        ),
+    )
+
+
+def _on_after_execute(_conn, cursor, _statement, _parameters, context, _many):
+    current: Optional[Span] = getattr(context, _SPAN, None)
+    if current is not None:
+        current.set(**{"db.rows": max(getattr(cursor, "rowcount", -1), 0)})
+        tracer.finish(current)
+
+
+def _on_error(exception_context):
+    current: Optional[Span] = getattr(exception_context.execution_context, _SPAN, None)
+    if current is not None:
+        current.fail(exception_context.original_exception)
+        tracer.finish(current)
+
+
+def install():
+    """
+    Registra os eventos dos spans de statements SQL em todos os motores.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _on_before_execute):
+        event.listen(Engine, "before_cursor_execute", _on_before_execute)
+        event.listen(Engine, "after_cursor_execute", _on_after_execute)
+        event.listen(Engine, "handle_error", _on_error)
+
+
+tracer = Tracer()
+"""
+Rastreador compartilhado pelo servidor e pelos repositórios.
+"""
@@ -0,0 +1,144 @@
+"""
+Módulo de aquecimento (warm-up) do servidor na inicialização.
+
+As primeiras requisições após um deploy pagam pelo pool vazio, pelo cache de
+statements compilados do SQLAlchemy vazio e pelas dimensões ainda não
+carregadas. O warm-up executa esse trabalho antes de o servidor se declarar
+pronto.
+
+Com um snapshot do catálogo (`SNAPSHOT_PATH`), dimensões e índice de carros
+são carregados do arquivo e o servidor fica pronto imediatamente; o restante
+do warm-up e a atualização pelo `change_log` seguem em segundo plano.
+
+As buscas canônicas rodam sob o mesmo prazo das ferramentas
+(`DB_STATEMENT_TIMEOUT`): no MySQL, o prazo vira um hint no statement, e só
+assim os statements compilados no warm-up são os mesmos das requisições.
+"""
+
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.deadline import deadline
+from mcp_car_agent.core.database.n_plus_one import IGNORE_OPTION
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+from mcp_car_agent.core.services.car_index import CarIndex
+from mcp_car_agent.core.services.dimension_cache import DimensionCache
+from mcp_car_agent.core.services.snapshot import Snapshot
+
+CANONICAL_SEARCHES: List[CarQuery] = [
+    CarQuery(limit=1),
+    CarQuery(filters={"name": ""}, limit=1),
+    CarQuery(filters={"manufacturer_id": 0}, limit=1),
+    CarQuery(filters={"transmission_id": 0}, limit=1),
+    CarQuery(filters={"engine_id": 0}, limit=1),
+    CarQuery(filters={"name": ""}, order_by="year", offset=0, limit=1),
+    CarQuery(filters={"manufacturer_id": 0}, order_by="year", offset=0, limit=1),
+]
+"""
+Formatos de busca mais usados pelo agente. Os valores dos filtros são
+irrelevantes: o cache do SQLAlchemy é indexado pela estrutura do statement,
+e os valores viram parâmetros.
+"""
+
+
+class WarmUp:
+    """
+    Executa o aquecimento do servidor e informa quando ele está pronto.
+    """
+
+    def __init__(
+        self,
+        dimensions: DimensionCache,
+        index: Optional[CarIndex] = None,
+        snapshot_path: str = config.SNAPSHOT_PATH,
+    ):
+        self.dimensions = dimensions
+        self.index = index
+        self.snapshot_path = snapshot_path
+        self.ready = False
+        self.duration: Optional[float] = None
+
+    async def run(
+        self,
+        session_factory: async_sessionmaker,
+        on_ready: Callable[[], None] = lambda: None,
+    ) -> float:
+        """
+        Abre as conexões mínimas do pool, compila as buscas canônicas e
+        carrega as dimensões (e o índice de carros, se houver snapshot).
+
+        Args:
+            session_factory (async_sessionmaker): A fábrica de sessões do banco.
+            on_ready (Callable[[], None]): Chamada no instante em que `ready`
+                passa a ser verdadeiro (ex: para avisar o supervisor), de
+                modo que `/ready` e o supervisor vejam o mesmo sinal.
+
+        Returns:
+            float: O tempo até o servidor ficar pronto, em segundos.
+        """
+        started = time.perf_counter()
+        if self._load_snapshot():
+            self._mark_ready(started, on_ready)
+        await self._open_pool(session_factory)
+        await self._prime_statements(session_factory)
+        await self.dimensions.load(session_factory)
+        if self.index is not None and self.index.loaded:
+            await self.index.catch_up(session_factory)
+        if not self.ready:
+            self._mark_ready(started, on_ready)
+        return self.duration
+
+    def _load_snapshot(self) -> bool:
+        """
+        Carrega dimensões e índice do snapshot, se ele existir.
+
+        Returns:
+            bool: Se o snapshot foi carregado.
+        """
+        if not self.snapshot_path or not Path(self.snapshot_path).is_file():
+            return False
+        with Snapshot(Path(self.snapshot_path)) as snapshot:
+            self.dimensions.load_snapshot(snapshot)
+            if self.index is not None:
+                self.index.load(snapshot)
+            logger.info(f"Snapshot carregado (versão {snapshot.version}).")
+        return True
+
+    def _mark_ready(self, started: float, on_ready: Callable[[], None]):
+        self.duration = time.perf_counter() - started
+        self.ready = True
+        on_ready()
+        logger.info(f"Warm-up concluído em {self.duration:.3f}s.")
+
+    @staticmethod
+    async def _open_pool(session_factory: async_sessionmaker):
+        """
+        Abre `DB_POOL_SIZE` conexões ao mesmo tempo, para que todas fiquem no pool.
+        """
+        engine = session_factory.kw["bind"]
+        async with AsyncExitStack() as stack:
+            for _ in range(config.DB_POOL_SIZE):
+                connection = await stack.enter_async_context(engine.connect())
+                await connection.execute(
+                    text("SELECT 1").execution_options(**{IGNORE_OPTION: True})
+                )
+
+    @staticmethod
+    async def _prime_statements(session_factory: async_sessionmaker):
+        """
+        Executa as buscas canônicas, populando o cache de statements compilados,
+        cada uma com o prazo de uma chamada de ferramenta.
+        """
+        async with session_factory() as session:
+            repository = CarRepository(session)
+            for query in CANONICAL_SEARCHES:
+                with deadline(config.DB_STATEMENT_TIMEOUT):
+                    await repository.search(**query.model_dump())
@@ -0,0 +1,499 @@
+"""
+Módulo da importação em massa do catálogo.
+
+Mesmo em lote, INSERTs são muito mais lentos que os carregadores nativos dos
+bancos para a carga inicial. A importação lê arquivos JSONL (um `Car` por
+linha, com equipamentos e especificações) ou CSV (um carro por linha, com as
+colunas de `CSV_COLUMNS`), grava-os em tabelas temporárias com `COPY` /
+`LOAD DATA` (ver `mcp_car_agent.ingestion.staging`) e os mescla no catálogo
+com SQL, em uma única transação:
+
+1. fabricantes, transmissões e motores ausentes são criados pela chave natural;
+2. os motores novos ganham a sua especificação;
+3. os carros são inseridos com as chaves estrangeiras resolvidas por JOIN;
+4. os equipamentos e as especificações dos carros são inseridos.
+
+Cada tabela alterada é registrada no `change_log` e invalidada por inteiro
+(`TABLE_ROW` e eventos sem IDs): com milhões de linhas, registrar e publicar
+cada ID criado custaria mais que reler as tabelas.
+
+Uso:
+    python -m mcp_car_agent.ingestion.bulk catalogo.jsonl [outro.csv ...]
+"""
+
+import argparse
+import asyncio
+import csv
+import itertools
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from loguru import logger
+from pydantic import ValidationError
+from sqlalchemy import Table, exists, func, insert, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, async_sessionmaker
+from sqlmodel import SQLModel
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.change_log import log_table
+from mcp_car_agent.core.database.models import (
+    CarModel,
+    CarSpecsModel,
+    EngineModel,
+    EngineSpecModel,
+    EquipmentModel,
+    ManufacturerModel,
+    TransmissionModel,
+)
+from mcp_car_agent.core.database.natural_key import (
+    engine_key,
+    manufacturer_key,
+    transmission_key,
+)
+from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.ingestion.loader import DIMENSIONS
+from mcp_car_agent.ingestion.normalizer import normalize_car
+from mcp_car_agent.ingestion.staging import (
+    STAGE_CAR,
+    STAGE_CAR_SPECS,
+    STAGE_ENGINE,
+    STAGE_EQUIPMENT,
+    STAGE_MANUFACTURER,
+    STAGE_TRANSMISSION,
+    STAGING,
+    bulk_connection,
+    loader_for,
+)
+
+CSV_COLUMNS = {
+    "manufacturer": {"name": "manufacturer"},
+    "transmission": {c: c for c in ("gearbox_type", "gears_qtde", "traction")},
+    "engine": {c: c for c in ("compression_rate", "total_cc", "aspiration")},
+    "engine_specs": {
+        c: c
+        for c in ("gas_type", "max_hp", "max_hp_rpm", "max_torque", "max_torque_rpm")
+    },
+    "car_specs": {c: c for c in ("gas", "config", "doors", "spaces")},
+}
+"""
+Colunas do CSV (além de `name`, `version` e `year`) agrupadas pelo campo do
+`Car` que preenchem. Equipamentos só podem ser importados por JSONL.
+"""
+
+STAGES = {
+    "manufacturer": (ManufacturerModel, STAGE_MANUFACTURER),
+    "transmission": (TransmissionModel, STAGE_TRANSMISSION),
+    "engine": (EngineModel, STAGE_ENGINE),
+}
+"""
+Dimensões do carro, com a tabela de destino e a tabela de staging.
+"""
+
+CAR_IDS_LOCK = "mcp_car_agent.car_ids"
+"""
+Nome do lock do MySQL (`GET_LOCK`) que serializa a numeração dos carros
+importados.
+"""
+
+NATURAL_KEYS = {
+    "manufacturer": manufacturer_key,
+    "transmission": transmission_key,
+    "engine": engine_key,
+}
+"""
+Funções que calculam a chave natural de cada dimensão do carro.
+"""
+
+CHILDREN = {EquipmentModel: STAGE_EQUIPMENT, CarSpecsModel: STAGE_CAR_SPECS}
+"""
+Coleções do carro, com a tabela de staging de cada uma.
+"""
+
+
+def _group(row: Dict[str, Optional[str]], columns: Dict[str, str]) -> Optional[Dict]:
+    """
+    Os campos de um grupo do CSV, ou `None` se todos estiverem vazios.
+    """
+    values = {field: row.get(column) for field, column in columns.items()}
+    return values if any(value is not None for value in values.values()) else None
+
+
+def car_from_csv(row: Dict[str, str]) -> Car:
+    """
+    Monta um carro a partir de uma linha do CSV de importação.
+
+    Args:
+        row (Dict[str, str]): A linha, indexada pelo nome da coluna.
+
+    Returns:
+        Car: O carro, sem equipamentos.
+    """
+    row = {key: (value or "").strip() or None for key, value in row.items()}
+    data = {field: row.get(field) for field in ("name", "version", "year")}
+    for attr in DIMENSIONS:
+        data[attr] = _group(row, CSV_COLUMNS[attr])
+    if data["engine"]:
+        data["engine"]["engine_specs"] = _group(row, CSV_COLUMNS["engine_specs"])
+    specs = _group(row, CSV_COLUMNS["car_specs"])
+    data["car_specs"] = [specs] if specs else []
+    return Car.model_validate(data)
+
+
+def read_cars(path: Path) -> Iterator[Car]:
+    """
+    Lê os carros de um arquivo JSONL ou CSV (pela extensão), um de cada vez.
+
+    Linhas inválidas são registradas no log e descartadas.
+
+    Args:
+        path (Path): O arquivo de importação.
+
+    Yields:
+        Car: Os carros válidos do arquivo.
+    """
+    path = Path(path)
+    with path.open(encoding="utf-8", newline="") as file:
+        rows = csv.DictReader(file) if path.suffix == ".csv" else file
+        for number, row in enumerate(rows, start=1):
+            try:
+                if isinstance(row, dict):
+                    yield car_from_csv(row)
+                elif row.strip():
+                    yield Car.model_validate_json(row)
+            except ValidationError as error:
+                logger.warning(f"{path}:{number}: linha descartada: {error}")
+
+
+def _insert_dimension(model: type[SQLModel], stage: Table):
+    """
+    INSERT ... SELECT das dimensões cuja chave natural ainda não existe.
+    """
+    columns = [c.name for c in stage.columns if c.name in model.__table__.columns]
+    query = select(*(stage.c[name] for name in columns)).where(
+        ~exists().where(model.natural_key == stage.c.natural_key)
+    )
+    return insert(model).from_select(columns, query)
+
+
+def _insert_engine_specs():
+    """
+    INSERT ... SELECT das especificações dos motores que ainda não têm uma.
+    """
+    stage = STAGE_ENGINE.c
+    columns = [*CSV_COLUMNS["engine_specs"], "torque_unit_measure"]
+    query = (
+        select(*(stage[name] for name in columns), EngineModel.id)
+        .select_from(STAGE_ENGINE)
+        .join(EngineModel, EngineModel.natural_key == stage.natural_key)
+        .where(
+            or_(*(stage[name].isnot(None) for name in CSV_COLUMNS["engine_specs"])),
+            ~exists().where(EngineSpecModel.engine_id == EngineModel.id),
+        )
+    )
+    return insert(EngineSpecModel).from_select([*columns, "engine_id"], query)
+
+
+def _insert_cars(base: int):
+    """
+    INSERT ... SELECT dos carros, com ID `base + line` e as chaves estrangeiras
+    resolvidas pela chave natural.
+    """
+    stage = STAGE_CAR.c
+    query = (
+        select(
+            (stage.line + base).label("id"),
+            stage.name,
+            stage.version,
+            stage.year,
+            ManufacturerModel.id.label("manufacturer_id"),
+            TransmissionModel.id.label("transmission_id"),
+            EngineModel.id.label("engine_id"),
+        )
+        .select_from(STAGE_CAR)
+        .join(
+            ManufacturerModel, ManufacturerModel.natural_key == stage.manufacturer_key
+        )
+        .join(
+            TransmissionModel, TransmissionModel.natural_key == stage.transmission_key
+        )
+        .join(EngineModel, EngineModel.natural_key == stage.engine_key)
+    )
+    return insert(CarModel).from_select(
+        [column.name for column in query.selected_columns], query
+    )
+
+
+def _insert_children(model: type[SQLModel], stage: Table, base: int):
+    """
+    INSERT ... SELECT dos equipamentos ou especificações, ligados ao carro
+    `base + line`.
+    """
+    columns = [column.name for column in stage.columns if column.name != "line"]
+    query = select(
+        *(stage.c[name] for name in columns), (stage.c.line + base).label("car_id")
+    )
+    return insert(model).from_select([*columns, "car_id"], query)
+
+
+async def _max_id(connection: AsyncConnection, model: type[SQLModel]) -> int:
+    query = select(func.coalesce(func.max(model.id), 0))
+    return (await connection.execute(query)).scalar_one()
+
+
+async def _reserve_car_ids(connection: AsyncConnection) -> int:
+    """
+    Impede que outros carros sejam criados até o fim da transação e retorna o
+    maior ID atual, a partir do qual os carros importados são numerados.
+
+    No PostgreSQL, a tabela `car` é bloqueada para escritas. No MySQL,
+    importações concorrentes são serializadas pelo lock nomeado
+    `CAR_IDS_LOCK` (liberado por `_release_car_ids` após o commit) e o maior
+    ID é lido com `FOR UPDATE`. A conexão da importação roda em REPEATABLE
+    READ (ver `BULK_ISOLATION_LEVELS`), em que essa leitura trava também o
+    intervalo depois do maior ID, bloqueando as inserções dos repositórios até
+    o commit; em READ COMMITTED o InnoDB não trava intervalos.
+
+    Raises:
+        TimeoutError: Se o lock do MySQL não for obtido em
+            `config.BULK_LOCK_TIMEOUT` segundos.
+    """
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        await connection.execute(text("LOCK TABLE car IN SHARE ROW EXCLUSIVE MODE"))
+    if dialect != "mysql":
+        return await _max_id(connection, CarModel)
+    acquired = await connection.scalar(
+        text("SELECT GET_LOCK(:name, :timeout)"),
+        {"name": CAR_IDS_LOCK, "timeout": config.BULK_LOCK_TIMEOUT},
+    )
+    if acquired != 1:
+        raise TimeoutError("Outra importação em massa está numerando os carros.")
+    last = select(CarModel.id).order_by(CarModel.id.desc()).limit(1)
+    return (await connection.execute(last.with_for_update())).scalar() or 0
+
+
+async def _release_car_ids(connection: AsyncConnection):
+    """
+    Libera o lock nomeado de `_reserve_car_ids` (MySQL), que pertence à
+    conexão e não é liberado pelo commit.
+    """
+    if connection.dialect.name == "mysql":
+        await connection.execute(
+            text("SELECT RELEASE_LOCK(:name)"), {"name": CAR_IDS_LOCK}
+        )
+
+
+async def _sync_car_sequence(connection: AsyncConnection):
+    """
+    Avança a sequência de `car.id` após a inserção com IDs explícitos.
+
+    MySQL e SQLite ajustam o auto incremento sozinhos.
+    """
+    if connection.dialect.name == "postgresql":
+        await connection.execute(
+            text(
+                "SELECT setval(pg_get_serial_sequence('car', 'id'), "
+                "(SELECT MAX(id) FROM car))"
+            )
+        )
+
+
+def _chunks(cars: Iterable[Car], size: int) -> Iterator[List[Car]]:
+    iterator = iter(cars)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class BulkImporter:
+    """
+    Importa arquivos de carros com os carregadores nativos do banco.
+
+    Args:
+        session_factory (async_sessionmaker): A fábrica de sessões do banco.
+        chunk_size (Optional[int]): Carros enviados por vez ao staging
+            (padrão: `config.BULK_CHUNK_SIZE`).
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker, chunk_size: Optional[int] = None
+    ):
+        self.engine = session_factory.kw["bind"]
+        self.chunk_size = chunk_size or config.BULK_CHUNK_SIZE
+        self.report = Counter()
+        self._seen = {attr: set() for attr in DIMENSIONS}
+
+    async def run(self, paths: Iterable[Path]) -> Counter:
+        """
+        Importa os arquivos em uma única transação.
+
+        Args:
+            paths (Iterable[Path]): Os arquivos JSONL ou CSV.
+
+        Returns:
+            Counter: Os carros descartados (`rejected`) e as linhas inseridas
+            em cada tabela.
+        """
+        return await self.load(itertools.chain.from_iterable(map(read_cars, paths)))
+
+    async def load(self, cars: Iterable[Car]) -> Counter:
+        """
+        Importa carros já montados (ex: gerados pelo
+        `mcp_car_agent.ingestion.synthetic`) em uma única transação.
+
+        Args:
+            cars (Iterable[Car]): Os carros, consumidos um bloco de cada vez.
+
+        Returns:
+            Counter: Os carros descartados (`rejected`) e as linhas inseridas
+            em cada tabela.
+        """
+        async with bulk_connection(self.engine) as connection:
+            try:
+                async with connection.begin():
+                    await connection.run_sync(STAGING.drop_all)
+                    await connection.run_sync(STAGING.create_all)
+                    await self._stage(connection, cars)
+                    changed = await self._merge(connection)
+                    await connection.run_sync(STAGING.drop_all)
+                    pending = await self._notify(connection, changed)
+            finally:
+                await _release_car_ids(connection)
+        for table in pending:
+            await BaseRepository.bus.publish(table, [])
+        return self.report
+
+    @staticmethod
+    async def _notify(connection: AsyncConnection, tables: List[str]) -> List[str]:
+        """
+        Publica na transação as invalidações das tabelas inteiras que o
+        barramento permite (ver `IInvalidationBus.statements`) e retorna as
+        tabelas que ficam para depois do commit.
+        """
+        pending = []
+        for table in tables:
+            statements = BaseRepository.bus.statements(table, [])
+            for statement in statements:
+                await connection.execute(statement)
+            if not statements:
+                pending.append(table)
+        return pending
+
+    def _cars(self, cars: Iterable[Car]) -> Iterator[Car]:
+        """
+        Os carros normalizados; carros sem fabricante, transmissão ou motor
+        são descartados.
+        """
+        for car in cars:
+            if all(getattr(car, attr) for attr in DIMENSIONS):
+                yield normalize_car(car)
+            else:
+                self.report["rejected"] += 1
+
+    async def _stage(self, connection: AsyncConnection, cars: Iterable[Car]):
+        """
+        Grava os carros nas tabelas de staging, um bloco de cada vez.
+        """
+        load = loader_for(connection.dialect.name)
+        numbered = enumerate(self._cars(cars), start=1)
+        for chunk in _chunks(numbered, self.chunk_size):
+            rows = {table: [] for table in STAGING.sorted_tables}
+            for line, car in chunk:
+                self._flatten(line, car, rows)
+            for table in STAGING.sorted_tables:
+                if rows[table]:
+                    await load(connection, table, rows[table])
+
+    def _flatten(self, line: int, car: Car, rows: Dict[Table, List[Dict]]):
+        """
+        Distribui um carro pelas linhas das tabelas de staging.
+        """
+        keys = {attr: key(getattr(car, attr)) for attr, key in NATURAL_KEYS.items()}
+        for attr, key in keys.items():
+            if key not in self._seen[attr]:
+                self._seen[attr].add(key)
+                rows[STAGES[attr][1]].append(
+                    {"natural_key": key, **self._dimension_row(getattr(car, attr))}
+                )
+        rows[STAGE_CAR].append(
+            {"line": line, "name": car.name, "version": car.version, "year": car.year}
+            | {f"{attr}_key": key for attr, key in keys.items()}
+        )
+        rows[STAGE_EQUIPMENT] += [
+            {"line": line, **item.model_dump(exclude={"id", "car_id"})}
+            for item in car.equipments or []
+        ]
+        rows[STAGE_CAR_SPECS] += [
+            {"line": line, **item.model_dump(exclude={"id", "car"})}
+            for item in car.car_specs or []
+        ]
+
+    @staticmethod
+    def _dimension_row(dimension) -> Dict:
+        specs = getattr(dimension, "engine_specs", None)
+        row = dimension.model_dump(exclude={"id", "engine_specs"})
+        return row | (specs.model_dump(exclude={"id", "engine"}) if specs else {})
+
+    async def _merge(self, connection: AsyncConnection) -> List[str]:
+        """
+        Mescla as tabelas de staging no catálogo.
+
+        Returns:
+            List[str]: As tabelas que receberam linhas, para a invalidação.
+        """
+        statements = [
+            (model, _insert_dimension(model, stage)) for model, stage in STAGES.values()
+        ]
+        statements.append((EngineSpecModel, _insert_engine_specs()))
+        changed = await self._apply(connection, statements)
+        base = await _reserve_car_ids(connection)
+        changed += await self._apply(connection, [(CarModel, _insert_cars(base))])
+        await _sync_car_sequence(connection)
+        statements = [
+            (model, _insert_children(model, stage, base))
+            for model, stage in CHILDREN.items()
+        ]
+        return changed + await self._apply(connection, statements)
+
+    async def _apply(self, connection: AsyncConnection, statements: List) -> List[str]:
+        """
+        Executa os INSERT ... SELECT, em ordem, e registra no `change_log` as
+        tabelas que receberam linhas, por inteiro (ver `log_table`).
+
+        Args:
+            statements (List): Pares (modelo, INSERT ... SELECT).
+
+        Returns:
+            List[str]: As tabelas que receberam linhas.
+        """
+        changed = []
+        for model, statement in statements:
+            table = model.__tablename__
+            self.report[table] = (await connection.execute(statement)).rowcount
+            if self.report[table]:
+                await connection.execute(log_table(table))
+                changed.append(table)
+        return changed
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando da importação em massa.
+    """
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("paths", nargs="+", type=Path, help="Arquivos JSONL ou CSV.")
+    args = arguments.parse_args()
+
+    async def run():
+        importer = BulkImporter(await ConnectionRepository.session_factory())
+        logger.info(f"Importação concluída: {dict(await importer.run(args.paths))}")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Módulo de impressões digitais dos registros ingeridos.
+
+Dois registros com o mesmo conteúdo (ignorando IDs gerados pelo banco) têm a
+mesma chave, o que permite à ingestão incremental detectar carros, motores e
+listas de equipamentos que não mudaram desde a última execução.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+IGNORED_KEYS = {"id", "car_id", "engine_id"}
+"""
+Campos gerados pelo banco, que não fazem parte do conteúdo de um registro.
+"""
+
+
+def _strip(value: Any) -> Any:
+    """
+    Remove recursivamente os campos ignorados de um registro serializado.
+    """
+    if isinstance(value, dict):
+        return {k: _strip(v) for k, v in value.items() if k not in IGNORED_KEYS}
+    if isinstance(value, list):
+        return [_strip(item) for item in value]
+    return value
+
+
+def content_key(record: BaseModel) -> str:
+    """
+    Serializa o conteúdo de um registro de forma canônica, sem os IDs.
+
+    Args:
+        record (BaseModel): O registro (ex: `Engine`, `Equipment`, `Car`).
+
+    Returns:
+        str: O JSON canônico do registro.
+    """
+    return json.dumps(_strip(record.model_dump(mode="json")), sort_keys=True)
+
+
+def content_hash(record: BaseModel) -> str:
+    """
+    Calcula o hash SHA-256 do conteúdo de um registro.
+
+    Args:
+        record (BaseModel): O registro.
+
+    Returns:
+        str: O hash em hexadecimal (64 caracteres).
+    """
+    return hashlib.sha256(content_key(record).encode()).hexdigest()
@@ -0,0 +1,326 @@
+"""
+Módulo de carga em lote dos carros no banco de dados.
+
+Recebe lotes de páginas interpretadas e grava os carros completos (com motor,
+transmissão, fabricante, equipamentos e especificações) tabela a tabela com
+`create_many`, resolvendo as chaves estrangeiras a partir dos IDs gerados.
+Fabricantes, transmissões e motores são resolvidos pela chave natural, de
+modo que cada um é gravado uma única vez, qualquer que seja o lote.
+
+A carga é incremental: cada página guarda a impressão digital do carro que
+originou (`source_page`). Páginas cujo conteúdo não mudou não geram escritas
+e, nas que mudaram, apenas as partes alteradas do carro são regravadas.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mcp_car_agent.core.database.repository.base_repository import (
+    BaseRepository,
+    atomic,
+)
+from mcp_car_agent.core.database.repository.car_repository import (
+    CarRepository,
+    CarSpecsRepository,
+)
+from mcp_car_agent.core.database.repository.engine_repository import (
+    EngineRepository,
+    EngineSpecRepository,
+)
+from mcp_car_agent.core.database.repository.equipment_repository import (
+    EquipmentRepository,
+)
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.database.repository.source_page_repository import (
+    SourcePageRepository,
+)
+from mcp_car_agent.core.database.repository.transmission_repository import (
+    TransmissionRepository,
+)
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.engine_schema import Engine, EngineSpec
+from mcp_car_agent.core.schemas.source_page_schema import SourcePage
+from mcp_car_agent.ingestion.fingerprint import content_key
+
+DIMENSIONS = {
+    "manufacturer": ManufacturerRepository,
+    "transmission": TransmissionRepository,
+    "engine": EngineRepository,
+}
+"""
+Relações muitos-para-um do carro e os repositórios que as gravam.
+"""
+
+
+@dataclass
+class PageRecord:
+    """
+    Carro interpretado de uma página de origem.
+
+    Attributes:
+        page (SourcePage): A impressão digital atual da página.
+        car (Car): O carro interpretado.
+        previous (Optional[SourcePage]): A impressão digital gravada na
+            ingestão anterior, se a página já era conhecida.
+    """
+
+    page: SourcePage
+    car: Car
+    previous: Optional[SourcePage] = None
+
+    @property
+    def known_car_id(self) -> Optional[int]:
+        """
+        O ID do carro gravado a partir desta página na ingestão anterior.
+        """
+        return self.previous.car_id if self.previous else None
+
+    @property
+    def unchanged(self) -> bool:
+        """
+        Indica se o conteúdo da página é o mesmo da ingestão anterior.
+        """
+        return (
+            self.known_car_id is not None
+            and self.previous.content_hash == self.page.content_hash
+        )
+
+
+def _with_car(record: BaseModel, car: Car) -> BaseModel:
+    """
+    Liga um equipamento ou especificação ao carro recém-criado.
+    """
+    if hasattr(record, "car_id"):
+        record.car_id = car.id
+    else:
+        record.car = Car(id=car.id)
+    return record
+
+
+def _car_row(car: Car) -> Tuple:
+    """
+    As colunas da tabela `car`, com as chaves estrangeiras já resolvidas.
+    """
+    return (
+        car.name,
+        car.version,
+        car.year,
+        car.manufacturer.id,
+        car.transmission.id,
+        car.engine.id,
+    )
+
+
+def _changed_dimensions(
+    pairs: List[Tuple[Car, Car]], skipped: Counter
+) -> Dict[str, List[BaseModel]]:
+    """
+    Reaproveita os IDs das dimensões que não mudaram e separa as que mudaram.
+
+    Returns:
+        Dict[str, List[BaseModel]]: As dimensões alteradas, que precisam ser gravadas.
+    """
+    changed = {attr: [] for attr in DIMENSIONS}
+    for car, old in pairs:
+        car.id = old.id
+        for attr, records in changed.items():
+            new, current = getattr(car, attr), getattr(old, attr)
+            if content_key(new) == content_key(current):
+                new.id = current.id
+                skipped[attr] += 1
+            else:
+                records.append(new)
+    return changed
+
+
+def _engine_specs(
+    engines: List[Engine], current: Dict[int, EngineSpec]
+) -> List[EngineSpec]:
+    """
+    As especificações dos motores que ainda não têm uma gravada.
+
+    A especificação faz parte da chave natural do motor (ver
+    `mcp_car_agent.core.database.natural_key.engine_key`): uma especificação
+    diferente resolve para outro motor, então a de um motor já gravado nunca
+    é regravada.
+
+    Args:
+        engines (List[Engine]): Os motores, com os IDs já resolvidos.
+        current (Dict[int, EngineSpec]): A especificação gravada de cada motor.
+
+    Returns:
+        List[EngineSpec]: As especificações a criar, uma por motor.
+    """
+    fresh = {}
+    for engine in engines:
+        if engine.engine_specs and engine.id not in current:
+            fresh[engine.id] = engine.engine_specs.model_copy(
+                update={"engine": Engine(id=engine.id)}
+            )
+    return list(fresh.values())
+
+
+class CatalogLoader:
+    """
+    Grava lotes de carros no banco, uma sessão e uma transação por lote.
+
+    Args:
+        session_factory (async_sessionmaker): A fábrica de sessões do banco.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+
+    async def fingerprints(self, urls: List[str]) -> Dict[str, SourcePage]:
+        """
+        Busca as impressões digitais gravadas para as páginas.
+
+        Args:
+            urls (List[str]): As URLs das páginas.
+
+        Returns:
+            Dict[str, SourcePage]: As páginas já conhecidas, indexadas pela URL.
+        """
+        async with self.session_factory() as session:
+            return await SourcePageRepository(session).get_many(urls)
+
+    async def load(self, records: List[PageRecord]) -> Counter:
+        """
+        Grava um lote de páginas, escrevendo apenas o que mudou, em uma única
+        transação: uma falha no meio do lote não deixa carros sem
+        equipamentos ou especificações, nem páginas sem `source_page`.
+
+        Args:
+            records (List[PageRecord]): As páginas interpretadas do lote.
+
+        Returns:
+            Counter: Quantas páginas (`pages_unchanged`) e linhas de cada
+            tabela deixaram de ser escritas por não terem mudado.
+        """
+        skipped = Counter(pages_unchanged=sum(r.unchanged for r in records))
+        async with self.session_factory() as session, atomic(session):
+            candidates = [r for r in records if r.known_car_id and not r.unchanged]
+            existing = {
+                car.id: car
+                for car in await CarRepository(session).get_many(
+                    [r.known_car_id for r in candidates]
+                )
+            }
+            await self._insert(
+                session,
+                [
+                    r.car
+                    for r in records
+                    if not r.unchanged and r.known_car_id not in existing
+                ],
+            )
+            skipped.update(
+                await self._update(
+                    session,
+                    [
+                        (r.car, existing[r.known_car_id])
+                        for r in candidates
+                        if r.known_car_id in existing
+                    ],
+                )
+            )
+            for record in records:
+                record.page.car_id = (
+                    record.known_car_id if record.unchanged else record.car.id
+                )
+            await SourcePageRepository(session).save_many([r.page for r in records])
+        return skipped
+
+    async def _insert(self, session: AsyncSession, cars: List[Car]):
+        """
+        Grava carros novos com todas as suas relações.
+        """
+        await self._create_dimensions(
+            session,
+            {attr: [getattr(car, attr) for car in cars] for attr in DIMENSIONS},
+        )
+        await CarRepository(session).create_many(cars)
+        await EquipmentRepository(session).create_many(
+            [_with_car(e, car) for car in cars for e in car.equipments or []]
+        )
+        await CarSpecsRepository(session).create_many(
+            [_with_car(s, car) for car in cars for s in car.car_specs or []]
+        )
+
+    async def _update(
+        self, session: AsyncSession, pairs: List[Tuple[Car, Car]]
+    ) -> Counter:
+        """
+        Regrava apenas as partes alteradas de carros já existentes.
+
+        Dimensões alteradas passam a apontar para novos registros (que podem
+        ser compartilhados com outros carros); listas de equipamentos e
+        especificações alteradas são substituídas por inteiro.
+
+        Args:
+            pairs (List[Tuple[Car, Car]]): Pares (carro interpretado, carro gravado).
+
+        Returns:
+            Counter: As linhas, por tabela, que não precisaram ser escritas.
+        """
+        skipped = Counter()
+        await self._create_dimensions(session, _changed_dimensions(pairs, skipped))
+
+        rows = [car for car, old in pairs if _car_row(car) != _car_row(old)]
+        skipped["car"] += len(pairs) - len(rows)
+        await CarRepository(session).update_many(rows)
+        skipped["equipment"] += await self._replace(
+            EquipmentRepository(session), "equipments", pairs
+        )
+        skipped["car_specs"] += await self._replace(
+            CarSpecsRepository(session), "car_specs", pairs
+        )
+        return skipped
+
+    @staticmethod
+    async def _create_dimensions(
+        session: AsyncSession, dimensions: Dict[str, List[BaseModel]]
+    ):
+        """
+        Resolve as dimensões pela chave natural, criando as que não existem, e
+        grava a especificação dos motores que ainda não têm uma.
+        """
+        for attr, records in dimensions.items():
+            await DIMENSIONS[attr](session).get_or_create_many(
+                list(filter(None, records))
+            )
+        engines = [engine for engine in dimensions["engine"] if engine]
+        repository = EngineSpecRepository(session)
+        current = await repository.by_engine([engine.id for engine in engines])
+        await repository.create_many(_engine_specs(engines, current))
+
+    @staticmethod
+    async def _replace(
+        repository: BaseRepository, attr: str, pairs: List[Tuple[Car, Car]]
+    ) -> int:
+        """
+        Substitui as coleções (`equipments`, `car_specs`) que mudaram.
+
+        Returns:
+            int: O número de linhas mantidas por não terem mudado.
+        """
+        kept, stale, fresh = 0, [], []
+        for car, old in pairs:
+            new_items, old_items = getattr(car, attr) or [], getattr(old, attr) or []
+            if sorted(map(content_key, new_items)) == sorted(
+                map(content_key, old_items)
+            ):
+                kept += len(old_items)
+                continue
+            stale += [item.id for item in old_items]
+            fresh += [_with_car(item, car) for item in new_items]
+        await repository.delete_many(stale)
+        await repository.create_many(fresh)
+        return kept
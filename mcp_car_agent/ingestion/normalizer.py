@@ -0,0 +1,66 @@
+"""
+Módulo de normalização dos carros interpretados pelo scraper.
+
+Páginas de origens diferentes grafam o mesmo dado de formas diferentes
+(espaços extras, caixa alta, equipamentos repetidos). A normalização
+acontece antes da carga, para que o banco receba registros consistentes.
+"""
+
+import re
+from typing import Optional
+
+from mcp_car_agent.core.schemas.car_schema import Car
+
+_SPACES = re.compile(r"\s+")
+
+
+def _clean(text: Optional[str]) -> Optional[str]:
+    """
+    Remove espaços nas pontas e colapsa espaços internos; texto vazio vira `None`.
+    """
+    if text is None:
+        return None
+    return _SPACES.sub(" ", text).strip() or None
+
+
+def _manufacturer_name(name: str) -> str:
+    """
+    Padroniza o nome do fabricante (ex: "  TOYOTA " -> "Toyota").
+
+    Nomes já em caixa mista (ex: "McLaren") são mantidos.
+    """
+    name = _clean(name) or name
+    return name.title() if name.isupper() or name.islower() else name
+
+
+def normalize_car(car: Car) -> Car:
+    """
+    Normaliza os textos do carro e remove equipamentos repetidos ou sem descrição.
+
+    Args:
+        car (Car): O carro interpretado.
+
+    Returns:
+        Car: O mesmo carro, normalizado.
+    """
+    car.name = _clean(car.name)
+    car.version = _clean(car.version)
+    if car.manufacturer:
+        car.manufacturer.name = _manufacturer_name(car.manufacturer.name)
+    if car.engine:
+        car.engine.aspiration = _clean(car.engine.aspiration)
+        car.engine.compression_rate = _clean(car.engine.compression_rate)
+    if car.transmission:
+        car.transmission.gearbox_type = (
+            _clean(car.transmission.gearbox_type) or "Desconhecido"
+        )
+        car.transmission.traction = _clean(car.transmission.traction)
+
+    unique = {}
+    for equipment in car.equipments or []:
+        equipment.category = _clean(equipment.category) or "Outros"
+        equipment.description = _clean(equipment.description)
+        if equipment.description:
+            unique.setdefault((equipment.category, equipment.description), equipment)
+    car.equipments = list(unique.values())
+    return car
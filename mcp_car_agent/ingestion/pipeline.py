@@ -0,0 +1,396 @@
+"""
+Módulo do pipeline de ingestão do catálogo de carros.
+
+A ingestão é dividida em etapas que rodam ao mesmo tempo, ligadas por filas
+de capacidade limitada:
+
+    fetch -> parse -> normalize -> load
+
+A ingestão é incremental: páginas já conhecidas são pedidas com cabeçalhos
+condicionais (`If-None-Match`/`If-Modified-Since`) e as que não mudaram são
+descartadas já no fetch; as demais só geram escritas para o que mudou.
+
+Quando uma etapa fica para trás (tipicamente a carga no banco), a fila
+anterior a ela enche e as etapas anteriores esperam, até o scraper deixar de
+iniciar novas requisições. Assim, a memória usada depende apenas do tamanho
+das filas e dos lotes, e não do tamanho do catálogo.
+
+Uso:
+    python -m mcp_car_agent.ingestion.pipeline https://exemplo.com/catalogo
+    python -m mcp_car_agent.ingestion.pipeline --cache-dir .cache --offline URL
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Dict, Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.core.interfaces.fetcher import FetchResponse, IFetcher
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.source_page_schema import SourcePage
+from mcp_car_agent.ingestion.fingerprint import content_hash
+from mcp_car_agent.ingestion.loader import CatalogLoader, PageRecord
+from mcp_car_agent.ingestion.normalizer import normalize_car
+from mcp_car_agent.scraper.cached_fetcher import CachedFetcher
+from mcp_car_agent.scraper.http_fetcher import HttpFetcher
+from mcp_car_agent.scraper.parser import ParseStage, parse_car_links
+from mcp_car_agent.scraper.response_cache import ResponseCache
+from mcp_car_agent.scraper.scraper import HeadersFor, Scraper
+
+_DONE = object()
+"""
+Marcador de fim enviado pelas filas quando a etapa anterior termina.
+"""
+
+
+@dataclass
+class StageStats:
+    """
+    Estatísticas de uma etapa do pipeline.
+
+    Attributes:
+        items (int): Itens processados pela etapa.
+        busy (float): Tempo, em segundos, gasto processando itens (somado
+            entre as tarefas da etapa).
+        started (float): Instante de início da etapa.
+        finished (Optional[float]): Instante de término da etapa, se terminou.
+    """
+
+    items: int = 0
+    busy: float = 0.0
+    started: float = field(default_factory=time.monotonic)
+    finished: Optional[float] = None
+
+    def record(self, started: float):
+        """
+        Contabiliza um item cujo processamento começou em `started`.
+        """
+        self.items += 1
+        self.busy += time.monotonic() - started
+
+    @property
+    def throughput(self) -> float:
+        """
+        Itens processados por segundo desde o início da etapa.
+        """
+        elapsed = (self.finished or time.monotonic()) - self.started
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+
+class StageQueue(asyncio.Queue):
+    """
+    Fila entre duas etapas, que registra a maior profundidade já atingida.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self.max_depth = 0
+
+    async def put(self, item: Any):
+        await super().put(item)
+        self.max_depth = max(self.max_depth, self.qsize())
+
+
+@dataclass
+class PipelineReport:
+    """
+    Relatório de vazão por etapa e profundidade das filas do pipeline.
+
+    `skipped` conta as páginas que não mudaram (`pages_not_modified` para
+    respostas 304, `pages_unchanged` para conteúdo igual), as que não puderam
+    ser interpretadas (`pages_failed`) e as linhas, por tabela, que não
+    precisaram ser escritas.
+    """
+
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    queues: Dict[str, StageQueue] = field(default_factory=dict)
+    skipped: Counter = field(default_factory=Counter)
+
+    def summary(self) -> str:
+        """
+        Resume o relatório em uma linha de log.
+        """
+        stages = ", ".join(
+            f"{name}: {stats.items} ({stats.throughput:.1f}/s)"
+            for name, stats in self.stages.items()
+        )
+        queues = ", ".join(
+            f"{name}: {queue.qsize()}/{queue.maxsize} (máx. {queue.max_depth})"
+            for name, queue in self.queues.items()
+        )
+        skipped = ", ".join(f"{name}: {n}" for name, n in self.skipped.items())
+        return f"Etapas [{stages}] | Filas [{queues}] | Ignorados [{skipped}]"
+
+
+async def _run_all(coroutines: List[Awaitable]):
+    """
+    Executa as etapas em paralelo; se uma falhar, cancela as demais.
+    """
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _chunks(urls: Iterable[str], size: int) -> Iterator[List[str]]:
+    """
+    Divide as URLs em blocos de até `size` itens, sem materializar o iterável.
+    """
+    iterator = iter(urls)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _conditional(known: Dict[str, SourcePage]) -> HeadersFor:
+    """
+    Cabeçalhos de requisição condicional para as páginas já conhecidas.
+    """
+    return lambda url: known[url].conditional_headers() if url in known else None
+
+
+class IngestionPipeline:
+    """
+    Pipeline de ingestão em etapas com backpressure.
+
+    Args:
+        scraper (Scraper): Obtém as páginas.
+        parser (ParseStage): Interpreta as páginas em um pool de processos.
+        loader (CatalogLoader): Grava os lotes de carros no banco.
+        batch_size (Optional[int]): Carros por lote; por padrão, `INGEST_BATCH_SIZE`.
+    """
+
+    def __init__(
+        self,
+        scraper: Scraper,
+        parser: ParseStage,
+        loader: CatalogLoader,
+        batch_size: Optional[int] = None,
+    ):
+        self.scraper = scraper
+        self.parser = parser
+        self.loader = loader
+        self.batch_size = batch_size or config.INGEST_BATCH_SIZE
+        self.report = PipelineReport()
+
+    async def run(self, urls: Iterable[str]) -> PipelineReport:
+        """
+        Obtém, interpreta, normaliza e grava as fichas técnicas das URLs.
+
+        Args:
+            urls (Iterable[str]): As URLs das fichas técnicas (pode ser um gerador).
+
+        Returns:
+            PipelineReport: A vazão de cada etapa e a profundidade das filas.
+        """
+        self.report = PipelineReport(
+            stages={
+                name: StageStats() for name in ("fetch", "parse", "normalize", "load")
+            },
+            queues={
+                name: StageQueue(config.INGEST_QUEUE_SIZE)
+                for name in ("fetched", "parsed", "normalized")
+            },
+        )
+        workers = config.INGEST_PARSE_CONCURRENCY
+        queues = self.report.queues
+        reporter = asyncio.create_task(self._report_periodically())
+        try:
+            await _run_all(
+                [
+                    self._fetch(urls, queues["fetched"], workers),
+                    *(
+                        self._parse(queues["fetched"], queues["parsed"])
+                        for _ in range(workers)
+                    ),
+                    self._normalize(queues["parsed"], queues["normalized"], workers),
+                    self._load(queues["normalized"]),
+                ]
+            )
+        finally:
+            reporter.cancel()
+        logger.info(f"Ingestão concluída. {self.report.summary()}")
+        return self.report
+
+    async def _fetch(self, urls: Iterable[str], sink: StageQueue, consumers: int):
+        stats = self.report.stages["fetch"]
+        for chunk in _chunks(urls, config.INGEST_BATCH_SIZE):
+            known = await self.loader.fingerprints(chunk)
+            async for response in self.scraper.crawl(
+                chunk, headers=_conditional(known)
+            ):
+                stats.items += 1
+                if response.status == 304:
+                    self.report.skipped["pages_not_modified"] += 1
+                    continue
+                await sink.put((response, known.get(response.url)))
+        stats.finished = time.monotonic()
+        for _ in range(consumers):
+            await sink.put(_DONE)
+
+    async def _parse(self, source: StageQueue, sink: StageQueue):
+        stats = self.report.stages["parse"]
+        while (item := await source.get()) is not _DONE:
+            response, previous = item
+            started = time.monotonic()
+            car = await self._parse_page(response)
+            stats.record(started)
+            if car is not None:
+                page = SourcePage(
+                    url=response.url,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                )
+                await sink.put(PageRecord(page, car, previous))
+        stats.finished = time.monotonic()
+        await sink.put(_DONE)
+
+    async def _parse_page(self, response: FetchResponse) -> Optional[Car]:
+        """
+        Interpreta uma página; uma falha é registrada e descarta apenas a
+        página, sem interromper a ingestão.
+        """
+        if response.status != 200:
+            return None
+        try:
+            return await self.parser.parse(response)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Falha ao interpretar {response.url}: {exc!r}")
+            self.report.skipped["pages_failed"] += 1
+            return None
+
+    async def _normalize(self, source: StageQueue, sink: StageQueue, producers: int):
+        stats = self.report.stages["normalize"]
+        while producers:
+            record = await source.get()
+            if record is _DONE:
+                producers -= 1
+                continue
+            started = time.monotonic()
+            record.car = normalize_car(record.car)
+            record.page.content_hash = content_hash(record.car)
+            stats.record(started)
+            await sink.put(record)
+        stats.finished = time.monotonic()
+        await sink.put(_DONE)
+
+    async def _load(self, source: StageQueue):
+        stats = self.report.stages["load"]
+        batch = []
+        while (record := await source.get()) is not _DONE:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                await self._flush(batch, stats)
+                batch = []
+        await self._flush(batch, stats)
+        stats.finished = time.monotonic()
+
+    async def _flush(self, batch: List[PageRecord], stats: StageStats):
+        if not batch:
+            return
+        started = time.monotonic()
+        self.report.skipped.update(await self.loader.load(batch))
+        stats.busy += time.monotonic() - started
+        stats.items += len(batch)
+
+    async def _report_periodically(self):
+        while True:
+            await asyncio.sleep(config.INGEST_REPORT_INTERVAL)
+            logger.info(self.report.summary())
+
+
+async def discover(scraper: Scraper, index_urls: Iterable[str]) -> List[str]:
+    """
+    Obtém as páginas de listagem e extrai as URLs das fichas técnicas.
+
+    Args:
+        scraper (Scraper): O scraper usado para obter as páginas.
+        index_urls (Iterable[str]): As URLs das páginas de listagem.
+
+    Returns:
+        List[str]: As URLs das fichas técnicas, sem repetições.
+    """
+    urls: Dict[str, None] = {}
+    async for response in scraper.crawl(index_urls):
+        urls.update(dict.fromkeys(parse_car_links(response.body, response.url)))
+    return list(urls)
+
+
+def build_fetcher() -> IFetcher:
+    """
+    Cria o cliente do scraper, passando pelo cache em disco se configurado.
+
+    Returns:
+        IFetcher: O cliente HTTP, ou o cliente com cache quando
+        `SCRAPER_CACHE_DIR` está definido.
+    """
+    fetcher = HttpFetcher()
+    if not config.SCRAPER_CACHE_DIR:
+        return fetcher
+    cache = ResponseCache(
+        Path(config.SCRAPER_CACHE_DIR), config.SCRAPER_CACHE_MAX_BYTES
+    )
+    return CachedFetcher(fetcher, cache, offline=config.SCRAPER_OFFLINE)
+
+
+async def ingest(index_urls: List[str]) -> PipelineReport:
+    """
+    Executa a ingestão completa a partir das páginas de listagem do catálogo.
+
+    Args:
+        index_urls (List[str]): As URLs das páginas de listagem.
+
+    Returns:
+        PipelineReport: O relatório do pipeline.
+    """
+    fetcher = build_fetcher()
+    parser = ParseStage()
+    try:
+        scraper = Scraper(fetcher)
+        loader = CatalogLoader(await ConnectionRepository.session_factory())
+        urls = await discover(scraper, index_urls)
+        return await IngestionPipeline(scraper, parser, loader).run(urls)
+    finally:
+        parser.close()
+        await fetcher.close()
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando da ingestão.
+    """
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("index_urls", nargs="+", help="Páginas de listagem.")
+    arguments.add_argument(
+        "--cache-dir",
+        default=config.SCRAPER_CACHE_DIR,
+        help="Diretório do cache de respostas em disco.",
+    )
+    arguments.add_argument(
+        "--offline",
+        action="store_true",
+        default=config.SCRAPER_OFFLINE,
+        help="Usa apenas o cache em disco, sem acessar a rede.",
+    )
+    args = arguments.parse_args()
+    if args.offline and not args.cache_dir:
+        arguments.error("--offline exige --cache-dir.")
+    config.SCRAPER_CACHE_DIR, config.SCRAPER_OFFLINE = args.cache_dir, args.offline
+    asyncio.run(ingest(args.index_urls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Módulo das tabelas de staging da importação em massa.
+
+Os carros importados são gravados primeiro em tabelas temporárias, com os
+carregadores nativos de cada banco, e só depois mesclados nas tabelas do
+catálogo com SQL (ver `mcp_car_agent.ingestion.bulk`):
+
+- PostgreSQL: `COPY ... FROM STDIN` pelo driver asyncpg;
+- MySQL: `LOAD DATA LOCAL INFILE`, que exige `local_infile=True` no driver;
+  por isso a importação abre a sua própria conexão (`bulk_connection`), e só
+  ela o liga;
+- demais bancos (ex: SQLite nos testes): INSERT com vários valores.
+
+Cada dimensão tem a sua tabela de staging, com uma linha por chave natural,
+de modo que nenhuma consulta da mesclagem referencia a mesma tabela temporária
+duas vezes (o MySQL não permite).
+
+PostgreSQL e MySQL recebem o mesmo formato texto: campos separados por TAB,
+`\\N` para nulos e barras invertidas escapando TAB, quebras de linha e a
+própria barra.
+"""
+
+import io
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    insert,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from mcp_car_agent.core.database.dialects import BULK_CONNECT_ARGS
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+
+STAGING = MetaData()
+
+STAGE_MANUFACTURER = Table(
+    "stage_manufacturer",
+    STAGING,
+    Column("natural_key", String(255), primary_key=True),
+    Column("name", String(150)),
+    prefixes=["TEMPORARY"],
+)
+
+STAGE_TRANSMISSION = Table(
+    "stage_transmission",
+    STAGING,
+    Column("natural_key", String(255), primary_key=True),
+    Column("gearbox_type", String(20)),
+    Column("gears_qtde", Integer),
+    Column("traction", String(45)),
+    prefixes=["TEMPORARY"],
+)
+
+STAGE_ENGINE = Table(
+    "stage_engine",
+    STAGING,
+    Column("natural_key", String(255), primary_key=True),
+    Column("compression_rate", String(10)),
+    Column("total_cc", Integer),
+    Column("aspiration", String(45)),
+    Column("gas_type", String(45)),
+    Column("max_hp", Integer),
+    Column("max_hp_rpm", Integer),
+    Column("max_torque", Integer),
+    Column("max_torque_rpm", Integer),
+    Column("torque_unit_measure", String(10)),
+    prefixes=["TEMPORARY"],
+)
+"""
+Um motor por chave natural, com a sua especificação.
+"""
+
+STAGE_CAR = Table(
+    "stage_car",
+    STAGING,
+    Column("line", Integer, primary_key=True),
+    Column("name", String(80)),
+    Column("version", String(80)),
+    Column("year", Date),
+    Column("manufacturer_key", String(255)),
+    Column("transmission_key", String(255)),
+    Column("engine_key", String(255)),
+    prefixes=["TEMPORARY"],
+)
+"""
+Um carro por linha, apontando para as dimensões pela chave natural. `line` é
+a posição do carro na importação.
+"""
+
+STAGE_EQUIPMENT = Table(
+    "stage_equipment",
+    STAGING,
+    Column("line", Integer),
+    Column("category", String(50)),
+    Column("description", String(150)),
+    Column("is_standard", Boolean),
+    Column("is_optional", Boolean),
+    prefixes=["TEMPORARY"],
+)
+
+STAGE_CAR_SPECS = Table(
+    "stage_car_specs",
+    STAGING,
+    Column("line", Integer),
+    Column("gas", String(50)),
+    Column("config", String(45)),
+    Column("doors", Integer),
+    Column("spaces", Integer),
+    prefixes=["TEMPORARY"],
+)
+
+StageLoader = Callable[[AsyncConnection, Table, List[Dict[str, Any]]], Awaitable[None]]
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _text_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value).translate(_ESCAPES)
+
+
+def text_rows(table: Table, rows: List[Dict[str, Any]]) -> bytes:
+    """
+    Serializa as linhas no formato texto do COPY e do LOAD DATA.
+
+    Args:
+        table (Table): A tabela de staging (define a ordem das colunas).
+        rows (List[Dict[str, Any]]): As linhas, indexadas pelo nome da coluna.
+
+    Returns:
+        bytes: As linhas em UTF-8, uma por linha.
+    """
+    return "".join(
+        "\t".join(_text_value(row.get(column.name)) for column in table.columns) + "\n"
+        for row in rows
+    ).encode()
+
+
+async def copy_rows(connection: AsyncConnection, table: Table, rows: List[Dict]):
+    """
+    Grava as linhas com `COPY ... FROM STDIN` (PostgreSQL/asyncpg).
+    """
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_to_table(
+        table.name,
+        source=io.BytesIO(text_rows(table, rows)),
+        columns=[column.name for column in table.columns],
+        format="text",
+    )
+
+
+async def load_data_rows(connection: AsyncConnection, table: Table, rows: List[Dict]):
+    """
+    Grava as linhas com `LOAD DATA LOCAL INFILE` (MySQL), via arquivo temporário.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".tsv", delete=False) as file:
+        file.write(text_rows(table, rows))
+    try:
+        columns = ", ".join(column.name for column in table.columns)
+        await connection.execute(
+            text(
+                f"LOAD DATA LOCAL INFILE :path INTO TABLE {table.name} "
+                f"CHARACTER SET utf8mb4 ({columns})"
+            ),
+            {"path": file.name},
+        )
+    finally:
+        os.unlink(file.name)
+
+
+async def insert_rows(connection: AsyncConnection, table: Table, rows: List[Dict]):
+    """
+    Grava as linhas com INSERTs em lote (bancos sem carregador nativo).
+    """
+    await connection.execute(insert(table), rows)
+
+
+LOADERS: Dict[str, StageLoader] = {
+    "postgresql": copy_rows,
+    "mysql": load_data_rows,
+}
+"""
+Carregadores nativos por dialeto; os demais usam `insert_rows`.
+"""
+
+
+@asynccontextmanager
+async def bulk_connection(engine: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    """
+    Abre a conexão da importação em massa com o mesmo banco de `engine`.
+
+    Nos bancos com `BULK_CONNECT_ARGS` (no MySQL, `local_infile`), a conexão
+    vem de um motor próprio, sem pool, descartado ao fim; nos demais, do pool
+    de `engine`.
+
+    Args:
+        engine (AsyncEngine): O motor compartilhado da aplicação.
+
+    Yields:
+        AsyncConnection: A conexão da importação.
+    """
+    if engine.dialect.name not in BULK_CONNECT_ARGS:
+        async with engine.connect() as connection:
+            yield connection
+        return
+    bulk = ConnectionRepository.dedicated_engine(engine, bulk=True)
+    try:
+        async with bulk.connect() as connection:
+            yield connection
+    finally:
+        await bulk.dispose()
+
+
+def loader_for(dialect: str) -> StageLoader:
+    """
+    Escolhe o carregador de staging do dialeto.
+
+    Args:
+        dialect (str): O nome do dialeto do SQLAlchemy (ex: "postgresql").
+
+    Returns:
+        StageLoader: O carregador nativo do banco ou `insert_rows`.
+    """
+    return LOADERS.get(dialect, insert_rows)
@@ -0,0 +1,388 @@
+"""
+Módulo do gerador de catálogo sintético.
+
+As fixtures dos testes criam poucos carros, o que não diz nada sobre o
+comportamento do banco com um catálogo real (~1M de carros e ~20M de
+equipamentos). O gerador produz carros com distribuições próximas às do
+mercado brasileiro:
+
+- fabricantes com participação desigual (`MANUFACTURERS`);
+- modelos por fabricante, também com popularidade desigual (Zipf);
+- motores concentrados em 1.0 e 2.0, com especificação derivada do motor;
+- poucas transmissões, compartilhadas por muitos carros;
+- anos concentrados nos mais recentes;
+- em média `EQUIPMENTS_PER_CAR` equipamentos por carro.
+
+A geração é determinística: a mesma semente produz os mesmos carros, e os N
+primeiros carros não dependem do total pedido. Os carros são carregados pela
+importação em massa (`BulkImporter.load`), com o carregador nativo do banco.
+
+Uso:
+    python -m mcp_car_agent.ingestion.synthetic 1000000 --seed 42
+    python -m mcp_car_agent.ingestion.synthetic 1000 --output catalogo.jsonl
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.core.schemas.car_schema import Car, CarSpecs
+from mcp_car_agent.core.schemas.engine_schema import Engine, EngineSpec
+from mcp_car_agent.core.schemas.equipment_schema import Equipment
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+from mcp_car_agent.ingestion.bulk import BulkImporter
+
+MANUFACTURERS = {
+    "Volkswagen": 16,
+    "Fiat": 15,
+    "Chevrolet": 14,
+    "Toyota": 9,
+    "Hyundai": 8,
+    "Jeep": 6,
+    "Renault": 6,
+    "Honda": 5,
+    "Nissan": 4,
+    "Ford": 4,
+    "Peugeot": 3,
+    "Citroën": 2,
+    "BMW": 2,
+    "Mercedes-Benz": 2,
+    "Mitsubishi": 1.5,
+    "Kia": 1.5,
+    "Audi": 1,
+    "BYD": 1,
+    "Caoa Chery": 1,
+    "Volvo": 0.5,
+}
+"""
+Fabricantes e os seus pesos relativos no catálogo.
+"""
+
+ENGINE_SIZES = {
+    1000: 30,
+    1300: 8,
+    1400: 6,
+    1500: 8,
+    1600: 12,
+    1800: 5,
+    2000: 18,
+    2400: 3,
+    2800: 2,
+    3000: 2,
+    3500: 1,
+    4000: 1,
+}
+"""
+Cilindradas (cm³) e os seus pesos relativos.
+"""
+
+TRANSMISSIONS = [
+    ("Manual", 5, "Dianteira"),
+    ("Manual", 6, "Dianteira"),
+    ("Automático", 6, "Dianteira"),
+    ("Automático", 8, "Traseira"),
+    ("Automático", 9, "Integral"),
+    ("CVT", None, "Dianteira"),
+    ("Automatizado", 5, "Dianteira"),
+    ("Automatizado", 7, "Dianteira"),
+    ("Manual", 6, "Integral"),
+    ("Automático", 6, "Integral"),
+]
+
+BODIES = {
+    "Hatch": ((4, 2), (5,)),
+    "Sedan": ((4,), (5,)),
+    "SUV": ((4,), (5, 7)),
+    "Picape": ((4, 2), (5, 2)),
+}
+"""
+Carrocerias, com as opções de portas e de lugares (a primeira é a mais comum).
+"""
+
+TRIMS = ["Base", "Comfort", "Style", "Sport", "Premium", "Limited"]
+"""
+Acabamentos, do mais simples ao mais completo.
+"""
+
+EQUIPMENTS = {
+    "Segurança": [
+        "Airbag duplo",
+        "Airbags laterais",
+        "Airbags de cortina",
+        "Freios ABS",
+        "Controle de estabilidade",
+        "Controle de tração",
+        "Assistente de partida em rampa",
+        "Alerta de ponto cego",
+        "Frenagem autônoma de emergência",
+        "Alerta de mudança de faixa",
+        "Câmera de ré",
+        "Sensor de estacionamento traseiro",
+        "Sensor de estacionamento dianteiro",
+        "Isofix",
+        "Monitoramento da pressão dos pneus",
+    ],
+    "Conforto": [
+        "Ar-condicionado",
+        "Ar-condicionado digital",
+        "Ar-condicionado de duas zonas",
+        "Direção elétrica",
+        "Vidros elétricos",
+        "Travas elétricas",
+        "Retrovisores elétricos",
+        "Banco do motorista com ajuste de altura",
+        "Bancos de couro",
+        "Bancos dianteiros aquecidos",
+        "Piloto automático",
+        "Piloto automático adaptativo",
+        "Chave presencial",
+        "Partida por botão",
+        "Teto solar",
+        "Volante com ajuste de profundidade",
+    ],
+    "Tecnologia": [
+        "Central multimídia",
+        "Android Auto",
+        "Apple CarPlay",
+        "Carregador por indução",
+        "Painel digital",
+        "Bluetooth",
+        "Entrada USB",
+        "Sistema de som premium",
+        "Navegador GPS",
+        "Conectividade remota",
+    ],
+    "Externo": [
+        "Rodas de liga leve",
+        "Faróis de LED",
+        "Faróis de neblina",
+        "Luz diurna de LED",
+        "Sensor de chuva",
+        "Sensor crepuscular",
+        "Rack de teto",
+        "Retrovisores rebatíveis",
+    ],
+}
+"""
+Equipamentos por categoria; acabamentos mais completos têm mais itens de série.
+"""
+
+EQUIPMENTS_PER_CAR = 20
+
+FIRST_YEAR, LAST_YEAR = 2000, 2025
+
+_SYLLABLES = ["ka", "ri", "no", "ve", "lo", "tra", "mi", "sa", "zen", "ox", "ar", "ti"]
+
+
+class CatalogGenerator:
+    """
+    Gera carros sintéticos de forma determinística.
+
+    Args:
+        seed (int): A semente do gerador.
+        models_per_manufacturer (int): Número máximo de modelos por fabricante.
+    """
+
+    def __init__(self, seed: int = 0, models_per_manufacturer: int = 30):
+        self.seed = seed
+        self.models_per_manufacturer = models_per_manufacturer
+        self._equipments = [
+            (category, description)
+            for category, descriptions in EQUIPMENTS.items()
+            for description in descriptions
+        ]
+
+    def cars(self, count: int) -> Iterator[Car]:
+        """
+        Gera os carros, um de cada vez.
+
+        Args:
+            count (int): O número de carros.
+
+        Yields:
+            Car: Os carros, com dimensões, equipamentos e especificações.
+        """
+        rng = random.Random(self.seed)
+        models = self._models(rng)
+        names = list(MANUFACTURERS)
+        weights = list(itertools.accumulate(MANUFACTURERS.values()))
+        for _ in range(count):
+            manufacturer = rng.choices(names, cum_weights=weights)[0]
+            catalog, cum_weights = models[manufacturer]
+            model = rng.choices(catalog, cum_weights=cum_weights)[0]
+            yield self._car(rng, manufacturer, model)
+
+    def _models(self, rng: random.Random) -> Dict[str, tuple]:
+        """
+        Os modelos de cada fabricante e os seus pesos (Zipf).
+        """
+        models = {}
+        for manufacturer in MANUFACTURERS:
+            count = rng.randint(
+                self.models_per_manufacturer // 3 or 1, self.models_per_manufacturer
+            )
+            catalog = [_model(rng) for _ in range(count)]
+            zipf = itertools.accumulate(1 / rank for rank in range(1, count + 1))
+            models[manufacturer] = (catalog, list(zipf))
+        return models
+
+    def _car(self, rng: random.Random, manufacturer: str, model: Dict) -> Car:
+        trim = rng.randrange(len(TRIMS))
+        engine = rng.choice(model["engines"])
+        transmission = rng.choice(model["transmissions"])
+        return Car(
+            name=model["name"],
+            version=f"{engine.total_cc / 1000:.1f} {TRIMS[trim]} {transmission.gearbox_type}",
+            year=date(int(rng.triangular(FIRST_YEAR, LAST_YEAR, LAST_YEAR)), 1, 1),
+            manufacturer=Manufacturer(name=manufacturer),
+            engine=engine,
+            transmission=transmission,
+            equipments=self._car_equipments(rng, trim),
+            car_specs=[
+                CarSpecs(
+                    gas=engine.engine_specs.gas_type,
+                    config=model["body"],
+                    doors=model["doors"],
+                    spaces=model["spaces"],
+                )
+            ],
+        )
+
+    def _car_equipments(self, rng: random.Random, trim: int) -> List[Equipment]:
+        """
+        Sorteia os equipamentos do carro; a chance de um item ser de série
+        cresce com o acabamento.
+        """
+        count = max(
+            0, min(len(self._equipments), round(rng.gauss(EQUIPMENTS_PER_CAR, 5)))
+        )
+        standard = (trim + 1) / (len(TRIMS) + 1)
+        equipments = []
+        for category, description in rng.sample(self._equipments, count):
+            is_standard = rng.random() < standard
+            equipments.append(
+                Equipment(
+                    category=category,
+                    description=description,
+                    is_standard=is_standard,
+                    is_optional=not is_standard,
+                )
+            )
+        return equipments
+
+
+def _model(rng: random.Random) -> Dict:
+    """
+    Um modelo: nome, carroceria e as combinações de motor e transmissão
+    oferecidas.
+    """
+    name = "".join(rng.choices(_SYLLABLES, k=rng.randint(2, 3))).title()
+    body = rng.choice(list(BODIES))
+    doors, spaces = BODIES[body]
+    return {
+        "name": f"{name} {rng.randint(1, 9)}0" if rng.random() < 0.2 else name,
+        "body": body,
+        "doors": _common(rng, doors),
+        "spaces": _common(rng, spaces),
+        "engines": [_engine(rng) for _ in range(rng.randint(1, 3))],
+        "transmissions": [
+            Transmission(gearbox_type=gearbox, gears_qtde=gears, traction=traction)
+            for gearbox, gears, traction in rng.sample(TRANSMISSIONS, rng.randint(1, 3))
+        ],
+    }
+
+
+def _common(rng: random.Random, options: tuple):
+    """
+    Sorteia uma opção, com 80% de chance para a primeira (a mais comum).
+    """
+    return options[0] if rng.random() < 0.8 else rng.choice(options)
+
+
+def _engine(rng: random.Random) -> Engine:
+    """
+    Um motor. A especificação é derivada da cilindrada, da aspiração e da taxa
+    de compressão, que formam a chave natural do motor, para que carros com o
+    mesmo motor tenham a mesma especificação.
+    """
+    total_cc = rng.choices(list(ENGINE_SIZES), weights=ENGINE_SIZES.values())[0]
+    turbo = rng.random() < (0.6 if total_cc <= 1000 or total_cc >= 2000 else 0.2)
+    compression = rng.choice((9.8, 10.5, 11.0, 12.0, 13.5)) if not turbo else 9.5
+    hp_per_liter = (110 if turbo else 75) + total_cc % 7
+    max_hp = total_cc * hp_per_liter // 1000
+    return Engine(
+        compression_rate=f"{compression}:1",
+        total_cc=total_cc,
+        aspiration="Turbo" if turbo else "Aspirado",
+        engine_specs=EngineSpec(
+            gas_type="gasolina" if total_cc >= 2800 else "gasolina/alcool",
+            max_hp=max_hp,
+            max_hp_rpm=5500 if turbo else 6000,
+            max_torque=max(1, max_hp * (18 if turbo else 13) // 100),
+            max_torque_rpm=2000 if turbo else 4000,
+        ),
+    )
+
+
+async def load(count: int, seed: int = 0, chunk_size: Optional[int] = None) -> Dict:
+    """
+    Gera e importa um catálogo sintético no banco configurado.
+
+    Args:
+        count (int): O número de carros.
+        seed (int): A semente do gerador.
+        chunk_size (Optional[int]): Carros enviados por vez ao staging.
+
+    Returns:
+        Dict: O relatório da importação em massa.
+    """
+    importer = BulkImporter(await ConnectionRepository.session_factory(), chunk_size)
+    return dict(await importer.load(CatalogGenerator(seed).cars(count)))
+
+
+def write_jsonl(path: Path, count: int, seed: int = 0):
+    """
+    Grava um catálogo sintético em JSONL, no formato da importação em massa.
+
+    Args:
+        path (Path): O arquivo de destino.
+        count (int): O número de carros.
+        seed (int): A semente do gerador.
+    """
+    with Path(path).open("w", encoding="utf-8") as file:
+        for car in CatalogGenerator(seed).cars(count):
+            file.write(car.model_dump_json(exclude_none=True) + "\n")
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando do gerador.
+    """
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arguments.add_argument("count", type=int, help="Número de carros.")
+    arguments.add_argument("--seed", type=int, default=0, help="Semente do gerador.")
+    arguments.add_argument(
+        "--output", type=Path, help="Grava em JSONL em vez de importar."
+    )
+    args = arguments.parse_args()
+
+    if args.output:
+        write_jsonl(args.output, args.count, args.seed)
+        logger.info(f"{args.count} carros gravados em {args.output}.")
+    else:
+        report = asyncio.run(load(args.count, args.seed))
+        logger.info(f"Catálogo sintético importado: {report}")
+
+
+if __name__ == "__main__":
+    main()
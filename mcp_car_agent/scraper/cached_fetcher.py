@@ -0,0 +1,84 @@
+"""
+Módulo do cliente do scraper que passa pelo cache de respostas em disco.
+
+No modo normal, as páginas continuam sendo obtidas da rede (com requisições
+condicionais a partir do cache) e toda resposta 200 é gravada. No modo
+somente replay, nenhuma requisição é feita: o catálogo inteiro é servido do
+disco, o que permite reprocessar a interpretação e a normalização sem rede.
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+from mcp_car_agent.core.interfaces.fetcher import FetchResponse, IFetcher
+from mcp_car_agent.scraper.response_cache import ResponseCache
+
+VALIDATORS = {"etag": "If-None-Match", "last-modified": "If-Modified-Since"}
+"""
+Cabeçalhos de resposta guardados no cache e os cabeçalhos condicionais
+correspondentes.
+"""
+
+
+class CacheMissError(LookupError):
+    """
+    A página não está no cache e o scraper está no modo somente replay.
+    """
+
+
+class CachedFetcher(IFetcher):
+    """
+    Implementação de `IFetcher` que grava e reaproveita respostas em disco.
+
+    Args:
+        fetcher (IFetcher): O cliente usado para obter as páginas da rede.
+        cache (ResponseCache): O cache de respostas em disco.
+        offline (bool): Se verdadeiro, responde apenas a partir do cache.
+    """
+
+    def __init__(self, fetcher: IFetcher, cache: ResponseCache, offline: bool = False):
+        self.fetcher = fetcher
+        self.cache = cache
+        self.offline = offline
+
+    async def fetch(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> FetchResponse:
+        """
+        Obtém a página da rede ou, no modo somente replay, do cache.
+
+        Cabeçalhos condicionais do chamador são repassados à origem sem
+        alteração. Sem eles, o cliente usa os validadores da resposta gravada
+        e transforma um `304` da origem na resposta do cache.
+
+        No modo somente replay, os cabeçalhos condicionais são ignorados e a
+        resposta gravada é sempre devolvida, para que todas as páginas sejam
+        reprocessadas.
+
+        Raises:
+            CacheMissError: No modo somente replay, se a página não estiver no cache.
+            ConnectionError: Se a página não puder ser obtida da rede.
+        """
+        cached = await asyncio.to_thread(self.cache.get, url)
+        if self.offline:
+            if cached is None:
+                raise CacheMissError(f"{url} não está no cache (modo somente replay).")
+            return cached
+
+        conditional = headers is None and cached is not None
+        if conditional:
+            headers = {
+                request_header: cached.headers[response_header]
+                for response_header, request_header in VALIDATORS.items()
+                if response_header in cached.headers
+            }
+        response = await self.fetcher.fetch(url, headers)
+        if conditional and response.status == 304:
+            return cached
+        if response.status == 200:
+            await asyncio.to_thread(self.cache.put, response)
+        return response
+
+    async def close(self):
+        await self.fetcher.close()
+        self.cache.close()
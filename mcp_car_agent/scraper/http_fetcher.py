@@ -0,0 +1,47 @@
+"""
+Módulo do cliente HTTP do scraper.
+
+Um único `httpx.AsyncClient` é compartilhado por todas as requisições, de
+modo que as conexões TCP/TLS com cada host são reaproveitadas (keep-alive).
+"""
+
+from typing import Dict, Optional
+
+import httpx
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.interfaces.fetcher import FetchResponse, IFetcher
+
+
+class HttpFetcher(IFetcher):
+    """
+    Implementação de `IFetcher` sobre um pool de conexões HTTP persistentes.
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.SCRAPER_MAX_CONNECTIONS,
+                max_keepalive_connections=config.SCRAPER_MAX_CONNECTIONS,
+            ),
+            timeout=config.SCRAPER_TIMEOUT,
+            headers={"User-Agent": config.SCRAPER_USER_AGENT},
+            follow_redirects=True,
+        )
+
+    async def fetch(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> FetchResponse:
+        try:
+            response = await self.client.get(url, headers=headers)
+        except httpx.TransportError as exc:
+            raise ConnectionError(f"Falha ao obter {url}: {exc!r}") from exc
+        return FetchResponse(
+            url=url,
+            status=response.status_code,
+            body=response.content,
+            headers=dict(response.headers),
+        )
+
+    async def close(self):
+        await self.client.aclose()
@@ -0,0 +1,223 @@
+"""
+Módulo de interpretação das páginas de ficha técnica obtidas pelo scraper.
+
+Interpretar HTML com o BeautifulSoup é trabalho de CPU e bloquearia o event
+loop se feito junto com as requisições. Por isso as páginas são enviadas a
+um pool de processos, que devolve apenas o registro já convertido para os
+schemas da aplicação (o HTML bruto não volta ao processo principal).
+"""
+
+import asyncio
+import importlib.util
+import multiprocessing
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.interfaces.fetcher import FetchResponse
+from mcp_car_agent.core.schemas.car_schema import Car, CarSpecs
+from mcp_car_agent.core.schemas.engine_schema import Engine, EngineSpec
+from mcp_car_agent.core.schemas.equipment_schema import Equipment
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+
+PARSER_BACKEND = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+"""
+Backend do BeautifulSoup: `lxml` (muito mais rápido) quando instalado,
+senão o parser da biblioteca padrão.
+"""
+
+GAS_TYPES = {"gasolina", "alcool", "gasolina/alcool"}
+
+_NUMBER = re.compile(r"\d+(?:,\d+)?")
+
+
+def _numbers(text: Optional[str]) -> List[float]:
+    """
+    Extrai os números de um texto, aceitando vírgula decimal (ex: "21,4 kgfm a 4400 rpm").
+    """
+    return [float(n.replace(",", ".")) for n in _NUMBER.findall(text or "")]
+
+
+def _integer(text: Optional[str], position: int = 0) -> Optional[int]:
+    """
+    Retorna o n-ésimo número do texto arredondado para inteiro, se existir.
+    """
+    numbers = _numbers(text)
+    return round(numbers[position]) if len(numbers) > position else None
+
+
+def _normalize(text: str) -> str:
+    """
+    Remove acentos e converte para minúsculas (ex: "Gasolina/Álcool" -> "gasolina/alcool").
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _specs_table(article: Tag) -> Dict[str, str]:
+    """
+    Converte a tabela de ficha técnica em um dicionário rótulo -> valor.
+    """
+    return {
+        row.th.get_text(strip=True): row.td.get_text(strip=True)
+        for row in article.select("table.specs tr")
+        if row.th and row.td
+    }
+
+
+def _engine(specs: Dict[str, str]) -> Engine:
+    """
+    Monta o motor e sua especificação a partir da ficha técnica.
+    """
+    gas_type = _normalize(specs.get("Combustível", ""))
+    torque = specs.get("Torque máximo")
+    return Engine(
+        compression_rate=specs.get("Taxa de compressão"),
+        total_cc=_integer(specs.get("Cilindrada")),
+        aspiration=specs.get("Aspiração"),
+        engine_specs=EngineSpec(
+            gas_type=gas_type if gas_type in GAS_TYPES else None,
+            max_hp=_integer(specs.get("Potência máxima")),
+            max_hp_rpm=_integer(specs.get("Potência máxima"), 1),
+            max_torque=_integer(torque),
+            max_torque_rpm=_integer(torque, 1),
+        ),
+    )
+
+
+def _equipments(article: Tag) -> List[Equipment]:
+    """
+    Monta a lista de equipamentos de série e opcionais da página.
+    """
+    return [
+        Equipment(
+            category=item.get("data-category", "Outros"),
+            description=item.get_text(strip=True),
+            is_standard=item.get("data-type") == "serie",
+            is_optional=item.get("data-type") == "opcional",
+        )
+        for item in article.select("ul.equipments li")
+    ]
+
+
+def _text(article: Tag, selector: str) -> Optional[str]:
+    """
+    O texto do primeiro elemento do seletor, ou `None` se não houver.
+    """
+    element = article.select_one(selector)
+    return element.get_text(strip=True) if element is not None else None
+
+
+def _car(article: Tag) -> Optional[Car]:
+    """
+    Monta o carro a partir do `article.car`, ou `None` se faltar o nome ou o
+    fabricante.
+    """
+    name, manufacturer = _text(article, ".name"), _text(article, ".manufacturer")
+    if not name or not manufacturer:
+        return None
+    specs = _specs_table(article)
+    year = _integer(specs.get("Ano"))
+    return Car(
+        name=name,
+        version=_text(article, ".version"),
+        year=date(year, 1, 1) if year else None,
+        engine=_engine(specs),
+        transmission=Transmission(
+            gearbox_type=specs.get("Câmbio", "Desconhecido"),
+            gears_qtde=_integer(specs.get("Marchas")),
+            traction=specs.get("Tração"),
+        ),
+        manufacturer=Manufacturer(name=manufacturer),
+        equipments=_equipments(article),
+        car_specs=[
+            CarSpecs(
+                gas=specs.get("Combustível"),
+                config=specs.get("Carroceria"),
+                doors=_integer(specs.get("Portas")),
+                spaces=_integer(specs.get("Lugares")),
+            )
+        ],
+    )
+
+
+def parse_car_page(html: bytes) -> Optional[Car]:
+    """
+    Interpreta uma página de ficha técnica e a converte no schema `Car` completo.
+
+    Executada nos processos do pool; apenas o trecho `article.car` da página é
+    construído pelo parser, o que reduz o trabalho por página.
+
+    Args:
+        html (bytes): O conteúdo da página.
+
+    Returns:
+        Optional[Car]: O carro com motor, transmissão, fabricante, equipamentos
+        e especificações, ou `None` se a página não for uma ficha técnica
+        válida (sem nome ou fabricante, ou com valores fora dos limites dos
+        schemas, como um nome com mais de 80 caracteres ou um ano inválido).
+    """
+    soup = BeautifulSoup(html, PARSER_BACKEND, parse_only=SoupStrainer("article"))
+    article = soup.find("article", class_="car")
+    if article is None:
+        return None
+    try:
+        return _car(article)
+    except ValueError:  # inclui a `ValidationError` do pydantic
+        return None
+
+
+def parse_car_links(html: bytes, base_url: str) -> List[str]:
+    """
+    Extrai as URLs das fichas técnicas de uma página de listagem do catálogo.
+
+    Args:
+        html (bytes): O conteúdo da página de listagem.
+        base_url (str): A URL da página, usada para resolver links relativos.
+
+    Returns:
+        List[str]: As URLs absolutas das fichas técnicas.
+    """
+    soup = BeautifulSoup(html, PARSER_BACKEND, parse_only=SoupStrainer("a"))
+    return [urljoin(base_url, a["href"]) for a in soup.select("a.car-link[href]")]
+
+
+class ParseStage:
+    """
+    Etapa de interpretação de páginas executada em um pool de processos.
+
+    Args:
+        workers (Optional[int]): Número de processos; por padrão, `PARSER_WORKERS`.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers or config.PARSER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    async def parse(self, response: FetchResponse) -> Optional[Car]:
+        """
+        Interpreta a página em um processo do pool, sem bloquear o event loop.
+
+        Args:
+            response (FetchResponse): A página obtida pelo scraper.
+
+        Returns:
+            Optional[Car]: O carro interpretado ou `None` se não for uma ficha técnica.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse_car_page, response.body)
+
+    def close(self):
+        """
+        Encerra os processos do pool.
+        """
+        self.executor.shutdown()
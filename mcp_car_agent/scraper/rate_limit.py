@@ -0,0 +1,78 @@
+"""
+Módulo de limites por host do scraper.
+
+Cada host tem um limite de requisições simultâneas e uma taxa máxima de
+requisições por segundo (token bucket), para que o scraper seja rápido no
+agregado sem sobrecarregar nenhum site de origem.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from urllib.parse import urlsplit
+
+
+class RateLimiter:
+    """
+    Limitador de taxa no formato token bucket.
+
+    Args:
+        rate (float): Requisições por segundo permitidas.
+        burst (int): Requisições que podem ser feitas de uma vez após um período ocioso.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """
+        Aguarda até que uma requisição possa ser feita dentro da taxa.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostLimiter:
+    """
+    Aplica os limites de concorrência e de taxa separadamente para cada host.
+
+    Args:
+        concurrency (int): Requisições simultâneas permitidas por host.
+        rate (float): Requisições por segundo permitidas por host.
+    """
+
+    def __init__(self, concurrency: int, rate: float):
+        self.concurrency = concurrency
+        self.rate = rate
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._rates: Dict[str, RateLimiter] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Reserva uma vaga para uma requisição ao host da URL.
+
+        Args:
+            url (str): A URL a ser requisitada.
+        """
+        host = urlsplit(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.concurrency)
+            self._rates[host] = RateLimiter(self.rate, burst=self.concurrency)
+        async with self._semaphores[host]:
+            await self._rates[host].acquire()
+            yield
@@ -0,0 +1,213 @@
+"""
+Módulo do cache em disco das respostas obtidas pelo scraper.
+
+Os corpos das respostas são gravados comprimidos e endereçados pelo seu hash
+SHA-256, de modo que páginas idênticas (ex: a mesma ficha em duas URLs)
+ocupam espaço uma única vez. Um índice SQLite associa cada URL ao seu corpo,
+ao status e aos cabeçalhos, e registra o último acesso para o descarte LRU
+quando o cache passa do tamanho máximo. O tamanho total é mantido em memória,
+de modo que gravar e descartar não exigem varrer o índice.
+
+    <diretório>/index.sqlite
+    <diretório>/objects/ab/abcdef...  (corpo comprimido com zlib)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from mcp_car_agent.core.interfaces.fetcher import FetchResponse
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL REFERENCES objects (digest),
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    accessed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+"""
+
+COMPRESSION_LEVEL = 6
+"""
+Nível de compressão do zlib: bom equilíbrio entre tamanho e velocidade para HTML.
+"""
+
+
+class ResponseCache:
+    """
+    Cache de respostas em disco, endereçado por conteúdo e com descarte LRU.
+
+    As operações são síncronas (disco local) e protegidas por um lock, de
+    modo que podem ser chamadas de várias threads (ex: `asyncio.to_thread`).
+
+    Args:
+        directory (Path): O diretório do cache (criado se não existir).
+        max_bytes (int): O tamanho máximo dos corpos comprimidos, em bytes.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.objects = self.directory / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.directory / "index.sqlite", check_same_thread=False
+        )
+        self._db.executescript(SCHEMA)
+        (self._size,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM objects"
+        ).fetchone()
+
+    @property
+    def size(self) -> int:
+        """
+        O espaço ocupado pelos corpos comprimidos, em bytes.
+        """
+        with self._lock:
+            return self._size
+
+    def get(self, url: str) -> Optional[FetchResponse]:
+        """
+        Busca a resposta gravada para a URL, marcando-a como usada agora.
+
+        Args:
+            url (str): A URL da página.
+
+        Returns:
+            Optional[FetchResponse]: A resposta gravada ou `None` se não houver.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest, status, headers FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            digest, status, headers = row
+            try:
+                body = zlib.decompress(self._path(digest).read_bytes())
+            except (OSError, zlib.error):
+                self._remove(url)
+                return None
+            with self._db:
+                self._db.execute(
+                    "UPDATE entries SET accessed = ? WHERE url = ?",
+                    (time.time_ns(), url),
+                )
+        return FetchResponse(
+            url=url, status=status, body=body, headers=json.loads(headers)
+        )
+
+    def put(self, response: FetchResponse):
+        """
+        Grava uma resposta, substituindo a anterior da mesma URL, e descarta
+        as menos usadas se o cache passar do tamanho máximo.
+
+        Args:
+            response (FetchResponse): A resposta a ser gravada.
+        """
+        digest = hashlib.sha256(response.body).hexdigest()
+        with self._lock:
+            replaced = self._digest(response.url)
+            self._store(digest, response.body)
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (
+                        response.url,
+                        digest,
+                        response.status,
+                        json.dumps(response.headers),
+                        time.time_ns(),
+                    ),
+                )
+            if replaced not in (None, digest):
+                self._release(replaced)
+            self._evict()
+
+    def close(self):
+        """
+        Fecha o índice do cache.
+        """
+        with self._lock:
+            self._db.close()
+
+    def _path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest
+
+    def _digest(self, url: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT digest FROM entries WHERE url = ?", (url,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _store(self, digest: str, body: bytes):
+        """
+        Grava o corpo comprimido, se ainda não existir um igual.
+        """
+        if self._db.execute(
+            "SELECT 1 FROM objects WHERE digest = ?", (digest,)
+        ).fetchone():
+            return
+        path = self._path(digest)
+        path.parent.mkdir(exist_ok=True)
+        compressed = zlib.compress(body, COMPRESSION_LEVEL)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(compressed)
+        os.replace(temporary, path)
+        with self._db:
+            self._db.execute(
+                "INSERT INTO objects VALUES (?, ?)", (digest, len(compressed))
+            )
+        self._size += len(compressed)
+
+    def _remove(self, url: str):
+        digest = self._digest(url)
+        with self._db:
+            self._db.execute("DELETE FROM entries WHERE url = ?", (url,))
+        if digest is not None:
+            self._release(digest)
+
+    def _release(self, digest: str):
+        """
+        Apaga o corpo se nenhuma URL o referencia mais.
+        """
+        if self._db.execute(
+            "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone():
+            return
+        row = self._db.execute(
+            "SELECT size FROM objects WHERE digest = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            return
+        self._path(digest).unlink(missing_ok=True)
+        with self._db:
+            self._db.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+        self._size -= row[0]
+
+    def _evict(self):
+        """
+        Descarta as URLs usadas há mais tempo até o cache caber no tamanho máximo,
+        percorrendo as entradas uma única vez em ordem de último acesso.
+        """
+        if self._size <= self.max_bytes:
+            return
+        oldest = self._db.execute("SELECT url FROM entries ORDER BY accessed")
+        for (url,) in oldest:
+            self._remove(url)
+            if self._size <= self.max_bytes:
+                break
@@ -0,0 +1,139 @@
+"""
+Módulo do scraper assíncrono do catálogo de carros.
+
+Busca páginas em paralelo respeitando os limites de cada host, com novas
+tentativas e backoff exponencial para falhas transitórias. O cliente que
+efetivamente obtém as páginas é plugável (`IFetcher`).
+"""
+
+import asyncio
+import itertools
+import random
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, Set
+
+from loguru import logger
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.interfaces.fetcher import FetchResponse, IFetcher
+from mcp_car_agent.scraper.rate_limit import HostLimiter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+"""
+Status HTTP considerados transitórios, que justificam uma nova tentativa.
+"""
+
+HeadersFor = Callable[[str], Optional[Dict[str, str]]]
+"""
+Função que informa os cabeçalhos extras da requisição de cada URL.
+"""
+
+
+class Scraper:
+    """
+    Scraper assíncrono com limites por host e novas tentativas.
+
+    Args:
+        fetcher (IFetcher): O cliente que obtém as páginas.
+        limiter (Optional[HostLimiter]): Limites por host; por padrão, os da configuração.
+    """
+
+    def __init__(self, fetcher: IFetcher, limiter: Optional[HostLimiter] = None):
+        self.fetcher = fetcher
+        self.limiter = limiter or HostLimiter(
+            config.SCRAPER_HOST_CONCURRENCY, config.SCRAPER_HOST_RATE
+        )
+        self.retries = config.SCRAPER_RETRIES
+        self.backoff = config.SCRAPER_BACKOFF
+
+    async def fetch(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> FetchResponse:
+        """
+        Obtém uma página, tentando novamente em caso de falha transitória.
+
+        Args:
+            url (str): A URL da página.
+            headers (Optional[Dict[str, str]]): Cabeçalhos extras da requisição.
+
+        Returns:
+            FetchResponse: A resposta obtida. Se todas as tentativas
+            resultarem em status transitório, a última resposta é retornada.
+
+        Raises:
+            ConnectionError: Se a última tentativa falhar por erro de rede.
+        """
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                async with self.limiter.slot(url):
+                    response = await self.fetcher.fetch(url, headers)
+            except ConnectionError:
+                if last_attempt:
+                    raise
+                await asyncio.sleep(self._delay(attempt))
+                continue
+            if response.status not in RETRY_STATUSES or last_attempt:
+                return response
+            await asyncio.sleep(self._delay(attempt, response))
+        raise AssertionError("inalcançável")
+
+    async def crawl(
+        self,
+        urls: Iterable[str],
+        max_in_flight: Optional[int] = None,
+        headers: Optional[HeadersFor] = None,
+    ) -> AsyncIterator[FetchResponse]:
+        """
+        Obtém várias páginas em paralelo, entregando-as à medida que chegam.
+
+        Apenas `max_in_flight` requisições ficam pendentes ao mesmo tempo, de
+        modo que listas muito grandes de URLs são percorridas em memória
+        constante. Páginas que falham após todas as tentativas são
+        registradas no log e ignoradas.
+
+        Args:
+            urls (Iterable[str]): As URLs a serem obtidas (pode ser um gerador).
+            max_in_flight (Optional[int]): Máximo de requisições pendentes.
+            headers (Optional[HeadersFor]): Cabeçalhos extras de cada URL (ex:
+                cabeçalhos de requisição condicional).
+
+        Yields:
+            FetchResponse: As respostas, na ordem em que foram concluídas.
+        """
+        limit = max_in_flight or config.SCRAPER_MAX_CONNECTIONS
+        remaining_urls = iter(urls)
+        headers = headers or (lambda _: None)
+        pending = self._schedule(remaining_urls, set(), limit, headers)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            pending = self._schedule(remaining_urls, pending, limit, headers)
+            for task in done:
+                if task.exception() is not None:
+                    logger.warning(f"Página ignorada: {task.exception()}")
+                    continue
+                yield task.result()
+
+    def _schedule(
+        self,
+        urls: Iterator[str],
+        pending: Set[asyncio.Task],
+        limit: int,
+        headers: HeadersFor,
+    ) -> Set[asyncio.Task]:
+        """
+        Inicia requisições para as próximas URLs até completar `limit` pendentes.
+        """
+        for url in itertools.islice(urls, limit - len(pending)):
+            pending.add(asyncio.create_task(self.fetch(url, headers(url))))
+        return pending
+
+    def _delay(self, attempt: int, response: Optional[FetchResponse] = None) -> float:
+        """
+        Calcula a espera antes da próxima tentativa, respeitando `Retry-After`.
+        """
+        retry_after = (response.headers if response else {}).get("retry-after", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff * 2**attempt + random.uniform(0, self.backoff)
@@ -0,0 +1,399 @@
+"""
+Módulo do servidor MCP do agente de carros.
+
+Expõe as consultas ao catálogo como ferramentas MCP. Cada chamada de
+ferramenta define um prazo para as consultas ao banco de dados, de modo que
+requisições abandonadas pelo cliente não continuem consumindo o banco, é
+uma requisição lógica para o detector de consultas N+1, é medida nas
+métricas do servidor (`/metrics`, no formato do Prometheus) e, se amostrada,
+é a raiz de um trace (ver `mcp_car_agent.core.services.tracing`).
+
+Na inicialização, o servidor executa um warm-up (pool, statements e
+dimensões) e só se declara pronto em `/ready` quando ele termina. Com um
+snapshot do catálogo, as buscas são atendidas pelo índice em memória.
+Os sinais `SIGUSR1` e `SIGUSR2` ligam o profiling sob demanda (ver
+`mcp_car_agent.server.profiling`).
+"""
+
+import asyncio
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from multiprocessing.synchronize import Event
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+import uvicorn
+from fastmcp import FastMCP
+from loguru import logger
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.deadline import deadline
+from mcp_car_agent.core.database.invalidation import PostgresInvalidationBus
+from mcp_car_agent.core.database.n_plus_one import watch
+from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.export_schema import ExportFormat, ExportResult
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+from mcp_car_agent.core.services.car_index import CarIndex
+from mcp_car_agent.core.services.catalog_service import CatalogService
+from mcp_car_agent.core.services.dimension_cache import DimensionCache
+from mcp_car_agent.core.services.export_service import (
+    ExportService,
+    file_name,
+    validate,
+)
+from mcp_car_agent.core.services.tracing import SERVER, tracer
+from mcp_car_agent.core.services.warmup import WarmUp
+from mcp_car_agent.server.metrics import CONTENT_TYPE, metrics
+from mcp_car_agent.server.metrics import serve as serve_metrics
+from mcp_car_agent.server.profiling import install_signals, profiler
+from mcp_car_agent.server.supervisor import Supervisor, bind_socket
+
+mcp = FastMCP("mcp-car-agent")
+dimensions = DimensionCache()
+car_index = CarIndex()
+warm_up = WarmUp(dimensions, car_index)
+
+
+catalog = CatalogService(None, index=car_index)
+"""
+Serviço de catálogo do processo. É único para que o seu semáforo limite as
+consultas simultâneas de todas as chamadas do worker
+(`MCP_BATCH_CONCURRENCY`), e não só as de um mesmo lote.
+"""
+
+
+async def catalog_service() -> CatalogService:
+    """
+    Retorna o serviço de catálogo do processo, sobre o pool de conexões
+    compartilhado.
+
+    Returns:
+        CatalogService: O serviço de catálogo.
+    """
+    catalog.session_factory = await ConnectionRepository.session_factory()
+    return catalog
+
+
+@contextmanager
+def tool_call(
+    name: str,
+    n_plus_one_threshold: int = config.DB_N_PLUS_ONE_THRESHOLD,
+    timeout: Optional[float] = None,
+) -> Iterator[None]:
+    """
+    Contexto de uma chamada de ferramenta que consulta o banco: métricas,
+    span raiz do trace, prazo das consultas (padrão: `DB_STATEMENT_TIMEOUT`),
+    detecção de N+1 e contagem das chamadas dos perfis de CPU.
+    """
+    seconds = timeout or config.DB_STATEMENT_TIMEOUT
+    with metrics.track(name), tool_span(name), deadline(seconds), watch(
+        name, n_plus_one_threshold
+    ):
+        try:
+            yield
+        finally:
+            profiler.request()
+
+
+def tool_span(name: str):
+    """
+    O span raiz de uma chamada de ferramenta.
+    """
+    return tracer.span(f"mcp.tool {name}", SERVER, **{"mcp.tool": name})
+
+
+@mcp.tool
+async def search_cars(query: CarQuery) -> List[Car]:
+    """
+    Busca carros no catálogo por filtros (ex: {"name": "Civic"}), com ordenação e paginação.
+    """
+    with tool_call("search_cars"):
+        return await (await catalog_service()).search(query)
+
+
+@mcp.tool
+async def batch_search(queries: List[CarQuery]) -> List[List[Car]]:
+    """
+    Executa várias buscas de carros em paralelo e retorna todos os resultados
+    em uma única resposta, na ordem das consultas. Use para comparações.
+    """
+    # Cada consulta do lote executa a sua busca: só repetições além delas são N+1.
+    threshold = config.DB_N_PLUS_ONE_THRESHOLD + len(queries)
+    with tool_call("batch_search", threshold):
+        return await (await catalog_service()).batch_search(queries)
+
+
+@mcp.tool
+async def get_cars(ids: List[int]) -> List[Car]:
+    """
+    Retorna os detalhes completos (motor, transmissão, fabricante, equipamentos
+    e especificações) dos carros informados.
+    """
+    with tool_call("get_cars"):
+        return await (await catalog_service()).get_cars(ids)
+
+
+@mcp.tool
+async def list_manufacturers() -> List[Manufacturer]:
+    """
+    Lista os fabricantes do catálogo, com os IDs usados no filtro `manufacturer_id`.
+    """
+    with tool_call("list_manufacturers"):
+        return await dimensions.list_manufacturers(
+            await ConnectionRepository.session_factory()
+        )
+
+
+@mcp.tool
+async def list_transmissions() -> List[Transmission]:
+    """
+    Lista as transmissões do catálogo, com os IDs usados no filtro `transmission_id`.
+    """
+    with tool_call("list_transmissions"):
+        return await dimensions.list_transmissions(
+            await ConnectionRepository.session_factory()
+        )
+
+
+@mcp.tool
+async def export_cars(
+    query: CarQuery,
+    file_format: ExportFormat = "csv",
+    compression: Optional[str] = None,
+) -> ExportResult:
+    """
+    Exporta os carros de uma busca (mesmos filtros de `search_cars`, sem
+    limite de tamanho) para um arquivo CSV, JSONL ou Parquet no servidor,
+    opcionalmente comprimido, e retorna o caminho e o número de linhas.
+    """
+    validate(file_format, compression)
+    directory = Path(config.EXPORT_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = f"cars-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    with tool_call("export_cars", timeout=config.EXPORT_TIMEOUT):
+        return await ExportService(await ConnectionRepository.session_factory()).export(
+            query,
+            directory / file_name(stem, file_format, compression),
+            file_format,
+            compression,
+        )
+
+
+@mcp.custom_route("/ready", methods=["GET"])
+async def ready(_: Request) -> JSONResponse:
+    """
+    Informa se o warm-up terminou e o servidor está pronto para receber tráfego.
+    """
+    return JSONResponse(
+        {"ready": warm_up.ready, "warm_up_seconds": warm_up.duration},
+        status_code=200 if warm_up.ready else 503,
+    )
+
+
+async def render_metrics() -> str:
+    """
+    Monta a coleta das métricas do servidor, com o pool do motor compartilhado.
+    """
+    session_factory = await ConnectionRepository.session_factory()
+    return metrics.render(
+        session_factory.kw["bind"].sync_engine.pool,
+        {"dimensions": dimensions.stats, "car_index": car_index.stats},
+    )
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(_: Request) -> PlainTextResponse:
+    """
+    Expõe as métricas do worker no formato texto do Prometheus.
+
+    Com vários workers, responde o worker que aceitou a conexão; para coletar
+    todos, use a porta de métricas de cada posto (ver `with_metrics`).
+    """
+    return PlainTextResponse(await render_metrics(), media_type=CONTENT_TYPE)
+
+
+async def startup(on_ready: Callable[[], None] = lambda: None):
+    """
+    Configura o barramento de invalidação de cache e executa o warm-up. Pode
+    ser repetida após uma falha.
+
+    Args:
+        on_ready (Callable[[], None]): Chamada quando o warm-up marca o
+            servidor como pronto (ver `WarmUp.run`).
+    """
+    session_factory = await ConnectionRepository.session_factory()
+    if config.CACHE_INVALIDATION_BUS == "postgresql" and not isinstance(
+        BaseRepository.bus, PostgresInvalidationBus
+    ):
+        # O LISTEN fica aberto enquanto o worker viver: fora do pool das requisições.
+        listen = ConnectionRepository.dedicated_engine(session_factory.kw["bind"])
+        bus = PostgresInvalidationBus(listen.raw_connection)
+        await bus.start()
+        BaseRepository.bus = bus
+    BaseRepository.bus.subscribe(dimensions.invalidate)
+    BaseRepository.bus.subscribe(car_index.invalidate)
+    await warm_up.run(session_factory, on_ready)
+
+
+async def shutdown():
+    """
+    Para o LISTEN do barramento de invalidação, se houver, e fecha os pools.
+    """
+    if isinstance(BaseRepository.bus, PostgresInvalidationBus):
+        await BaseRepository.bus.stop()
+    await ConnectionRepository.close()
+
+
+async def startup_with_retry(on_ready: Callable[[], None]):
+    """
+    Executa `startup` até ela concluir, com backoff exponencial entre as
+    tentativas. `on_ready` é chamada quando `/ready` passa a responder 200.
+    """
+    delay = config.WARM_UP_RETRY_BACKOFF
+    while True:
+        try:
+            await startup(on_ready)
+            break
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.opt(exception=exc).error(
+                f"Falha na inicialização; nova tentativa em {delay:g} s."
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, config.WARM_UP_RETRY_BACKOFF_MAX)
+
+
+def _report_startup(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.opt(exception=task.exception()).error("Inicialização interrompida.")
+
+
+def with_warm_up(app: Starlette, on_ready: Callable[[], None] = lambda: None):
+    """
+    Inicia o warm-up em segundo plano junto com o ciclo de vida da aplicação HTTP.
+
+    O warm-up precisa rodar no mesmo event loop que atenderá as requisições,
+    pois as conexões do pool pertencem ao loop em que foram abertas. Os sinais
+    de profiling também são registrados nesse loop, e ao fim do ciclo de vida
+    os pools e o monitoramento das réplicas são encerrados.
+
+    Args:
+        app (Starlette): A aplicação HTTP do servidor MCP.
+        on_ready (Callable[[], None]): Chamada quando o warm-up termina (ex:
+            para avisar o supervisor de que o worker está pronto).
+
+    Returns:
+        Starlette: A mesma aplicação, com o ciclo de vida estendido.
+    """
+    lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan_with_warm_up(application: Starlette):
+        async with lifespan(application):
+            install_signals()
+            task = asyncio.create_task(startup_with_retry(on_ready))
+            task.add_done_callback(_report_startup)
+            try:
+                yield
+            finally:
+                task.cancel()
+                await shutdown()
+
+    app.router.lifespan_context = lifespan_with_warm_up
+    return app
+
+
+def with_metrics(app: Starlette, port: int):
+    """
+    Expõe as métricas do worker em `METRICS_HOST:port` junto com o ciclo de
+    vida da aplicação HTTP.
+
+    Args:
+        app (Starlette): A aplicação HTTP do servidor MCP.
+        port (int): A porta de métricas do posto do worker.
+
+    Returns:
+        Starlette: A mesma aplicação, com o ciclo de vida estendido.
+    """
+    lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan_with_metrics(application: Starlette):
+        server = await serve_metrics(
+            render_metrics, config.METRICS_HOST, port, reuse_port=True
+        )
+        try:
+            async with lifespan(application):
+                yield
+        finally:
+            server.close()
+
+    app.router.lifespan_context = lifespan_with_metrics
+    return app
+
+
+async def serve_stdio():
+    """
+    Executa a inicialização e, em seguida, atende pelo transporte stdio, com
+    as métricas em `METRICS_PORT` e os sinais de profiling.
+    """
+    install_signals()
+    if config.METRICS_PORT:
+        await serve_metrics(render_metrics, config.METRICS_HOST, config.METRICS_PORT)
+    try:
+        await startup()
+        await mcp.run_async()
+    finally:
+        await shutdown()
+
+
+def serve_http(sock: socket.socket, pool_size: int, warmed_up: Event, slot: int):
+    """
+    Executa um worker HTTP sobre o socket compartilhado pelo supervisor.
+
+    O transporte é stateless, pois requisições de um mesmo cliente podem ser
+    atendidas por workers diferentes. As métricas do worker ficam em
+    `METRICS_PORT + slot`.
+
+    Args:
+        sock (socket.socket): O socket de escuta compartilhado.
+        pool_size (int): O tamanho do pool de conexões deste worker.
+        warmed_up (Event): Sinalizado ao supervisor quando o warm-up termina.
+        slot (int): O índice do posto do worker.
+    """
+    config.DB_POOL_SIZE = pool_size
+    config.DB_MAX_OVERFLOW = 0
+    app = with_warm_up(mcp.http_app(stateless_http=True), warmed_up.set)
+    if config.METRICS_PORT:
+        app = with_metrics(app, config.METRICS_PORT + slot)
+    uvicorn.Server(uvicorn.Config(app, log_level="info")).run(sockets=[sock])
+
+
+def main():
+    """
+    Inicia o servidor MCP.
+
+    Com `MCP_WORKERS` maior que 1, o servidor roda em modo HTTP com vários
+    processos supervisionados; caso contrário, usa o transporte padrão.
+    """
+    if config.MCP_WORKERS > 1:
+        sock = bind_socket(config.MCP_HOST, config.MCP_PORT)
+        Supervisor(
+            serve_http, sock, config.MCP_WORKERS, config.DB_CONNECTION_BUDGET
+        ).run()
+        return
+    asyncio.run(serve_stdio())
+
+
+if __name__ == "__main__":
+    main()
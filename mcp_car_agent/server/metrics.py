@@ -0,0 +1,277 @@
+"""
+Módulo de métricas do servidor MCP, no formato texto do Prometheus.
+
+Expõe, a cada coleta:
+
+- por ferramenta: requisições (por resultado), histograma de latência e
+  requisições em andamento (`track`);
+- por método de repositório: histograma de latência, e por método e tipo de
+  statement: latência e consultas lentas (ver
+  `mcp_car_agent.core.database.instrumentation`);
+- do pool de conexões: tamanho, conexões em uso, overflow e histograma da
+  espera por uma conexão;
+- dos caches em memória: acertos, faltas e a taxa de acerto.
+
+As métricas são do processo: com vários workers, cada um expõe as suas em
+uma porta própria (`METRICS_PORT` mais o índice do posto, ver
+`mcp_car_agent.server.supervisor`), que o Prometheus coleta como alvos
+distintos. O endpoint escuta apenas localmente por padrão (`METRICS_HOST`).
+"""
+
+import asyncio
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
+from loguru import logger
+from sqlalchemy.pool import Pool, QueuePool
+
+from mcp_car_agent.core.database.instrumentation import (
+    LATENCY_BUCKETS,
+    Histogram,
+    SqlInstrumentation,
+    instrumentation,
+)
+from mcp_car_agent.core.services.cache_stats import CacheStats
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""
+Tipo de conteúdo do formato texto do Prometheus.
+"""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class Exposition:
+    """
+    Monta o texto de uma coleta, uma família de métricas por vez.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def family(self, name: str, kind: str, description: str):
+        """
+        Inicia uma família: as amostras seguintes devem ser dela.
+        """
+        self.lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+
+    def sample(self, name: str, labels: Dict[str, str], value: float):
+        """
+        Adiciona uma amostra.
+        """
+        self.lines.append(f"{name}{_labels(labels)} {value!r}")
+
+    def histogram(self, name: str, labels: Dict[str, str], histogram: Histogram):
+        """
+        Adiciona as faixas (acumuladas), a soma e a contagem de um histograma.
+        """
+        seen = 0
+        bounds = [f"{bound:g}" for bound in histogram.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, histogram.counts):
+            seen += count
+            self.sample(f"{name}_bucket", {**labels, "le": bound}, seen)
+        self.sample(f"{name}_sum", labels, histogram.sum)
+        self.sample(f"{name}_count", labels, histogram.count)
+
+    def text(self) -> str:
+        """
+        O texto da coleta.
+        """
+        return "\n".join(self.lines) + "\n"
+
+
+class ToolStats:
+    """
+    Estatísticas das chamadas de uma ferramenta MCP.
+    """
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.requests: Counter = Counter()
+        self.in_flight = 0
+
+
+class ServerMetrics:
+    """
+    As métricas do servidor e a sua exposição no formato do Prometheus.
+
+    Args:
+        sql (SqlInstrumentation): A instrumentação dos repositórios e statements.
+    """
+
+    def __init__(self, sql: SqlInstrumentation = instrumentation):
+        self.sql = sql
+        self.tools: Dict[str, ToolStats] = defaultdict(ToolStats)
+
+    @contextmanager
+    def track(self, tool: str) -> Iterator[None]:
+        """
+        Mede uma chamada de ferramenta: latência, resultado (`ok` ou `error`)
+        e chamadas em andamento.
+        """
+        stats = self.tools[tool]
+        stats.in_flight += 1
+        started, status = time.perf_counter(), "error"
+        try:
+            yield
+            status = "ok"
+        finally:
+            stats.in_flight -= 1
+            stats.requests[status] += 1
+            stats.latency.observe(time.perf_counter() - started)
+
+    def render(
+        self,
+        pool: Optional[Pool] = None,
+        caches: Optional[Dict[str, CacheStats]] = None,
+    ) -> str:
+        """
+        Monta a coleta das métricas.
+
+        Args:
+            pool (Optional[Pool]): O pool de conexões do motor compartilhado.
+            caches (Optional[Dict[str, CacheStats]]): Os caches, por nome.
+
+        Returns:
+            str: As métricas no formato texto do Prometheus.
+        """
+        out = Exposition()
+        self._render_tools(out)
+        self._render_repositories(out)
+        if isinstance(pool, QueuePool):
+            _render_pool(out, pool)
+        _render_caches(out, caches or {})
+        return out.text()
+
+    def _render_tools(self, out: Exposition):
+        tools = sorted(self.tools.items())
+        out.family("mcp_tool_requests_total", "counter", "Chamadas de ferramentas.")
+        for tool, stats in tools:
+            for status, count in sorted(stats.requests.items()):
+                out.sample(
+                    "mcp_tool_requests_total", {"tool": tool, "status": status}, count
+                )
+        out.family(
+            "mcp_tool_duration_seconds", "histogram", "Latência das ferramentas."
+        )
+        for tool, stats in tools:
+            out.histogram("mcp_tool_duration_seconds", {"tool": tool}, stats.latency)
+        out.family("mcp_tool_in_flight", "gauge", "Chamadas em andamento.")
+        for tool, stats in tools:
+            out.sample("mcp_tool_in_flight", {"tool": tool}, stats.in_flight)
+
+    def _render_repositories(self, out: Exposition):
+        out.family(
+            "mcp_repository_duration_seconds",
+            "histogram",
+            "Latência dos métodos de repositório.",
+        )
+        for method, histogram in sorted(self.sql.methods.items()):
+            out.histogram(
+                "mcp_repository_duration_seconds", {"method": method}, histogram
+            )
+        statements = sorted(self.sql.stats.items())
+        out.family(
+            "mcp_db_statement_duration_seconds",
+            "histogram",
+            "Latência dos statements SQL, por método e tipo de statement.",
+        )
+        for (operation, kind), stats in statements:
+            labels = {"operation": operation, "statement": kind}
+            out.histogram("mcp_db_statement_duration_seconds", labels, stats.latency)
+        out.family("mcp_db_slow_statements_total", "counter", "Statements SQL lentos.")
+        for (operation, kind), stats in statements:
+            labels = {"operation": operation, "statement": kind}
+            out.sample("mcp_db_slow_statements_total", labels, stats.slow)
+
+
+def _render_pool(out: Exposition, pool: QueuePool):
+    gauges = {
+        "mcp_db_pool_size": ("Conexões permanentes do pool.", pool.size()),
+        "mcp_db_pool_checked_out": ("Conexões em uso.", pool.checkedout()),
+        "mcp_db_pool_overflow": (
+            "Conexões além do tamanho do pool (negativo: ainda não abertas).",
+            pool.overflow(),
+        ),
+    }
+    for name, (description, value) in gauges.items():
+        out.family(name, "gauge", description)
+        out.sample(name, {}, value)
+    wait = getattr(pool, "wait", None)
+    if wait is not None:
+        out.family(
+            "mcp_db_pool_wait_seconds", "histogram", "Espera por uma conexão do pool."
+        )
+        out.histogram("mcp_db_pool_wait_seconds", {}, wait)
+
+
+def _render_caches(out: Exposition, caches: Dict[str, CacheStats]):
+    series = [
+        ("mcp_cache_hits_total", "counter", "Leituras atendidas pelo cache.", "hits"),
+        ("mcp_cache_misses_total", "counter", "Leituras que foram ao banco.", "misses"),
+        ("mcp_cache_hit_ratio", "gauge", "Fração das leituras atendidas.", "ratio"),
+    ]
+    for name, kind, description, attribute in series:
+        out.family(name, kind, description)
+        for cache, stats in sorted(caches.items()):
+            out.sample(name, {"cache": cache}, getattr(stats, attribute))
+
+
+async def serve(
+    render: Callable[[], Awaitable[str]],
+    host: str,
+    port: int,
+    reuse_port: bool = False,
+):
+    """
+    Sobe um servidor HTTP mínimo que responde `GET /metrics` com `render()`.
+
+    Args:
+        render (Callable[[], Awaitable[str]]): Monta a coleta.
+        host (str): O endereço de escuta.
+        port (int): A porta de escuta.
+        reuse_port (bool): Permite que o worker novo de um reload escute na
+            porta enquanto o antigo do mesmo posto ainda não terminou.
+
+    Returns:
+        asyncio.Server: O servidor, já escutando.
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        request = await reader.readline()
+        while (await reader.readline()).strip():
+            pass
+        found = request.split()[:2] == [b"GET", b"/metrics"]
+        body = (await render()).encode() if found else b"nao encontrado\n"
+        writer.write(
+            (
+                f"HTTP/1.1 {'200 OK' if found else '404 Not Found'}\r\n"
+                f"Content-Type: {CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + body
+        )
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, host, port, reuse_port=reuse_port)
+    logger.info(f"Métricas em http://{host}:{port}/metrics.")
+    return server
+
+
+metrics = ServerMetrics()
+"""
+Métricas compartilhadas pelas ferramentas do servidor.
+"""
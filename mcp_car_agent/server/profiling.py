@@ -0,0 +1,288 @@
+"""
+Módulo de profiling sob demanda do servidor MCP.
+
+Permite investigar um processo em produção sem reimplantá-lo. O acesso é por
+sinais do sistema operacional, restritos a quem administra o processo (no
+modo com vários workers, o supervisor repassa os sinais a todos eles):
+
+- `SIGUSR1`: liga um profiler por amostragem por `config.PROFILE_SECONDS`
+  segundos ou, com `config.PROFILE_REQUESTS`, até essa quantidade de chamadas
+  de ferramentas terminar. As pilhas amostradas são gravadas no formato
+  "folded" (uma pilha por linha, com a contagem), lido por `flamegraph.pl`,
+  speedscope e inferno;
+- `SIGUSR2`: grava um snapshot do `tracemalloc` (ligado no primeiro sinal) e
+  registra no log as linhas que mais cresceram desde o snapshot anterior.
+
+Os snapshots podem ser comparados depois, fora do servidor:
+
+    python -m mcp_car_agent.server.profiling antes.tracemalloc depois.tracemalloc
+
+Os arquivos são gravados em `config.PROFILE_DIR`.
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Callable, List, Optional, Set
+
+from loguru import logger
+
+from mcp_car_agent.core import config
+
+PROFILING_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGUSR1", "SIGUSR2") if hasattr(signal, name)
+)
+"""
+Sinais do profiling, quando a plataforma os oferece.
+"""
+
+
+_sequence = itertools.count(1)
+
+
+def _stamp() -> str:
+    return f"{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}-{next(_sequence)}"
+
+
+def folded(frame: Optional[FrameType]) -> str:
+    """
+    Uma pilha no formato "folded": as funções da mais externa para a mais
+    interna, separadas por `;`.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SamplingProfiler:
+    """
+    Profiler por amostragem: uma thread lê, a cada `interval`, a pilha de
+    todas as outras threads do processo. Não instrumenta as chamadas, de modo
+    que o custo não depende da carga.
+
+    Args:
+        directory (Path): Onde gravar os perfis.
+        interval (float): O intervalo, em segundos, entre as amostras.
+    """
+
+    def __init__(
+        self,
+        directory: Path = Path(config.PROFILE_DIR),
+        interval: float = config.PROFILE_INTERVAL,
+    ):
+        self.directory = directory
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.remaining = 0
+        self.done = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """
+        Se há um perfil em andamento.
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, seconds: float, requests: int = 0) -> Optional[Path]:
+        """
+        Inicia um perfil, se nenhum estiver em andamento.
+
+        Args:
+            seconds (float): A duração máxima do perfil.
+            requests (int): Se positivo, o perfil termina antes, quando esse
+                número de chamadas de ferramentas terminar.
+
+        Returns:
+            Optional[Path]: O arquivo que receberá o perfil, ou `None` se já
+                houver um em andamento.
+        """
+        if self.running:
+            logger.warning("Já há um perfil em andamento.")
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        output = self.directory / f"cpu-{_stamp()}.folded"
+        self.stacks.clear()
+        self.remaining = requests
+        self.done.clear()
+        self.thread = threading.Thread(
+            target=self._run, args=(output, seconds), name="profiler", daemon=True
+        )
+        self.thread.start()
+        logger.info(f"Profiler ligado por até {seconds:g} s ({output}).")
+        return output
+
+    def request(self):
+        """
+        Conta o fim de uma chamada de ferramenta, para perfis por número de
+        chamadas.
+        """
+        if self.remaining > 0:
+            self.remaining -= 1
+            if not self.remaining:
+                self.done.set()
+
+    def stop(self):
+        """
+        Termina o perfil em andamento e aguarda a gravação do arquivo.
+        """
+        self.done.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def sample(self):
+        """
+        Registra a pilha atual de cada thread, exceto a do profiler.
+        """
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():  # pylint: disable=W0212
+            if thread_id != own:
+                self.stacks[folded(frame)] += 1
+
+    def _run(self, output: Path, seconds: float):
+        deadline = time.monotonic() + seconds
+        while not self.done.wait(self.interval) and time.monotonic() < deadline:
+            self.sample()
+        output.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self.stacks.items()),
+            encoding="utf-8",
+        )
+        logger.info(
+            f"Perfil gravado em {output} ({sum(self.stacks.values())} amostras)."
+        )
+
+
+class MemorySnapshots:
+    """
+    Snapshots do `tracemalloc`, gravados em arquivo para comparação.
+
+    Args:
+        directory (Path): Onde gravar os snapshots.
+        frames (int): Quantos quadros da pilha guardar por alocação.
+    """
+
+    def __init__(self, directory: Path = Path(config.PROFILE_DIR), frames: int = 10):
+        self.directory = directory
+        self.frames = frames
+        self.previous: Optional[Path] = None
+
+    def take(self) -> Path:
+        """
+        Grava um snapshot, ligando o `tracemalloc` se necessário (apenas as
+        alocações feitas a partir daí são rastreadas), e registra no log a
+        comparação com o snapshot anterior.
+
+        Returns:
+            Path: O arquivo do snapshot.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        output = self.directory / f"memory-{_stamp()}.tracemalloc"
+        tracemalloc.take_snapshot().dump(str(output))
+        logger.info(f"Snapshot de memória gravado em {output}.")
+        if self.previous is not None:
+            growth = "\n".join(diff(self.previous, output, limit=10))
+            logger.info(f"Maiores crescimentos desde {self.previous}:\n{growth}")
+        self.previous = output
+        return output
+
+    def stop(self):
+        """
+        Desliga o `tracemalloc` e descarta a referência ao último snapshot.
+        """
+        tracemalloc.stop()
+        self.previous = None
+
+
+def diff(before: Path, after: Path, limit: int = 20) -> List[str]:
+    """
+    As linhas de código cuja memória alocada mais cresceu entre dois snapshots.
+
+    Args:
+        before (Path): O snapshot inicial.
+        after (Path): O snapshot final.
+        limit (int): Quantas linhas retornar.
+
+    Returns:
+        List[str]: As linhas, com o crescimento em bytes e em alocações.
+    """
+    old = tracemalloc.Snapshot.load(str(before))
+    new = tracemalloc.Snapshot.load(str(after))
+    return [str(stat) for stat in new.compare_to(old, "lineno")[:limit]]
+
+
+profiler = SamplingProfiler()
+"""
+Profiler do processo, ligado por `SIGUSR1`.
+"""
+
+snapshots = MemorySnapshots()
+"""
+Snapshots de memória do processo, gravados a cada `SIGUSR2`.
+"""
+
+
+_pending: Set[asyncio.Future] = set()
+
+
+def _finished(task: asyncio.Future):
+    _pending.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.opt(exception=task.exception()).error("Falha no profiling.")
+
+
+def _in_thread(function: Callable[[], object]):
+    task = asyncio.ensure_future(asyncio.to_thread(function))
+    _pending.add(task)
+    task.add_done_callback(_finished)
+
+
+def _start_profiler():
+    profiler.start(config.PROFILE_SECONDS, config.PROFILE_REQUESTS)
+
+
+def install_signals():
+    """
+    Registra os sinais do profiling no event loop em execução.
+
+    Os sinais são tratados pelo loop, e não por um handler de `signal`, que
+    interromperia a thread principal no meio de uma requisição; o trabalho
+    (gravar um snapshot e compará-lo com o anterior pode levar segundos) roda
+    em uma thread, sem bloquear o loop.
+    """
+    if not PROFILING_SIGNALS:
+        return
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGUSR1, _in_thread, _start_profiler)
+    loop.add_signal_handler(signal.SIGUSR2, _in_thread, snapshots.take)
+
+
+def main():
+    """
+    Ponto de entrada de linha de comando da comparação de snapshots.
+    """
+    arguments = argparse.ArgumentParser(description="Compara snapshots de memória.")
+    arguments.add_argument("before", type=Path)
+    arguments.add_argument("after", type=Path)
+    arguments.add_argument("--limit", type=int, default=20)
+    args = arguments.parse_args()
+    logger.info("\n".join(diff(args.before, args.after, args.limit)))
+
+
+if __name__ == "__main__":
+    main()
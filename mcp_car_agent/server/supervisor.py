@@ -0,0 +1,293 @@
+"""
+Módulo de execução do servidor MCP em múltiplos processos.
+
+Um processo supervisor abre o socket de escuta e inicia N processos worker
+que o compartilham, de modo que o kernel distribui as conexões entre eles e
+a validação do pydantic e a serialização JSON escalam com os núcleos da
+máquina. Cada worker tem seu próprio motor e pool, dimensionado a partir de
+um orçamento global de conexões ao banco, com a folga de um worker para o
+reload.
+
+O supervisor reinicia workers que terminam inesperadamente, com backoff
+exponencial para os que falham seguidamente sem ficar prontos, e faz reload
+gracioso ao receber `SIGHUP`, um posto de cada vez: o novo worker (com o
+código recarregado) é iniciado e só quando ele sinaliza que está pronto o
+antigo recebe `SIGTERM` e termina as requisições em andamento. Assim, no
+máximo um worker a mais que o normal fica aberto, dentro da folga do
+orçamento. Se um novo worker falhar ou não ficar pronto a tempo, o reload é
+abortado e os antigos dos postos restantes continuam atendendo. Durante a
+espera, os workers que terminarem inesperadamente continuam sendo
+reiniciados. Os sinais de profiling (`SIGUSR1` e `SIGUSR2`) são repassados
+a todos os workers.
+"""
+
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from dataclasses import dataclass
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event
+from typing import Callable, List
+
+from loguru import logger
+
+from mcp_car_agent.server.profiling import PROFILING_SIGNALS
+
+WorkerTarget = Callable[[socket.socket, int, Event, int], None]
+"""
+Função executada por cada worker, recebendo o socket compartilhado, o
+tamanho do pool de conexões daquele processo, o evento que ele sinaliza
+quando estiver pronto para receber tráfego e o índice do seu posto (estável
+entre reinícios e reloads, ex: para a porta das métricas).
+"""
+
+CHECK_INTERVAL = 0.5
+"""
+Intervalo, em segundos, entre as verificações dos workers pelo supervisor.
+"""
+
+SHUTDOWN_GRACE = 10.0
+"""
+Tempo, em segundos, que um worker tem para terminar após receber `SIGTERM`.
+"""
+
+READY_TIMEOUT = 120.0
+"""
+Tempo, em segundos, que o novo worker de um posto, no reload, tem para ficar
+pronto.
+"""
+
+RESTART_BACKOFF = 1.0
+RESTART_BACKOFF_MAX = 60.0
+"""
+Espera, em segundos, antes de reiniciar um worker que falhou de novo sem
+ficar pronto: dobra a cada falha seguida, até o máximo. A primeira falha é
+reiniciada imediatamente.
+"""
+
+
+def connections_per_worker(budget: int, workers: int) -> int:
+    """
+    Divide o orçamento global de conexões ao banco entre os workers e o worker
+    extra que fica aberto durante o reload de um posto.
+
+    Args:
+        budget (int): Total de conexões permitidas para o servidor.
+        workers (int): Número de processos worker.
+
+    Returns:
+        int: O número de conexões do pool de cada worker (no mínimo 1).
+    """
+    return max(1, budget // (workers + 1))
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """
+    Abre o socket de escuta que será compartilhado pelos workers.
+
+    Args:
+        host (str): Endereço de escuta.
+        port (int): Porta de escuta.
+
+    Returns:
+        socket.socket: O socket já em modo de escuta e herdável.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+@dataclass
+class Worker:
+    """
+    Um processo worker, o evento de prontidão dele e as falhas seguidas do
+    seu posto, para o backoff dos reinícios.
+    """
+
+    process: BaseProcess
+    ready: Event
+    crashes: int = 0
+    restart_at: float = 0.0
+
+
+class Supervisor:
+    """
+    Supervisiona os processos worker do servidor MCP.
+
+    Os workers são iniciados com o método `spawn` do `multiprocessing`, de modo
+    que cada um importa o código do zero: é isso que permite ao reload
+    carregar uma nova versão da aplicação sem derrubar o socket de escuta.
+    """
+
+    def __init__(
+        self, target: WorkerTarget, sock: socket.socket, workers: int, budget: int
+    ):
+        self.target = target
+        self.sock = sock
+        self.workers = workers
+        self.pool_size = connections_per_worker(budget, workers)
+        self.slots: List[Worker] = []
+        self._reload = False
+        self._running = False
+
+    @property
+    def processes(self) -> List[BaseProcess]:
+        """
+        Os processos worker atuais.
+        """
+        return [worker.process for worker in self.slots]
+
+    def spawn(self, slot: int, crashes: int = 0) -> Worker:
+        """
+        Inicia um novo processo worker.
+
+        Args:
+            slot (int): O índice do posto que o worker ocupa.
+            crashes (int): As falhas seguidas desse posto.
+
+        Returns:
+            Worker: O worker iniciado.
+        """
+        context = multiprocessing.get_context("spawn")
+        ready = context.Event()
+        process = context.Process(
+            target=self.target, args=(self.sock, self.pool_size, ready, slot)
+        )
+        process.start()
+        logger.info(
+            f"Worker {process.pid} iniciado no posto {slot} "
+            f"(pool de {self.pool_size})."
+        )
+        return Worker(process, ready, crashes)
+
+    def start(self):
+        """
+        Inicia todos os workers.
+        """
+        self.slots = [self.spawn(slot) for slot in range(self.workers)]
+
+    def reap(self) -> int:
+        """
+        Substitui os workers que terminaram inesperadamente, respeitando o
+        backoff dos que falham seguidamente.
+
+        Returns:
+            int: O número de workers reiniciados.
+        """
+        restarted = 0
+        for index, worker in enumerate(self.slots):
+            if worker.process.is_alive():
+                continue
+            if not worker.restart_at:
+                self._schedule_restart(worker)
+            if time.monotonic() >= worker.restart_at:
+                self.slots[index] = self.spawn(index, worker.crashes)
+                restarted += 1
+        return restarted
+
+    def reload(self) -> bool:
+        """
+        Substitui todos os workers sem interromper o atendimento, um posto de
+        cada vez.
+
+        O worker antigo de um posto só é encerrado depois que o novo fica
+        pronto. Caso contrário, o novo é encerrado, o reload é abortado e os
+        antigos dos postos restantes seguem.
+
+        Returns:
+            bool: Se o reload foi concluído.
+        """
+        for slot in range(self.workers):
+            new_worker = self.spawn(slot)
+            if not self._wait_ready(new_worker):
+                logger.error(
+                    f"Novo worker do posto {slot} não ficou pronto; reload abortado."
+                )
+                self._terminate([new_worker.process])
+                return False
+            old_worker, self.slots[slot] = self.slots[slot], new_worker
+            self._terminate([old_worker.process])
+        logger.info("Reload dos workers concluído.")
+        return True
+
+    def stop(self):
+        """
+        Encerra todos os workers, aguardando o término gracioso.
+        """
+        self._running = False
+        self._terminate(self.processes)
+        self.slots = []
+
+    def run(self):
+        """
+        Inicia os workers e os supervisiona até receber `SIGTERM` ou `SIGINT`.
+        """
+        signal.signal(signal.SIGHUP, self._request_reload)
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+        for signum in PROFILING_SIGNALS:
+            signal.signal(signum, self._forward)
+        self._running = True
+        self.start()
+        while self._running:
+            time.sleep(CHECK_INTERVAL)
+            if self._reload:
+                self._reload = False
+                self.reload()
+            if self._running:
+                self.reap()
+        self.stop()
+
+    def _request_reload(self, *_):
+        self._reload = True
+
+    def _request_stop(self, *_):
+        self._running = False
+
+    def _forward(self, signum: int, _):
+        for process in self.processes:
+            if process.is_alive():
+                os.kill(process.pid, signum)
+
+    @staticmethod
+    def _schedule_restart(worker: Worker):
+        worker.process.join()
+        # Uma falha depois de ficar pronto não é uma falha seguida.
+        worker.crashes = 1 if worker.ready.is_set() else worker.crashes + 1
+        delay = 0.0
+        if worker.crashes > 1:
+            delay = min(
+                RESTART_BACKOFF_MAX, RESTART_BACKOFF * 2 ** (worker.crashes - 2)
+            )
+        worker.restart_at = time.monotonic() + delay
+        logger.warning(
+            f"Worker {worker.process.pid} terminou com código "
+            f"{worker.process.exitcode}; reiniciando em {delay:g} s."
+        )
+
+    def _wait_ready(self, worker: Worker) -> bool:
+        limit = time.monotonic() + READY_TIMEOUT
+        while time.monotonic() < limit:
+            if not worker.process.is_alive():
+                return False
+            if worker.ready.is_set():
+                return True
+            self.reap()
+            time.sleep(CHECK_INTERVAL / 5)
+        return False
+
+    @staticmethod
+    def _terminate(processes: List[BaseProcess]):
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(SHUTDOWN_GRACE)
+            if process.is_alive():
+                logger.warning(f"Worker {process.pid} não terminou a tempo; matando.")
+                process.kill()
+                process.join()
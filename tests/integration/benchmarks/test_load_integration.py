@@ -0,0 +1,85 @@
+import pytest
+
+from mcp_car_agent.benchmarks.load import (
+    local_target,
+    replay,
+    run,
+    synthetic_session,
+)
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+
+
+@pytest.fixture(name="target")
+def setup_target(monkeypatch, session_factory):
+    """Fornece o servidor MCP do processo, ligado ao banco de testes."""
+
+    async def test_session_factory():
+        return session_factory
+
+    monkeypatch.setattr(ConnectionRepository, "session_factory", test_session_factory)
+    return local_target()
+
+
+@pytest.mark.asyncio
+class TestLoadIntegration:
+    """
+    Testes de integração para o teste de carga do servidor MCP.
+    """
+
+    @pytest.mark.usefixtures("car_catalog")
+    async def test_quando_carga_sobe_entao_cada_estagio_e_reportado(self, target):
+        """
+        Verifica a execução de sessões sintéticas em estágios.
+
+        Cenário:
+            Uma rampa de 1 para 2 agentes simultâneos.
+
+        Dado que:
+            - O servidor do processo, com o catálogo de teste.
+        Quando:
+            - A sessão sintética é executada em dois estágios curtos.
+        Então:
+            - Há um resultado por estágio, com chamadas e sem erros.
+        """
+        # Quando
+        result = await run(target, [synthetic_session], [1, 2], 0.2)
+
+        # Então
+        assert [stage.clients for stage in result.stages] == [1, 2]
+        assert all(stage.calls > 0 for stage in result.stages)
+        assert all(stage.errors == 0 for stage in result.stages)
+
+    @pytest.mark.usefixtures("car_catalog")
+    async def test_quando_chamada_falha_entao_sessao_e_encerrada_e_erro_contado(
+        self, target
+    ):
+        """
+        Verifica a contagem de erros de uma sessão gravada.
+
+        Cenário:
+            Uma sessão gravada que chama uma ferramenta inexistente.
+
+        Dado que:
+            - Uma sessão com a ferramenta inexistente antes de uma busca.
+        Quando:
+            - A sessão é executada por um agente.
+        Então:
+            - Toda execução da sessão termina no erro, sem chegar à busca.
+        """
+        # Dado que
+        session = replay(
+            [
+                {"tool": "inexistente"},
+                {"tool": "search_cars", "arguments": {"query": {}}},
+            ]
+        )
+
+        # Quando
+        result = await run(target, [session], [1], 0.2)
+
+        # Então
+        [stage] = result.stages
+        assert stage.calls == stage.errors > 0
+        assert stage.error_rate == 1.0
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import text
+
+from mcp_car_agent.benchmarks.query_plans import (
+    CANONICAL_SEARCHES,
+    explain_all,
+    regressions,
+)
+
+
+@pytest.mark.asyncio
+class TestQueryPlansIntegration:
+    """
+    Testes de integração para a verificação dos planos das buscas canônicas.
+    """
+
+    @pytest.mark.usefixtures("car_catalog")
+    async def test_quando_tabelas_tem_indices_entao_nenhuma_busca_le_tabela_inteira(
+        self, session_factory
+    ):
+        """
+        Verifica os planos das buscas canônicas no esquema dos modelos.
+
+        Cenário:
+            O catálogo de teste, com os índices declarados nos modelos.
+
+        Dado que:
+            - Os três carros do catálogo de teste.
+        Quando:
+            - Os planos de todas as buscas canônicas são capturados.
+        Então:
+            - Há um plano por busca e nenhuma regressão.
+        """
+        # Quando
+        plans = await explain_all(session_factory, "sqlite")
+
+        # Então
+        assert [plan.name for plan in plans] == list(CANONICAL_SEARCHES)
+        assert regressions(plans) == []
+
+    @pytest.mark.usefixtures("car_catalog")
+    async def test_quando_indice_e_removido_entao_busca_aponta_leitura_completa(
+        self, session, session_factory
+    ):
+        """
+        Verifica que a perda de um índice é detectada.
+
+        Cenário:
+            O índice de `car.manufacturer_id` é removido do banco.
+
+        Dado que:
+            - O catálogo de teste sem o índice por fabricante.
+        Quando:
+            - Os planos das buscas canônicas são capturados.
+        Então:
+            - A busca por fabricante é apontada, com leitura completa de `car`.
+        """
+        # Dado que
+        await session.exec(text("DROP INDEX ix_car_manufacturer_id"))
+        await session.commit()
+
+        # Quando
+        plans = await explain_all(session_factory, "sqlite")
+
+        # Então
+        failures = regressions(plans)
+        assert "car_by_manufacturer" in [plan.name for plan in failures]
+        assert all(plan.full_scans == ["car"] for plan in failures)
@@ -0,0 +1,69 @@
+import pytest
+from sqlmodel import func, select
+
+from mcp_car_agent.benchmarks.repository import RepositoryBenchmark, run_all
+from mcp_car_agent.core.database.models import CarModel
+
+
+@pytest.mark.asyncio
+class TestRepositoryBenchmarkIntegration:
+    """
+    Testes de integração do benchmark dos repositórios (SQLite em memória).
+    """
+
+    # O benchmark repete cada operação de propósito: não é um N+1.
+    @pytest.mark.n_plus_one(100)
+    async def test_quando_benchmark_e_executado_entao_todas_as_operacoes_sao_medidas(
+        self, session, session_factory
+    ):
+        """
+        Verifica uma execução curta do benchmark.
+
+        Cenário:
+            O benchmark sobre um catálogo sintético de 30 carros.
+
+        Dado que:
+            - Um benchmark com 5 execuções por operação e lotes de 3 carros.
+        Quando:
+            - O benchmark é executado.
+        Então:
+            - Há um resultado por operação, com vazão e percentis positivos.
+            - O catálogo termina com os 30 carros iniciais.
+        """
+        # Dado que
+        benchmark = RepositoryBenchmark(session_factory, batch=3)
+
+        # Quando
+        results = await benchmark.run("sqlite", 30, iterations=5)
+
+        # Então
+        assert [r.operation for r in results] == [
+            name for name, _, _ in benchmark.operations()
+        ]
+        assert all(r.ops == 5 and r.ops_per_sec > 0 and r.p99_ms > 0 for r in results)
+        assert {r.rows_per_op for r in results} == {1, 3}
+        count = select(func.count()).select_from(CarModel)
+        assert (await session.exec(count)).one() == 30
+
+    async def test_quando_banco_nao_esta_configurado_entao_e_ignorado(self):
+        """
+        Verifica que bancos sem URL ou inacessíveis não interrompem o benchmark.
+
+        Cenário:
+            PostgreSQL sem URL e um MySQL sem driver instalado.
+
+        Dado que:
+            - Os bancos com URL vazia e com um driver inexistente.
+        Quando:
+            - O benchmark é executado.
+        Então:
+            - Nenhum resultado é produzido.
+        """
+        # Dado que
+        backends = {"postgresql": "", "mysql": "mysql+inexistente://localhost/db"}
+
+        # Quando
+        run = await run_all(backends, [10], iterations=1, batch=1)
+
+        # Então
+        assert run.results == []
@@ -1,3 +1,9 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
@@ -8,9 +14,12 @@ from mcp_car_agent.core.database.models import (
     CarModel,
     CarSpecsModel,
     EngineModel,
+    EngineSpecModel,
+    EquipmentModel,
     ManufacturerModel,
     TransmissionModel,
 )
+from mcp_car_agent.core.database.n_plus_one import watch
 from mcp_car_agent.core.database.repository.car_repository import (
     CarRepository,
     CarSpecsRepository,
@@ -26,6 +35,8 @@ from mcp_car_agent.core.schemas.engine_schema import Engine
 from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
 from mcp_car_agent.core.schemas.transmission_schema import Transmission
 
+FIXTURE_PAGES = Path(__file__).parent.parent / "fixtures" / "pages"
+
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 AsyncSessionLocal = async_sessionmaker(
@@ -33,6 +44,27 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def pytest_configure(config):
+    """Registra o marcador que ajusta a detecção de N+1 por teste."""
+    config.addinivalue_line(
+        "markers",
+        "n_plus_one(threshold): repetições de um statement toleradas no teste.",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Executa cada teste como uma requisição lógica: um teste que repete o mesmo
+    statement (ex: carga preguiçosa de uma relação por linha) falha com
+    `NPlusOneError`, para que regressões N+1 quebrem a CI.
+    """
+    marker = item.get_closest_marker("n_plus_one")
+    options = {"threshold": marker.args[0]} if marker else {}
+    with watch(item.name, mode="raise", **options):
+        return (yield)
+
+
 @pytest_asyncio.fixture(name="session")
 async def session_fixture():
     """
@@ -100,6 +132,47 @@ async def car_with_specs(session: AsyncSession, setup_dependencies):
     return {"carro": carro_com_specs, "specs": car_specs}
 
 
+@pytest_asyncio.fixture
+async def car_catalog(session: AsyncSession, setup_dependencies):
+    """Cria um pequeno catálogo de carros com equipamentos e especificações."""
+    session.add(
+        EngineSpecModel(
+            engine_id=setup_dependencies["engine_id"], gas_type="gasolina", max_hp=150
+        )
+    )
+    cars = [
+        CarModel(
+            name=name,
+            engine_id=setup_dependencies["engine_id"],
+            transmission_id=setup_dependencies["transmission_id"],
+            manufacturer_id=setup_dependencies["manufacturer_id"],
+        )
+        for name in ("Corolla", "Civic", "Cruze")
+    ]
+    session.add_all(cars)
+    await session.commit()
+    for car in cars:
+        await session.refresh(car)
+        session.add(CarSpecsModel(car_id=car.id, gas="Gasolina", doors=4, spaces=5))
+        session.add(
+            EquipmentModel(car_id=car.id, category="Seguranca", description="Airbag")
+        )
+    await session.commit()
+    return cars
+
+
+@pytest.fixture
+def db_engine():
+    """Fornece o motor assíncrono do banco de testes."""
+    return engine
+
+
+@pytest.fixture
+def session_factory(session: AsyncSession):  # pylint: disable=unused-argument
+    """Fornece a fábrica de sessões do banco de testes, com as tabelas já criadas."""
+    return AsyncSessionLocal
+
+
 @pytest.fixture
 def car_repository(session: AsyncSession):
     """Fornece uma instância de CarRepository para os testes."""
@@ -128,3 +201,83 @@ def engine_spec_repository(session: AsyncSession):
 def equipment_repository(session: AsyncSession):
     """Fornece uma instância de EquipmentRepository para os testes."""
     return EquipmentRepository(session=session)
+
+
+class FixtureSiteHandler(BaseHTTPRequestHandler):
+    """
+    Handler do site local que substitui a fonte de dados nos testes do scraper.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Serve as páginas de `tests/fixtures/pages` (ou de `overrides`), com
+        ETag e respostas 304, simulando falhas e latência.
+        """
+        site = self.server
+        with site.lock:
+            site.connections.add(self.client_address)
+            site.in_flight += 1
+            site.max_in_flight = max(site.max_in_flight, site.in_flight)
+            site.requests.append(self.path)
+            failing = site.failures.get(self.path, 0) > 0
+            if failing:
+                site.failures[self.path] -= 1
+        time.sleep(site.latency)
+        page = FIXTURE_PAGES / self.path.lstrip("/")
+        body = site.overrides.get(self.path)
+        if body is None and page.is_file():
+            body = page.read_bytes()
+        if failing:
+            self._respond(503, b"indisponivel")
+        elif body is not None:
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            not_modified = self.headers.get("If-None-Match") == etag
+            self._respond(304 if not_modified else 200, body, etag)
+        else:
+            self._respond(404, b"nao encontrado")
+        with site.lock:
+            site.in_flight -= 1
+
+    def _respond(self, status, body, etag=None):
+        if status == 304:
+            body = b""
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        """Silencia o log de acesso do servidor de testes."""
+
+
+@pytest.fixture
+def fixture_site():
+    """
+    Sobe um servidor HTTP local servindo as páginas de fixture.
+
+    O servidor registra as conexões TCP abertas, as requisições recebidas e o
+    pico de requisições simultâneas. `failures` permite simular respostas 503
+    para um caminho, `overrides` substitui o conteúdo de um caminho e
+    `latency` adiciona atraso a cada resposta.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureSiteHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = set()
+    server.requests = []
+    server.failures = {}
+    server.overrides = {}
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.latency = 0.0
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -2,6 +2,7 @@ import pytest
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from mcp_car_agent.core.database.deadline import deadline
 from mcp_car_agent.core.database.models import CarModel, CarSpecsModel
 from mcp_car_agent.core.database.repository.base_repository import BaseRepository
 from mcp_car_agent.core.schemas.car_schema import Car, CarSpecs
@@ -267,3 +268,54 @@ class TestCarSpecRepositoryIntegration:
         assert db_item is not None
         assert db_item.gas == "Alcool"
         assert db_item.car_id == car_with_specs["carro"].id
+
+
+@pytest.mark.asyncio
+class TestCarRepositoryDeadlineIntegration:
+    """
+    Testes de integração das buscas de CarRepository executadas com prazo.
+    """
+
+    async def test_quando_busca_dentro_do_prazo_entao_resultados_sao_retornados(
+        self, car_repository, car_with_specs
+    ):
+        """
+        Verifica que a busca continua funcionando quando há um prazo ativo.
+
+        Cenário:
+            Busca executada dentro de um bloco `deadline` com folga.
+
+        Dado que:
+            - Um carro existe no banco de dados.
+        Quando:
+            - O método `search` é chamado dentro de um prazo de 5 segundos.
+        Então:
+            - O carro é retornado normalmente.
+        """
+        # Quando
+        with deadline(5):
+            results = await car_repository.search(filters={"name": "Carro com Specs"})
+
+        # Então
+        assert [car.id for car in results] == [car_with_specs["carro"].id]
+
+    async def test_quando_prazo_expirado_entao_get_one_levanta_timeout(
+        self, car_repository, car_with_specs
+    ):
+        """
+        Verifica que `get_one` respeita o prazo corrente.
+
+        Cenário:
+            Busca única executada com o prazo já esgotado.
+
+        Dado que:
+            - Um carro existe no banco de dados.
+        Quando:
+            - O método `get_one` é chamado com um prazo de zero segundos.
+        Então:
+            - `TimeoutError` é levantado.
+        """
+        # Quando e Então
+        with deadline(0):
+            with pytest.raises(TimeoutError):
+                await car_repository.get_one(by={"id": car_with_specs["carro"].id})
@@ -79,3 +79,82 @@ class TestEngineRepositoryIntegration:
         assert db_item is not None
         assert db_item.max_hp == 150
         assert db_item.engine_id == setup_dependencies["engine_id"]
+
+    async def test_quando_motores_repetidos_sao_resolvidos_entao_um_registro_e_criado(
+        self, engine_repository, session
+    ):
+        """
+        Verifica a resolução em lote de motores pela chave natural.
+
+        Cenário:
+            Resolução de motores iguais a menos de maiúsculas, acentos e espaços.
+
+        Dado que:
+            - O motor "13,0:1 / 1987 / Aspiração natural" já foi resolvido uma vez.
+        Quando:
+            - `get_or_create_many` é chamado com variações do mesmo motor e um
+              motor diferente.
+        Então:
+            - As variações recebem o ID do motor já existente.
+            - Apenas o motor diferente é criado.
+        """
+        # Dado que
+        [first] = await engine_repository.get_or_create_many(
+            [Engine(compression_rate="13,0:1", total_cc=1987, aspiration="Natural")]
+        )
+
+        # Quando
+        engines = await engine_repository.get_or_create_many(
+            [
+                Engine(compression_rate="13,0:1", total_cc=1987, aspiration="NATURAL"),
+                Engine(compression_rate="13,0:1", total_cc=1987, aspiration=" natural"),
+                Engine(compression_rate="10:1", total_cc=2000, aspiration="Turbo"),
+            ]
+        )
+
+        # Então
+        assert engines[0].id == engines[1].id == first.id
+        assert engines[2].id != first.id
+        assert len((await session.exec(select(EngineModel))).all()) == 2
+
+    async def test_quando_motor_e_alterado_entao_chave_natural_acompanha_os_valores(
+        self, engine_repository, engine_spec_repository, session
+    ):
+        """
+        Verifica que `update` recalcula a chave natural, inclusive com a
+        especificação gravada do motor.
+
+        Cenário:
+            A aspiração de um motor com especificação é corrigida.
+
+        Dado que:
+            - Um motor "Natural" de 150 cv já resolvido pela chave natural.
+        Quando:
+            - A aspiração é alterada para "Turbo" com `update`.
+            - O motor é resolvido de novo com os valores novos e os antigos.
+        Então:
+            - Os valores novos resolvem para o motor alterado.
+            - Os antigos criam outro motor, em vez de reaproveitar o alterado.
+        """
+        # Dado que
+        spec = EngineSpec(gas_type="gasolina", max_hp=150)
+        [engine] = await engine_repository.get_or_create_many(
+            [Engine(total_cc=1987, aspiration="Natural", engine_specs=spec)]
+        )
+        await engine_spec_repository.create(
+            spec.model_copy(update={"engine": Engine(id=engine.id)})
+        )
+
+        # Quando
+        await engine_repository.update(Engine(aspiration="Turbo"), engine.id)
+        renamed, old = await engine_repository.get_or_create_many(
+            [
+                Engine(total_cc=1987, aspiration="Turbo", engine_specs=spec),
+                Engine(total_cc=1987, aspiration="Natural", engine_specs=spec),
+            ]
+        )
+
+        # Então
+        assert renamed.id == engine.id
+        assert old.id != engine.id
+        assert len((await session.exec(select(EngineModel))).all()) == 2
@@ -66,4 +66,4 @@ class TestEquipmentRepositoryIntegration:
         assert created_item.category == "Seguranca"
         assert db_item is not None
         assert db_item.description == "Airbag Duplo"
-        assert db_item.car_id == carro.id
\ No newline at end of file
+        assert db_item.car_id == carro.id
@@ -0,0 +1,52 @@
+import pytest
+from sqlmodel import select
+
+from mcp_car_agent.core.database.models import ManufacturerModel
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+
+
+@pytest.mark.asyncio
+class TestManufacturerRepositoryIntegration:
+    """
+    Testes de integração para a classe ManufacturerRepository.
+    """
+
+    async def test_quando_fabricante_e_renomeado_entao_novo_nome_resolve_para_ele(
+        self, session
+    ):
+        """
+        Verifica que `update` mantém a chave natural de acordo com o nome.
+
+        Cenário:
+            Um fabricante gravado com o nome errado é renomeado.
+
+        Dado que:
+            - O fabricante "Chevrolet" já foi resolvido pela chave natural.
+        Quando:
+            - Ele é renomeado para "GM" com `update`.
+            - "GM" e "Chevrolet" são resolvidos de novo.
+        Então:
+            - "GM" resolve para o fabricante renomeado, sem criar um repetido.
+            - "Chevrolet" passa a ser outro fabricante.
+        """
+        # Dado que
+        repository = ManufacturerRepository(session)
+        [manufacturer] = await repository.get_or_create_many(
+            [Manufacturer(name="Chevrolet")]
+        )
+
+        # Quando
+        await repository.update(Manufacturer(name="GM"), manufacturer.id)
+        renamed, old = await repository.get_or_create_many(
+            [Manufacturer(name="gm"), Manufacturer(name="Chevrolet")]
+        )
+
+        # Então
+        db_item = await session.get(ManufacturerModel, manufacturer.id)
+        assert db_item.natural_key == "gm"
+        assert renamed.id == manufacturer.id
+        assert old.id != manufacturer.id
+        assert len((await session.exec(select(ManufacturerModel))).all()) == 2
@@ -0,0 +1,45 @@
+import pytest
+
+from mcp_car_agent.core.database.repository.source_page_repository import (
+    SourcePageRepository,
+)
+from mcp_car_agent.core.schemas.source_page_schema import SourcePage
+
+
+@pytest.mark.asyncio
+class TestSourcePageRepositoryIntegration:
+    """
+    Testes de integração para a classe SourcePageRepository.
+    """
+
+    async def test_quando_paginas_sao_gravadas_novamente_entao_sao_atualizadas(
+        self, session
+    ):
+        """
+        Verifica que `save_many` atualiza as páginas conhecidas e cria as novas.
+
+        Cenário:
+            Segunda gravação de uma página já conhecida, junto com uma nova.
+
+        Dado que:
+            - A página "/a" foi gravada com o ETag "v1".
+        Quando:
+            - `save_many` é chamado com "/a" (ETag "v2") e "/b".
+        Então:
+            - "/a" mantém o ID e passa a ter o ETag "v2".
+            - "/b" é criada.
+        """
+        # Dado que
+        repository = SourcePageRepository(session)
+        [first] = await repository.save_many([SourcePage(url="/a", etag="v1")])
+
+        # Quando
+        await repository.save_many(
+            [SourcePage(url="/a", etag="v2"), SourcePage(url="/b", etag="v1")]
+        )
+
+        # Então
+        pages = await repository.get_many(["/a", "/b", "/c"])
+        assert pages["/a"].id == first.id
+        assert pages["/a"].etag == "v2"
+        assert set(pages) == {"/a", "/b"}
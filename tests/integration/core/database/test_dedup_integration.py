@@ -0,0 +1,82 @@
+import pytest
+from sqlmodel import select
+
+from mcp_car_agent.core.database.dedup import deduplicate
+from mcp_car_agent.core.database.models import (
+    CarModel,
+    EngineModel,
+    EngineSpecModel,
+    ManufacturerModel,
+    TransmissionModel,
+)
+
+
+@pytest.mark.asyncio
+class TestDedupIntegration:
+    """
+    Testes de integração do job de deduplicação das dimensões.
+    """
+
+    async def test_quando_dimensoes_estao_repetidas_entao_sao_mescladas(
+        self, session, session_factory
+    ):
+        """
+        Verifica a mesclagem de dimensões repetidas e o reapontamento dos carros.
+
+        Cenário:
+            Banco populado antes das chaves naturais, com um motor por carro.
+
+        Dado que:
+            - Dois carros com fabricantes "Toyota" e "TOYOTA" e motores iguais,
+              com a mesma especificação, gravados sem `natural_key`.
+            - Um terceiro motor igual, mas com mais potência.
+        Quando:
+            - O job de deduplicação é executado.
+        Então:
+            - Um fabricante e um motor repetidos são excluídos, com a
+              especificação do motor excluído.
+            - Os dois carros apontam para os registros mantidos.
+            - O motor com outra especificação é mantido separado.
+            - Os registros mantidos têm a chave natural preenchida.
+        """
+        # Dado que
+        manufacturers = [ManufacturerModel(name=n) for n in ("Toyota", "TOYOTA")]
+        engines = [EngineModel(total_cc=1987, aspiration="Natural") for _ in "abc"]
+        transmission = TransmissionModel(gearbox_type="CVT")
+        session.add_all([*manufacturers, *engines, transmission])
+        await session.flush()
+        session.add_all(
+            [
+                CarModel(
+                    name="Corolla",
+                    engine_id=engine.id,
+                    transmission_id=transmission.id,
+                    manufacturer_id=manufacturer.id,
+                )
+                for manufacturer, engine in zip(manufacturers, engines)
+            ]
+        )
+        session.add_all(
+            [
+                EngineSpecModel(gas_type="gasolina", max_hp=hp, engine_id=engine.id)
+                for hp, engine in zip((150, 150, 177), engines)
+            ]
+        )
+        await session.commit()
+        kept, stronger = (manufacturers[0].id, engines[0].id), engines[2].id
+
+        # Quando
+        removed = await deduplicate(session_factory)
+
+        # Então
+        session.expire_all()
+        cars = (await session.exec(select(CarModel))).all()
+        specs = (await session.exec(select(EngineSpecModel))).all()
+        manufacturer = (await session.exec(select(ManufacturerModel))).one()
+        assert removed == {"manufacturer": 1, "transmission": 0, "engine": 1}
+        assert {(c.manufacturer_id, c.engine_id) for c in cars} == {kept}
+        assert {(s.engine_id, s.max_hp) for s in specs} == {
+            (kept[1], 150),
+            (stronger, 177),
+        }
+        assert manufacturer.natural_key == "toyota"
@@ -0,0 +1,92 @@
+from contextlib import AsyncExitStack
+
+import pytest
+from sqlalchemy import text
+
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+
+
+@pytest.mark.asyncio
+class TestDialectsIntegration:
+    """
+    Testes de integração dos perfis de conexão de cada banco.
+    """
+
+    async def test_quando_banco_e_sqlite_entao_conexoes_usam_wal(
+        self, monkeypatch, tmp_path
+    ):
+        """
+        Verifica os ajustes aplicados a cada conexão do SQLite.
+
+        Cenário:
+            `DB_ENGINE` é SQLITE, com o banco em arquivo.
+
+        Dado que:
+            - O motor é criado pelo `ConnectionRepository`.
+        Quando:
+            - Uma conexão consulta o modo do journal e as chaves estrangeiras.
+        Então:
+            - O journal está em WAL e as chaves estrangeiras estão ligadas.
+        """
+        # Dado que
+        monkeypatch.setattr("mcp_car_agent.core.config.DB_ENGINE", "SQLITE")
+        monkeypatch.setattr(
+            "mcp_car_agent.core.config.DB_NAME", str(tmp_path / "carros.db")
+        )
+        engine = ConnectionRepository.engine(ConnectionRepository.url())
+
+        # Quando
+        async with engine.connect() as connection:
+            journal = await connection.scalar(text("PRAGMA journal_mode"))
+            foreign_keys = await connection.scalar(text("PRAGMA foreign_keys"))
+        await engine.dispose()
+
+        # Então
+        assert journal == "wal"
+        assert foreign_keys == 1
+
+    async def test_quando_conexao_dedicada_esta_aberta_entao_pool_segue_completo(
+        self, monkeypatch, tmp_path
+    ):
+        """
+        Verifica que conexões de longa duração não ocupam o pool das requisições.
+
+        Cenário:
+            Um worker com pool de 2 conexões, sem overflow, e o LISTEN do
+            barramento de invalidação aberto.
+
+        Dado que:
+            - Uma conexão crua aberta pelo motor dedicado e mantida aberta.
+        Quando:
+            - O warm-up abre as 2 conexões do pool ao mesmo tempo.
+        Então:
+            - As 2 conexões são obtidas sem esperar pelo pool.
+        """
+        # Dado que
+        monkeypatch.setattr("mcp_car_agent.core.config.DB_ENGINE", "SQLITE")
+        monkeypatch.setattr(
+            "mcp_car_agent.core.config.DB_NAME", str(tmp_path / "carros.db")
+        )
+        monkeypatch.setattr("mcp_car_agent.core.config.DB_POOL_SIZE", 2)
+        monkeypatch.setattr("mcp_car_agent.core.config.DB_MAX_OVERFLOW", 0)
+        engine = ConnectionRepository.engine(ConnectionRepository.url())
+        engine.sync_engine.pool._timeout = 1  # pylint: disable=protected-access
+        dedicated = ConnectionRepository.dedicated_engine(engine)
+        held = await dedicated.raw_connection()
+
+        # Quando
+        try:
+            async with AsyncExitStack() as stack:
+                for _ in range(2):
+                    connection = await stack.enter_async_context(engine.connect())
+                    await connection.execute(text("SELECT 1"))
+                checked_out = engine.sync_engine.pool.checkedout()
+        finally:
+            held.close()
+            await dedicated.dispose()
+            await engine.dispose()
+
+        # Então
+        assert checked_out == 2
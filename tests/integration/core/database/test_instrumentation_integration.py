@@ -0,0 +1,56 @@
+import pytest
+from loguru import logger
+
+from mcp_car_agent.core.database.instrumentation import (
+    UNKNOWN_OPERATION,
+    SqlInstrumentation,
+)
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+
+
+@pytest.mark.asyncio
+class TestInstrumentationIntegration:
+    """
+    Testes de integração da instrumentação SQL.
+    """
+
+    async def test_quando_repositorio_consulta_entao_statement_e_atribuido_ao_metodo(
+        self, session, db_engine, car_catalog
+    ):
+        """
+        Verifica a medição dos statements e o log de consultas lentas.
+
+        Cenário:
+            Uma busca de carros com limite de consulta lenta igual a zero.
+
+        Dado que:
+            - Uma instrumentação registrada no motor, que considera lenta
+              qualquer consulta.
+        Quando:
+            - O repositório busca os carros.
+        Então:
+            - O SELECT é atribuído a `CarRepository.search`, com as 3 linhas.
+            - A consulta lenta é registrada no log com os campos estruturados.
+        """
+        # Dado que
+        instrumentation = SqlInstrumentation(slow_query_seconds=0)
+        instrumentation.attach(db_engine)
+        records = []
+        sink = logger.add(records.append, level="WARNING")
+
+        # Quando
+        try:
+            cars = await CarRepository(session).search()
+        finally:
+            logger.remove(sink)
+            instrumentation.detach(db_engine)
+
+        # Então
+        stats = instrumentation.stats[("CarRepository.search", "SELECT")]
+        assert stats.latency.count == stats.slow == 1
+        assert stats.rows.sum in (0, len(cars))
+        extra = records[-1].record["extra"]
+        assert extra["operation"] == "CarRepository.search"
+        assert extra["statement"].startswith("SELECT")
+        assert (UNKNOWN_OPERATION, "SELECT") not in instrumentation.stats
+        assert len(cars) == len(car_catalog)
@@ -0,0 +1,184 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from mcp_car_agent.core.database.invalidation import (
+    InProcessInvalidationBus,
+    PostgresInvalidationBus,
+)
+from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.services.dimension_cache import DimensionCache
+
+
+@pytest.fixture(name="bus")
+def setup_bus(monkeypatch):
+    """Substitui o barramento compartilhado dos repositórios por um novo, isolado."""
+    bus = InProcessInvalidationBus()
+    monkeypatch.setattr(BaseRepository, "bus", bus)
+    return bus
+
+
+class TransactionalBus(InProcessInvalidationBus):
+    """Barramento que publica pela transação da escrita, como o do PostgreSQL."""
+
+    def __init__(self, statement: str):
+        super().__init__()
+        self.statement = statement
+        self.published = []
+
+    async def publish(self, table, ids):
+        self.published.append((table, ids))
+
+    def statements(self, table, ids):
+        return [text(self.statement)]
+
+
+@pytest.mark.asyncio
+class TestInvalidationIntegration:
+    """
+    Testes de integração entre as escritas dos repositórios e o barramento de invalidação.
+    """
+
+    async def test_quando_repositorio_escreve_entao_evento_e_publicado_por_operacao(
+        self, session, bus
+    ):
+        """
+        Verifica que create, update e delete publicam a tabela e o ID alterados.
+
+        Cenário:
+            Ciclo de vida completo de um fabricante.
+
+        Dado que:
+            - Um handler inscrito no barramento dos repositórios.
+        Quando:
+            - Um fabricante é criado, atualizado e excluído.
+        Então:
+            - Três eventos da tabela `manufacturer` são publicados com o ID do registro.
+            - As versões são crescentes.
+        """
+        # Dado que
+        received = []
+        bus.subscribe(received.append)
+        repository = ManufacturerRepository(session)
+
+        # Quando
+        created = await repository.create(Manufacturer(name="Fiat"))
+        await repository.update(Manufacturer(name="Fiat Brasil"), created.id)
+        await repository.delete(created.id)
+
+        # Então
+        assert [(e.table, e.ids) for e in received] == [
+            ("manufacturer", [created.id])
+        ] * 3
+        assert [e.version for e in received] == sorted(e.version for e in received)
+
+    async def test_quando_fabricante_e_criado_entao_cache_de_dimensoes_e_recarregado(
+        self, session, session_factory, bus
+    ):
+        """
+        Verifica que o cache de dimensões não serve dados antigos após uma escrita.
+
+        Cenário:
+            Um novo fabricante é cadastrado com o cache já carregado.
+
+        Dado que:
+            - Um cache de dimensões carregado e inscrito no barramento.
+        Quando:
+            - Um fabricante é criado pelo repositório.
+        Então:
+            - A próxima listagem já inclui o novo fabricante.
+        """
+        # Dado que
+        dimensions = DimensionCache()
+        bus.subscribe(dimensions.invalidate)
+        assert await dimensions.list_manufacturers(session_factory) == []
+
+        # Quando
+        await ManufacturerRepository(session).create(Manufacturer(name="Fiat"))
+
+        # Então
+        manufacturers = await dimensions.list_manufacturers(session_factory)
+        assert [m.name for m in manufacturers] == ["Fiat"]
+
+    async def test_quando_publicacao_na_transacao_falha_entao_escrita_e_desfeita(
+        self, session, monkeypatch
+    ):
+        """
+        Verifica que a invalidação publicada na transação é atômica com a escrita.
+
+        Cenário:
+            Um barramento que publica pela transação da escrita.
+
+        Dado que:
+            - Um barramento cujos statements funcionam e outro cujos falham.
+        Quando:
+            - Um fabricante é criado com cada barramento.
+        Então:
+            - Com o primeiro, a escrita é confirmada sem `publish` após o commit.
+            - Com o segundo, a escrita falha e não é confirmada.
+        """
+        # Dado que
+        repository = ManufacturerRepository(session)
+        working = TransactionalBus("SELECT 1")
+        failing = TransactionalBus("SELECT pg_notify('canal', 'evento')")
+
+        # Quando
+        monkeypatch.setattr(BaseRepository, "bus", working)
+        await repository.create(Manufacturer(name="Fiat"))
+        monkeypatch.setattr(BaseRepository, "bus", failing)
+        with pytest.raises(OperationalError):
+            await repository.create(Manufacturer(name="Ford"))
+        await session.rollback()
+
+        # Então
+        assert working.published == [] and failing.published == []
+        assert [m.name for m in await repository.search()] == ["Fiat"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"),
+    reason="Requer um PostgreSQL local em TEST_POSTGRES_URL.",
+)
+async def test_quando_postgres_local_entao_notify_entrega_evento_entre_barramentos():
+    """
+    Verifica o barramento contra um PostgreSQL real.
+
+    Cenário:
+        Dois barramentos conectados ao mesmo banco.
+
+    Dado que:
+        - Um PostgreSQL acessível em `TEST_POSTGRES_URL` (postgresql+asyncpg://...).
+    Quando:
+        - Um barramento publica um evento.
+    Então:
+        - O outro barramento o recebe em milissegundos.
+    """
+    # Dado que
+    pytest.importorskip("asyncpg")
+    engine = create_async_engine(os.environ["TEST_POSTGRES_URL"])
+    publisher = PostgresInvalidationBus(engine.raw_connection)
+    subscriber = PostgresInvalidationBus(engine.raw_connection)
+    received = asyncio.Event()
+    subscriber.subscribe(lambda event: received.set())
+    await publisher.start()
+    await subscriber.start()
+
+    # Quando
+    await publisher.publish("car", [1])
+
+    # Então
+    try:
+        await asyncio.wait_for(received.wait(), 1)
+    finally:
+        await publisher.stop()
+        await subscriber.stop()
+        await engine.dispose()
@@ -0,0 +1,66 @@
+import pytest
+
+from mcp_car_agent.core.database.n_plus_one import NPlusOneError, watch
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+
+
+@pytest.mark.asyncio
+class TestNPlusOneIntegration:
+    """
+    Testes de integração para o detector de consultas N+1.
+    """
+
+    async def test_quando_relacao_e_carregada_por_linha_entao_erro_aponta_a_relacao(
+        self, session, car_catalog
+    ):
+        """
+        Verifica a detecção de cargas preguiçosas repetidas.
+
+        Cenário:
+            Uma ferramenta lê os equipamentos de cada carro de uma busca.
+
+        Dado que:
+            - Os três carros do catálogo, com as relações ainda não carregadas.
+        Quando:
+            - `equipments` é lido carro a carro, em uma requisição com limite
+              de 3 repetições.
+        Então:
+            - A requisição falha com `NPlusOneError`, apontando a relação.
+        """
+        # Dado que
+        cars = car_catalog
+
+        # Quando / Então
+        with pytest.raises(NPlusOneError, match="CarModel.equipments"):
+            with watch("teste", threshold=3, mode="raise"):
+                for car in cars:
+                    await session.run_sync(lambda _, car=car: car.equipments)
+
+    async def test_quando_relacoes_sao_carregadas_em_lote_entao_nada_e_reportado(
+        self, session, car_catalog
+    ):
+        """
+        Verifica que a carga antecipada de `get_many` não é um N+1.
+
+        Cenário:
+            A leitura dos detalhes completos dos carros do catálogo.
+
+        Dado que:
+            - Os IDs dos três carros do catálogo.
+        Quando:
+            - Os carros são buscados por `get_many`, em uma requisição com
+              limite de 2 repetições.
+        Então:
+            - Os statements são contados e nenhum formato se repete.
+        """
+        # Dado que
+        ids = [car.id for car in car_catalog]
+
+        # Quando
+        with watch("get_cars", threshold=2, mode="raise") as current:
+            cars = await CarRepository(session).get_many(ids)
+
+        # Então
+        assert len(cars) == 3
+        assert current.statements > 0
+        assert current.offenders() == []
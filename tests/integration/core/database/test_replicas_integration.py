@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from mcp_car_agent.core.database.models import ManufacturerModel
+from mcp_car_agent.core.database.replicas import (
+    ReplicaSet,
+    primary_only,
+    read_your_writes,
+    routing_sessionmaker,
+)
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.services.dimension_cache import DimensionCache
+
+
+async def open_database(path, manufacturer):
+    """Cria um banco SQLite em arquivo com um único fabricante."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+        await connection.execute(
+            ManufacturerModel.__table__.insert(), {"id": 1, "name": manufacturer}
+        )
+    return engine
+
+
+@pytest_asyncio.fixture(name="databases")
+async def setup_databases(tmp_path):
+    """
+    Fornece um primário e uma réplica com dados distintos, para identificar de
+    onde cada leitura veio.
+    """
+    primary = await open_database(tmp_path / "primario.db", "Primário")
+    replica = await open_database(tmp_path / "replica.db", "Réplica")
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.mark.asyncio
+class TestReplicasIntegration:
+    """
+    Testes de integração para o roteamento das leituras para as réplicas.
+    """
+
+    async def test_quando_repositorio_le_entao_search_e_get_one_vao_para_a_replica(
+        self, databases
+    ):
+        """
+        Verifica a divisão entre leituras e escritas.
+
+        Cenário:
+            Uma sessão que lê e escreve.
+
+        Dado que:
+            - Um primário e uma réplica saudável.
+        Quando:
+            - A sessão busca, lê um registro e cria outro.
+        Então:
+            - `search` e `get_one` são atendidos pela réplica.
+            - A escrita vai para o primário.
+        """
+        # Dado que
+        primary, replica = databases
+        factory = routing_sessionmaker(primary, ReplicaSet([replica]))
+
+        # Quando
+        async with factory() as session:
+            repository = ManufacturerRepository(session)
+            found = await repository.search()
+            one = await repository.get_one({"id": 1})
+            await repository.create(Manufacturer(name="Novo"))
+
+        # Então
+        assert [manufacturer.name for manufacturer in found] == ["Réplica"]
+        assert one.name == "Réplica"
+        async with factory() as session:
+            written = await session.get(ManufacturerModel, 2)
+        assert written.name == "Novo"
+
+    async def test_quando_sessao_pede_ler_as_proprias_escritas_entao_le_do_primario(
+        self, databases
+    ):
+        """
+        Verifica a consistência de leitura das próprias escritas.
+
+        Cenário:
+            Uma sessão que cria um registro e o busca em seguida.
+
+        Dado que:
+            - Uma sessão marcada com `read_your_writes`.
+        Quando:
+            - A sessão busca antes e depois de escrever.
+        Então:
+            - Antes da escrita, a busca vai para a réplica.
+            - Depois, vai para o primário, e o registro novo é encontrado.
+        """
+        # Dado que
+        primary, replica = databases
+        factory = routing_sessionmaker(primary, ReplicaSet([replica]))
+
+        # Quando
+        async with factory() as session:
+            repository = ManufacturerRepository(read_your_writes(session))
+            before = await repository.search()
+            await repository.create(Manufacturer(name="Novo"))
+            after = await repository.search()
+
+        # Então
+        assert [manufacturer.name for manufacturer in before] == ["Réplica"]
+        assert [manufacturer.name for manufacturer in after] == ["Primário", "Novo"]
+
+    async def test_quando_replica_esta_fora_do_ar_entao_leituras_vao_para_o_primario(
+        self, databases, tmp_path
+    ):
+        """
+        Verifica a verificação de saúde das réplicas.
+
+        Cenário:
+            Uma réplica saudável e outra inacessível.
+
+        Dado que:
+            - Uma réplica cujo arquivo não pode ser aberto.
+        Quando:
+            - As réplicas são verificadas e a réplica saudável também cai.
+        Então:
+            - A réplica inacessível sai do rodízio.
+            - Sem réplicas saudáveis, as leituras vão para o primário.
+        """
+        # Dado que
+        primary, replica = databases
+        unreachable = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'inexistente' / 'replica.db'}"
+        )
+        replicas = ReplicaSet([replica, unreachable])
+
+        # Quando
+        await replicas.check()
+        healthy = list(replicas.healthy)
+        replicas.mark_down(replica, "teste")
+        async with routing_sessionmaker(primary, replicas)() as session:
+            found = await ManufacturerRepository(session).search()
+
+        # Então
+        assert healthy == [replica]
+        assert [manufacturer.name for manufacturer in found] == ["Primário"]
+        await unreachable.dispose()
+
+    async def test_quando_cache_recarrega_apos_invalidacao_entao_le_do_primario(
+        self, databases
+    ):
+        """
+        Verifica que as cargas do cache de dimensões não vão para as réplicas.
+
+        Cenário:
+            Uma réplica atrasada, que ainda não aplicou a escrita invalidada.
+
+        Dado que:
+            - Um primário e uma réplica saudável com dados distintos.
+        Quando:
+            - O cache de dimensões é carregado e uma sessão comum busca.
+        Então:
+            - O cache tem os dados do primário.
+            - A sessão comum continua lendo da réplica.
+        """
+        # Dado que
+        primary, replica = databases
+        factory = routing_sessionmaker(primary, ReplicaSet([replica]))
+        cache = DimensionCache()
+
+        # Quando
+        await cache.load(factory)
+        async with factory() as session:
+            found = await ManufacturerRepository(session).search()
+        async with factory() as session:
+            pinned = await ManufacturerRepository(primary_only(session)).search()
+
+        # Então
+        assert cache.manufacturers[1].name == "Primário"
+        assert [manufacturer.name for manufacturer in found] == ["Réplica"]
+        assert [manufacturer.name for manufacturer in pinned] == ["Primário"]
+
+    async def test_quando_replicas_sao_fechadas_entao_monitoramento_para(
+        self, databases
+    ):
+        """
+        Verifica o encerramento das réplicas.
+
+        Cenário:
+            O servidor termina com o monitoramento das réplicas em andamento.
+
+        Dado que:
+            - Um conjunto de réplicas com o monitoramento iniciado.
+        Quando:
+            - `close` é chamado.
+        Então:
+            - A tarefa de monitoramento é cancelada e descartada.
+            - Nenhuma réplica segue no rodízio.
+        """
+        # Dado que
+        _, replica = databases
+        replicas = ReplicaSet([replica], check_interval=0.01)
+        replicas.start()
+        task = replicas.task
+        await asyncio.sleep(0.05)
+
+        # Quando
+        await replicas.close()
+
+        # Então
+        assert task.cancelled()
+        assert replicas.task is None and replicas.healthy == []
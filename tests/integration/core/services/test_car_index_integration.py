@@ -0,0 +1,230 @@
+import pytest
+from sqlalchemy import insert, select, update
+
+from mcp_car_agent.core.database.change_log import GAP_SCAN
+from mcp_car_agent.core.database.models import CarModel, ChangeLogModel
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.invalidation_schema import InvalidationEvent
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+from mcp_car_agent.core.services.car_index import CarIndex
+from mcp_car_agent.core.services.catalog_service import CatalogService
+from mcp_car_agent.core.services.dimension_cache import DimensionCache
+from mcp_car_agent.core.services.snapshot import Snapshot, build
+from mcp_car_agent.core.services.warmup import WarmUp
+
+
+async def _load_index(session_factory, path) -> CarIndex:
+    """Gera o snapshot do catálogo e carrega um índice a partir dele."""
+    await build(session_factory, path)
+    index = CarIndex()
+    with Snapshot(path) as snapshot:
+        index.load(snapshot)
+    return index
+
+
+async def _rename(session_factory, car_id: int, name: str, version: int):
+    """Renomeia um carro registrando a alteração no `change_log` com a versão dada."""
+    async with session_factory() as session:
+        await session.exec(
+            update(CarModel).where(CarModel.id == car_id).values(name=name)
+        )
+        await session.exec(
+            insert(ChangeLogModel).values(
+                version=version, table_name="car", row_id=car_id
+            )
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+class TestCarIndexIntegration:
+    """
+    Testes de integração para o snapshot do catálogo e o índice de carros.
+    """
+
+    async def test_quando_servidor_inicia_com_snapshot_entao_busca_usa_o_indice(
+        self, session_factory, car_catalog, tmp_path
+    ):
+        """
+        Verifica o warm-up a partir do snapshot e as buscas atendidas em memória.
+
+        Cenário:
+            Um nó novo do servidor inicia com o snapshot do catálogo.
+
+        Dado que:
+            - Um snapshot gerado a partir do catálogo com três carros.
+        Quando:
+            - O warm-up é executado com o snapshot.
+            - Uma busca por nome e uma busca ordenada são feitas.
+        Então:
+            - Dimensões e índice vêm do snapshot, na versão atual do banco.
+            - As buscas retornam os mesmos carros que o banco.
+        """
+        # Dado que
+        path = tmp_path / "catalogo.snap"
+        version = await build(session_factory, path)
+        dimensions, index = DimensionCache(), CarIndex()
+
+        # Quando
+        await WarmUp(dimensions, index, str(path)).run(session_factory)
+        by_name, ordered = await CatalogService(
+            session_factory, index=index
+        ).batch_search(
+            [
+                CarQuery(filters={"name": "Civic"}),
+                CarQuery(order_by="name", offset=1, limit=2),
+            ]
+        )
+
+        # Então
+        assert index.version == version
+        assert dimensions.manufacturers[car_catalog[0].manufacturer_id].name == "Honda"
+        assert [car.id for car in by_name] == [car_catalog[1].id]
+        assert [car.name for car in ordered] == ["Corolla", "Cruze"]
+
+    async def test_quando_banco_muda_apos_snapshot_entao_indice_alcanca_pelo_change_log(
+        self, session_factory, car_catalog, tmp_path
+    ):
+        """
+        Verifica a atualização do índice pelas alterações posteriores ao snapshot.
+
+        Cenário:
+            Carros alterados e excluídos depois da geração do snapshot.
+
+        Dado que:
+            - Um índice carregado de um snapshot do catálogo.
+            - Um carro renomeado e outro excluído pelo repositório.
+        Quando:
+            - O índice recebe a invalidação e uma busca é feita.
+        Então:
+            - A busca reflete as alterações do banco.
+        """
+        # Dado que
+        index = await _load_index(session_factory, tmp_path / "catalogo.snap")
+        await index.catch_up(session_factory)
+        corolla, civic = car_catalog[:2]
+        async with session_factory() as session:
+            await CarRepository(session).update(Car(name="Corolla Cross"), corolla.id)
+            await CarRepository(session).delete_many([civic.id])
+
+        # Quando
+        index.invalidate(InvalidationEvent(table="car", ids=[corolla.id], version=1))
+        cars = await index.search(CarQuery(order_by="name"), session_factory)
+
+        # Então
+        assert [car.name for car in cars] == ["Corolla Cross", "Cruze"]
+        assert index.stale is False
+
+    async def test_quando_versao_menor_e_confirmada_depois_entao_indice_a_aplica(
+        self, session_factory, car_catalog, tmp_path
+    ):
+        """
+        Verifica a releitura das versões puladas do `change_log`.
+
+        Cenário:
+            Duas escritas concorrentes: a de versão menor faz commit depois que
+            o índice já leu a de versão maior.
+
+        Dado que:
+            - Um índice em dia, na versão V.
+            - O Cruze renomeado na versão V + 2, já lida pelo índice, enquanto
+              a versão V + 1 ainda não tinha sido confirmada.
+        Quando:
+            - O Civic é renomeado na versão V + 1 e o índice recebe a invalidação.
+        Então:
+            - A lacuna V + 1 é lida e a busca reflete as duas alterações.
+        """
+        # Dado que
+        index = await _load_index(session_factory, tmp_path / "catalogo.snap")
+        await index.catch_up(session_factory)
+        version = index.version
+        civic, cruze = car_catalog[1:3]
+        await _rename(session_factory, cruze.id, "Cruze Sport6", version + 2)
+        index.invalidate(InvalidationEvent(table="car", ids=[cruze.id], version=1))
+        await index.catch_up(session_factory)
+        assert index.cursor.gaps.keys() == {version + 1}
+
+        # Quando
+        await _rename(session_factory, civic.id, "Civic Si", version + 1)
+        index.invalidate(InvalidationEvent(table="car", ids=[civic.id], version=1))
+        cars = await index.search(CarQuery(order_by="name"), session_factory)
+
+        # Então
+        assert [car.name for car in cars] == ["Civic Si", "Corolla", "Cruze Sport6"]
+        assert index.version == version + 2
+        assert not index.cursor.gaps
+
+    async def test_quando_filtro_nao_e_suportado_entao_busca_vai_ao_banco(
+        self, session_factory, car_catalog, tmp_path
+    ):
+        """
+        Verifica que o índice recusa buscas que não sabe atender.
+
+        Cenário:
+            Uma busca por uma coluna que não está no índice.
+
+        Dado que:
+            - Um índice carregado de um snapshot do catálogo.
+        Quando:
+            - Uma busca filtra por uma coluna desconhecida.
+        Então:
+            - O índice retorna `None`, para que a busca vá ao banco.
+        """
+        # Dado que
+        index = await _load_index(session_factory, tmp_path / "catalogo.snap")
+
+        # Quando
+        cars = await index.search(
+            CarQuery(filters={"manufacturer": "Honda"}), session_factory
+        )
+
+        # Então
+        assert cars is None
+        assert len(index.rows) == len(car_catalog)
+
+    async def test_quando_snapshot_e_regerado_entao_change_log_anterior_e_excluido(
+        self, session_factory, car_catalog, tmp_path
+    ):
+        """
+        Verifica a retenção do `change_log` pelas gerações do snapshot.
+
+        Cenário:
+            O snapshot é regerado depois de muitas escritas.
+
+        Dado que:
+            - Um snapshot gerado com alterações nas versões 1 e 2.
+            - Uma alteração na versão `GAP_SCAN + 5` e um novo snapshot.
+        Quando:
+            - O snapshot é gerado pela terceira vez.
+        Então:
+            - As alterações anteriores às `GAP_SCAN` versões da segunda
+              geração são excluídas e a mais recente é mantida.
+            - Um índice carregado do novo snapshot alcança o banco.
+        """
+        # Dado que
+        path = tmp_path / "catalogo.snap"
+        corolla, civic = car_catalog[:2]
+        await _rename(session_factory, corolla.id, "Corolla Cross", 1)
+        await _rename(session_factory, civic.id, "Civic Si", 2)
+        await build(session_factory, path)
+        await _rename(session_factory, civic.id, "Civic Type R", GAP_SCAN + 5)
+        await build(session_factory, path)
+
+        # Quando
+        index = await _load_index(session_factory, path)
+        await index.catch_up(session_factory)
+
+        # Então
+        async with session_factory() as session:
+            query = select(ChangeLogModel.version)
+            versions = (await session.exec(query)).scalars().all()
+        assert versions == [GAP_SCAN + 5]
+        assert index.version == GAP_SCAN + 5
+        assert [
+            car.name for car in await index.search(CarQuery(), session_factory)
+        ] == [
+            "Corolla Cross",
+            "Civic Type R",
+            "Cruze",
+        ]
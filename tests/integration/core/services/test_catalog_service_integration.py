@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import event
+
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+from mcp_car_agent.core.services.catalog_service import CatalogService
+
+
+def count_statements(engine):
+    """Registra um contador de statements SQL executados no motor informado."""
+    statements = []
+
+    def before_cursor_execute(*args):
+        statements.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return statements, lambda: event.remove(
+        engine.sync_engine, "before_cursor_execute", before_cursor_execute
+    )
+
+
+@pytest.mark.asyncio
+class TestCatalogServiceIntegration:
+    """
+    Testes de integração para a classe CatalogService.
+    """
+
+    async def test_quando_lote_de_consultas_entao_resultados_sao_retornados_na_ordem(
+        self, session_factory, car_catalog
+    ):
+        """
+        Verifica se `batch_search` retorna o resultado de cada consulta na ordem pedida.
+
+        Cenário:
+            Comparação de três carros em uma única chamada.
+
+        Dado que:
+            - O catálogo possui Corolla, Civic e Cruze.
+        Quando:
+            - `batch_search` é chamado com uma consulta por nome.
+        Então:
+            - Cada posição do resultado contém apenas o carro da consulta correspondente.
+        """
+        # Dado que
+        service = CatalogService(session_factory)
+        names = ["Cruze", "Corolla", "Civic"]
+
+        # Quando
+        results = await service.batch_search(
+            [CarQuery(filters={"name": name}) for name in names]
+        )
+
+        # Então
+        assert [[car.name for car in result] for result in results] == [
+            [name] for name in names
+        ]
+
+    async def test_quando_get_cars_entao_grafo_completo_e_carregado_com_consultas_constantes(
+        self, session_factory, db_engine, car_catalog
+    ):
+        """
+        Verifica se `get_cars` carrega o grafo completo sem consultas por carro (N+1).
+
+        Cenário:
+            Busca dos detalhes de um e de três carros.
+
+        Dado que:
+            - O catálogo possui três carros com equipamentos e especificações.
+        Quando:
+            - `get_cars` é chamado com um ID e depois com três IDs.
+        Então:
+            - O número de statements SQL é o mesmo nas duas chamadas.
+            - Motor, transmissão, fabricante, equipamentos e specs são preenchidos.
+        """
+        # Dado que
+        service = CatalogService(session_factory)
+        ids = [car.id for car in car_catalog]
+        statements, stop = count_statements(db_engine)
+
+        # Quando
+        await service.get_cars(ids[:1])
+        single = len(statements)
+        statements.clear()
+        cars = await service.get_cars(list(reversed(ids)))
+        stop()
+
+        # Então
+        assert len(statements) == single
+        assert [car.id for car in cars] == list(reversed(ids))
+        for car in cars:
+            assert car.engine.total_cc == 2000
+            assert car.engine.engine_specs.max_hp == 150
+            assert car.transmission.gearbox_type == "Manual"
+            assert car.manufacturer.name == "Honda"
+            assert [e.description for e in car.equipments] == ["Airbag"]
+            assert car.car_specs[0].doors == 4
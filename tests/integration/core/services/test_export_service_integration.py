@@ -0,0 +1,132 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+from mcp_car_agent.core.services.export_service import ExportService
+
+
+@pytest.mark.asyncio
+class TestExportServiceIntegration:
+    """
+    Testes de integração para a classe ExportService.
+    """
+
+    async def test_quando_exporta_csv_comprimido_entao_linhas_filtradas_sao_gravadas(
+        self, session_factory, car_catalog, tmp_path, monkeypatch
+    ):
+        """
+        Verifica a exportação em CSV com gzip, filtros e ordenação.
+
+        Cenário:
+            Exportação dos carros de um fabricante, em blocos de 2 linhas.
+
+        Dado que:
+            - O catálogo possui Corolla, Civic e Cruze, todos da Honda.
+        Quando:
+            - Os carros da Honda são exportados ordenados pelo nome, com limite 2.
+        Então:
+            - O arquivo gzip tem o cabeçalho e as linhas de Civic e Corolla.
+            - As colunas das dimensões (ex: fabricante) são incluídas.
+        """
+        # Dado que
+        monkeypatch.setattr(config, "EXPORT_BATCH_SIZE", 2)
+        path = tmp_path / "carros.csv.gz"
+        query = CarQuery(
+            filters={"manufacturer_id": car_catalog[0].manufacturer_id},
+            order_by="name",
+            limit=2,
+        )
+
+        # Quando
+        result = await ExportService(session_factory).export(query, path, "csv", "gzip")
+
+        # Então
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+        assert result.rows == 2
+        assert [row["name"] for row in rows] == ["Civic", "Corolla"]
+        assert {row["manufacturer"] for row in rows} == {"Honda"}
+
+    async def test_quando_exporta_jsonl_em_blocos_entao_todas_as_linhas_sao_gravadas(
+        self, session_factory, car_catalog, tmp_path, monkeypatch
+    ):
+        """
+        Verifica a exportação em JSONL com mais linhas que o tamanho do bloco.
+
+        Cenário:
+            Exportação de todo o catálogo em blocos de 2 linhas.
+
+        Dado que:
+            - O catálogo possui 3 carros.
+        Quando:
+            - Todos os carros são exportados em JSONL.
+        Então:
+            - O arquivo tem um objeto por carro, com os IDs do catálogo.
+        """
+        # Dado que
+        monkeypatch.setattr(config, "EXPORT_BATCH_SIZE", 2)
+        path = tmp_path / "carros.jsonl"
+
+        # Quando
+        result = await ExportService(session_factory).export(CarQuery(), path, "jsonl")
+
+        # Então
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert result.rows == 3
+        assert sorted(row["id"] for row in rows) == sorted(c.id for c in car_catalog)
+
+    async def test_quando_exporta_parquet_entao_esquema_vem_das_colunas(
+        self, session_factory, car_catalog, tmp_path
+    ):
+        """
+        Verifica a exportação em Parquet (exige o pacote opcional pyarrow).
+
+        Cenário:
+            Exportação de todo o catálogo, em que `year` é sempre nulo.
+
+        Dado que:
+            - O catálogo possui 3 carros sem ano.
+        Quando:
+            - Os carros são exportados em Parquet com zstd.
+        Então:
+            - O arquivo tem 3 linhas e a coluna `year` é do tipo data.
+        """
+        # Dado que
+        parquet = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "carros.parquet"
+
+        # Quando
+        await ExportService(session_factory).export(CarQuery(), path, "parquet", "zstd")
+
+        # Então
+        table = parquet.read_table(path)
+        assert table.num_rows == len(car_catalog)
+        assert str(table.schema.field("year").type) == "date32[day]"
+
+    async def test_quando_compressao_nao_se_aplica_ao_formato_entao_erro_e_lancado(
+        self, session_factory, tmp_path
+    ):
+        """
+        Verifica a validação da compressão antes de qualquer consulta.
+
+        Cenário:
+            Exportação em CSV com uma compressão exclusiva do Parquet.
+
+        Dado que:
+            - Um pedido de CSV com compressão "zstd".
+        Quando:
+            - A exportação é iniciada.
+        Então:
+            - Um ValueError é lançado e nenhum arquivo é criado.
+        """
+        # Dado que
+        path = tmp_path / "carros.csv"
+
+        # Quando / Então
+        with pytest.raises(ValueError):
+            await ExportService(session_factory).export(CarQuery(), path, "csv", "zstd")
+        assert not path.exists()
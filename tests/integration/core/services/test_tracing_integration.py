@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.services.tracing import CLIENT, OtlpJsonExporter, tracer
+
+
+@pytest.mark.asyncio
+class TestTracingIntegration:
+    """
+    Testes de integração para o rastreamento das chamadas de ferramentas.
+    """
+
+    @pytest.mark.usefixtures("car_catalog")
+    async def test_quando_ferramenta_busca_carros_entao_trace_tem_repositorio_e_sql(
+        self, session, tmp_path, monkeypatch
+    ):
+        """
+        Verifica a árvore de spans de uma chamada de ferramenta.
+
+        Cenário:
+            Uma busca de carros rastreada.
+
+        Dado que:
+            - O rastreador compartilhado, amostrando todos os traces e
+              gravando em arquivo.
+        Quando:
+            - `CarRepository.search` é executado dentro do span da ferramenta.
+        Então:
+            - O método de repositório é filho do span da ferramenta.
+            - O statement SQL e a conversão para o esquema são filhos do
+              método de repositório.
+        """
+        # Dado que
+        path = tmp_path / "traces.jsonl"
+        monkeypatch.setattr(tracer, "sample_rate", 1.0)
+        monkeypatch.setattr(tracer, "exporter", OtlpJsonExporter(str(path)))
+
+        # Quando
+        with tracer.span("mcp.tool search_cars"):
+            cars = await CarRepository(session).search()
+
+        # Então
+        [line] = path.read_text(encoding="utf-8").splitlines()
+        spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        by_name = {span["name"]: span for span in spans}
+        tool = by_name["mcp.tool search_cars"]
+        search = by_name["CarRepository.search"]
+        statement = by_name["db.statement"]
+        conversion = by_name["schema.convert"]
+        assert search["parentSpanId"] == tool["spanId"]
+        assert statement["parentSpanId"] == search["spanId"]
+        assert statement["kind"] == CLIENT
+        assert conversion["parentSpanId"] == search["spanId"]
+        assert {"key": "rows", "value": {"intValue": str(len(cars))}} in conversion[
+            "attributes"
+        ]
@@ -0,0 +1,118 @@
+import pytest
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.deadline import remaining
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.services.dimension_cache import DimensionCache
+from mcp_car_agent.core.services.warmup import CANONICAL_SEARCHES, WarmUp
+
+
+@pytest.mark.asyncio
+class TestWarmUpIntegration:
+    """
+    Testes de integração para o warm-up do servidor.
+    """
+
+    async def test_quando_warm_up_termina_entao_servidor_fica_pronto_com_dimensoes(
+        self, session_factory, setup_dependencies
+    ):
+        """
+        Verifica que o warm-up carrega as dimensões e só então marca o servidor como pronto.
+
+        Cenário:
+            Inicialização do servidor com um banco já populado.
+
+        Dado que:
+            - O banco possui um fabricante e uma transmissão.
+            - Um warm-up ainda não executado.
+        Quando:
+            - O warm-up é executado.
+        Então:
+            - O warm-up passa de não pronto para pronto e registra sua duração.
+            - O aviso de pronto é dado uma vez, quando `ready` já é verdadeiro.
+            - Fabricante e transmissão estão em cache, indexados por ID.
+        """
+        # Dado que
+        dimensions = DimensionCache()
+        warm_up = WarmUp(dimensions)
+        assert warm_up.ready is False
+        signaled = []
+
+        # Quando
+        duration = await warm_up.run(
+            session_factory, lambda: signaled.append(warm_up.ready)
+        )
+
+        # Então
+        assert warm_up.ready is True
+        assert signaled == [True]
+        assert warm_up.duration == duration > 0
+        manufacturer_id = setup_dependencies["manufacturer_id"]
+        transmission_id = setup_dependencies["transmission_id"]
+        assert dimensions.manufacturers[manufacturer_id].name == "Honda"
+        assert dimensions.transmissions[transmission_id].gearbox_type == "Manual"
+
+    async def test_quando_cache_nao_carregado_entao_listagem_carrega_sob_demanda(
+        self, session_factory, setup_dependencies
+    ):
+        """
+        Verifica que as dimensões são carregadas na primeira listagem se o
+        warm-up ainda não tiver terminado.
+
+        Cenário:
+            Uma listagem de fabricantes chega antes do fim do warm-up.
+
+        Dado que:
+            - Um cache de dimensões vazio.
+        Quando:
+            - `list_manufacturers` é chamado.
+        Então:
+            - O fabricante do banco é retornado e o cache fica carregado.
+        """
+        # Dado que
+        dimensions = DimensionCache()
+
+        # Quando
+        manufacturers = await dimensions.list_manufacturers(session_factory)
+
+        # Então
+        assert [m.id for m in manufacturers] == [setup_dependencies["manufacturer_id"]]
+        assert dimensions.loaded is True
+
+    async def test_quando_buscas_sao_aquecidas_entao_rodam_com_o_prazo_das_ferramentas(
+        self, session_factory, monkeypatch
+    ):
+        """
+        Verifica que o warm-up compila os mesmos statements das requisições.
+
+        Cenário:
+            No MySQL, o prazo da chamada entra no statement como hint.
+
+        Dado que:
+            - As buscas do repositório de carros registram o prazo corrente.
+        Quando:
+            - O warm-up é executado.
+        Então:
+            - Cada busca canônica roda com um prazo novo de
+              `DB_STATEMENT_TIMEOUT`, como a primeira consulta de uma chamada.
+        """
+        # Dado que
+        deadlines = []
+        search = CarRepository.search
+
+        async def recording_search(self, *args, **kwargs):
+            deadlines.append(remaining())
+            return await search(self, *args, **kwargs)
+
+        monkeypatch.setattr(CarRepository, "search", recording_search)
+
+        # Quando
+        await WarmUp(DimensionCache()).run(session_factory)
+
+        # Então
+        assert len(deadlines) == len(CANONICAL_SEARCHES)
+        assert all(
+            0 < seconds <= config.DB_STATEMENT_TIMEOUT
+            and seconds > config.DB_STATEMENT_TIMEOUT - 1
+            for seconds in deadlines
+        )
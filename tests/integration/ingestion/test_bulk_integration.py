@@ -0,0 +1,158 @@
+import pytest
+from sqlalchemy import select
+
+from mcp_car_agent.core.database.change_log import TABLE_ROW
+from mcp_car_agent.core.database.invalidation import InProcessInvalidationBus
+from mcp_car_agent.core.database.models import ChangeLogModel
+from mcp_car_agent.core.database.repository.base_repository import BaseRepository
+from mcp_car_agent.core.database.repository.car_repository import CarRepository
+from mcp_car_agent.core.database.repository.engine_repository import (
+    EngineSpecRepository,
+)
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.engine_schema import Engine, EngineSpec
+from mcp_car_agent.core.schemas.equipment_schema import Equipment
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+from mcp_car_agent.core.services.car_index import CarIndex
+from mcp_car_agent.core.services.snapshot import Snapshot, build
+from mcp_car_agent.ingestion.bulk import BulkImporter
+
+CSV = """name,version,year,manufacturer,gearbox_type,gears_qtde,traction,\
+compression_rate,total_cc,aspiration,gas_type,max_hp,gas,config,doors,spaces
+Civic,Touring,2021-01-01,Honda,CVT,,Dianteira,,1498,Turbo,gasolina,173,Gasolina,Sedã,4,5
+Sem motor,,,Honda,CVT,,,,,,,,,,,
+"""
+
+
+def _corolla(version: str) -> Car:
+    return Car(
+        name="Corolla",
+        version=version,
+        manufacturer=Manufacturer(name="TOYOTA"),
+        transmission=Transmission(gearbox_type="CVT", traction="Dianteira"),
+        engine=Engine(
+            total_cc=1987,
+            aspiration="Natural",
+            engine_specs=EngineSpec(gas_type="gasolina/alcool", max_hp=177),
+        ),
+        equipments=[
+            Equipment(category="Conforto", description="Ar digital"),
+            Equipment(category="Segurança", description="7 airbags"),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+class TestBulkIntegration:
+    """
+    Testes de integração da importação em massa (fallback com INSERTs do SQLite).
+    """
+
+    async def test_quando_arquivos_sao_importados_entao_catalogo_e_mesclado(
+        self, session, session_factory, tmp_path
+    ):
+        """
+        Verifica a importação de JSONL e CSV com resolução das chaves em SQL.
+
+        Cenário:
+            Importação em blocos de 1 carro sobre um banco que já tem a Toyota.
+
+        Dado que:
+            - O fabricante "Toyota" já existe.
+            - Um JSONL com duas versões do Corolla (fabricante "TOYOTA").
+            - Um CSV com o Civic e uma linha sem motor.
+        Quando:
+            - Os dois arquivos são importados.
+        Então:
+            - Os dois Corollas usam a Toyota existente e o mesmo motor.
+            - O Civic é criado com a sua especificação; a linha sem motor é descartada.
+            - Cada motor tem uma especificação e cada Corolla dois equipamentos.
+            - Carros criados depois da importação recebem IDs novos.
+        """
+        # Dado que
+        [toyota] = await ManufacturerRepository(session).create_many(
+            [Manufacturer(name="Toyota")]
+        )
+        (tmp_path / "catalogo.jsonl").write_text(
+            "\n".join(_corolla(v).model_dump_json() for v in ("XEi", "Altis")) + "\n"
+        )
+        (tmp_path / "catalogo.csv").write_text(CSV)
+
+        # Quando
+        report = await BulkImporter(session_factory, chunk_size=1).run(
+            [tmp_path / "catalogo.jsonl", tmp_path / "catalogo.csv"]
+        )
+
+        # Então
+        assert report == {
+            "rejected": 1,
+            "manufacturer": 1,
+            "transmission": 1,
+            "engine": 2,
+            "engine_specs": 2,
+            "car": 3,
+            "equipment": 4,
+            "car_specs": 1,
+        }
+        cars = await CarRepository(session).get_many([1, 2, 3])
+        corollas = [car for car in cars if car.name == "Corolla"]
+        assert {car.manufacturer.id for car in corollas} == {toyota.id}
+        assert len({car.engine.id for car in corollas}) == 1
+        assert all(len(car.equipments) == 2 for car in corollas)
+        [civic] = [car for car in cars if car.name == "Civic"]
+        assert (civic.car_specs[0].doors, civic.engine.engine_specs.max_hp) == (4, 173)
+        assert len(await EngineSpecRepository(session).search()) == 2
+        new = corollas[0].model_copy(update={"id": None, "name": "Novo"})
+        await CarRepository(session).create_many([new])
+        assert new.id == 4
+
+    async def test_quando_importacao_termina_entao_tabelas_sao_invalidadas_por_inteiro(
+        self, session_factory, car_catalog, tmp_path, monkeypatch
+    ):
+        """
+        Verifica que a importação não registra nem publica cada ID criado.
+
+        Cenário:
+            Um nó com o índice de carros carregado de um snapshot e uma
+            importação em massa posterior.
+
+        Dado que:
+            - Um índice carregado do snapshot do catálogo com três carros.
+            - Um handler inscrito em um barramento de invalidação isolado.
+        Quando:
+            - Duas versões do Corolla são importadas.
+        Então:
+            - O `change_log` recebe uma linha `TABLE_ROW` por tabela alterada.
+            - Os eventos publicados não têm IDs.
+            - O índice relê a tabela e encontra os carros importados.
+        """
+        # Dado que
+        path = tmp_path / "catalogo.snap"
+        await build(session_factory, path)
+        index = CarIndex()
+        with Snapshot(path) as snapshot:
+            index.load(snapshot)
+        events, bus = [], InProcessInvalidationBus()
+        bus.subscribe(events.append)
+        monkeypatch.setattr(BaseRepository, "bus", bus)
+
+        # Quando
+        await BulkImporter(session_factory).load([_corolla("XEi"), _corolla("Altis")])
+
+        # Então
+        async with session_factory() as session:
+            query = select(ChangeLogModel.table_name, ChangeLogModel.row_id)
+            logged = (await session.exec(query)).all()
+        assert sorted(logged) == sorted(
+            (table, TABLE_ROW)
+            for table in ("manufacturer", "transmission", "engine", "engine_specs")
+            + ("car", "equipment")
+        )
+        assert {event.table for event in events} >= {"car", "equipment"}
+        assert all(event.ids == [] for event in events)
+        await index.catch_up(session_factory)
+        assert len(index.rows) == len(car_catalog) + 2
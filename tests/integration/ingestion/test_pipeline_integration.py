@@ -0,0 +1,352 @@
+import asyncio
+from collections import Counter
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from mcp_car_agent.core import config
+from mcp_car_agent.core.database.repository.car_repository import (
+    CarRepository,
+    CarSpecsRepository,
+)
+from mcp_car_agent.core.database.repository.engine_repository import (
+    EngineRepository,
+    EngineSpecRepository,
+)
+from mcp_car_agent.core.database.repository.manufacturer_repository import (
+    ManufacturerRepository,
+)
+from mcp_car_agent.core.database.repository.source_page_repository import (
+    SourcePageRepository,
+)
+from mcp_car_agent.ingestion.loader import CatalogLoader
+from mcp_car_agent.ingestion.pipeline import IngestionPipeline, discover
+from mcp_car_agent.scraper.http_fetcher import HttpFetcher
+from mcp_car_agent.scraper.parser import ParseStage
+from mcp_car_agent.scraper.rate_limit import HostLimiter
+from mcp_car_agent.scraper.scraper import Scraper
+
+FIXTURE_PAGES = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+
+CAR_PAGES = [
+    "/carros/toyota-corolla-xei-2022.html",
+    "/carros/honda-civic-touring-2021.html",
+    "/carros/chevrolet-cruze-ltz-2020.html",
+]
+
+
+@pytest_asyncio.fixture(name="scraper")
+async def setup_scraper():
+    """Fornece um scraper rápido (sem backoff) sobre o cliente HTTP real."""
+    fetcher = HttpFetcher()
+    scraper = Scraper(fetcher, HostLimiter(concurrency=2, rate=1000))
+    scraper.backoff = 0
+    yield scraper
+    await fetcher.close()
+
+
+@pytest.fixture(name="parser")
+def setup_parser():
+    """Fornece uma etapa de interpretação com um único processo."""
+    stage = ParseStage(workers=1)
+    yield stage
+    stage.close()
+
+
+class SlowLoader:
+    """
+    Carregador que simula um banco lento e registra quantas páginas já
+    tinham sido pedidas ao site a cada lote gravado.
+    """
+
+    def __init__(self, site):
+        self.site = site
+        self.loaded = 0
+        self.ahead = []
+
+    async def fingerprints(self, _):
+        """Nenhuma página é conhecida."""
+        return {}
+
+    async def load(self, records):
+        """Grava o lote após um atraso, registrando o avanço do fetch."""
+        await asyncio.sleep(0.02)
+        self.loaded += len(records)
+        self.ahead.append(len(self.site.requests) - self.loaded)
+        return Counter()
+
+
+@pytest.mark.asyncio
+class TestPipelineIntegration:
+    """
+    Testes de integração do pipeline de ingestão contra o site local de fixtures.
+    """
+
+    async def test_quando_catalogo_e_ingerido_entao_carros_sao_gravados(
+        self, scraper, parser, fixture_site, session, session_factory
+    ):
+        """
+        Verifica a ingestão completa a partir da página de listagem.
+
+        Cenário:
+            Ingestão do catálogo de fixture com lotes de 2 carros.
+
+        Dado que:
+            - Um site local com uma listagem e três fichas técnicas.
+        Quando:
+            - As fichas são descobertas pela listagem e o pipeline é executado.
+        Então:
+            - Os três carros são gravados com equipamentos e especificações.
+            - Cada etapa do relatório processou os três carros.
+        """
+        # Dado que
+        loader = CatalogLoader(session_factory)
+        pipeline = IngestionPipeline(scraper, parser, loader, batch_size=2)
+
+        # Quando
+        urls = await discover(scraper, [fixture_site.base_url + "/index.html"])
+        report = await pipeline.run(urls)
+
+        # Então
+        cars = await CarRepository(session).get_many([1, 2, 3])
+        assert sorted(car.name for car in cars) == ["Civic", "Corolla", "Cruze"]
+        assert all(car.equipments and car.car_specs for car in cars)
+        assert all(car.engine.engine_specs for car in cars)
+        assert len(await ManufacturerRepository(session).search()) == 3
+        assert {name: s.items for name, s in report.stages.items()} == {
+            "fetch": 3,
+            "parse": 3,
+            "normalize": 3,
+            "load": 3,
+        }
+
+    async def test_quando_banco_e_lento_entao_fetch_espera_pela_carga(
+        self, scraper, parser, fixture_site, monkeypatch
+    ):
+        """
+        Verifica o backpressure quando a carga no banco é o gargalo.
+
+        Cenário:
+            Ingestão de 30 páginas com um banco lento e filas de 2 itens.
+
+        Dado que:
+            - Filas com capacidade 2, lotes de 1 carro e até 2 requisições pendentes.
+            - Um carregador que leva 20ms por lote.
+        Quando:
+            - O pipeline é executado.
+        Então:
+            - Todos os 30 carros são gravados.
+            - Nenhuma fila passa da capacidade.
+            - O fetch nunca fica mais que filas + requisições pendentes à
+              frente da carga.
+        """
+        # Dado que
+        monkeypatch.setattr(config, "INGEST_QUEUE_SIZE", 2)
+        monkeypatch.setattr(config, "INGEST_PARSE_CONCURRENCY", 1)
+        monkeypatch.setattr(config, "SCRAPER_MAX_CONNECTIONS", 2)
+        loader = SlowLoader(fixture_site)
+        pipeline = IngestionPipeline(scraper, parser, loader, batch_size=1)
+        urls = (fixture_site.base_url + CAR_PAGES[i % 3] for i in range(30))
+
+        # Quando
+        report = await pipeline.run(urls)
+
+        # Então
+        assert loader.loaded == 30
+        assert all(queue.max_depth <= 2 for queue in report.queues.values())
+        assert max(loader.ahead) <= 3 * 2 + 1 + 2 + 1
+
+    async def test_quando_catalogo_e_reingerido_sem_mudancas_entao_nada_e_escrito(
+        self, scraper, parser, fixture_site, session, session_factory
+    ):
+        """
+        Verifica que páginas não modificadas são descartadas pelo ETag.
+
+        Cenário:
+            Segunda ingestão do mesmo catálogo, sem alterações no site.
+
+        Dado que:
+            - O catálogo de fixture já foi ingerido uma vez.
+        Quando:
+            - O pipeline é executado novamente com as mesmas URLs.
+        Então:
+            - As três páginas respondem 304 e são contadas como não modificadas.
+            - Nenhum carro é interpretado ou gravado de novo.
+        """
+        # Dado que
+        loader = CatalogLoader(session_factory)
+        urls = [fixture_site.base_url + page for page in CAR_PAGES]
+        await IngestionPipeline(scraper, parser, loader).run(urls)
+
+        # Quando
+        report = await IngestionPipeline(scraper, parser, loader).run(urls)
+
+        # Então
+        assert report.skipped["pages_not_modified"] == 3
+        assert report.stages["parse"].items == 0
+        assert len(await CarRepository(session).search()) == 3
+
+    async def test_quando_apenas_equipamentos_mudam_entao_so_eles_sao_regravados(
+        self, scraper, parser, fixture_site, session, session_factory
+    ):
+        """
+        Verifica a regravação apenas das partes alteradas de um carro.
+
+        Cenário:
+            Após a primeira ingestão, o Corolla ganha um equipamento novo e a
+            página do Civic muda apenas na formatação.
+
+        Dado que:
+            - O catálogo de fixture já foi ingerido uma vez.
+            - A página do Corolla tem um equipamento a mais.
+            - A página do Civic tem espaços a mais (ETag diferente, mesmo conteúdo).
+        Quando:
+            - O pipeline é executado novamente.
+        Então:
+            - O Cruze é descartado pelo ETag e o Civic pelo hash do conteúdo.
+            - O carro, o motor, o fabricante e a transmissão do Corolla não são
+              regravados; apenas sua lista de equipamentos é substituída.
+            - O Corolla mantém o ID e passa a ter 5 equipamentos.
+        """
+        # Dado que
+        loader = CatalogLoader(session_factory)
+        urls = [fixture_site.base_url + page for page in CAR_PAGES]
+        await IngestionPipeline(scraper, parser, loader).run(urls)
+        corolla = (FIXTURE_PAGES / CAR_PAGES[0].lstrip("/")).read_bytes()
+        civic = (FIXTURE_PAGES / CAR_PAGES[1].lstrip("/")).read_bytes()
+        fixture_site.overrides[CAR_PAGES[0]] = corolla.replace(
+            b"</ul>", b'<li data-category="Conforto">Bancos de couro</li></ul>'
+        )
+        fixture_site.overrides[CAR_PAGES[1]] = civic.replace(b"<h1>", b"<h1>   ")
+
+        # Quando
+        report = await IngestionPipeline(scraper, parser, loader).run(urls)
+
+        # Então
+        assert report.skipped["pages_not_modified"] == 1
+        assert report.skipped["pages_unchanged"] == 1
+        for table in ("car", "engine", "manufacturer", "transmission", "car_specs"):
+            assert report.skipped[table] == 1
+        assert report.skipped["equipment"] == 0
+        cars = await CarRepository(session).search(filters={"name": "Corolla"})
+        corolla_car = (await CarRepository(session).get_many([cars[0].id]))[0]
+        assert len(cars) == 1
+        assert len(corolla_car.equipments) == 5
+        assert len(await EngineRepository(session).search()) == 3
+
+    async def test_quando_especificacao_do_motor_muda_entao_carro_passa_a_outro_motor(
+        self, scraper, parser, fixture_site, session, session_factory
+    ):
+        """
+        Verifica que uma especificação diferente não sobrescreve a de um motor
+        que pode ser compartilhado por outros carros.
+
+        Cenário:
+            Após a primeira ingestão, a potência do Corolla é corrigida na
+            página, sem mudar a taxa de compressão, a cilindrada ou a aspiração.
+
+        Dado que:
+            - O catálogo de fixture já foi ingerido uma vez.
+            - A página do Corolla informa 180 cv em vez de 177 cv.
+        Quando:
+            - O pipeline é executado novamente.
+        Então:
+            - O Corolla passa a um motor com 180 cv.
+            - O motor anterior mantém a sua especificação de 177 cv.
+        """
+        # Dado que
+        loader = CatalogLoader(session_factory)
+        urls = [fixture_site.base_url + page for page in CAR_PAGES]
+        await IngestionPipeline(scraper, parser, loader).run(urls)
+        [car] = await CarRepository(session).search(filters={"name": "Corolla"})
+        [before] = await CarRepository(session).get_many([car.id])
+        corolla = (FIXTURE_PAGES / CAR_PAGES[0].lstrip("/")).read_bytes()
+        fixture_site.overrides[CAR_PAGES[0]] = corolla.replace(b"177 cv", b"180 cv")
+
+        # Quando
+        await IngestionPipeline(scraper, parser, loader).run(urls)
+
+        # Então
+        [after] = await CarRepository(session).get_many([car.id])
+        specs = await EngineSpecRepository(session).by_engine(
+            [before.engine.id, after.engine.id]
+        )
+        assert after.engine.id != before.engine.id
+        assert specs[after.engine.id].max_hp == 180
+        assert specs[before.engine.id].max_hp == 177
+
+    async def test_quando_pagina_nao_pode_ser_interpretada_entao_demais_sao_gravadas(
+        self, scraper, parser, fixture_site, session, session_factory, monkeypatch
+    ):
+        """
+        Verifica que uma página malformada não interrompe a ingestão.
+
+        Cenário:
+            A interpretação da ficha do Civic falha.
+
+        Dado que:
+            - O parser levanta uma exceção para a página do Civic.
+        Quando:
+            - O pipeline é executado.
+        Então:
+            - O Corolla e o Cruze são gravados.
+            - A falha é contada em `pages_failed`.
+        """
+        # Dado que
+        parse = parser.parse
+
+        async def failing_parse(response):
+            if response.url.endswith(CAR_PAGES[1]):
+                raise AttributeError("'NoneType' object has no attribute 'get_text'")
+            return await parse(response)
+
+        monkeypatch.setattr(parser, "parse", failing_parse)
+        urls = [fixture_site.base_url + page for page in CAR_PAGES]
+
+        # Quando
+        report = await IngestionPipeline(
+            scraper, parser, CatalogLoader(session_factory)
+        ).run(urls)
+
+        # Então
+        cars = await CarRepository(session).search()
+        assert sorted(car.name for car in cars) == ["Corolla", "Cruze"]
+        assert report.skipped["pages_failed"] == 1
+
+    async def test_quando_carga_falha_no_meio_do_lote_entao_nada_do_lote_e_gravado(
+        self, scraper, parser, fixture_site, session, session_factory, monkeypatch
+    ):
+        """
+        Verifica que cada lote é gravado em uma única transação.
+
+        Cenário:
+            A gravação das especificações dos carros falha.
+
+        Dado que:
+            - As especificações são a última tabela do carro gravada no lote.
+            - A gravação delas levanta uma exceção.
+        Quando:
+            - O pipeline é executado.
+        Então:
+            - A exceção é propagada.
+            - Nenhum carro, fabricante ou página de origem fica gravado.
+        """
+
+        # Dado que
+        async def failing_create_many(*_):
+            raise RuntimeError("conexão perdida")
+
+        monkeypatch.setattr(CarSpecsRepository, "create_many", failing_create_many)
+        urls = [fixture_site.base_url + page for page in CAR_PAGES]
+
+        # Quando
+        with pytest.raises(RuntimeError):
+            await IngestionPipeline(
+                scraper, parser, CatalogLoader(session_factory)
+            ).run(urls)
+
+        # Então
+        assert await CarRepository(session).search() == []
+        assert await ManufacturerRepository(session).search() == []
+        assert await SourcePageRepository(session).get_many(urls) == {}
@@ -0,0 +1,53 @@
+import pytest
+from sqlmodel import func, select
+
+from mcp_car_agent.core.database.models import (
+    CarModel,
+    EngineModel,
+    EngineSpecModel,
+    EquipmentModel,
+)
+from mcp_car_agent.ingestion.bulk import BulkImporter
+from mcp_car_agent.ingestion.synthetic import CatalogGenerator
+
+
+@pytest.mark.asyncio
+class TestSyntheticIntegration:
+    """
+    Testes de integração da carga do catálogo sintético.
+    """
+
+    async def test_quando_catalogo_sintetico_e_carregado_entao_dimensoes_sao_compartilhadas(
+        self, session, session_factory
+    ):
+        """
+        Verifica a carga do catálogo sintético pela importação em massa.
+
+        Cenário:
+            Um banco local populado para benchmarks.
+
+        Dado que:
+            - 200 carros gerados com a semente 3.
+        Quando:
+            - Os carros são carregados em blocos de 50.
+        Então:
+            - Todos os carros e equipamentos são inseridos.
+            - Os motores são compartilhados entre os carros, cada um com uma
+              especificação.
+        """
+        # Dado que
+        cars = list(CatalogGenerator(seed=3).cars(200))
+
+        # Quando
+        report = await BulkImporter(session_factory, chunk_size=50).load(cars)
+
+        # Então
+        assert report["car"] == 200
+        assert report["equipment"] == sum(len(car.equipments) for car in cars)
+        counts = {
+            model: (await session.exec(select(func.count()).select_from(model))).one()
+            for model in (CarModel, EquipmentModel, EngineModel, EngineSpecModel)
+        }
+        assert counts[CarModel] == 200
+        assert counts[EquipmentModel] == report["equipment"]
+        assert counts[EngineModel] == counts[EngineSpecModel] < 200
@@ -0,0 +1,62 @@
+import pytest
+
+from mcp_car_agent.scraper.cached_fetcher import CachedFetcher
+from mcp_car_agent.scraper.http_fetcher import HttpFetcher
+from mcp_car_agent.scraper.rate_limit import HostLimiter
+from mcp_car_agent.scraper.response_cache import ResponseCache
+from mcp_car_agent.scraper.scraper import Scraper
+
+CAR_PAGES = [
+    "/carros/toyota-corolla-xei-2022.html",
+    "/carros/honda-civic-touring-2021.html",
+    "/carros/chevrolet-cruze-ltz-2020.html",
+]
+
+
+@pytest.mark.asyncio
+class TestCachedFetcherIntegration:
+    """
+    Testes de integração do cache em disco contra o site local de fixtures.
+    """
+
+    async def test_quando_catalogo_e_reprocessado_offline_entao_site_nao_e_acessado(
+        self, fixture_site, tmp_path
+    ):
+        """
+        Verifica que um crawl gravado pode ser repetido sem rede.
+
+        Cenário:
+            Crawl do catálogo online e, depois, o mesmo crawl em modo somente replay.
+
+        Dado que:
+            - Um crawl online das três fichas, gravando no cache em disco.
+        Quando:
+            - O mesmo crawl é feito com um novo cliente em modo somente replay.
+        Então:
+            - As três páginas são devolvidas com o mesmo conteúdo.
+            - O site não recebe nenhuma requisição nova.
+        """
+        # Dado que
+        urls = [fixture_site.base_url + page for page in CAR_PAGES]
+        online = CachedFetcher(HttpFetcher(), ResponseCache(tmp_path, 10**7))
+        recorded = {
+            r.url: r.body
+            async for r in Scraper(online, HostLimiter(2, 1000)).crawl(urls)
+        }
+        await online.close()
+        requests = len(fixture_site.requests)
+
+        # Quando
+        offline = CachedFetcher(
+            HttpFetcher(), ResponseCache(tmp_path, 10**7), offline=True
+        )
+        replayed = {
+            r.url: r.body
+            async for r in Scraper(offline, HostLimiter(2, 1000)).crawl(urls)
+        }
+        await offline.close()
+
+        # Então
+        assert replayed == recorded
+        assert len(replayed) == 3
+        assert len(fixture_site.requests) == requests
@@ -0,0 +1,49 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from mcp_car_agent.core.interfaces.fetcher import FetchResponse
+from mcp_car_agent.scraper.parser import ParseStage
+
+FIXTURE_PAGES = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+
+
+@pytest.mark.asyncio
+class TestParseStageIntegration:
+    """
+    Testes de integração da etapa de interpretação em pool de processos.
+    """
+
+    async def test_quando_paginas_sao_enviadas_ao_pool_entao_carros_sao_retornados(
+        self,
+    ):
+        """
+        Verifica que as páginas são interpretadas nos processos do pool.
+
+        Cenário:
+            Interpretação concorrente das três fichas técnicas de fixture.
+
+        Dado que:
+            - Uma etapa de interpretação com 2 processos.
+        Quando:
+            - As três páginas são interpretadas ao mesmo tempo.
+        Então:
+            - Os três carros são retornados, na ordem das páginas.
+        """
+        # Dado que
+        stage = ParseStage(workers=2)
+        pages = sorted((FIXTURE_PAGES / "carros").glob("*.html"))
+        responses = [
+            FetchResponse(url=page.name, status=200, body=page.read_bytes())
+            for page in pages
+        ]
+
+        # Quando
+        try:
+            cars = await asyncio.gather(*(stage.parse(r) for r in responses))
+        finally:
+            stage.close()
+
+        # Então
+        assert [car.name for car in cars] == ["Cruze", "Civic", "Corolla"]
@@ -0,0 +1,114 @@
+import pytest
+import pytest_asyncio
+
+from mcp_car_agent.scraper.http_fetcher import HttpFetcher
+from mcp_car_agent.scraper.rate_limit import HostLimiter
+from mcp_car_agent.scraper.scraper import Scraper
+
+CAR_PAGES = [
+    "/carros/toyota-corolla-xei-2022.html",
+    "/carros/honda-civic-touring-2021.html",
+    "/carros/chevrolet-cruze-ltz-2020.html",
+]
+
+
+@pytest_asyncio.fixture(name="scraper")
+async def setup_scraper():
+    """Fornece um scraper rápido (sem backoff) sobre o cliente HTTP real."""
+    fetcher = HttpFetcher()
+    scraper = Scraper(fetcher, HostLimiter(concurrency=2, rate=1000))
+    scraper.backoff = 0
+    yield scraper
+    await fetcher.close()
+
+
+@pytest.mark.asyncio
+class TestScraperIntegration:
+    """
+    Testes de integração do scraper contra um site local de fixtures.
+    """
+
+    async def test_quando_crawl_de_varias_paginas_entao_conexoes_sao_reaproveitadas(
+        self, scraper, fixture_site
+    ):
+        """
+        Verifica que o scraper obtém todas as páginas reaproveitando conexões
+        e sem ultrapassar o limite de concorrência do host.
+
+        Cenário:
+            Crawl de 30 páginas de um mesmo host.
+
+        Dado que:
+            - Um site local com latência de 10ms por resposta.
+            - Um scraper limitado a 2 requisições simultâneas por host.
+        Quando:
+            - `crawl` é chamado com 30 URLs.
+        Então:
+            - Todas as 30 respostas têm status 200.
+            - O site nunca atende mais de 2 requisições ao mesmo tempo.
+            - No máximo 2 conexões TCP são abertas (keep-alive).
+        """
+        # Dado que
+        fixture_site.latency = 0.01
+        urls = [fixture_site.base_url + CAR_PAGES[i % 3] for i in range(30)]
+
+        # Quando
+        responses = [response async for response in scraper.crawl(urls)]
+
+        # Então
+        assert [r.status for r in responses] == [200] * 30
+        assert fixture_site.max_in_flight <= 2
+        assert len(fixture_site.connections) <= 2
+
+    async def test_quando_pagina_falha_transitoriamente_entao_nova_tentativa_tem_sucesso(
+        self, scraper, fixture_site
+    ):
+        """
+        Verifica as novas tentativas para respostas 503.
+
+        Cenário:
+            A página responde 503 duas vezes antes de responder normalmente.
+
+        Dado que:
+            - O site local falha duas vezes para a página do Corolla.
+        Quando:
+            - `fetch` é chamado para a página.
+        Então:
+            - A resposta final tem status 200 e o conteúdo da página.
+            - O site recebeu três requisições para a página.
+        """
+        # Dado que
+        fixture_site.failures[CAR_PAGES[0]] = 2
+
+        # Quando
+        response = await scraper.fetch(fixture_site.base_url + CAR_PAGES[0])
+
+        # Então
+        assert response.status == 200
+        assert b"Corolla" in response.body
+        assert fixture_site.requests == [CAR_PAGES[0]] * 3
+
+    async def test_quando_host_inacessivel_entao_pagina_e_ignorada_no_crawl(
+        self, scraper, fixture_site
+    ):
+        """
+        Verifica que uma página inacessível não interrompe o crawl.
+
+        Cenário:
+            Uma das URLs aponta para uma porta sem servidor.
+
+        Dado que:
+            - Uma URL válida do site local e uma URL de host inacessível.
+        Quando:
+            - `crawl` é chamado com as duas URLs.
+        Então:
+            - Apenas a resposta da URL válida é entregue.
+        """
+        # Dado que
+        urls = ["http://127.0.0.1:9/inexistente", fixture_site.base_url + CAR_PAGES[1]]
+
+        # Quando
+        responses = [response async for response in scraper.crawl(urls)]
+
+        # Então
+        assert [r.url for r in responses] == [urls[1]]
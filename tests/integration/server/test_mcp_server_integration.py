@@ -0,0 +1,145 @@
+import pytest
+from fastmcp import Client
+
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.core.services.dimension_cache import DimensionCache
+from mcp_car_agent.server.mcp_server import catalog_service, mcp
+
+
+@pytest.fixture(name="mcp_client")
+def setup_mcp_client(monkeypatch, session_factory):
+    """Fornece um cliente MCP em memória ligado ao banco de testes."""
+
+    async def test_session_factory():
+        return session_factory
+
+    monkeypatch.setattr(ConnectionRepository, "session_factory", test_session_factory)
+    return Client(mcp)
+
+
+@pytest.mark.asyncio
+class TestMcpServerIntegration:
+    """
+    Testes de integração para as ferramentas do servidor MCP.
+    """
+
+    async def test_quando_batch_search_e_chamado_entao_todas_as_consultas_sao_respondidas(
+        self, mcp_client, car_catalog
+    ):
+        """
+        Verifica se a ferramenta `batch_search` responde várias consultas em uma chamada.
+
+        Cenário:
+            O agente compara dois carros.
+
+        Dado que:
+            - O catálogo possui Corolla, Civic e Cruze.
+        Quando:
+            - A ferramenta `batch_search` é chamada com duas consultas.
+        Então:
+            - A resposta contém um resultado por consulta.
+        """
+        # Quando
+        async with mcp_client:
+            result = await mcp_client.call_tool(
+                "batch_search",
+                {
+                    "queries": [
+                        {"filters": {"name": "Civic"}},
+                        {"filters": {"name": "Cruze"}},
+                    ]
+                },
+            )
+
+        # Então
+        names = [
+            [car["name"] for car in cars]
+            for cars in result.structured_content["result"]
+        ]
+        assert names == [["Civic"], ["Cruze"]]
+
+    async def test_quando_get_cars_e_chamado_entao_detalhes_completos_sao_retornados(
+        self, mcp_client, car_catalog
+    ):
+        """
+        Verifica se a ferramenta `get_cars` retorna os detalhes completos dos carros.
+
+        Cenário:
+            O agente pede os detalhes de um carro encontrado na busca.
+
+        Dado que:
+            - O catálogo possui três carros.
+        Quando:
+            - A ferramenta `get_cars` é chamada com o ID do primeiro carro.
+        Então:
+            - O carro retornado inclui o fabricante e os equipamentos.
+        """
+        # Quando
+        async with mcp_client:
+            result = await mcp_client.call_tool(
+                "get_cars", {"ids": [car_catalog[0].id]}
+            )
+
+        # Então
+        (car,) = result.structured_content["result"]
+        assert car["manufacturer"]["name"] == "Honda"
+        assert car["equipments"][0]["description"] == "Airbag"
+
+    async def test_quando_list_manufacturers_e_chamado_entao_fabricantes_sao_retornados(
+        self, mcp_client, setup_dependencies, monkeypatch
+    ):
+        """
+        Verifica se a ferramenta `list_manufacturers` expõe os fabricantes com seus IDs.
+
+        Cenário:
+            O agente precisa do ID de um fabricante para montar um filtro.
+
+        Dado que:
+            - O banco possui o fabricante Honda.
+            - O cache de dimensões do servidor ainda não foi carregado.
+        Quando:
+            - A ferramenta `list_manufacturers` é chamada.
+        Então:
+            - A Honda é retornada com o seu ID.
+        """
+        # Dado que
+        monkeypatch.setattr(
+            "mcp_car_agent.server.mcp_server.dimensions", DimensionCache()
+        )
+
+        # Quando
+        async with mcp_client:
+            result = await mcp_client.call_tool("list_manufacturers", {})
+
+        # Então
+        assert result.structured_content["result"] == [
+            {"id": setup_dependencies["manufacturer_id"], "name": "Honda"}
+        ]
+
+    @pytest.mark.usefixtures("mcp_client")
+    async def test_quando_ferramentas_sao_chamadas_entao_servico_de_catalogo_e_unico(
+        self, session_factory
+    ):
+        """
+        Verifica que as chamadas compartilham o limite de concorrência.
+
+        Cenário:
+            Duas chamadas de ferramenta obtêm o serviço de catálogo.
+
+        Dado que:
+            - O servidor usa o banco de testes.
+        Quando:
+            - O serviço de catálogo é obtido duas vezes.
+        Então:
+            - As duas chamadas recebem o mesmo serviço (e o mesmo semáforo),
+              ligado ao pool compartilhado.
+        """
+        # Quando
+        first = await catalog_service()
+        second = await catalog_service()
+
+        # Então
+        assert first is second
+        assert first.session_factory is session_factory
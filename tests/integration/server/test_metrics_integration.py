@@ -0,0 +1,104 @@
+import httpx
+import pytest
+from fastmcp import Client
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from mcp_car_agent.core.database.instrumentation import MeteredQueuePool
+from mcp_car_agent.core.database.repository.connection_repository import (
+    ConnectionRepository,
+)
+from mcp_car_agent.server.mcp_server import mcp
+from mcp_car_agent.server.metrics import ServerMetrics
+
+
+@pytest.mark.asyncio
+class TestMetricsIntegration:
+    """
+    Testes de integração para as métricas do servidor MCP.
+    """
+
+    @pytest.mark.usefixtures("car_catalog")
+    async def test_quando_ferramenta_e_chamada_entao_metrics_expoe_a_chamada(
+        self, monkeypatch, session_factory
+    ):
+        """
+        Verifica o endpoint `/metrics` após uma chamada de ferramenta.
+
+        Cenário:
+            O Prometheus coleta as métricas depois de uma busca do agente.
+
+        Dado que:
+            - O servidor ligado ao banco de testes, com o catálogo.
+        Quando:
+            - A ferramenta `search_cars` é chamada.
+            - `/metrics` é requisitado.
+        Então:
+            - A resposta está no formato texto do Prometheus.
+            - A chamada e a latência do repositório aparecem na coleta.
+        """
+
+        # Dado que
+        async def test_session_factory():
+            return session_factory
+
+        monkeypatch.setattr(
+            ConnectionRepository, "session_factory", test_session_factory
+        )
+        transport = httpx.ASGITransport(app=mcp.http_app())
+
+        # Quando
+        async with Client(mcp) as client:
+            await client.call_tool(
+                "search_cars", {"query": {"filters": {"name": "Civic"}}}
+            )
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://mcp"
+        ) as http:
+            response = await http.get("/metrics")
+
+        # Então
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'mcp_tool_requests_total{tool="search_cars",status="ok"}' in response.text
+        )
+        assert (
+            'mcp_repository_duration_seconds_count{method="CarRepository.search"}'
+            in response.text
+        )
+
+    async def test_quando_pool_e_medido_entao_coleta_traz_uso_e_espera(self, tmp_path):
+        """
+        Verifica as métricas do pool de conexões.
+
+        Cenário:
+            Um motor com o pool instrumentado atende duas consultas.
+
+        Dado que:
+            - Um motor SQLite em arquivo com `MeteredQueuePool`.
+        Quando:
+            - Duas consultas são executadas, uma delas com a conexão ainda aberta
+              no momento da coleta.
+        Então:
+            - A espera foi medida nas duas retiradas de conexão.
+            - A coleta mostra uma conexão em uso.
+        """
+        # Dado que
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=MeteredQueuePool
+        )
+        pool = engine.sync_engine.pool
+
+        # Quando
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            lines = ServerMetrics().render(pool).splitlines()
+        await engine.dispose()
+
+        # Então
+        assert pool.wait.count == 2
+        assert "mcp_db_pool_checked_out 1" in lines
+        assert "mcp_db_pool_wait_seconds_count 2" in lines
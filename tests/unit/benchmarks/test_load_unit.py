@@ -0,0 +1,146 @@
+import json
+import random
+
+import pytest
+
+from mcp_car_agent.benchmarks.load import StageStats, load_recording, pool_samples
+
+METRICS = """# HELP mcp_db_pool_size Conexões permanentes do pool.
+# TYPE mcp_db_pool_size gauge
+mcp_db_pool_size 5
+mcp_db_pool_checked_out 3
+mcp_db_pool_wait_seconds_bucket{le="0.001"} 7
+mcp_db_pool_wait_seconds_sum 0.5
+mcp_db_pool_wait_seconds_count 10
+mcp_tool_in_flight{tool="search_cars"} 2
+"""
+
+
+class TestLoadUnit:
+    """
+    Testes unitários para o teste de carga do servidor MCP.
+    """
+
+    def test_quando_metricas_sao_coletadas_entao_amostras_do_pool_sao_lidas(self):
+        """
+        Verifica a leitura das métricas do pool em uma coleta do Prometheus.
+
+        Cenário:
+            Uma coleta com métricas do pool e de ferramentas.
+
+        Dado que:
+            - O texto de uma coleta.
+        Quando:
+            - As amostras do pool são extraídas.
+        Então:
+            - Apenas as amostras sem rótulos do pool são retornadas.
+        """
+        # Quando
+        samples = pool_samples(METRICS)
+
+        # Então
+        assert samples == {
+            "mcp_db_pool_size": 5.0,
+            "mcp_db_pool_checked_out": 3.0,
+            "mcp_db_pool_wait_seconds_sum": 0.5,
+            "mcp_db_pool_wait_seconds_count": 10.0,
+        }
+
+    def test_quando_coleta_junta_varios_workers_entao_amostras_do_pool_sao_somadas(
+        self,
+    ):
+        """
+        Verifica a soma das métricas do pool das coletas de vários workers.
+
+        Cenário:
+            As coletas de 2 workers, lidas de portas de métricas distintas.
+
+        Dado que:
+            - O texto das coletas dos 2 workers, concatenado.
+        Quando:
+            - As amostras do pool são extraídas.
+        Então:
+            - Cada amostra é a soma das dos 2 workers.
+        """
+        # Quando
+        samples = pool_samples(METRICS + METRICS)
+
+        # Então
+        assert samples["mcp_db_pool_size"] == 10.0
+        assert samples["mcp_db_pool_checked_out"] == 6.0
+        assert samples["mcp_db_pool_wait_seconds_count"] == 20.0
+
+    def test_quando_estagio_termina_entao_resumo_inclui_erros_e_espera_do_pool(self):
+        """
+        Verifica o resumo de um estágio.
+
+        Cenário:
+            Um estágio com 4 chamadas, uma delas com erro.
+
+        Dado que:
+            - As latências, o erro e o pico do pool medidos no estágio.
+            - Coletas das métricas antes e depois do estágio.
+        Quando:
+            - O estágio é resumido.
+        Então:
+            - A vazão, a taxa de erros e a espera média pelo pool são
+              calculadas.
+        """
+        # Dado que
+        stats = StageStats()
+        stats.latencies = [0.01, 0.02, 0.03, 0.04]
+        stats.errors = 1
+        stats.pool_peak = 3
+        before = {"mcp_db_pool_wait_seconds_sum": 0.1}
+        after = pool_samples(METRICS)
+
+        # Quando
+        result = stats.result(2, 2.0, before, after)
+
+        # Então
+        assert result.calls == 4 and result.calls_per_sec == 2.0
+        assert result.error_rate == 0.25
+        assert result.p50_ms == pytest.approx(20) and result.p99_ms == pytest.approx(40)
+        assert (result.pool_size, result.pool_peak_in_use) == (5, 3)
+        assert result.pool_wait_ms == pytest.approx(40)
+
+    @pytest.mark.asyncio
+    async def test_quando_gravacao_e_lida_entao_sessoes_sao_reproduzidas_na_ordem(
+        self, tmp_path
+    ):
+        """
+        Verifica a reprodução das sessões gravadas.
+
+        Cenário:
+            Uma gravação com duas sessões intercaladas.
+
+        Dado que:
+            - Um arquivo JSONL com as chamadas das sessões `a` e `b`.
+        Quando:
+            - As sessões lidas são executadas.
+        Então:
+            - Cada sessão reproduz as suas chamadas, na ordem do arquivo.
+        """
+        # Dado que
+        steps = [
+            {"session": "a", "tool": "list_manufacturers"},
+            {"session": "b", "tool": "get_cars", "arguments": {"ids": [1]}},
+            {"session": "a", "tool": "search_cars", "arguments": {"query": {}}},
+        ]
+        path = tmp_path / "sessoes.jsonl"
+        path.write_text("\n".join(map(json.dumps, steps)), encoding="utf-8")
+        calls = []
+
+        async def call(tool, arguments):
+            calls.append((tool, arguments))
+
+        # Quando
+        for session in load_recording(path):
+            await session(call, random.Random(0))
+
+        # Então
+        assert calls == [
+            ("list_manufacturers", {}),
+            ("search_cars", {"query": {}}),
+            ("get_cars", {"ids": [1]}),
+        ]
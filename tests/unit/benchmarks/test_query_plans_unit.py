@@ -0,0 +1,108 @@
+from mcp_car_agent.benchmarks.query_plans import (
+    mysql_plan,
+    postgres_plan,
+    regressions,
+    sqlite_plan,
+)
+from mcp_car_agent.core.schemas.query_plan_schema import QueryPlan
+
+
+class TestQueryPlansUnit:
+    """
+    Testes unitários para a interpretação dos planos de execução.
+    """
+
+    def test_quando_planos_sao_interpretados_entao_leituras_completas_sao_apontadas(
+        self,
+    ):
+        """
+        Verifica a detecção de leituras completas em cada dialeto.
+
+        Cenário:
+            Planos com uma tabela lida por índice e outra lida por inteiro.
+
+        Dado que:
+            - Um plano do SQLite, um do PostgreSQL (JSON) e um do MySQL (JSON).
+        Quando:
+            - Os planos são interpretados.
+        Então:
+            - Apenas as tabelas lidas sem índice são apontadas.
+        """
+        # Dado que
+        sqlite_rows = [
+            (2, 0, 0, "SEARCH car USING INDEX ix_car_year (year=?)"),
+            (3, 0, 0, "SCAN car USING INDEX ix_car_year"),
+            (4, 0, 0, "SCAN equipment"),
+        ]
+        postgres_rows = [
+            (
+                '[{"Plan": {"Node Type": "Nested Loop", "Plans": ['
+                '{"Node Type": "Index Scan", "Relation Name": "car"}, '
+                '{"Node Type": "Seq Scan", "Relation Name": "engine_specs"}]}}]',
+            )
+        ]
+        mysql_rows = [
+            (
+                {
+                    "query_block": {
+                        "nested_loop": [
+                            {"table": {"table_name": "car", "access_type": "ref"}},
+                            {
+                                "table": {
+                                    "table_name": "equipment",
+                                    "access_type": "ALL",
+                                }
+                            },
+                        ]
+                    }
+                },
+            )
+        ]
+
+        # Quando
+        scans = [
+            parse(rows)[1]
+            for parse, rows in [
+                (sqlite_plan, sqlite_rows),
+                (postgres_plan, postgres_rows),
+                (mysql_plan, mysql_rows),
+            ]
+        ]
+
+        # Então
+        assert scans == [["equipment"], ["engine_specs"], ["equipment"]]
+
+    def test_quando_leitura_completa_e_de_tabela_pequena_entao_nao_e_regressao(self):
+        """
+        Verifica que apenas as tabelas protegidas falham a verificação.
+
+        Cenário:
+            Uma busca que lê a tabela de fabricantes por inteiro e outra que lê
+            a de carros.
+
+        Dado que:
+            - Os dois planos.
+        Quando:
+            - As regressões são procuradas.
+        Então:
+            - Apenas o plano com leitura completa de `car` é apontado.
+        """
+        # Dado que
+        plans = [
+            QueryPlan(
+                backend="sqlite",
+                name="a",
+                statement="",
+                plan=[],
+                full_scans=["manufacturer"],
+            ),
+            QueryPlan(
+                backend="sqlite", name="b", statement="", plan=[], full_scans=["car"]
+            ),
+        ]
+
+        # Quando
+        failures = regressions(plans)
+
+        # Então
+        assert [plan.key for plan in failures] == ["sqlite/b"]
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+from mcp_car_agent.benchmarks.stats import compare, percentile, summarize
+from mcp_car_agent.core.schemas.benchmark_schema import BenchmarkRun
+
+
+def _run(ops_per_sec: float, p95_ms: float) -> BenchmarkRun:
+    labels = {"backend": "sqlite", "size": 10, "operation": "search", "rows_per_op": 1}
+    result = summarize(labels, [0.001, 0.002])
+    result = result.model_copy(update={"ops_per_sec": ops_per_sec, "p95_ms": p95_ms})
+    return BenchmarkRun(
+        created_at=datetime(2025, 1, 1), python="3.10", results=[result]
+    )
+
+
+class TestStatsUnit:
+    """
+    Testes unitários para as medições e comparações dos benchmarks.
+    """
+
+    def test_quando_latencias_sao_resumidas_entao_percentis_e_vazao_sao_calculados(
+        self,
+    ):
+        """
+        Verifica o resumo das latências de uma operação.
+
+        Cenário:
+            100 execuções com latências de 1 a 100 ms.
+
+        Dado que:
+            - As latências 1, 2, ..., 100 ms.
+        Quando:
+            - As latências são resumidas.
+        Então:
+            - p50, p95 e p99 são 50, 95 e 99 ms (posto mais próximo).
+            - A vazão é o número de execuções pelo tempo total.
+        """
+        # Dado que
+        latencies = [ms / 1000 for ms in range(1, 101)]
+        labels = {
+            "backend": "sqlite",
+            "size": 0,
+            "operation": "get_one",
+            "rows_per_op": 1,
+        }
+
+        # Quando
+        result = summarize(labels, latencies)
+
+        # Então
+        assert (result.p50_ms, result.p95_ms, result.p99_ms) == (50, 95, 99)
+        assert result.ops_per_sec == 100 / sum(latencies)
+        assert percentile([3.0], 99) == 3.0
+
+    def test_quando_metricas_pioram_acima_do_limite_entao_regressoes_sao_apontadas(
+        self,
+    ):
+        """
+        Verifica a comparação de duas execuções do benchmark.
+
+        Cenário:
+            Uma execução com vazão 20% menor e p95 5% maior que a referência.
+
+        Dado que:
+            - A referência com 100 ops/s e p95 de 10 ms.
+            - A execução atual com 80 ops/s e p95 de 10,5 ms.
+        Quando:
+            - As execuções são comparadas com limite de 10%.
+        Então:
+            - Apenas a vazão é apontada como regressão, com a variação de -20%.
+            - A execução comparada com ela mesma não tem regressões.
+        """
+        # Dado que
+        baseline, current = _run(100, 10), _run(80, 10.5)
+
+        # Quando
+        regressions = compare(baseline, current, threshold=0.10)
+
+        # Então
+        assert [(r.key, r.metric) for r in regressions] == [
+            ("sqlite/10/search", "ops_per_sec")
+        ]
+        assert round(regressions[0].change, 2) == -0.2
+        assert not compare(baseline, baseline, threshold=0.10)
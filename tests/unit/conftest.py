@@ -15,7 +15,9 @@ from mcp_car_agent.core.database.repository.engine_repository import (
 @pytest.fixture(name="mock_session")
 def setup_mock_session():
     """Cria uma sessão de mock assíncrona."""
-    return AsyncMock()
+    session = AsyncMock()
+    session.info = {}
+    return session
 
 
 @pytest.fixture
@@ -45,8 +47,12 @@ def engine_spec_repository(mock_session):
 @pytest.fixture
 def mock_config(monkeypatch):
     """Mocks as variáveis de ambiente de configuração."""
+    monkeypatch.setattr("mcp_car_agent.core.config.DB_ENGINE", "POSTGRESQL")
     monkeypatch.setattr("mcp_car_agent.core.config.DB_USER", "user")
     monkeypatch.setattr("mcp_car_agent.core.config.DB_PWD", "pwd")
     monkeypatch.setattr("mcp_car_agent.core.config.DB_HOST", "host")
     monkeypatch.setattr("mcp_car_agent.core.config.DB_PORT", "port")
     monkeypatch.setattr("mcp_car_agent.core.config.DB_NAME", "db")
+    monkeypatch.setattr("mcp_car_agent.core.config.DB_POOL_SIZE", 5)
+    monkeypatch.setattr("mcp_car_agent.core.config.DB_MAX_OVERFLOW", 10)
+    monkeypatch.setattr("mcp_car_agent.core.config.DB_ECHO", False)
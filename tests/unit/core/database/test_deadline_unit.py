@@ -0,0 +1,279 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import mysql
+from sqlmodel import select
+
+from mcp_car_agent.core.database.deadline import (
+    deadline,
+    exec_with_deadline,
+    remaining,
+    stream_with_deadline,
+)
+from mcp_car_agent.core.database.models import CarModel
+
+
+def build_session(dialect_name: str, exec_delay: float = 0.0):
+    """Cria uma sessão de mock com dialeto e tempo de execução configuráveis."""
+
+    async def slow_exec(statement, **_):
+        await asyncio.sleep(exec_delay)
+        return statement
+
+    connection = AsyncMock()
+    connection.info = {}
+    connection.execute.return_value = MagicMock(scalar=MagicMock(return_value=42))
+
+    cancel_connection = AsyncMock()
+    cancel_context = MagicMock()
+    cancel_context.__aenter__ = AsyncMock(return_value=cancel_connection)
+    cancel_context.__aexit__ = AsyncMock(return_value=None)
+
+    connection.engine = MagicMock()
+    connection.engine.connect.return_value = cancel_context
+
+    session = AsyncMock()
+    session.bind = MagicMock()
+    session.bind.dialect.name = dialect_name
+    session.connection.return_value = connection
+    session.exec.side_effect = slow_exec
+    return session, connection, cancel_connection
+
+
+def slow_rows(count: int, delay: float):
+    """Cria um resultado de cursor no servidor que entrega uma linha a cada `delay`."""
+
+    async def rows():
+        for number in range(count):
+            await asyncio.sleep(delay)
+            yield {"id": number}
+
+    result = MagicMock()
+    result.mappings.return_value = rows()
+    return result
+
+
+class TestDeadlineUnit:
+    """
+    Testes unitários para o módulo de prazos de consultas.
+    """
+
+    def test_quando_prazos_aninhados_entao_o_menor_prazo_prevalece(self):
+        """
+        Verifica que um prazo interno não estende o prazo externo.
+
+        Cenário:
+            Dois blocos `deadline` aninhados, o interno com prazo maior.
+
+        Dado que:
+            - Um prazo externo de 1 segundo está ativo.
+        Quando:
+            - Um prazo interno de 60 segundos é definido.
+        Então:
+            - O tempo restante continua limitado ao prazo externo.
+            - Ao sair dos blocos, nenhum prazo permanece ativo.
+        """
+        # Dado que
+        with deadline(1):
+            # Quando
+            with deadline(60):
+                # Então
+                assert remaining() <= 1
+
+        assert remaining() is None
+
+    @pytest.mark.asyncio
+    async def test_quando_prazo_ja_expirou_entao_consulta_nao_e_executada(self):
+        """
+        Verifica que nenhuma consulta é enviada ao banco com o prazo esgotado.
+
+        Cenário:
+            Execução de uma consulta após o fim do prazo.
+
+        Dado que:
+            - Um prazo de zero segundos está ativo.
+        Quando:
+            - `exec_with_deadline` é chamado.
+        Então:
+            - `TimeoutError` é levantado.
+            - A sessão não executa nenhum statement.
+        """
+        # Dado que
+        session, _, _ = build_session("postgresql")
+
+        # Quando e Então
+        with deadline(0):
+            with pytest.raises(TimeoutError):
+                await exec_with_deadline(session, select(CarModel))
+        session.exec.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_quando_postgresql_excede_prazo_entao_consulta_e_cancelada_no_servidor(
+        self,
+    ):
+        """
+        Verifica que o timeout é repassado ao PostgreSQL e que a consulta é
+        cancelada no servidor quando o prazo expira.
+
+        Cenário:
+            Consulta mais lenta que o prazo definido.
+
+        Dado que:
+            - Uma sessão PostgreSQL cuja consulta demora mais que o prazo.
+        Quando:
+            - `exec_with_deadline` é chamado dentro de um prazo curto.
+        Então:
+            - `statement_timeout` é definido antes da consulta.
+            - `pg_cancel_backend` é chamado com o id da conexão no servidor.
+            - A conexão da sessão é invalidada e `TimeoutError` é levantado.
+        """
+        # Dado que
+        session, connection, cancel_connection = build_session(
+            "postgresql", exec_delay=1
+        )
+
+        # Quando
+        with deadline(0.05):
+            with pytest.raises(TimeoutError):
+                await exec_with_deadline(session, select(CarModel))
+
+        # Então
+        executed = [str(call.args[0]) for call in connection.execute.call_args_list]
+        assert "SELECT pg_backend_pid()" in executed
+        assert any("statement_timeout" in sql for sql in executed)
+        cancel_call = cancel_connection.execute.call_args
+        assert "pg_cancel_backend" in str(cancel_call.args[0])
+        assert cancel_call.args[1] == {"backend_id": 42}
+        session.invalidate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_quando_postgresql_conclui_no_prazo_entao_timeout_e_restaurado(
+        self,
+    ):
+        """
+        Verifica que o timeout da transação não vale para os statements
+        seguintes.
+
+        Cenário:
+            Consulta rápida executada dentro de um prazo, em uma transação que
+            continua depois dela.
+
+        Dado que:
+            - Uma sessão PostgreSQL.
+        Quando:
+            - `exec_with_deadline` é chamado com um prazo de 2 segundos.
+        Então:
+            - O `statement_timeout` é definido antes da consulta e restaurado
+              ao padrão depois dela.
+        """
+        # Dado que
+        session, connection, _ = build_session("postgresql")
+
+        # Quando
+        with deadline(2):
+            await exec_with_deadline(session, select(CarModel))
+
+        # Então
+        executed = [str(call.args[0]) for call in connection.execute.call_args_list]
+        assert "set_config('statement_timeout'" in executed[-2]
+        assert executed[-1] == "SET LOCAL statement_timeout TO DEFAULT"
+
+    @pytest.mark.asyncio
+    async def test_quando_mysql_com_prazo_entao_hint_max_execution_time_e_aplicado(
+        self,
+    ):
+        """
+        Verifica que o prazo é enviado ao MySQL como hint do otimizador.
+
+        Cenário:
+            Consulta rápida executada dentro de um prazo.
+
+        Dado que:
+            - Uma sessão MySQL.
+        Quando:
+            - `exec_with_deadline` é chamado com um prazo de 2 segundos.
+        Então:
+            - O statement executado contém o hint `MAX_EXECUTION_TIME(2000)`.
+            - Nenhum cancelamento é enviado ao servidor.
+        """
+        # Dado que
+        session, _, cancel_connection = build_session("mysql")
+
+        # Quando
+        with deadline(2):
+            executed = await exec_with_deadline(session, select(CarModel))
+
+        # Então
+        assert "SELECT /*+ MAX_EXECUTION_TIME(2000) */" in str(
+            executed.compile(dialect=mysql.dialect())
+        )
+        cancel_connection.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_quando_task_e_cancelada_entao_cancelamento_e_propagado_ao_banco(
+        self,
+    ):
+        """
+        Verifica que o cancelamento da task asyncio interrompe a consulta no banco.
+
+        Cenário:
+            O cliente MCP desconecta e a task que executa a consulta é cancelada.
+
+        Dado que:
+            - Uma sessão MySQL cuja consulta ainda está em andamento.
+        Quando:
+            - A task que executa a consulta é cancelada.
+        Então:
+            - `KILL QUERY` é enviado ao servidor por outra conexão.
+            - `CancelledError` é propagado ao chamador.
+        """
+        # Dado que
+        session, _, cancel_connection = build_session("mysql", exec_delay=5)
+        task = asyncio.create_task(exec_with_deadline(session, select(CarModel)))
+        await asyncio.sleep(0.01)
+
+        # Quando
+        task.cancel()
+
+        # Então
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert "KILL QUERY" in str(cancel_connection.execute.call_args.args[0])
+        session.invalidate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_quando_leitura_com_cursor_excede_prazo_entao_consulta_e_cancelada(
+        self,
+    ):
+        """
+        Verifica que o prazo vale para a leitura inteira de um cursor no servidor.
+
+        Cenário:
+            Exportação cujas linhas chegam rápido, mas que no total demora mais
+            que o prazo.
+
+        Dado que:
+            - Uma sessão PostgreSQL cujo cursor entrega uma linha a cada 20 ms.
+        Quando:
+            - As linhas são lidas com `stream_with_deadline` dentro de um
+              prazo de 50 ms.
+        Então:
+            - Algumas linhas são entregues antes de `TimeoutError`.
+            - `pg_cancel_backend` é chamado e a conexão da sessão é invalidada.
+        """
+        # Dado que
+        session, _, cancel_connection = build_session("postgresql")
+        session.stream.return_value = slow_rows(count=100, delay=0.02)
+        read = []
+
+        # Quando
+        with deadline(0.05):
+            with pytest.raises(TimeoutError):
+                async for row in stream_with_deadline(session, select(CarModel)):
+                    read.append(row)
+
+        # Então
+        assert 0 < len(read) < 100
+        assert "pg_cancel_backend" in str(cancel_connection.execute.call_args.args[0])
+        session.invalidate.assert_awaited_once()
@@ -0,0 +1,41 @@
+import math
+
+from mcp_car_agent.core.database.instrumentation import Histogram
+
+
+class TestInstrumentationUnit:
+    """
+    Testes unitários para o histograma da instrumentação SQL.
+    """
+
+    def test_quando_valores_sao_observados_entao_quantis_sao_os_limites_das_faixas(
+        self,
+    ):
+        """
+        Verifica a contagem por faixa e a estimativa dos quantis.
+
+        Cenário:
+            Latências de statements distribuídas em três faixas.
+
+        Dado que:
+            - Um histograma com as faixas 0,01, 0,1 e 1 segundo.
+        Quando:
+            - São observados 8 valores até 0,01 s, 1 até 0,1 s e 1 acima de 1 s.
+        Então:
+            - As contagens, a soma e o total são registrados por faixa.
+            - O p50 é 0,01 s, o p90 é 0,1 s e o p99 cai na faixa `+Inf`.
+        """
+        # Dado que
+        histogram = Histogram((0.01, 0.1, 1))
+
+        # Quando
+        for value in [0.001] * 7 + [0.01, 0.05, 3]:
+            histogram.observe(value)
+
+        # Então
+        assert histogram.counts == [8, 1, 0, 1]
+        assert histogram.count == 10
+        assert math.isclose(histogram.sum, 3.067)
+        assert histogram.quantile(0.5) == 0.01
+        assert histogram.quantile(0.9) == 0.1
+        assert histogram.quantile(0.99) == math.inf
@@ -0,0 +1,240 @@
+import asyncio
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from mcp_car_agent.core.database.invalidation import (
+    NOTIFY_CHANNEL,
+    InProcessInvalidationBus,
+    PostgresInvalidationBus,
+)
+
+
+class FakeNotifyServer:
+    """
+    Substituto local do PostgreSQL para LISTEN/NOTIFY: entrega cada
+    `pg_notify` a todos os listeners de todas as conexões, como o servidor faria.
+    """
+
+    def __init__(self):
+        self.listeners = []
+
+    async def connect(self):
+        """Retorna uma conexão crua cuja `driver_connection` imita o asyncpg."""
+        return FakeRawConnection(self)
+
+    async def notify(self, channel, payload):
+        """Entrega a notificação aos listeners do canal, fora da chamada original."""
+        await asyncio.sleep(0)
+        for listened_channel, callback in list(self.listeners):
+            if listened_channel == channel:
+                callback(None, 1, channel, payload)
+
+
+class FakeRawConnection:
+    def __init__(self, server):
+        self.driver_connection = self
+        self.server = server
+        self.closed = False
+        self.terminated = []
+
+    async def add_listener(self, channel, callback):
+        self.server.listeners.append((channel, callback))
+
+    async def remove_listener(self, channel, callback):
+        self.server.listeners.remove((channel, callback))
+
+    def add_termination_listener(self, callback):
+        self.terminated.append(callback)
+
+    def remove_termination_listener(self, callback):
+        self.terminated.remove(callback)
+
+    async def execute(self, _query, *args):
+        if self.closed:
+            raise ConnectionError("conexão encerrada")
+        if args:
+            await self.server.notify(*args)
+
+    def terminate(self):
+        """Simula a queda da conexão: o servidor esquece os seus listeners."""
+        self.closed = True
+        self.server.listeners.clear()
+        for callback in self.terminated:
+            callback(self)
+
+    def invalidate(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+class TestInvalidationBusUnit:
+    """
+    Testes unitários para os barramentos de invalidação de cache.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_handler_falha_entao_demais_handlers_recebem_o_evento(self):
+        """
+        Verifica que um cache com erro não impede a invalidação dos demais.
+
+        Cenário:
+            Dois handlers inscritos, o primeiro levantando exceção.
+
+        Dado que:
+            - Um barramento em processo com um handler que falha e outro que registra eventos.
+        Quando:
+            - Uma escrita na tabela `car` é publicada.
+        Então:
+            - O segundo handler recebe o evento com tabela, IDs e versão.
+        """
+        # Dado que
+        bus = InProcessInvalidationBus()
+        received = []
+
+        def failing_handler(_):
+            raise RuntimeError("falha")
+
+        bus.subscribe(failing_handler)
+        bus.subscribe(received.append)
+
+        # Quando
+        await bus.publish("car", [1, 2])
+
+        # Então
+        assert [(e.table, e.ids) for e in received] == [("car", [1, 2])]
+        assert received[0].version > 0
+
+    @pytest.mark.asyncio
+    async def test_quando_outro_no_publica_entao_evento_chega_via_notify(self):
+        """
+        Verifica a propagação de invalidações entre nós via LISTEN/NOTIFY.
+
+        Cenário:
+            Dois nós conectados ao mesmo servidor de notificações.
+
+        Dado que:
+            - Dois barramentos PostgreSQL iniciados sobre o mesmo servidor substituto.
+        Quando:
+            - O primeiro nó publica uma escrita com 1200 IDs.
+        Então:
+            - O segundo nó recebe todos os IDs, divididos em notificações de até 500 IDs.
+            - Todas as partes carregam a mesma versão.
+        """
+        # Dado que
+        server = FakeNotifyServer()
+        publisher = PostgresInvalidationBus(server.connect)
+        subscriber = PostgresInvalidationBus(server.connect)
+        received = []
+        subscriber.subscribe(received.append)
+        await publisher.start()
+        await subscriber.start()
+
+        # Quando
+        await publisher.publish("engine", list(range(1200)))
+
+        # Então
+        assert [len(e.ids) for e in received] == [500, 500, 200]
+        assert sum((e.ids for e in received), []) == list(range(1200))
+        assert len({e.version for e in received}) == 1
+
+    @pytest.mark.asyncio
+    async def test_quando_barramento_para_entao_listener_e_conexao_sao_liberados(self):
+        """
+        Verifica que parar o barramento devolve a conexão dedicada ao pool.
+
+        Cenário:
+            Desligamento do servidor.
+
+        Dado que:
+            - Um barramento PostgreSQL iniciado.
+        Quando:
+            - `stop` é chamado.
+        Então:
+            - O listener do canal é removido e a conexão é fechada.
+        """
+        # Dado que
+        server = FakeNotifyServer()
+        bus = PostgresInvalidationBus(server.connect)
+        await bus.start()
+        connection = bus._connection  # pylint: disable=protected-access
+        assert server.listeners[0][0] == NOTIFY_CHANNEL
+
+        # Quando
+        await bus.stop()
+
+        # Então
+        assert not server.listeners
+        assert connection.closed is True
+
+    def test_quando_escrita_publica_na_transacao_entao_notify_e_dividido(self):
+        """
+        Verifica os statements que publicam o evento na transação da escrita.
+
+        Cenário:
+            Uma escrita que altera 1200 motores.
+
+        Dado que:
+            - Um barramento PostgreSQL.
+        Quando:
+            - Os statements do evento são montados.
+        Então:
+            - Há um `pg_notify` no canal de invalidação por parte de até 500 IDs.
+        """
+        # Dado que
+        bus = PostgresInvalidationBus(FakeNotifyServer().connect)
+
+        # Quando
+        statements = bus.statements("engine", list(range(1200)))
+
+        # Então
+        compiled = [s.compile(dialect=postgresql.dialect()) for s in statements]
+        assert ["pg_notify" in str(c) for c in compiled] == [True] * 3
+        assert {c.params["channel"] for c in compiled} == {NOTIFY_CHANNEL}
+
+    @pytest.mark.asyncio
+    async def test_quando_conexao_do_listen_cai_entao_reconecta_e_invalida_tudo(
+        self,
+    ):
+        """
+        Verifica que a queda da conexão do LISTEN não deixa os caches
+        desatualizados para sempre.
+
+        Cenário:
+            A conexão dedicada do barramento é encerrada pelo servidor.
+
+        Dado que:
+            - Um barramento PostgreSQL iniciado com um handler inscrito.
+        Quando:
+            - A conexão do LISTEN cai.
+        Então:
+            - O barramento abre uma nova conexão e volta a escutar o canal.
+            - Todas as tabelas são invalidadas, pois eventos podem ter se perdido.
+            - Notificações seguintes voltam a ser entregues.
+        """
+        # Dado que
+        server = FakeNotifyServer()
+        bus = PostgresInvalidationBus(server.connect, check_interval=0.05)
+        received = []
+        bus.subscribe(received.append)
+        await bus.start()
+        lost = bus._connection  # pylint: disable=protected-access
+
+        # Quando
+        lost.terminate()
+        for _ in range(100):
+            if server.listeners:
+                break
+            await asyncio.sleep(0.01)
+
+        # Então
+        try:
+            assert bus._connection is not lost  # pylint: disable=protected-access
+            assert {"car", "manufacturer"} <= {e.table for e in received}
+            received.clear()
+            await bus.publish("car", [1])
+            assert [(e.table, e.ids) for e in received] == [("car", [1])]
+        finally:
+            await bus.stop()
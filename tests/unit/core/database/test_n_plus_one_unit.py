@@ -0,0 +1,79 @@
+import pytest
+
+from mcp_car_agent.core.database.n_plus_one import (
+    NPlusOneError,
+    QueryWatch,
+    report,
+    shape,
+)
+
+
+class TestNPlusOneUnit:
+    """
+    Testes unitários para o agrupamento de statements do detector de N+1.
+    """
+
+    def test_quando_statements_diferem_nos_parametros_entao_tem_o_mesmo_formato(
+        self,
+    ):
+        """
+        Verifica a normalização das listas de parâmetros.
+
+        Cenário:
+            A mesma busca por IDs com listas de tamanhos e estilos diferentes.
+
+        Dado que:
+            - Statements com `IN` de 1 e 3 parâmetros, nos estilos `?` e `$n`.
+        Quando:
+            - O formato de cada um é calculado.
+        Então:
+            - Todos têm o mesmo formato, com a lista reduzida a `(?)`.
+        """
+        # Dado que
+        statements = [
+            "SELECT car.id FROM car WHERE car.id IN (?) LIMIT ?",
+            "SELECT car.id FROM car WHERE car.id IN (?, ?, ?) LIMIT ?",
+            "SELECT car.id FROM car WHERE car.id IN ($1, $2, $3) LIMIT $4",
+        ]
+
+        # Quando
+        shapes = {shape(statement) for statement in statements}
+
+        # Então
+        assert shapes == {"SELECT car.id FROM car WHERE car.id IN (?) LIMIT ?"}
+
+    def test_quando_leitura_se_repete_entao_relacao_e_reportada(self):
+        """
+        Verifica o relatório de uma carga preguiçosa por linha.
+
+        Cenário:
+            Uma requisição que carrega os equipamentos de cada carro.
+
+        Dado que:
+            - Uma requisição com limite de 3 repetições.
+        Quando:
+            - A carga de `CarModel.equipments` é executada 3 vezes, e um
+              INSERT, também 3 vezes.
+        Então:
+            - No modo `raise`, o erro aponta apenas a relação.
+            - No modo `warn`, nada é lançado.
+        """
+        # Dado que
+        current = QueryWatch("get_cars", threshold=3)
+
+        # Quando
+        for _ in range(3):
+            current.loading = "CarModel.equipments"
+            current.record(
+                "SELECT equipment.id FROM equipment WHERE ? = equipment.car_id"
+            )
+            current.record("INSERT INTO change_log (table_name, row_id) VALUES (?, ?)")
+
+        # Então
+        with pytest.raises(NPlusOneError, match="CarModel.equipments") as error:
+            report(current, "raise")
+        assert [offender.relationship for offender in error.value.offenders] == [
+            "CarModel.equipments"
+        ]
+        assert current.statements == 6
+        report(current, "warn")
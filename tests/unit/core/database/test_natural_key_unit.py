@@ -0,0 +1,56 @@
+from mcp_car_agent.core.database.natural_key import MAX_LENGTH, natural_key
+
+
+class TestNaturalKeyUnit:
+    """
+    Testes unitários para a função natural_key.
+    """
+
+    def test_quando_partes_diferem_em_acentos_e_espacos_entao_chave_e_a_mesma(self):
+        """
+        Verifica a normalização das partes da chave natural.
+
+        Cenário:
+            Dois fabricantes escritos de formas diferentes.
+
+        Dado que:
+            - Os nomes "Citroën" e "  CITROEN ".
+        Quando:
+            - As chaves naturais são calculadas.
+        Então:
+            - As duas chaves são "citroen".
+        """
+        # Dado que
+        names = ["Citroën", "  CITROEN "]
+
+        # Quando
+        keys = {natural_key(name) for name in names}
+
+        # Então
+        assert keys == {"citroen"}
+
+    def test_quando_parte_e_nula_entao_chave_mantem_a_posicao(self):
+        """
+        Verifica a chave natural de registros com partes nulas.
+
+        Cenário:
+            Uma transmissão sem quantidade de marchas e um texto muito longo.
+
+        Dado que:
+            - As partes ("Manual", None, "Traseira") e um texto de 300 caracteres.
+        Quando:
+            - As chaves naturais são calculadas.
+        Então:
+            - A parte nula vira uma posição vazia.
+            - A chave longa é truncada no tamanho da coluna.
+        """
+        # Dado que
+        parts = ("Manual", None, "Traseira")
+
+        # Quando
+        key = natural_key(*parts)
+        long_key = natural_key("x" * 300)
+
+        # Então
+        assert key == "manual||traseira"
+        assert len(long_key) == MAX_LENGTH
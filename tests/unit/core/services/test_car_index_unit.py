@@ -0,0 +1,131 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_car_agent.core.schemas.query_schema import CarQuery
+from mcp_car_agent.core.services.car_index import CarIndex
+
+ROWS = [
+    {"id": 1, "name": "Civic", "version": "EXL", "year": date(2020, 1, 1)},
+    {"id": 2, "name": "corolla", "version": "XEi", "year": None},
+    {"id": 3, "name": "Cruze", "version": "LTZ", "year": date(2018, 1, 1)},
+]
+
+
+def _index() -> CarIndex:
+    """Um índice carregado com `ROWS` e em dia com o banco."""
+    snapshot = MagicMock(version=1, gaps=[])
+    snapshot.rows.return_value = [
+        row | {"manufacturer_id": 1, "transmission_id": 1, "engine_id": 1}
+        for row in ROWS
+    ]
+    index = CarIndex()
+    index.load(snapshot)
+    index.stale = False
+    return index
+
+
+def _session_factory(dialect: str):
+    """Uma fábrica de sessões ligada a um motor do banco informado."""
+    engine = SimpleNamespace(dialect=SimpleNamespace(name=dialect))
+    return SimpleNamespace(kw={"bind": engine})
+
+
+@pytest.mark.asyncio
+class TestCarIndexUnit:
+    """
+    Testes unitários para a equivalência entre o índice de carros e o banco.
+    """
+
+    @pytest.mark.parametrize(
+        "dialect, expected",
+        [("postgresql", [3, 1, 2]), ("mysql", [2, 3, 1]), ("sqlite", [2, 3, 1])],
+    )
+    async def test_quando_ordena_por_coluna_com_nulos_entao_segue_o_banco(
+        self, dialect, expected
+    ):
+        """
+        Verifica a posição dos nulos na ordenação do índice.
+
+        Cenário:
+            Uma busca ordenada pelo ano, com um carro sem ano.
+
+        Dado que:
+            - Um índice carregado com três carros, um deles sem ano.
+        Quando:
+            - A busca é ordenada pelo ano em cada banco.
+        Então:
+            - O carro sem ano vem por último no PostgreSQL e primeiro no MySQL
+              e no SQLite, como no `ORDER BY` de cada um.
+        """
+        # Dado que
+        index = _index()
+
+        # Quando
+        cars = await index.search(CarQuery(order_by="year"), _session_factory(dialect))
+
+        # Então
+        assert [car.id for car in cars] == expected
+
+    @pytest.mark.parametrize(
+        "query",
+        [CarQuery(filters={"name": "Corolla"}), CarQuery(order_by="name")],
+    )
+    async def test_quando_banco_e_mysql_entao_buscas_por_texto_vao_ao_banco(
+        self, query
+    ):
+        """
+        Verifica que o índice não compara textos onde o banco não o faz byte a
+        byte.
+
+        Cenário:
+            O MySQL, cuja collation não diferencia maiúsculas.
+
+        Dado que:
+            - Um índice carregado com um carro chamado "corolla".
+        Quando:
+            - Uma busca filtra ou ordena pelo nome no MySQL.
+        Então:
+            - O índice retorna `None`, para que a busca vá ao banco.
+        """
+        # Dado que
+        index = _index()
+
+        # Quando
+        cars = await index.search(query, _session_factory("mysql"))
+
+        # Então
+        assert cars is None
+
+    async def test_quando_banco_e_postgresql_entao_so_ordenacao_por_texto_vai_ao_banco(
+        self,
+    ):
+        """
+        Verifica as buscas por texto atendidas no PostgreSQL.
+
+        Cenário:
+            O PostgreSQL, que compara textos exatamente mas os ordena pela
+            collation do banco.
+
+        Dado que:
+            - Um índice carregado com três carros.
+        Quando:
+            - Uma busca filtra pelo nome e outra ordena pelo nome.
+        Então:
+            - O filtro é atendido pelo índice e a ordenação vai ao banco.
+        """
+        # Dado que
+        index = _index()
+        session_factory = _session_factory("postgresql")
+
+        # Quando
+        filtered = await index.search(
+            CarQuery(filters={"name": "Civic"}), session_factory
+        )
+        ordered = await index.search(CarQuery(order_by="name"), session_factory)
+
+        # Então
+        assert [car.id for car in filtered] == [1]
+        assert ordered is None
@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Column, Integer, Numeric
+from sqlalchemy.types import NullType
+
+from mcp_car_agent.core.services.export_service import ParquetWriter
+
+
+class TestExportServiceUnit:
+    """
+    Testes unitários para os formatos de exportação.
+    """
+
+    def test_quando_coluna_nao_tem_tipo_arrow_entao_parquet_grava_texto(self, tmp_path):
+        """
+        Verifica o esquema Parquet de colunas sem equivalente no Arrow.
+
+        Cenário:
+            Exportação de uma consulta com uma coluna decimal e uma sem tipo.
+
+        Dado que:
+            - Colunas `id` (inteiro), `price` (decimal) e `extra` (sem tipo).
+        Quando:
+            - Um bloco de linhas é gravado em Parquet.
+        Então:
+            - `id` é gravada como inteiro e as demais como texto, com os nulos
+              preservados.
+        """
+        # Dado que
+        parquet = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "carros.parquet"
+        columns = [
+            Column("id", Integer),
+            Column("price", Numeric),
+            Column("extra", NullType()),
+        ]
+        writer = ParquetWriter(path, columns, None)
+
+        # Quando
+        writer.write(
+            [
+                {"id": 1, "price": Decimal("10.50"), "extra": None},
+                {"id": 2, "price": None, "extra": 3},
+            ]
+        )
+        writer.close()
+
+        # Então
+        table = parquet.read_table(path)
+        assert str(table.schema.field("id").type) == "int64"
+        assert str(table.schema.field("price").type) == "string"
+        assert table.to_pylist() == [
+            {"id": 1, "price": "10.50", "extra": None},
+            {"id": 2, "price": None, "extra": "3"},
+        ]
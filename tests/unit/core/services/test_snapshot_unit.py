@@ -0,0 +1,68 @@
+from datetime import date
+
+from mcp_car_agent.core.services.snapshot import decode_column, encode_column
+
+
+class TestSnapshotUnit:
+    """
+    Testes unitários para a codificação das colunas do snapshot.
+    """
+
+    def test_quando_coluna_e_codificada_entao_decodificacao_devolve_os_valores(self):
+        """
+        Verifica a ida e volta das colunas de cada tipo, com nulos.
+
+        Cenário:
+            Colunas de texto, data, inteiro, real e booleano do catálogo.
+
+        Dado que:
+            - Valores de cada tipo intercalados com `None`.
+        Quando:
+            - Cada coluna é codificada e decodificada.
+        Então:
+            - Os valores, inclusive os nulos e o texto vazio, são preservados.
+        """
+        # Dado que
+        columns = {
+            "str": ["Civic", None, "", "Citroën C4"],
+            "date": [date(2020, 1, 1), None, date(1999, 12, 31), None],
+            "int": [1, None, -3, 2**40],
+            "float": [1.5, None, 0.0, -2.25],
+            "bool": [True, False, None, True],
+        }
+
+        # Quando
+        decoded = {
+            kind: decode_column(kind, encode_column(kind, values), len(values))
+            for kind, values in columns.items()
+        }
+
+        # Então
+        assert decoded == columns
+
+    def test_quando_arquivo_tem_outra_ordem_de_bytes_entao_valores_sao_invertidos(
+        self,
+    ):
+        """
+        Verifica a leitura de um snapshot gravado com a outra ordem de bytes.
+
+        Cenário:
+            Um snapshot gerado em uma máquina big-endian.
+
+        Dado que:
+            - Uma coluna inteira com os bytes de cada valor invertidos.
+        Quando:
+            - A coluna é decodificada com `swap=True`.
+        Então:
+            - Os valores originais são devolvidos.
+        """
+        # Dado que
+        values = [1, 256, 70000]
+        swapped = [int.from_bytes(v.to_bytes(8, "little"), "big") for v in values]
+        block = encode_column("int", swapped)
+
+        # Quando
+        decoded = decode_column("int", block, len(values), swap=True)
+
+        # Então
+        assert decoded == values
@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from mcp_car_agent.core.services.tracing import (
+    SERVER,
+    STATUS_ERROR,
+    OtlpJsonExporter,
+    Tracer,
+)
+
+
+def exported(path):
+    """
+    Os spans de cada trace gravado no arquivo, indexados pelo nome.
+    """
+    traces = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        resource = json.loads(line)["resourceSpans"][0]
+        spans = resource["scopeSpans"][0]["spans"]
+        traces.append({span["name"]: span for span in spans})
+    return traces
+
+
+class TestTracingUnit:
+    """
+    Testes unitários para os spans e a exportação dos traces.
+    """
+
+    def test_quando_spans_sao_aninhados_entao_trace_e_exportado_no_formato_otlp(
+        self, tmp_path
+    ):
+        """
+        Verifica a hierarquia e o formato dos spans exportados.
+
+        Cenário:
+            Uma chamada de ferramenta com um método de repositório.
+
+        Dado que:
+            - Um rastreador que amostra todos os traces, gravando em arquivo.
+        Quando:
+            - Um span filho é aberto dentro do span raiz.
+        Então:
+            - Um único trace é gravado, com os dois spans.
+            - O filho aponta para a raiz e os identificadores têm o tamanho
+              do OTLP.
+            - Os atributos estão no formato `AnyValue`.
+        """
+        # Dado que
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(1.0, OtlpJsonExporter(str(path)))
+
+        # Quando
+        with tracer.span("mcp.tool search_cars", SERVER, tool="search_cars"):
+            with tracer.span("CarRepository.search", rows=3):
+                pass
+
+        # Então
+        [trace] = exported(path)
+        root, child = trace["mcp.tool search_cars"], trace["CarRepository.search"]
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        assert "parentSpanId" not in root and root["kind"] == SERVER
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["traceId"] == root["traceId"]
+        assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+        assert child["attributes"] == [{"key": "rows", "value": {"intValue": "3"}}]
+
+    def test_quando_bloco_falha_entao_span_e_marcado_com_erro(self, tmp_path):
+        """
+        Verifica o status dos spans de um bloco que lança uma exceção.
+
+        Cenário:
+            Um método de repositório que falha.
+
+        Dado que:
+            - Um rastreador que amostra todos os traces.
+        Quando:
+            - O bloco do span lança `ValueError`.
+        Então:
+            - A exceção é propagada e o trace é exportado com o erro.
+        """
+        # Dado que
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(1.0, OtlpJsonExporter(str(path)))
+
+        # Quando
+        with pytest.raises(ValueError):
+            with tracer.span("CarRepository.get_one"):
+                raise ValueError("não encontrado")
+
+        # Então
+        [trace] = exported(path)
+        status = trace["CarRepository.get_one"]["status"]
+        assert status == {
+            "code": STATUS_ERROR,
+            "message": "ValueError: não encontrado",
+        }
+
+    def test_quando_trace_nao_e_amostrado_entao_nenhum_span_e_criado(self, tmp_path):
+        """
+        Verifica a amostragem decidida na raiz.
+
+        Cenário:
+            O rastreamento desligado (taxa de amostragem 0).
+
+        Dado que:
+            - Um rastreador com taxa de amostragem 0.
+        Quando:
+            - Spans aninhados são abertos.
+        Então:
+            - Nenhum span é criado e nada é exportado.
+        """
+        # Dado que
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(0.0, OtlpJsonExporter(str(path)))
+
+        # Quando
+        with tracer.span("mcp.tool search_cars") as root:
+            with tracer.span("CarRepository.search") as child:
+                pass
+
+        # Então
+        assert root is None and child is None
+        assert not path.exists()
@@ -0,0 +1,115 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_car_agent.ingestion.bulk import _reserve_car_ids, car_from_csv
+from mcp_car_agent.ingestion.staging import STAGE_EQUIPMENT, text_rows
+
+
+class TestBulkUnit:
+    """
+    Testes unitários para a leitura e o staging da importação em massa.
+    """
+
+    def test_quando_linha_csv_e_lida_entao_carro_e_montado_por_grupos(self):
+        """
+        Verifica a montagem de um carro a partir de uma linha do CSV.
+
+        Cenário:
+            Uma linha com motor, especificação do motor e sem especificação do carro.
+
+        Dado que:
+            - Uma linha com fabricante, transmissão, motor e potência, com espaços
+              e colunas de especificação do carro vazias.
+        Quando:
+            - A linha é convertida em carro.
+        Então:
+            - As dimensões e a especificação do motor são preenchidas.
+            - O carro não tem especificações.
+        """
+        # Dado que
+        row = {
+            "name": " Corolla ",
+            "year": "2022-01-01",
+            "manufacturer": "Toyota",
+            "gearbox_type": "CVT",
+            "total_cc": "1987",
+            "max_hp": "177",
+            "gas": "",
+            "doors": "",
+        }
+
+        # Quando
+        car = car_from_csv(row)
+
+        # Então
+        assert car.name == "Corolla"
+        assert car.year == date(2022, 1, 1)
+        assert car.manufacturer.name == "Toyota"
+        assert car.transmission.gearbox_type == "CVT"
+        assert car.engine.total_cc == 1987
+        assert car.engine.engine_specs.max_hp == 177
+        assert car.car_specs == []
+
+    def test_quando_linhas_sao_serializadas_entao_formato_texto_e_escapado(self):
+        """
+        Verifica o formato texto enviado ao COPY e ao LOAD DATA.
+
+        Cenário:
+            Um equipamento com TAB, quebra de linha e barra na descrição.
+
+        Dado que:
+            - Uma linha de staging de equipamento com caracteres especiais e
+              uma coluna nula.
+        Quando:
+            - A linha é serializada.
+        Então:
+            - Os caracteres especiais são escapados, o nulo vira `\\N` e os
+              booleanos viram 1/0.
+        """
+        # Dado que
+        rows = [
+            {
+                "line": 1,
+                "category": "Conforto",
+                "description": "Ar\tdigital\n2 zonas\\",
+                "is_standard": True,
+                "is_optional": None,
+            }
+        ]
+
+        # Quando
+        data = text_rows(STAGE_EQUIPMENT, rows)
+
+        # Então
+        assert data == b"1\tConforto\tAr\\tdigital\\n2 zonas\\\\\t1\t\\N\n"
+
+    @pytest.mark.asyncio
+    async def test_quando_lock_do_mysql_nao_e_obtido_entao_ids_nao_sao_reservados(
+        self,
+    ):
+        """
+        Verifica a serialização da numeração dos carros no MySQL.
+
+        Cenário:
+            Outra importação em massa segura o lock da numeração dos carros.
+
+        Dado que:
+            - Uma conexão MySQL em que `GET_LOCK` expira (retorna 0).
+        Quando:
+            - Os IDs dos carros são reservados.
+        Então:
+            - `TimeoutError` é lançado e o maior ID não é lido.
+        """
+        # Dado que
+        connection = MagicMock()
+        connection.dialect.name = "mysql"
+        connection.scalar = AsyncMock(return_value=0)
+        connection.execute = AsyncMock()
+
+        # Quando / Então
+        with pytest.raises(TimeoutError):
+            await _reserve_car_ids(connection)
+        assert "GET_LOCK" in str(connection.scalar.await_args.args[0])
+        connection.execute.assert_not_awaited()
@@ -0,0 +1,70 @@
+from mcp_car_agent.core.schemas.engine_schema import Engine, EngineSpec
+from mcp_car_agent.core.schemas.source_page_schema import SourcePage
+from mcp_car_agent.ingestion.fingerprint import content_hash, content_key
+
+
+class TestFingerprintUnit:
+    """
+    Testes unitários para as impressões digitais da ingestão incremental.
+    """
+
+    def test_quando_registros_diferem_apenas_nos_ids_entao_chaves_sao_iguais(self):
+        """
+        Verifica que IDs gerados pelo banco não fazem parte do conteúdo.
+
+        Cenário:
+            O mesmo motor interpretado de novo e lido do banco.
+
+        Dado que:
+            - Um motor sem IDs e o mesmo motor com IDs no motor e na especificação.
+            - Um terceiro motor com cilindrada diferente.
+        Quando:
+            - As chaves e hashes de conteúdo são calculados.
+        Então:
+            - Os dois primeiros têm a mesma chave e o mesmo hash.
+            - O terceiro tem uma chave diferente.
+        """
+        # Dado que
+        parsed = Engine(total_cc=1987, engine_specs=EngineSpec(gas_type="gasolina"))
+        stored = Engine(
+            id=7, total_cc=1987, engine_specs=EngineSpec(id=3, gas_type="gasolina")
+        )
+        other = Engine(total_cc=1498, engine_specs=EngineSpec(gas_type="gasolina"))
+
+        # Quando / Então
+        assert content_key(parsed) == content_key(stored)
+        assert content_hash(parsed) == content_hash(stored)
+        assert content_key(parsed) != content_key(other)
+
+    def test_quando_pagina_tem_etag_e_data_entao_cabecalhos_condicionais_sao_gerados(
+        self,
+    ):
+        """
+        Verifica os cabeçalhos de requisição condicional de uma página conhecida.
+
+        Cenário:
+            Página gravada com ETag e Last-Modified, e outra sem nenhum dos dois.
+
+        Dado que:
+            - Uma página com ETag e Last-Modified e outra sem eles.
+        Quando:
+            - Os cabeçalhos condicionais são gerados.
+        Então:
+            - A primeira gera `If-None-Match` e `If-Modified-Since`.
+            - A segunda não gera cabeçalhos.
+        """
+        # Dado que
+        known = SourcePage(
+            url="/a", etag='"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+        bare = SourcePage(url="/b")
+
+        # Quando
+        headers = known.conditional_headers()
+
+        # Então
+        assert headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        assert bare.conditional_headers() == {}
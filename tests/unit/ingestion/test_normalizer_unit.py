@@ -0,0 +1,79 @@
+from mcp_car_agent.core.schemas.car_schema import Car
+from mcp_car_agent.core.schemas.equipment_schema import Equipment
+from mcp_car_agent.core.schemas.manufacturer_schema import Manufacturer
+from mcp_car_agent.core.schemas.transmission_schema import Transmission
+from mcp_car_agent.ingestion.normalizer import normalize_car
+
+
+class TestNormalizerUnit:
+    """
+    Testes unitários para a normalização dos carros interpretados.
+    """
+
+    def test_quando_textos_tem_espacos_e_caixa_alta_entao_sao_padronizados(self):
+        """
+        Verifica a padronização dos textos do carro.
+
+        Cenário:
+            Carro com espaços extras e fabricante em caixa alta.
+
+        Dado que:
+            - Um carro "  Corolla " da "TOYOTA" com câmbio em branco.
+        Quando:
+            - O carro é normalizado.
+        Então:
+            - O nome perde os espaços extras.
+            - O fabricante vira "Toyota" e nomes em caixa mista são mantidos.
+            - O câmbio em branco vira "Desconhecido".
+        """
+        # Dado que
+        car = Car(
+            name="  Corolla ",
+            version="XEi   2.0",
+            manufacturer=Manufacturer(name="TOYOTA"),
+            transmission=Transmission(gearbox_type=" "),
+        )
+        other = Car(manufacturer=Manufacturer(name="McLaren"))
+
+        # Quando
+        normalize_car(car)
+        normalize_car(other)
+
+        # Então
+        assert car.name == "Corolla"
+        assert car.version == "XEi 2.0"
+        assert car.manufacturer.name == "Toyota"
+        assert other.manufacturer.name == "McLaren"
+        assert car.transmission.gearbox_type == "Desconhecido"
+
+    def test_quando_equipamentos_repetidos_entao_apenas_um_e_mantido(self):
+        """
+        Verifica a remoção de equipamentos repetidos ou sem descrição.
+
+        Cenário:
+            Página que lista o mesmo equipamento duas vezes e um item vazio.
+
+        Dado que:
+            - Um carro com "Airbag" duas vezes (com espaçamentos diferentes)
+              e um equipamento com descrição em branco.
+        Quando:
+            - O carro é normalizado.
+        Então:
+            - Apenas um "Airbag" permanece.
+        """
+        # Dado que
+        car = Car(
+            equipments=[
+                Equipment(category="Segurança", description="Airbag"),
+                Equipment(category=" Segurança", description="Airbag  "),
+                Equipment(category="Outros", description=" "),
+            ]
+        )
+
+        # Quando
+        normalize_car(car)
+
+        # Então
+        assert [(e.category, e.description) for e in car.equipments] == [
+            ("Segurança", "Airbag")
+        ]
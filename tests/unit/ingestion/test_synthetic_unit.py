@@ -0,0 +1,83 @@
+import statistics
+from collections import Counter
+
+from mcp_car_agent.ingestion.synthetic import (
+    EQUIPMENTS_PER_CAR,
+    MANUFACTURERS,
+    CatalogGenerator,
+)
+
+
+class TestSyntheticUnit:
+    """
+    Testes unitários para o gerador de catálogo sintético.
+    """
+
+    def test_quando_mesma_semente_e_usada_entao_carros_sao_os_mesmos(self):
+        """
+        Verifica o determinismo do gerador.
+
+        Cenário:
+            Duas execuções de benchmark que precisam do mesmo catálogo.
+
+        Dado que:
+            - Dois geradores com a semente 7 e um com a semente 8.
+        Quando:
+            - 50 carros são gerados por cada um, e 20 por um terceiro com a semente 7.
+        Então:
+            - A mesma semente gera os mesmos carros, independente do total pedido.
+            - Outra semente gera carros diferentes.
+        """
+        # Dado que
+        seeds = (7, 7, 8)
+
+        # Quando
+        first, second, other = (
+            [car.model_dump() for car in CatalogGenerator(seed).cars(50)]
+            for seed in seeds
+        )
+        prefix = [car.model_dump() for car in CatalogGenerator(7).cars(20)]
+
+        # Então
+        assert first == second
+        assert prefix == first[:20]
+        assert other != first
+
+    def test_quando_catalogo_e_gerado_entao_distribuicoes_sao_realistas(self):
+        """
+        Verifica as distribuições do catálogo gerado.
+
+        Cenário:
+            Um catálogo sintético de 2000 carros.
+
+        Dado que:
+            - Um gerador com a semente padrão.
+        Quando:
+            - 2000 carros são gerados.
+        Então:
+            - Todo carro tem fabricante, motor com especificação, transmissão e
+              uma especificação de carro.
+            - Os fabricantes de maior peso são os mais frequentes.
+            - A média de equipamentos por carro é próxima de `EQUIPMENTS_PER_CAR`,
+              sem equipamentos repetidos no mesmo carro.
+        """
+        # Dado que
+        generator = CatalogGenerator()
+
+        # Quando
+        cars = list(generator.cars(2000))
+
+        # Então
+        assert all(car.engine.engine_specs.max_hp > 0 for car in cars)
+        assert all(car.transmission and len(car.car_specs) == 1 for car in cars)
+        frequent = {
+            name
+            for name, _ in Counter(c.manufacturer.name for c in cars).most_common(3)
+        }
+        assert frequent == set(list(MANUFACTURERS)[:3])
+        counts = [len(car.equipments) for car in cars]
+        assert abs(statistics.mean(counts) - EQUIPMENTS_PER_CAR) < 1
+        assert all(
+            len({e.description for e in car.equipments}) == len(car.equipments)
+            for car in cars
+        )
@@ -0,0 +1,136 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from mcp_car_agent.scraper.parser import parse_car_links, parse_car_page
+
+FIXTURE_PAGES = Path(__file__).parent.parent.parent / "fixtures" / "pages"
+
+
+class TestParserUnit:
+    """
+    Testes unitários para a interpretação das páginas do catálogo.
+    """
+
+    def test_quando_ficha_tecnica_valida_entao_grafo_completo_do_carro_e_montado(self):
+        """
+        Verifica a conversão de uma ficha técnica nos schemas da aplicação.
+
+        Cenário:
+            Interpretação da página do Toyota Corolla XEi 2022.
+
+        Dado que:
+            - O HTML da ficha técnica do Corolla.
+        Quando:
+            - `parse_car_page` é chamado.
+        Então:
+            - Fabricante, modelo, versão e ano são preenchidos.
+            - Motor, especificação do motor e transmissão têm os valores numéricos da página.
+            - Equipamentos de série e opcionais são distinguidos.
+        """
+        # Dado que
+        html = (FIXTURE_PAGES / "carros" / "toyota-corolla-xei-2022.html").read_bytes()
+
+        # Quando
+        car = parse_car_page(html)
+
+        # Então
+        assert (car.manufacturer.name, car.name, car.version) == (
+            "Toyota",
+            "Corolla",
+            "XEi 2.0",
+        )
+        assert car.year == date(2022, 1, 1)
+        assert car.engine.total_cc == 1987
+        assert car.engine.compression_rate == "13,0:1"
+        assert car.engine.engine_specs.gas_type == "gasolina/alcool"
+        assert (car.engine.engine_specs.max_hp, car.engine.engine_specs.max_hp_rpm) == (
+            177,
+            6600,
+        )
+        assert car.engine.engine_specs.max_torque_rpm == 4400
+        assert (car.transmission.gearbox_type, car.transmission.gears_qtde) == (
+            "CVT",
+            10,
+        )
+        assert car.car_specs[0].doors == 4
+        assert len(car.equipments) == 4
+        assert [e.description for e in car.equipments if e.is_optional] == [
+            "Teto solar"
+        ]
+
+    def test_quando_pagina_nao_e_ficha_tecnica_entao_nenhum_carro_e_retornado(self):
+        """
+        Verifica que páginas sem ficha técnica são descartadas.
+
+        Cenário:
+            Interpretação da página de listagem do catálogo.
+
+        Dado que:
+            - O HTML da página de listagem.
+        Quando:
+            - `parse_car_page` é chamado.
+        Então:
+            - `None` é retornado.
+        """
+        # Dado que
+        html = (FIXTURE_PAGES / "index.html").read_bytes()
+
+        # Quando e Então
+        assert parse_car_page(html) is None
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            b'<article class="car"><h1 class="version">x</h1></article>',
+            b'<article class="car"><h1 class="name">Civic</h1></article>',
+            b'<article class="car"><h1 class="name">'
+            + b"C" * 81
+            + b'</h1><span class="manufacturer">Honda</span></article>',
+        ],
+        ids=["sem_nome", "sem_fabricante", "nome_longo"],
+    )
+    def test_quando_ficha_tecnica_e_invalida_entao_nenhum_carro_e_retornado(self, html):
+        """
+        Verifica que uma ficha técnica malformada não interrompe a ingestão.
+
+        Cenário:
+            Fichas técnicas incompletas ou com valores fora dos limites.
+
+        Dado que:
+            - Uma ficha sem nome, uma sem fabricante e uma com nome longo demais.
+        Quando:
+            - `parse_car_page` é chamado.
+        Então:
+            - `None` é retornado, sem exceção.
+        """
+        # Quando e Então
+        assert parse_car_page(html) is None
+
+    def test_quando_pagina_de_listagem_entao_links_absolutos_sao_extraidos(self):
+        """
+        Verifica a descoberta das fichas técnicas a partir da listagem.
+
+        Cenário:
+            Interpretação da página de listagem do catálogo.
+
+        Dado que:
+            - O HTML da listagem com três carros.
+        Quando:
+            - `parse_car_links` é chamado com a URL base do site.
+        Então:
+            - As três URLs absolutas das fichas técnicas são retornadas.
+        """
+        # Dado que
+        html = (FIXTURE_PAGES / "index.html").read_bytes()
+
+        # Quando
+        links = parse_car_links(html, "http://site.local/index.html")
+
+        # Então
+        assert links == [
+            "http://site.local/carros/toyota-corolla-xei-2022.html",
+            "http://site.local/carros/honda-civic-touring-2021.html",
+            "http://site.local/carros/chevrolet-cruze-ltz-2020.html",
+        ]
@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+import pytest
+
+from mcp_car_agent.scraper.rate_limit import HostLimiter, RateLimiter
+
+
+@pytest.mark.asyncio
+class TestRateLimitUnit:
+    """
+    Testes unitários para os limites por host do scraper.
+    """
+
+    async def test_quando_taxa_e_excedida_entao_requisicoes_sao_espacadas(self):
+        """
+        Verifica que o token bucket respeita a taxa configurada.
+
+        Cenário:
+            Cinco aquisições seguidas com taxa de 50 por segundo e sem rajada.
+
+        Dado que:
+            - Um limitador de 50 requisições por segundo.
+        Quando:
+            - Cinco requisições são liberadas em sequência.
+        Então:
+            - O tempo total é de pelo menos 4 intervalos de 20ms.
+        """
+        # Dado que
+        limiter = RateLimiter(rate=50)
+        started = time.monotonic()
+
+        # Quando
+        for _ in range(5):
+            await limiter.acquire()
+
+        # Então
+        assert time.monotonic() - started >= 0.075
+
+    async def test_quando_hosts_diferentes_entao_limites_sao_independentes(self):
+        """
+        Verifica que o limite de concorrência é aplicado por host.
+
+        Cenário:
+            Requisições simultâneas para dois hosts, com limite de 1 por host.
+
+        Dado que:
+            - Um limitador de 1 requisição simultânea por host.
+        Quando:
+            - Duas requisições para hosts diferentes são feitas ao mesmo tempo.
+        Então:
+            - As duas ocupam uma vaga simultaneamente.
+            - Uma segunda requisição ao mesmo host precisa aguardar.
+        """
+        # Dado que
+        limiter = HostLimiter(concurrency=1, rate=1000)
+        active = []
+
+        async def request(url, hold):
+            async with limiter.slot(url):
+                active.append(url)
+                await hold.wait()
+
+        hold = asyncio.Event()
+
+        # Quando
+        tasks = [
+            asyncio.create_task(request("http://a.com/1", hold)),
+            asyncio.create_task(request("http://b.com/1", hold)),
+            asyncio.create_task(request("http://a.com/2", hold)),
+        ]
+        await asyncio.sleep(0.05)
+
+        # Então
+        assert active == ["http://a.com/1", "http://b.com/1"]
+        hold.set()
+        await asyncio.gather(*tasks)
+        assert active[-1] == "http://a.com/2"
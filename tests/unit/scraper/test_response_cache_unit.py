@@ -0,0 +1,197 @@
+import pytest
+
+from mcp_car_agent.core.interfaces.fetcher import FetchResponse, IFetcher
+from mcp_car_agent.scraper.cached_fetcher import CachedFetcher, CacheMissError
+from mcp_car_agent.scraper.response_cache import ResponseCache
+
+PAGE = b"<html>" + b"ficha tecnica " * 500 + b"</html>"
+
+
+class StubFetcher(IFetcher):
+    """Cliente que responde com um status fixo e registra os cabeçalhos recebidos."""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = []
+
+    async def fetch(self, url, headers=None):
+        self.requests.append(headers)
+        return FetchResponse(url=url, status=self.status, body=PAGE)
+
+    async def close(self):
+        pass
+
+
+class TestResponseCacheUnit:
+    """
+    Testes unitários para o cache de respostas em disco.
+    """
+
+    def test_quando_paginas_iguais_sao_gravadas_entao_corpo_e_armazenado_uma_vez(
+        self, tmp_path
+    ):
+        """
+        Verifica o endereçamento por conteúdo e a compressão.
+
+        Cenário:
+            A mesma página gravada sob duas URLs.
+
+        Dado que:
+            - Um cache vazio.
+        Quando:
+            - A mesma resposta é gravada para "/a" e "/b".
+        Então:
+            - As duas URLs devolvem o corpo original.
+            - Apenas um arquivo comprimido, menor que o corpo, é gravado.
+        """
+        # Dado que
+        cache = ResponseCache(tmp_path, max_bytes=10**6)
+
+        # Quando
+        cache.put(FetchResponse(url="/a", status=200, body=PAGE, headers={"etag": "1"}))
+        cache.put(FetchResponse(url="/b", status=200, body=PAGE))
+
+        # Então
+        assert cache.get("/a").body == PAGE
+        assert cache.get("/a").headers == {"etag": "1"}
+        assert cache.get("/b").body == PAGE
+        assert len(list((tmp_path / "objects").glob("*/*"))) == 1
+        assert 0 < cache.size < len(PAGE)
+
+    def test_quando_cache_passa_do_limite_entao_menos_usada_e_descartada(
+        self, tmp_path
+    ):
+        """
+        Verifica o descarte LRU ao passar do tamanho máximo.
+
+        Cenário:
+            Cache que comporta apenas duas páginas.
+
+        Dado que:
+            - Um cache com "/a" e "/b", em que "/a" foi lida depois de "/b".
+        Quando:
+            - Uma terceira página "/c" é gravada.
+        Então:
+            - "/b", a menos usada, é descartada; "/a" e "/c" permanecem.
+        """
+        # Dado que
+        bodies = {url: url.encode() * 2000 for url in ("/a", "/b", "/c")}
+        cache = ResponseCache(tmp_path, max_bytes=10**6)
+        for url in ("/a", "/b"):
+            cache.put(FetchResponse(url=url, status=200, body=bodies[url]))
+        cache.max_bytes = cache.size
+        cache.get("/a")
+
+        # Quando
+        cache.put(FetchResponse(url="/c", status=200, body=bodies["/c"]))
+
+        # Então
+        assert cache.get("/b") is None
+        assert cache.get("/a").body == bodies["/a"]
+        assert cache.get("/c").body == bodies["/c"]
+
+    def test_quando_url_e_regravada_entao_somente_corpo_substituido_e_apagado(
+        self, tmp_path
+    ):
+        """
+        Verifica a coleta do corpo substituído e o tamanho mantido em memória.
+
+        Cenário:
+            URL regravada com outro conteúdo enquanto outra URL compartilha o antigo.
+
+        Dado que:
+            - "/a" e "/b" com o mesmo corpo e "/c" com outro.
+        Quando:
+            - "/a" e depois "/c" são regravadas com um corpo novo.
+        Então:
+            - O corpo antigo de "/a" permanece, pois "/b" ainda o usa.
+            - O corpo antigo de "/c" é apagado.
+            - O tamanho é o mesmo ao reabrir o cache.
+        """
+        # Dado que
+        cache = ResponseCache(tmp_path, max_bytes=10**6)
+        cache.put(FetchResponse(url="/a", status=200, body=PAGE))
+        cache.put(FetchResponse(url="/b", status=200, body=PAGE))
+        cache.put(FetchResponse(url="/c", status=200, body=b"antigo" * 100))
+
+        # Quando
+        cache.put(FetchResponse(url="/a", status=200, body=b"novo" * 100))
+        cache.put(FetchResponse(url="/c", status=200, body=b"novo" * 100))
+
+        # Então
+        assert cache.get("/b").body == PAGE
+        assert cache.get("/c").body == b"novo" * 100
+        assert len(list((tmp_path / "objects").glob("*/*"))) == 2
+        size = cache.size
+        cache.close()
+        assert ResponseCache(tmp_path, max_bytes=10**6).size == size
+
+
+@pytest.mark.asyncio
+class TestCachedFetcherUnit:
+    """
+    Testes unitários para o cliente do scraper com cache em disco.
+    """
+
+    async def test_quando_offline_entao_rede_nao_e_usada(self, tmp_path):
+        """
+        Verifica o modo somente replay.
+
+        Cenário:
+            Página gravada em uma execução anterior e outra nunca obtida.
+
+        Dado que:
+            - O cache contém "/a".
+            - Um cliente no modo somente replay.
+        Quando:
+            - "/a" é pedida com cabeçalhos condicionais e "/b" é pedida.
+        Então:
+            - "/a" é devolvida do cache com status 200, ignorando os cabeçalhos.
+            - "/b" gera `CacheMissError`.
+            - Nenhuma requisição chega à rede.
+        """
+        # Dado que
+        network = StubFetcher()
+        cache = ResponseCache(tmp_path, max_bytes=10**6)
+        cache.put(FetchResponse(url="/a", status=200, body=PAGE, headers={"etag": "1"}))
+        fetcher = CachedFetcher(network, cache, offline=True)
+
+        # Quando
+        response = await fetcher.fetch("/a", {"If-None-Match": "1"})
+
+        # Então
+        assert (response.status, response.body) == (200, PAGE)
+        with pytest.raises(CacheMissError):
+            await fetcher.fetch("/b")
+        assert not network.requests
+
+    async def test_quando_origem_responde_304_entao_resposta_do_cache_e_usada(
+        self, tmp_path
+    ):
+        """
+        Verifica a revalidação das respostas gravadas.
+
+        Cenário:
+            Página gravada com ETag que não mudou na origem.
+
+        Dado que:
+            - O cache contém "/a" com o ETag "1".
+            - Uma origem que responde 304.
+        Quando:
+            - "/a" é pedida sem cabeçalhos.
+        Então:
+            - A origem recebe `If-None-Match: 1`.
+            - A resposta do cache é devolvida com status 200.
+        """
+        # Dado que
+        network = StubFetcher(status=304)
+        cache = ResponseCache(tmp_path, max_bytes=10**6)
+        cache.put(FetchResponse(url="/a", status=200, body=PAGE, headers={"etag": "1"}))
+        fetcher = CachedFetcher(network, cache)
+
+        # Quando
+        response = await fetcher.fetch("/a")
+
+        # Então
+        assert network.requests == [{"If-None-Match": "1"}]
+        assert (response.status, response.body) == (200, PAGE)
@@ -0,0 +1,47 @@
+import pytest
+
+from mcp_car_agent.server.mcp_server import startup_with_retry
+
+
+class TestMcpServerUnit:
+    """
+    Testes unitários para a inicialização do servidor MCP.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_banco_esta_fora_no_boot_entao_inicializacao_e_repetida(
+        self, monkeypatch
+    ):
+        """
+        Verifica que uma falha na inicialização não deixa o worker sem warm-up
+        para sempre.
+
+        Cenário:
+            O banco está fora do ar nas duas primeiras tentativas.
+
+        Dado que:
+            - A inicialização falha duas vezes e depois conclui.
+        Quando:
+            - `startup_with_retry` é executado.
+        Então:
+            - A inicialização é tentada três vezes.
+            - O worker é declarado pronto uma única vez, ao final.
+        """
+        # Dado que
+        attempts, ready = [], []
+
+        async def flaky_startup(on_ready):
+            attempts.append(len(attempts))
+            if len(attempts) < 3:
+                raise ConnectionError("banco fora do ar")
+            on_ready()
+
+        monkeypatch.setattr("mcp_car_agent.server.mcp_server.startup", flaky_startup)
+        monkeypatch.setattr("mcp_car_agent.core.config.WARM_UP_RETRY_BACKOFF", 0.01)
+
+        # Quando
+        await startup_with_retry(lambda: ready.append(len(attempts)))
+
+        # Então
+        assert len(attempts) == 3
+        assert ready == [3]
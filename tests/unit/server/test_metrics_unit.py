@@ -0,0 +1,56 @@
+import pytest
+
+from mcp_car_agent.core.database.instrumentation import SqlInstrumentation
+from mcp_car_agent.core.services.cache_stats import CacheStats
+from mcp_car_agent.server.metrics import ServerMetrics
+
+
+class TestMetricsUnit:
+    """
+    Testes unitários para as métricas do servidor MCP.
+    """
+
+    def test_quando_ferramentas_sao_chamadas_entao_coleta_traz_contagens_e_latencia(
+        self,
+    ):
+        """
+        Verifica as métricas das ferramentas e dos caches no formato do Prometheus.
+
+        Cenário:
+            Uma ferramenta chamada duas vezes, uma delas com erro.
+
+        Dado que:
+            - Métricas novas e um cache com 3 acertos e 1 falta.
+        Quando:
+            - `search_cars` termina uma vez com sucesso e outra com erro.
+            - A coleta é montada.
+        Então:
+            - As chamadas aparecem por resultado, sem nenhuma em andamento.
+            - O histograma tem as faixas acumuladas, a contagem e a faixa `+Inf`.
+            - O cache aparece com acertos, faltas e taxa de acerto.
+        """
+        # Dado que
+        metrics = ServerMetrics(SqlInstrumentation())
+        cache = CacheStats()
+        for hit in (True, True, True, False):
+            cache.record(hit)
+
+        # Quando
+        with metrics.track("search_cars"):
+            pass
+        with pytest.raises(TimeoutError):
+            with metrics.track("search_cars"):
+                raise TimeoutError
+        lines = metrics.render(caches={"car_index": cache}).splitlines()
+
+        # Então
+        assert 'mcp_tool_requests_total{tool="search_cars",status="error"} 1' in lines
+        assert 'mcp_tool_requests_total{tool="search_cars",status="ok"} 1' in lines
+        assert 'mcp_tool_in_flight{tool="search_cars"} 0' in lines
+        assert (
+            'mcp_tool_duration_seconds_bucket{tool="search_cars",le="+Inf"} 2' in lines
+        )
+        assert 'mcp_tool_duration_seconds_count{tool="search_cars"} 2' in lines
+        assert "# TYPE mcp_tool_duration_seconds histogram" in lines
+        assert 'mcp_cache_hits_total{cache="car_index"} 3' in lines
+        assert 'mcp_cache_hit_ratio{cache="car_index"} 0.75' in lines
@@ -0,0 +1,171 @@
+import asyncio
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from mcp_car_agent.server import profiling
+from mcp_car_agent.server.profiling import (
+    MemorySnapshots,
+    SamplingProfiler,
+    diff,
+    install_signals,
+)
+
+
+def busy(seconds):
+    """Mantém a thread ocupada pelo tempo informado."""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sum(range(1000))
+
+
+class TestProfilingUnit:
+    """
+    Testes unitários para o profiling sob demanda.
+    """
+
+    def test_quando_chamadas_terminam_entao_perfil_e_gravado_no_formato_folded(
+        self, tmp_path
+    ):
+        """
+        Verifica o perfil limitado por número de chamadas.
+
+        Cenário:
+            Um perfil ligado por duas chamadas de ferramentas.
+
+        Dado que:
+            - Um profiler com amostras a cada milissegundo.
+        Quando:
+            - O perfil é ligado e a thread principal fica ocupada em `busy`
+              antes de duas chamadas terminarem.
+        Então:
+            - O perfil termina antes da duração máxima.
+            - O arquivo tem pilhas no formato "folded" que passam por `busy`.
+        """
+        # Dado que
+        profiler = SamplingProfiler(tmp_path, interval=0.001)
+
+        # Quando
+        output = profiler.start(seconds=60, requests=2)
+        busy(0.2)
+        profiler.request()
+        profiler.request()
+        profiler.thread.join(5)
+
+        # Então
+        assert not profiler.running
+        lines = output.read_text(encoding="utf-8").splitlines()
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0 and ";" in stack
+        assert any("busy (test_profiling_unit.py:" in line for line in lines)
+
+    def test_quando_perfil_esta_em_andamento_entao_novo_perfil_e_ignorado(
+        self, tmp_path
+    ):
+        """
+        Verifica que um segundo sinal não inicia outro perfil.
+
+        Cenário:
+            Dois `SIGUSR1` seguidos.
+
+        Dado que:
+            - Um perfil em andamento.
+        Quando:
+            - Um novo perfil é pedido.
+        Então:
+            - O pedido é ignorado, e o perfil original é gravado ao parar.
+        """
+        # Dado que
+        profiler = SamplingProfiler(tmp_path, interval=0.001)
+        output = profiler.start(seconds=60)
+
+        # Quando
+        ignored = profiler.start(seconds=60)
+        profiler.stop()
+
+        # Então
+        assert ignored is None
+        assert output.exists()
+
+    def test_quando_memoria_cresce_entre_snapshots_entao_diff_aponta_a_linha(
+        self, tmp_path
+    ):
+        """
+        Verifica a comparação de dois snapshots de memória.
+
+        Cenário:
+            A materialização de um resultado grande entre dois snapshots.
+
+        Dado que:
+            - Um snapshot tirado antes da materialização.
+        Quando:
+            - Um resultado de ~1 MB é alocado e um segundo snapshot é tirado.
+        Então:
+            - Os snapshots são gravados em arquivos distintos.
+            - A linha da alocação é a que mais cresceu.
+        """
+        # Dado que
+        snapshots = MemorySnapshots(tmp_path)
+        try:
+            before = snapshots.take()
+
+            # Quando
+            result = [bytearray(1024) for _ in range(1024)]
+            after = snapshots.take()
+        finally:
+            snapshots.stop()
+
+        # Então
+        assert before != after
+        growth = diff(before, after, limit=1)
+        assert len(result) == 1024
+        assert "test_profiling_unit.py" in growth[0]
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="Sem SIGUSR2.")
+    @pytest.mark.asyncio
+    async def test_quando_sigusr2_chega_entao_snapshot_e_gravado_fora_do_event_loop(
+        self, tmp_path, monkeypatch
+    ):
+        """
+        Verifica que os sinais do profiling são tratados pelo event loop e que
+        o trabalho roda em outra thread.
+
+        Cenário:
+            Um `SIGUSR2` enviado ao processo com o loop em execução.
+
+        Dado que:
+            - Os sinais registrados no loop, com snapshots gravados em um
+              diretório temporário.
+        Quando:
+            - O processo recebe `SIGUSR2`.
+        Então:
+            - Um snapshot é gravado, por uma thread diferente da do loop.
+        """
+        # Dado que
+        snapshots = MemorySnapshots(tmp_path)
+        threads = []
+        take = snapshots.take
+        monkeypatch.setattr(
+            snapshots, "take", lambda: threads.append(threading.get_ident()) or take()
+        )
+        monkeypatch.setattr(profiling, "snapshots", snapshots)
+        install_signals()
+        loop = asyncio.get_running_loop()
+
+        # Quando
+        try:
+            os.kill(os.getpid(), signal.SIGUSR2)
+            limit = time.monotonic() + 10
+            while not list(tmp_path.iterdir()) and time.monotonic() < limit:
+                await asyncio.sleep(0.05)
+        finally:
+            loop.remove_signal_handler(signal.SIGUSR1)
+            loop.remove_signal_handler(signal.SIGUSR2)
+            snapshots.stop()
+
+        # Então
+        assert len(list(tmp_path.glob("memory-*.tracemalloc"))) == 1
+        assert threads and threads[0] != threading.get_ident()
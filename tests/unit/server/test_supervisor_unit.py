@@ -0,0 +1,324 @@
+import socket
+import sys
+import time
+
+import pytest
+
+from mcp_car_agent.server.supervisor import (
+    Supervisor,
+    bind_socket,
+    connections_per_worker,
+)
+
+
+def crash(sock, pool_size, ready, slot):  # pylint: disable=unused-argument
+    """Worker que termina imediatamente com erro."""
+    sys.exit(1)
+
+
+def exit_with_slot(sock, pool_size, ready, slot):  # pylint: disable=unused-argument
+    """Worker que termina com um código que identifica o seu posto."""
+    sys.exit(10 + slot)
+
+
+def idle(sock, pool_size, ready, slot):  # pylint: disable=unused-argument
+    """Worker que fica pronto e ocioso até ser encerrado."""
+    ready.set()
+    time.sleep(60)
+
+
+def slow_idle(sock, pool_size, ready, slot):  # pylint: disable=unused-argument
+    """Worker que demora a ficar pronto e fica ocioso até ser encerrado."""
+    time.sleep(0.5)
+    ready.set()
+    time.sleep(60)
+
+
+def answer_pool_size(sock, pool_size, ready, slot):  # pylint: disable=unused-argument
+    """Worker que atende uma conexão respondendo o tamanho do seu pool."""
+    ready.set()
+    connection, _ = sock.accept()
+    connection.sendall(str(pool_size).encode())
+    connection.close()
+    time.sleep(60)
+
+
+@pytest.fixture(name="listening_socket")
+def setup_listening_socket():
+    """Abre um socket de escuta em uma porta livre."""
+    sock = bind_socket("127.0.0.1", 0)
+    yield sock
+    sock.close()
+
+
+def wait_until(predicate, timeout=10.0):
+    """Aguarda até que a condição seja verdadeira ou o tempo acabe."""
+    limit = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < limit:
+        time.sleep(0.05)
+    return predicate()
+
+
+class TestSupervisorUnit:
+    """
+    Testes unitários para o supervisor de workers do servidor MCP.
+    """
+
+    def test_quando_orcamento_e_dividido_entao_cada_worker_tem_ao_menos_uma_conexao(
+        self,
+    ):
+        """
+        Verifica a divisão do orçamento global de conexões entre os workers,
+        com a folga de um worker para o reload.
+
+        Cenário:
+            Orçamentos maiores e menores que o número de workers.
+
+        Dado que:
+            - Um orçamento de 20 conexões para 4 workers e de 3 para 8 workers.
+        Quando:
+            - `connections_per_worker` é chamado.
+        Então:
+            - Cada worker recebe 4 conexões no primeiro caso (5 workers cabem
+              no orçamento) e 1 no segundo.
+        """
+        assert connections_per_worker(20, 4) == 4
+        assert connections_per_worker(3, 8) == 1
+
+    def test_quando_worker_recebe_socket_entao_atende_conexoes_com_pool_dimensionado(
+        self, listening_socket
+    ):
+        """
+        Verifica que os workers compartilham o socket aberto pelo supervisor.
+
+        Cenário:
+            Um cliente conecta na porta aberta pelo supervisor.
+
+        Dado que:
+            - Um supervisor com 2 workers e orçamento de 10 conexões.
+        Quando:
+            - Um cliente conecta no socket compartilhado.
+        Então:
+            - Um dos workers atende e informa um pool de 3 conexões, deixando
+              a folga de um worker para o reload.
+        """
+        # Dado que
+        supervisor = Supervisor(answer_pool_size, listening_socket, 2, 10)
+        supervisor.start()
+
+        # Quando
+        try:
+            with socket.create_connection(listening_socket.getsockname(), 10) as client:
+                client.settimeout(10)
+                response = client.recv(16)
+        finally:
+            supervisor.stop()
+
+        # Então
+        assert response == b"3"
+
+    def test_quando_worker_termina_inesperadamente_entao_e_reiniciado(
+        self, listening_socket
+    ):
+        """
+        Verifica que o supervisor substitui workers que terminaram.
+
+        Cenário:
+            Os workers falham logo após iniciar.
+
+        Dado que:
+            - Um supervisor com 2 workers que terminam com erro.
+        Quando:
+            - `reap` é chamado após os workers terminarem.
+        Então:
+            - Os 2 workers são substituídos por novos processos.
+        """
+        # Dado que
+        supervisor = Supervisor(crash, listening_socket, 2, 10)
+        supervisor.start()
+        crashed = list(supervisor.processes)
+        assert wait_until(lambda: not any(p.is_alive() for p in crashed))
+
+        # Quando
+        restarted = supervisor.reap()
+        supervisor.stop()
+
+        # Então
+        assert restarted == 2
+        assert all(p.exitcode == 1 for p in crashed)
+
+    def test_quando_worker_e_reiniciado_entao_mantem_o_indice_do_posto(
+        self, listening_socket
+    ):
+        """
+        Verifica que cada worker recebe o índice do seu posto e o mantém ao
+        ser reiniciado.
+
+        Cenário:
+            Os workers terminam informando o posto no código de saída.
+
+        Dado que:
+            - Um supervisor com 2 workers que terminam com o código `10 + posto`.
+        Quando:
+            - `reap` reinicia os workers.
+        Então:
+            - Os postos são distintos e cada reinício herda o posto do anterior.
+        """
+        # Dado que
+        supervisor = Supervisor(exit_with_slot, listening_socket, 2, 10)
+        supervisor.start()
+        first = list(supervisor.processes)
+        assert wait_until(lambda: not any(p.is_alive() for p in first))
+
+        # Quando
+        supervisor.reap()
+        second = list(supervisor.processes)
+        assert wait_until(lambda: not any(p.is_alive() for p in second))
+        supervisor.stop()
+
+        # Então
+        assert [p.exitcode for p in first] == [10, 11]
+        assert [p.exitcode for p in second] == [10, 11]
+
+    def test_quando_reload_entao_novos_workers_sobem_antes_dos_antigos_encerrarem(
+        self, listening_socket
+    ):
+        """
+        Verifica o reload gracioso dos workers.
+
+        Cenário:
+            Um reload é solicitado com os workers em execução.
+
+        Dado que:
+            - Um supervisor com 2 workers ociosos.
+        Quando:
+            - `reload` é chamado.
+        Então:
+            - O reload é concluído e os workers antigos foram encerrados.
+            - Novos workers, já prontos, estão em execução.
+        """
+        # Dado que
+        supervisor = Supervisor(idle, listening_socket, 2, 10)
+        supervisor.start()
+        old_processes = list(supervisor.processes)
+
+        # Quando
+        reloaded = supervisor.reload()
+
+        # Então
+        try:
+            assert reloaded
+            assert all(worker.ready.is_set() for worker in supervisor.slots)
+            assert not any(p.is_alive() for p in old_processes)
+            assert all(p.is_alive() for p in supervisor.processes)
+            assert not set(supervisor.processes) & set(old_processes)
+        finally:
+            supervisor.stop()
+
+    def test_quando_worker_termina_durante_reload_entao_e_reiniciado_na_espera(
+        self, listening_socket
+    ):
+        """
+        Verifica que a espera do reload não suspende os reinícios.
+
+        Cenário:
+            Um worker termina enquanto o reload aguarda outro posto.
+
+        Dado que:
+            - Um supervisor com 2 workers ociosos, e o do posto 1 terminou.
+            - Os novos workers demoram a ficar prontos.
+        Quando:
+            - `reload` é chamado.
+        Então:
+            - O posto 1 é reiniciado enquanto o reload aguarda o posto 0.
+            - O reload é concluído, com todos os workers em execução.
+        """
+        # Dado que
+        supervisor = Supervisor(idle, listening_socket, 2, 10)
+        supervisor.start()
+        supervisor.processes[1].terminate()
+        assert wait_until(lambda: not supervisor.processes[1].is_alive())
+        supervisor.target = slow_idle
+        restarted = []
+        reap = supervisor.reap
+        supervisor.reap = lambda: restarted.append(reap()) or restarted[-1]
+
+        # Quando
+        reloaded = supervisor.reload()
+
+        # Então
+        try:
+            assert reloaded
+            assert sum(restarted) == 1
+            assert all(p.is_alive() for p in supervisor.processes)
+        finally:
+            supervisor.stop()
+
+    def test_quando_novos_workers_falham_no_reload_entao_antigos_continuam_atendendo(
+        self, listening_socket
+    ):
+        """
+        Verifica que um deploy quebrado não derruba os workers saudáveis.
+
+        Cenário:
+            Um reload carrega uma versão que falha ao iniciar.
+
+        Dado que:
+            - Um supervisor com 2 workers ociosos.
+            - Os novos workers terminam com erro antes de ficarem prontos.
+        Quando:
+            - `reload` é chamado.
+        Então:
+            - O reload é abortado.
+            - Os workers antigos continuam em execução.
+        """
+        # Dado que
+        supervisor = Supervisor(idle, listening_socket, 2, 10)
+        supervisor.start()
+        old_processes = list(supervisor.processes)
+        supervisor.target = crash
+
+        # Quando
+        reloaded = supervisor.reload()
+
+        # Então
+        try:
+            assert not reloaded
+            assert supervisor.processes == old_processes
+            assert all(p.is_alive() for p in old_processes)
+        finally:
+            supervisor.stop()
+
+    def test_quando_worker_falha_seguidamente_entao_reinicio_aguarda_backoff(
+        self, listening_socket
+    ):
+        """
+        Verifica o backoff dos reinícios de um worker que nunca fica pronto.
+
+        Cenário:
+            O worker falha de novo logo após ser reiniciado.
+
+        Dado que:
+            - Um supervisor com 1 worker que termina com erro.
+            - O worker já foi reiniciado uma vez e falhou de novo.
+        Quando:
+            - `reap` é chamado.
+        Então:
+            - O worker não é reiniciado antes do fim do backoff.
+        """
+        # Dado que
+        supervisor = Supervisor(crash, listening_socket, 1, 10)
+        supervisor.start()
+        assert wait_until(lambda: not supervisor.processes[0].is_alive())
+        assert supervisor.reap() == 1
+        assert wait_until(lambda: not supervisor.processes[0].is_alive())
+
+        # Quando
+        restarted = supervisor.reap()
+        (worker,) = supervisor.slots
+        supervisor.stop()
+
+        # Então
+        assert restarted == 0
+        assert worker.crashes == 2
+        assert worker.restart_at > time.monotonic()